@@ -62,6 +62,15 @@ class Config:
     FACE_ENCODING_DIMENSIONS = 128  # dlib face_recognition default
     FACE_ENCODING_BYTES = 512  # 128 * 4 bytes (float32)
 
+    # Loyalty Bulk Import Settings
+    LOYALTY_IMPORT_DOWNLOAD_WORKERS = 16  # Concurrent photo downloads (I/O bound)
+    LOYALTY_IMPORT_ENCODE_WORKERS = os.cpu_count() or 1  # Encoding processes (CPU bound)
+    LOYALTY_IMPORT_BATCH_SIZE = 200  # Members inserted per commit
+
+    # NCMEC Poster Sync Settings
+    NCMEC_SYNC_DOWNLOAD_WORKERS = 16  # Concurrent poster photo downloads
+    NCMEC_SYNC_ENCODE_WORKERS = os.cpu_count() or 1  # Encoding processes
+
     # Database Compilation Settings
     DATABASE_VERSIONS_TO_KEEP = 5  # Keep last 5 versions for rollback
 
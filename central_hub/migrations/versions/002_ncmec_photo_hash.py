@@ -0,0 +1,27 @@
+"""Add photo_hash to ncmec_records
+
+Stores the SHA256 of the poster photo each NCMEC encoding was extracted
+from, so the nightly poster sync can skip posters whose photo has not
+changed instead of downloading and re-encoding them.
+
+Revision ID: 002_ncmec_photo_hash
+Revises: 001_initial
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002_ncmec_photo_hash'
+down_revision = '001_initial'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('ncmec_records', sa.Column('photo_hash', sa.String(64), nullable=True))
+
+
+def downgrade():
+    op.drop_column('ncmec_records', 'photo_hash')
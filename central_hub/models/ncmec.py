@@ -57,6 +57,10 @@ class NCMECRecord(db.Model):
     # Photo storage path (filesystem)
     photo_path = db.Column(db.String(500))
 
+    # SHA256 of the poster photo the encoding was extracted from; the
+    # poster sync skips posters whose photo hash is unchanged
+    photo_hash = db.Column(db.String(64))
+
     # Record status (active/resolved)
     status = db.Column(
         db.String(20),
@@ -103,6 +107,7 @@ class NCMECRecord(db.Model):
             'missing_since': self.missing_since.isoformat() if self.missing_since else None,
             'last_known_location': self.last_known_location,
             'photo_path': self.photo_path,
+            'photo_hash': self.photo_hash,
             'status': self.status,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
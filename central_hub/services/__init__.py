@@ -6,6 +6,7 @@ alert processing, and notifications.
 """
 
 from central_hub.services.face_encoder import (
+    create_encoding_pool,
     extract_encoding,
     extract_encoding_from_bytes,
     validate_image_file,
@@ -54,6 +55,7 @@ from central_hub.services.alert_processor import (
 
 __all__ = [
     # Face encoder
+    'create_encoding_pool',
     'extract_encoding',
     'extract_encoding_from_bytes',
     'validate_image_file',
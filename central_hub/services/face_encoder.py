@@ -6,8 +6,10 @@ library (dlib). Encodings are stored as binary blobs (512 bytes) for efficient
 database storage and FAISS compatibility.
 """
 
+import io
 import logging
-import os
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -153,8 +155,6 @@ def extract_encoding_from_bytes(image_data: bytes) -> bytes:
         InvalidImageError: If the image data is invalid.
         NoFaceDetectedError: If no face is detected in the image.
     """
-    import tempfile
-
     config = get_config()
 
     # Check size limit
@@ -162,56 +162,69 @@ def extract_encoding_from_bytes(image_data: bytes) -> bytes:
         max_mb = config.MAX_CONTENT_LENGTH / (1024 * 1024)
         raise InvalidImageError(f"Image data exceeds maximum allowed ({max_mb}MB)")
 
-    # Write to temporary file for face_recognition processing
-    with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp:
-        tmp.write(image_data)
-        tmp_path = tmp.name
+    # Load the image straight from memory (no temporary file)
+    try:
+        image = face_recognition.load_image_file(io.BytesIO(image_data))
+    except Exception as e:
+        logger.error(f"Failed to load image from bytes: {e}")
+        raise InvalidImageError(f"Failed to load image: {e}")
 
     try:
-        # Load the image
-        try:
-            image = face_recognition.load_image_file(tmp_path)
-        except Exception as e:
-            logger.error(f"Failed to load image from bytes: {e}")
-            raise InvalidImageError(f"Failed to load image: {e}")
-
-        try:
-            # Extract face encodings
-            encodings = face_recognition.face_encodings(
-                image,
-                num_jitters=config.FACE_ENCODING_NUM_JITTERS
-            )
-        except Exception as e:
-            logger.error(f"Face encoding extraction failed: {e}")
-            raise FaceEncodingError(f"Face encoding extraction failed: {e}")
-
-        if not encodings:
-            logger.warning("No face detected in image bytes")
-            raise NoFaceDetectedError("No face detected in uploaded image")
-
-        # Log warning if multiple faces detected
-        if len(encodings) > 1:
-            logger.warning(
-                f"Multiple faces ({len(encodings)}) detected, "
-                "using first detected face"
-            )
-
-        # Convert to float32 and return as bytes
-        encoding = encodings[0].astype(np.float32)
-
-        if encoding.shape[0] != config.FACE_ENCODING_DIMENSIONS:
-            raise FaceEncodingError(
-                f"Unexpected encoding dimensions: {encoding.shape[0]}, "
-                f"expected {config.FACE_ENCODING_DIMENSIONS}"
-            )
-
-        return encoding.tobytes()
-    finally:
-        # Clean up temporary file
-        try:
-            os.unlink(tmp_path)
-        except OSError:
-            pass
+        # Extract face encodings
+        encodings = face_recognition.face_encodings(
+            image,
+            num_jitters=config.FACE_ENCODING_NUM_JITTERS
+        )
+    except Exception as e:
+        logger.error(f"Face encoding extraction failed: {e}")
+        raise FaceEncodingError(f"Face encoding extraction failed: {e}")
+
+    if not encodings:
+        logger.warning("No face detected in image bytes")
+        raise NoFaceDetectedError("No face detected in uploaded image")
+
+    # Log warning if multiple faces detected
+    if len(encodings) > 1:
+        logger.warning(
+            f"Multiple faces ({len(encodings)}) detected, "
+            "using first detected face"
+        )
+
+    # Convert to float32 and return as bytes
+    encoding = encodings[0].astype(np.float32)
+
+    if encoding.shape[0] != config.FACE_ENCODING_DIMENSIONS:
+        raise FaceEncodingError(
+            f"Unexpected encoding dimensions: {encoding.shape[0]}, "
+            f"expected {config.FACE_ENCODING_DIMENSIONS}"
+        )
+
+    return encoding.tobytes()
+
+
+def create_encoding_pool(max_workers: int) -> Executor:
+    """
+    Create an executor for running extract_encoding_from_bytes in bulk.
+
+    Encoding is CPU bound (dlib with num_jitters), so it runs in worker
+    processes started via forkserver, which keeps them from inheriting
+    the caller's threads and database connections. Daemonic processes
+    cannot have children, so inside one the pool falls back to threads.
+
+    Args:
+        max_workers: Number of encoding workers.
+
+    Returns:
+        Executor to submit extract_encoding_from_bytes calls to.
+    """
+    if multiprocessing.current_process().daemon:
+        logger.info("Running in a daemonic process, encoding faces in threads")
+        return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="face-encode")
+
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("forkserver"),
+    )
 
 
 def encoding_from_bytes(encoding_bytes: bytes) -> np.ndarray:
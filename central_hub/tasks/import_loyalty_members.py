@@ -8,17 +8,25 @@ Processes CSV or JSON bulk imports of loyalty members:
 4. Create LoyaltyMember records
 5. Trigger FAISS recompilation when complete
 
+Photos are downloaded by a thread pool and encoded by a process pool as a
+pipeline; members are inserted in batches with progress published as
+Celery task state. Member codes already stored for the network are
+skipped, so re-running an interrupted import (the upload is only removed
+on success) continues from the last committed batch.
+
 Triggered via API: POST /api/v1/networks/{id}/loyalty/import
 """
 
 import csv
-import io
 import json
 import logging
+import threading
 import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import requests
 
@@ -26,7 +34,7 @@ from central_hub.extensions import celery, db
 from central_hub.config import get_config
 from central_hub.models.loyalty import LoyaltyMember
 from central_hub.services.face_encoder import (
-    extract_encoding,
+    create_encoding_pool,
     extract_encoding_from_bytes,
     NoFaceDetectedError,
     InvalidImageError,
@@ -43,11 +51,26 @@ logger = logging.getLogger(__name__)
 
 PHOTO_DOWNLOAD_TIMEOUT = 30
 
+# Photos downloaded ahead of the row being committed, per download worker.
+# Bounds memory held by downloaded-but-not-yet-encoded photos.
+DOWNLOADS_IN_FLIGHT_PER_WORKER = 4
+
+_thread_local = threading.local()
+
+
+def _get_http_session() -> requests.Session:
+    """Return this thread's HTTP session so photo hosts reuse connections."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
 
 def _download_member_photo(url: str) -> Optional[bytes]:
     """Download a member photo from a URL."""
     try:
-        response = requests.get(url, timeout=PHOTO_DOWNLOAD_TIMEOUT)
+        response = _get_http_session().get(url, timeout=PHOTO_DOWNLOAD_TIMEOUT)
         response.raise_for_status()
         return response.content
     except requests.exceptions.RequestException as e:
@@ -68,15 +91,17 @@ def _save_photo_bytes(photo_bytes: bytes, member_id: uuid.UUID, network_id: uuid
     return f"loyalty/{network_id}/{member_id}.jpg"
 
 
-def _process_csv_row(
-    row: Dict,
-    network_id: uuid.UUID,
-    existing_codes: set,
-) -> Optional[Dict]:
+def _field(row: Dict, key: str) -> str:
+    """Read a CSV/JSON field as a stripped string."""
+    value = row.get(key)
+    return str(value).strip() if value is not None else ""
+
+
+def _parse_member_row(row: Dict) -> Optional[Dict]:
     """
-    Process a single CSV row into member data.
+    Validate a single CSV/JSON row into member data.
 
-    Expected CSV columns:
+    Expected columns:
     - member_code (required)
     - name (required)
     - photo_url (required) - URL to download face photo
@@ -85,11 +110,11 @@ def _process_csv_row(
     - assigned_playlist_id (optional)
 
     Returns:
-        Dict with member data and encoding, or None if failed.
+        Dict with member fields, or None if the row is incomplete.
     """
-    member_code = row.get("member_code", "").strip()
-    name = row.get("name", "").strip()
-    photo_url = row.get("photo_url", "").strip()
+    member_code = _field(row, "member_code")
+    name = _field(row, "name")
+    photo_url = _field(row, "photo_url")
 
     if not member_code or not name:
         return None
@@ -98,38 +123,194 @@ def _process_csv_row(
         logger.warning("No photo_url for member %s, skipping", member_code)
         return None
 
-    # Skip duplicates
-    if member_code in existing_codes:
-        logger.debug("Member %s already exists, skipping", member_code)
-        return None
+    return {
+        "member_code": member_code,
+        "name": name,
+        "photo_url": photo_url,
+        "email": _field(row, "email") or None,
+        "phone": _field(row, "phone") or None,
+        "assigned_playlist_id": row.get("assigned_playlist_id") or None,
+    }
+
 
-    # Download photo
-    photo_bytes = _download_member_photo(photo_url)
+def _fetch_and_encode(member: Dict, encoder) -> Tuple[Optional[bytes], Optional[Future]]:
+    """Download a member photo and queue it for encoding (download thread)."""
+    photo_bytes = _download_member_photo(member["photo_url"])
     if not photo_bytes:
-        return None
+        return None, None
+    return photo_bytes, encoder.submit(extract_encoding_from_bytes, photo_bytes)
+
+
+def _collect_encoded_member(
+    member: Dict,
+    download: Future,
+) -> Tuple[Dict, Optional[bytes], Optional[bytes]]:
+    """Wait for a member's download and encoding to finish."""
+    photo_bytes, encoding_future = download.result()
+    if encoding_future is None:
+        return member, None, None
 
-    # Extract face encoding
     try:
-        encoding = extract_encoding_from_bytes(photo_bytes)
+        encoding = encoding_future.result()
     except (NoFaceDetectedError, InvalidImageError, FaceEncodingError) as e:
-        logger.warning("Encoding failed for member %s: %s", member_code, e)
-        return None
+        logger.warning("Encoding failed for member %s: %s", member["member_code"], e)
+        return member, photo_bytes, None
+
+    return member, photo_bytes, encoding
 
-    member_id = uuid.uuid4()
-    photo_path = _save_photo_bytes(photo_bytes, member_id, network_id)
 
+def _iter_encoded_members(
+    members: Iterable[Dict],
+    download_workers: int,
+    encode_workers: int,
+) -> Iterator[Tuple[Dict, Optional[bytes], Optional[bytes]]]:
+    """
+    Download and encode member photos as a pipeline.
+
+    Download threads fetch photos and hand the bytes straight to the
+    encoding pool, so network waits overlap CPU-bound encoding. At most
+    download_workers * DOWNLOADS_IN_FLIGHT_PER_WORKER members are in
+    flight at once.
+
+    Yields:
+        Tuples of (member, photo_bytes, encoding) in input order.
+        photo_bytes is None if the download failed; encoding is None if
+        no usable face encoding could be extracted.
+    """
+    max_in_flight = max(1, download_workers * DOWNLOADS_IN_FLIGHT_PER_WORKER)
+
+    with create_encoding_pool(encode_workers) as encoder, ThreadPoolExecutor(
+        max_workers=download_workers, thread_name_prefix="loyalty-photo"
+    ) as downloads:
+        pending = deque()
+        for member in members:
+            pending.append((member, downloads.submit(_fetch_and_encode, member, encoder)))
+            if len(pending) >= max_in_flight:
+                yield _collect_encoded_member(*pending.popleft())
+
+        while pending:
+            yield _collect_encoded_member(*pending.popleft())
+
+
+def _new_import_stats(rows_total: int) -> Dict:
+    """Create the statistics dict reported as task progress and result."""
     return {
-        "id": member_id,
-        "member_code": member_code,
-        "name": name,
-        "email": row.get("email", "").strip() or None,
-        "phone": row.get("phone", "").strip() or None,
-        "assigned_playlist_id": row.get("assigned_playlist_id") or None,
-        "encoding": encoding,
-        "photo_path": photo_path,
+        "rows_total": rows_total,
+        "rows_processed": 0,
+        "members_created": 0,
+        "members_skipped": 0,
+        "members_existing": 0,
+        "photos_failed": 0,
+        "encoding_failed": 0,
     }
 
 
+def _report_progress(task, stats: Dict) -> None:
+    """Publish import statistics as Celery task state."""
+    task.update_state(state="PROGRESS", meta=dict(stats))
+
+
+def _import_members(
+    task,
+    rows: List[Dict],
+    network_uuid: uuid.UUID,
+    stats: Dict,
+) -> None:
+    """
+    Import member rows into a network.
+
+    Member codes already stored for the network are skipped, so a task
+    redelivered after a crash or time limit resumes where the committed
+    batches stopped. New members are inserted LOYALTY_IMPORT_BATCH_SIZE
+    rows per commit, and progress is reported after each commit.
+
+    Args:
+        task: Bound Celery task (for progress updates)
+        rows: Raw CSV/JSON member rows
+        network_uuid: Network the members belong to
+        stats: Statistics dict from _new_import_stats(), updated in place
+    """
+    config = get_config()
+
+    existing_codes = {
+        member_code for (member_code,) in LoyaltyMember.query.filter_by(
+            network_id=network_uuid
+        ).with_entities(LoyaltyMember.member_code)
+    }
+
+    members = []
+    for row in rows:
+        member = _parse_member_row(row)
+        if member is None:
+            stats["rows_processed"] += 1
+            stats["members_skipped"] += 1
+            continue
+
+        if member["member_code"] in existing_codes:
+            logger.debug("Member %s already exists, skipping", member["member_code"])
+            stats["rows_processed"] += 1
+            stats["members_skipped"] += 1
+            stats["members_existing"] += 1
+            continue
+
+        existing_codes.add(member["member_code"])
+        members.append(member)
+
+    logger.info(
+        "Importing %d new members (%d rows skipped, %d already imported)",
+        len(members), stats["members_skipped"], stats["members_existing"]
+    )
+    _report_progress(task, stats)
+
+    batch = []
+    for member, photo_bytes, encoding in _iter_encoded_members(
+        members,
+        download_workers=config.LOYALTY_IMPORT_DOWNLOAD_WORKERS,
+        encode_workers=config.LOYALTY_IMPORT_ENCODE_WORKERS,
+    ):
+        stats["rows_processed"] += 1
+
+        if photo_bytes is None:
+            stats["photos_failed"] += 1
+            stats["members_skipped"] += 1
+            continue
+
+        if encoding is None:
+            stats["encoding_failed"] += 1
+            stats["members_skipped"] += 1
+            continue
+
+        member_id = uuid.uuid4()
+        batch.append(LoyaltyMember(
+            id=member_id,
+            network_id=network_uuid,
+            member_code=member["member_code"],
+            name=member["name"],
+            email=member["email"],
+            phone=member["phone"],
+            face_encoding=encoding,
+            photo_path=_save_photo_bytes(photo_bytes, member_id, network_uuid),
+            assigned_playlist_id=member["assigned_playlist_id"],
+        ))
+        stats["members_created"] += 1
+
+        if len(batch) >= config.LOYALTY_IMPORT_BATCH_SIZE:
+            db.session.add_all(batch)
+            db.session.commit()
+            logger.info(
+                "Committed batch: %d members (%d total)",
+                len(batch), stats["members_created"]
+            )
+            batch = []
+            _report_progress(task, stats)
+
+    # Commit remaining
+    if batch:
+        db.session.add_all(batch)
+        db.session.commit()
+        _report_progress(task, stats)
+
+
 @celery.task(
     base=LongRunningTask,
     bind=True,
@@ -167,21 +348,9 @@ def import_loyalty_csv_task(
         task_id, network_id
     )
 
-    stats = {
-        "rows_processed": 0,
-        "members_created": 0,
-        "members_skipped": 0,
-        "photos_failed": 0,
-        "encoding_failed": 0,
-    }
+    stats = _new_import_stats(rows_total=0)
 
     try:
-        # Get existing member codes for this network
-        existing_members = LoyaltyMember.query.filter_by(
-            network_id=network_uuid
-        ).with_entities(LoyaltyMember.member_code).all()
-        existing_codes = {m.member_code for m in existing_members}
-
         # Parse CSV
         csv_path = Path(csv_file_path)
         if not csv_path.exists():
@@ -191,45 +360,10 @@ def import_loyalty_csv_task(
             )
 
         with open(csv_path, "r", newline="", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            batch = []
+            rows = list(csv.DictReader(f))
 
-            for row in reader:
-                stats["rows_processed"] += 1
-
-                result = _process_csv_row(row, network_uuid, existing_codes)
-                if result:
-                    member = LoyaltyMember(
-                        id=result["id"],
-                        network_id=network_uuid,
-                        member_code=result["member_code"],
-                        name=result["name"],
-                        email=result["email"],
-                        phone=result["phone"],
-                        face_encoding=result["encoding"],
-                        photo_path=result["photo_path"],
-                        assigned_playlist_id=result.get("assigned_playlist_id"),
-                    )
-                    batch.append(member)
-                    existing_codes.add(result["member_code"])
-                    stats["members_created"] += 1
-
-                    # Commit in batches of 50
-                    if len(batch) >= 50:
-                        db.session.add_all(batch)
-                        db.session.commit()
-                        logger.info(
-                            "Committed batch: %d members (%d total)",
-                            len(batch), stats["members_created"]
-                        )
-                        batch = []
-                else:
-                    stats["members_skipped"] += 1
-
-            # Commit remaining
-            if batch:
-                db.session.add_all(batch)
-                db.session.commit()
+        stats["rows_total"] = len(rows)
+        _import_members(self, rows, network_uuid, stats)
 
         # Trigger FAISS recompilation
         if stats["members_created"] > 0:
@@ -251,11 +385,14 @@ def import_loyalty_csv_task(
 
         logger.info(
             "Loyalty CSV import completed in %.1fs: "
-            "processed=%d, created=%d, skipped=%d",
+            "processed=%d, created=%d, skipped=%d, "
+            "photos_failed=%d, encoding_failed=%d",
             duration,
             stats["rows_processed"],
             stats["members_created"],
             stats["members_skipped"],
+            stats["photos_failed"],
+            stats["encoding_failed"],
         )
 
         return task_success_result(
@@ -320,11 +457,7 @@ def import_loyalty_json_task(
         task_id, network_id
     )
 
-    stats = {
-        "rows_processed": 0,
-        "members_created": 0,
-        "members_skipped": 0,
-    }
+    stats = _new_import_stats(rows_total=0)
 
     try:
         json_path = Path(json_file_path)
@@ -344,43 +477,8 @@ def import_loyalty_json_task(
                 code="EMPTY_DATA",
             )
 
-        # Get existing codes
-        existing_members = LoyaltyMember.query.filter_by(
-            network_id=network_uuid
-        ).with_entities(LoyaltyMember.member_code).all()
-        existing_codes = {m.member_code for m in existing_members}
-
-        batch = []
-        for row in members_data:
-            stats["rows_processed"] += 1
-
-            result = _process_csv_row(row, network_uuid, existing_codes)
-            if result:
-                member = LoyaltyMember(
-                    id=result["id"],
-                    network_id=network_uuid,
-                    member_code=result["member_code"],
-                    name=result["name"],
-                    email=result["email"],
-                    phone=result["phone"],
-                    face_encoding=result["encoding"],
-                    photo_path=result["photo_path"],
-                    assigned_playlist_id=result.get("assigned_playlist_id"),
-                )
-                batch.append(member)
-                existing_codes.add(result["member_code"])
-                stats["members_created"] += 1
-
-                if len(batch) >= 50:
-                    db.session.add_all(batch)
-                    db.session.commit()
-                    batch = []
-            else:
-                stats["members_skipped"] += 1
-
-        if batch:
-            db.session.add_all(batch)
-            db.session.commit()
+        stats["rows_total"] = len(members_data)
+        _import_members(self, members_data, network_uuid, stats)
 
         # Trigger recompilation
         if stats["members_created"] > 0:
@@ -396,8 +494,10 @@ def import_loyalty_json_task(
         duration = (completed_at - started_at).total_seconds()
 
         logger.info(
-            "Loyalty JSON import completed in %.1fs: created=%d, skipped=%d",
-            duration, stats["members_created"], stats["members_skipped"]
+            "Loyalty JSON import completed in %.1fs: created=%d, skipped=%d, "
+            "photos_failed=%d, encoding_failed=%d",
+            duration, stats["members_created"], stats["members_skipped"],
+            stats["photos_failed"], stats["encoding_failed"]
         )
 
         return task_success_result(
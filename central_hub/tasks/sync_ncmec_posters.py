@@ -8,22 +8,33 @@ Daily scheduled task that:
 4. Creates/updates NCMECRecord entries in the database
 5. Triggers FAISS index recompilation when new records are added
 
+The next page is prefetched while the current one is processed. Photos
+are downloaded concurrently and encoded on a worker pool; each page is
+written with a single upsert keyed by case_id. A poster whose photo hash
+matches the stored photo_hash is not re-encoded, so a nightly run only
+pays for posters that changed.
+
 Schedule: Runs daily at 02:00 UTC via Celery Beat.
 Can also be triggered manually via API: POST /api/v1/ncmec/sync
 """
 
-import io
+import hashlib
 import logging
 import os
-import tempfile
+import threading
+import uuid
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import requests
+from sqlalchemy.dialects import postgresql, sqlite
 
 from central_hub.extensions import celery, db
+from central_hub.config import get_config
 from central_hub.models.ncmec import NCMECRecord, NCMECStatus
 from central_hub.services.face_encoder import (
+    create_encoding_pool,
     extract_encoding_from_bytes,
     NoFaceDetectedError,
     InvalidImageError,
@@ -48,6 +59,26 @@ MAX_PAGES = 500  # Safety limit: 50,000 records max per sync
 PHOTO_DOWNLOAD_TIMEOUT = 30
 MAX_PHOTO_SIZE = 10 * 1024 * 1024  # 10MB
 
+# Outcomes of resolving a poster's photo
+PHOTO_ENCODED = "encoded"
+PHOTO_UNCHANGED = "unchanged"
+PHOTO_FAILED = "failed"
+
+# Poster fields compared to decide whether an unchanged photo still needs
+# its record updated
+POSTER_FIELDS = ("name", "age_when_missing", "missing_since", "last_known_location")
+
+_thread_local = threading.local()
+
+
+def _get_http_session() -> requests.Session:
+    """Return this thread's HTTP session so API and photo hosts reuse connections."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
 
 def _get_api_token() -> str:
     """
@@ -105,7 +136,7 @@ def _fetch_posters(token: str, page: int = 1) -> Dict:
         "pageSize": PAGE_SIZE,
     }
 
-    response = requests.post(
+    response = _get_http_session().post(
         f"{POSTER_API_BASE}/Poster/Search",
         headers=headers,
         json=body,
@@ -126,7 +157,7 @@ def _download_photo(url: str) -> Optional[bytes]:
         Photo bytes, or None if download fails.
     """
     try:
-        response = requests.get(url, timeout=PHOTO_DOWNLOAD_TIMEOUT)
+        response = _get_http_session().get(url, timeout=PHOTO_DOWNLOAD_TIMEOUT)
         response.raise_for_status()
 
         if len(response.content) > MAX_PHOTO_SIZE:
@@ -195,55 +226,39 @@ def _extract_poster_info(poster: Dict) -> Dict:
     }
 
 
-def _process_poster(poster_info: Dict) -> Optional[NCMECRecord]:
+def _resolve_poster_photo(
+    poster_info: Dict,
+    known_hash: Optional[str],
+    encoder: Executor,
+) -> Tuple[str, Optional[str], Optional[bytes]]:
     """
-    Process a single poster: download photo, extract encoding, create record.
+    Find the face encoding for a poster (runs on a download thread).
+
+    Photo URLs are tried in order until one yields a face. A photo whose
+    SHA256 matches the stored photo_hash is not encoded again.
 
     Args:
         poster_info: Normalized poster data from _extract_poster_info().
+        known_hash: photo_hash of the stored record, if any.
+        encoder: Executor running extract_encoding_from_bytes.
 
     Returns:
-        NCMECRecord if successful, None if failed.
+        Tuple of (outcome, photo_hash, encoding_bytes). encoding_bytes is
+        only set for PHOTO_ENCODED.
     """
     case_id = poster_info["case_id"]
-    if not case_id:
-        return None
-
-    # Check if record already exists
-    existing = NCMECRecord.query.filter_by(case_id=case_id).first()
-    if existing and existing.face_encoding:
-        # Already processed, skip
-        return None
 
-    # Try each photo URL until we get a face encoding
     for photo_url in poster_info["photo_urls"]:
         photo_bytes = _download_photo(photo_url)
         if not photo_bytes:
             continue
 
-        try:
-            encoding_bytes = extract_encoding_from_bytes(photo_bytes)
-
-            if existing:
-                # Update existing record with encoding
-                existing.face_encoding = encoding_bytes
-                existing.status = NCMECStatus.ACTIVE.value
-                logger.info("Updated encoding for case %s", case_id)
-                return existing
-            else:
-                # Create new record
-                record = NCMECRecord(
-                    case_id=case_id,
-                    name=poster_info["name"],
-                    age_when_missing=poster_info.get("age_when_missing"),
-                    missing_since=_parse_date(poster_info.get("missing_since")),
-                    last_known_location=poster_info.get("last_known_location"),
-                    face_encoding=encoding_bytes,
-                    status=NCMECStatus.ACTIVE.value,
-                )
-                logger.info("Created record for case %s (%s)", case_id, poster_info["name"])
-                return record
+        photo_hash = hashlib.sha256(photo_bytes).hexdigest()
+        if photo_hash == known_hash:
+            return PHOTO_UNCHANGED, photo_hash, None
 
+        try:
+            encoding_bytes = encoder.submit(extract_encoding_from_bytes, photo_bytes).result()
         except NoFaceDetectedError:
             logger.debug("No face in photo for case %s, trying next photo", case_id)
             continue
@@ -251,8 +266,143 @@ def _process_poster(poster_info: Dict) -> Optional[NCMECRecord]:
             logger.warning("Encoding failed for case %s: %s", case_id, e)
             continue
 
+        return PHOTO_ENCODED, photo_hash, encoding_bytes
+
     logger.warning("No usable face photo found for case %s", case_id)
-    return None
+    return PHOTO_FAILED, None, None
+
+
+def _load_existing_records(case_ids: List[str]) -> Dict[str, Dict]:
+    """Load stored poster fields, encoding and photo hash for a page of cases."""
+    if not case_ids:
+        return {}
+
+    rows = db.session.query(
+        NCMECRecord.case_id,
+        NCMECRecord.name,
+        NCMECRecord.age_when_missing,
+        NCMECRecord.missing_since,
+        NCMECRecord.last_known_location,
+        NCMECRecord.face_encoding,
+        NCMECRecord.photo_hash,
+    ).filter(NCMECRecord.case_id.in_(case_ids)).all()
+
+    return {row.case_id: row._asdict() for row in rows}
+
+
+def _record_values(poster_info: Dict, face_encoding: bytes, photo_hash: str) -> Dict:
+    """Build ncmec_records column values for a poster."""
+    missing_since = _parse_date(poster_info.get("missing_since"))
+    if missing_since:
+        missing_since = missing_since.date()
+
+    return {
+        "case_id": poster_info["case_id"],
+        "name": poster_info["name"],
+        "age_when_missing": poster_info.get("age_when_missing"),
+        "missing_since": missing_since,
+        "last_known_location": poster_info.get("last_known_location"),
+        "face_encoding": face_encoding,
+        "photo_hash": photo_hash,
+    }
+
+
+def _upsert_records(values: List[Dict]) -> None:
+    """
+    Insert or update a page of records in one statement keyed by case_id.
+
+    New records are created active. Existing records get the new poster
+    fields, encoding and photo hash; their status is left as is.
+    """
+    if not values:
+        return
+
+    dialect = db.session.get_bind().dialect.name
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            **row,
+            "id": uuid.uuid4(),
+            "status": NCMECStatus.ACTIVE.value,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for row in values
+    ]
+
+    stmt = insert(NCMECRecord.__table__).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["case_id"],
+        set_={
+            column: stmt.excluded[column]
+            for column in (*POSTER_FIELDS, "face_encoding", "photo_hash", "updated_at")
+        },
+    )
+    db.session.execute(stmt)
+
+
+def _sync_poster_page(
+    posters: List[Dict],
+    downloads: Executor,
+    encoder: Executor,
+    stats: Dict,
+) -> None:
+    """
+    Resolve photos for a page of posters and upsert the changed records.
+
+    Args:
+        posters: Raw poster data from one API page.
+        downloads: Thread pool for photo downloads.
+        encoder: Executor running extract_encoding_from_bytes.
+        stats: Sync statistics, updated in place.
+    """
+    poster_infos = {}
+    for poster in posters:
+        poster_info = _extract_poster_info(poster)
+        if not poster_info["case_id"]:
+            stats["photos_failed"] += 1
+            continue
+        poster_infos[poster_info["case_id"]] = poster_info
+
+    existing = _load_existing_records(list(poster_infos))
+
+    pending = {
+        case_id: downloads.submit(
+            _resolve_poster_photo,
+            poster_info,
+            existing.get(case_id, {}).get("photo_hash"),
+            encoder,
+        )
+        for case_id, poster_info in poster_infos.items()
+    }
+
+    values = []
+    for case_id, future in pending.items():
+        outcome, photo_hash, encoding_bytes = future.result()
+        current = existing.get(case_id)
+
+        if outcome == PHOTO_FAILED:
+            stats["photos_failed"] += 1
+            continue
+
+        if outcome == PHOTO_UNCHANGED:
+            row = _record_values(poster_infos[case_id], current["face_encoding"], photo_hash)
+            if all(row[field] == current[field] for field in POSTER_FIELDS):
+                stats["records_unchanged"] += 1
+                continue
+        else:
+            row = _record_values(poster_infos[case_id], encoding_bytes, photo_hash)
+            stats["photos_processed"] += 1
+
+        values.append(row)
+        if current:
+            stats["records_updated"] += 1
+        else:
+            stats["records_created"] += 1
+
+    _upsert_records(values)
 
 
 def _parse_date(date_str: Optional[str]) -> Optional[datetime]:
@@ -299,6 +449,7 @@ def sync_ncmec_posters_task(self, triggered_by: Optional[str] = None) -> Dict:
         "posters_fetched": 0,
         "records_created": 0,
         "records_updated": 0,
+        "records_unchanged": 0,
         "photos_processed": 0,
         "photos_failed": 0,
         "pages_fetched": 0,
@@ -309,53 +460,51 @@ def sync_ncmec_posters_task(self, triggered_by: Optional[str] = None) -> Dict:
         token = _get_api_token()
         logger.info("NCMEC API authentication successful")
 
-        # Paginate through all posters
-        page = 1
-        while page <= MAX_PAGES:
-            try:
-                data = _fetch_posters(token, page)
-            except requests.exceptions.RequestException as e:
-                logger.error("Failed to fetch page %d: %s", page, e)
-                break
-
-            posters = data.get("posters", [])
-            if not posters:
-                logger.info("No more posters at page %d, sync complete", page)
-                break
-
-            stats["pages_fetched"] += 1
-            stats["posters_fetched"] += len(posters)
-
-            for poster in posters:
-                poster_info = _extract_poster_info(poster)
-
-                record = _process_poster(poster_info)
-                if record:
-                    if record.id:
-                        # Existing record updated
-                        stats["records_updated"] += 1
-                    else:
-                        # New record
-                        db.session.add(record)
-                        stats["records_created"] += 1
-                    stats["photos_processed"] += 1
-                else:
-                    stats["photos_failed"] += 1
-
-            # Commit batch
-            db.session.commit()
-            logger.info(
-                "Processed page %d: %d posters (%d new, %d updated)",
-                page, len(posters),
-                stats["records_created"], stats["records_updated"]
-            )
-
-            # Check if there are more pages
-            total_records = data.get("totalRecords", 0)
-            if stats["posters_fetched"] >= total_records:
-                break
+        config = get_config()
+        with create_encoding_pool(config.NCMEC_SYNC_ENCODE_WORKERS) as encoder, \
+                ThreadPoolExecutor(
+                    max_workers=config.NCMEC_SYNC_DOWNLOAD_WORKERS,
+                    thread_name_prefix="ncmec-photo",
+                ) as downloads, \
+                ThreadPoolExecutor(max_workers=1, thread_name_prefix="ncmec-page") as prefetch:
+
+            # Paginate through all posters, fetching the next page while
+            # the current one is processed
+            page = 1
+            next_page = prefetch.submit(_fetch_posters, token, page)
+            while next_page is not None:
+                try:
+                    data = next_page.result()
+                except requests.exceptions.RequestException as e:
+                    logger.error("Failed to fetch page %d: %s", page, e)
+                    break
+
+                posters = data.get("posters", [])
+                if not posters:
+                    logger.info("No more posters at page %d, sync complete", page)
+                    break
+
+                stats["pages_fetched"] += 1
+                stats["posters_fetched"] += len(posters)
+
+                # Check if there are more pages
+                total_records = data.get("totalRecords", 0)
+                next_page = None
+                if stats["posters_fetched"] < total_records and page < MAX_PAGES:
+                    next_page = prefetch.submit(_fetch_posters, token, page + 1)
+
+                _sync_poster_page(posters, downloads, encoder, stats)
+
+                # Commit batch
+                db.session.commit()
+                logger.info(
+                    "Processed page %d: %d posters (%d new, %d updated, %d unchanged)",
+                    page, len(posters),
+                    stats["records_created"], stats["records_updated"],
+                    stats["records_unchanged"]
+                )
 
-            page += 1
+                page += 1
 
         # Trigger FAISS recompilation if new records were added
         if stats["records_created"] > 0 or stats["records_updated"] > 0:
@@ -372,11 +521,12 @@ def sync_ncmec_posters_task(self, triggered_by: Optional[str] = None) -> Dict:
 
         logger.info(
             "NCMEC poster sync completed in %.1fs: "
-            "fetched=%d, created=%d, updated=%d, failed=%d",
+            "fetched=%d, created=%d, updated=%d, unchanged=%d, failed=%d",
             duration,
             stats["posters_fetched"],
             stats["records_created"],
             stats["records_updated"],
+            stats["records_unchanged"],
             stats["photos_failed"],
         )
 
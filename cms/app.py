@@ -72,6 +72,10 @@ def create_app(config_name: Optional[str] = None) -> Flask:
     db.init_app(app)
     migrate.init_app(app, db)
 
+    # Background audit log writer (AUDIT_LOG_ASYNC)
+    from cms.utils.audit import init_audit_writer
+    init_audit_writer(app)
+
     # Initialize security extensions in production
     _init_security(app, config_class)
 
@@ -179,6 +183,39 @@ def _run_migrations(app: Flask) -> None:
     from sqlalchemy import text, inspect
     inspector = inspect(db.engine)
 
+    # Migration: Add file_hash column to content table (backfill with
+    # python -m cms.migrations.add_content_file_hash)
+    if 'content' in inspector.get_table_names():
+        content_columns = [c['name'] for c in inspector.get_columns('content')]
+        if 'file_hash' not in content_columns:
+            try:
+                db.session.execute(text(
+                    'ALTER TABLE content ADD COLUMN file_hash VARCHAR(64)'
+                ))
+                db.session.execute(text(
+                    'CREATE INDEX ix_content_file_hash ON content(file_hash)'
+                ))
+                db.session.commit()
+                app.logger.info('Migration: Added file_hash column to content')
+            except Exception as e:
+                db.session.rollback()
+                app.logger.error(f'Migration: content file_hash failed: {e}')
+
+    # Migration: Add composite and prefix-match indexes to audit_logs
+    # (expression indexes are not reflected, so rely on IF NOT EXISTS)
+    if 'audit_logs' in inspector.get_table_names():
+        from sqlalchemy.schema import CreateIndex
+        from cms.models import AuditLog
+        try:
+            for index in AuditLog.__table__.indexes:
+                db.session.execute(CreateIndex(index, if_not_exists=True))
+            # Replaced by ix_audit_logs_ip_address_lower
+            db.session.execute(text('DROP INDEX IF EXISTS ix_audit_logs_ip_address'))
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            app.logger.error(f'Migration: audit_logs indexes failed: {e}')
+
     if 'playlist_items' not in inspector.get_table_names():
         return
 
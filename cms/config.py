@@ -46,6 +46,23 @@ class Config:
     # Content Catalog Settings
     CONTENT_CATALOG_URL = os.environ.get('CONTENT_CATALOG_URL', 'https://catalog.skillzmedia.com')
 
+    # Audit Log Writer Settings (entries are queued and written in batches)
+    AUDIT_LOG_ASYNC = os.environ.get('CMS_AUDIT_LOG_ASYNC', 'true').lower() == 'true'
+    AUDIT_LOG_QUEUE_SIZE = 10000  # Entries held in memory before spooling to disk
+    AUDIT_LOG_BATCH_SIZE = 200  # Max entries per insert transaction
+    AUDIT_LOG_FLUSH_INTERVAL = 0.5  # Seconds to wait for a batch to fill
+    AUDIT_LOG_SPOOL_PATH = Path(os.environ.get(
+        'CMS_AUDIT_LOG_SPOOL_PATH', BASE_DIR / 'data' / 'audit_spool.jsonl'
+    ))
+    AUDIT_LOG_MAX_REPLAY_ATTEMPTS = 5  # Failed replays before an entry goes to the .dead file
+
+    # Session Validation Settings
+    # Seconds; 0 (default) disables the cache. Hits are re-checked with one
+    # read, which costs about what the cache saves (scripts/benchmark_session_auth.py)
+    SESSION_CACHE_TTL = int(os.environ.get('CMS_SESSION_CACHE_TTL', 0))
+    SESSION_CACHE_SIZE = 1024  # Max validated sessions held per process
+    SESSION_ACTIVITY_UPDATE_INTERVAL = 60  # Min seconds between last_active writes per session
+
     @classmethod
     def init_app(cls, app):
         """Initialize application with this configuration."""
@@ -68,6 +85,9 @@ class TestingConfig(Config):
     TESTING = True
     DATABASE_PATH = Path(Config.BASE_DIR / 'data' / 'cms_test.db')
     SQLALCHEMY_DATABASE_URI = f'sqlite:///{DATABASE_PATH}'
+    AUDIT_LOG_ASYNC = False  # Write audit entries synchronously in tests
+    SESSION_CACHE_TTL = 0  # Validate sessions against the database in tests
+    SESSION_ACTIVITY_UPDATE_INTERVAL = 0  # Record activity on every request
 
 
 class ProductionConfig(Config):
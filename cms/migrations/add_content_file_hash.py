@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Migration: Add file_hash column to content table.
+
+This migration adds a SHA256 content hash to the Content model so hub
+content manifests can carry it. Hubs use the hash to reuse files they
+already hold instead of downloading the same bytes again.
+
+Changes:
+- Adds file_hash column (VARCHAR(64), nullable)
+- Creates index on file_hash
+- Backfills file_hash for existing content whose file is in the uploads folder
+
+Run this script to upgrade an existing database:
+    python -m cms.migrations.add_content_file_hash
+
+Or import and call migrate() from Python:
+    from cms.migrations.add_content_file_hash import migrate
+    migrate()
+"""
+
+import hashlib
+import os
+import sqlite3
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def get_db_path():
+    """Get the SQLite database path."""
+    cms_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(cms_dir, 'data', 'cms.db')
+
+
+def get_uploads_path():
+    """Get the uploads folder path (same default as CMS config)."""
+    cms_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.environ.get('CMS_UPLOAD_PATH', os.path.join(cms_dir, 'uploads'))
+
+
+def column_exists(cursor, table_name, column_name):
+    """Check if a column exists in a table."""
+    cursor.execute(f"PRAGMA table_info({table_name})")
+    columns = cursor.fetchall()
+    return any(col[1] == column_name for col in columns)
+
+
+def index_exists(cursor, index_name):
+    """Check if an index exists in the database."""
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='index' AND name=?
+    """, (index_name,))
+    return cursor.fetchone() is not None
+
+
+def calculate_sha256(file_path):
+    """Calculate the SHA256 hex digest of a file."""
+    sha256_hash = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            sha256_hash.update(chunk)
+    return sha256_hash.hexdigest()
+
+
+def migrate():
+    """Run the migration to add file_hash column to content table."""
+    db_path = get_db_path()
+
+    if not os.path.exists(db_path):
+        print(f"Database not found at {db_path}")
+        print("Database will be created with new schema on app startup.")
+        return True
+
+    print(f"Migrating database: {db_path}")
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        # Check if content table exists
+        cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name='content'
+        """)
+        if not cursor.fetchone():
+            print("  content table does not exist, skipping migration")
+            print("  Table will be created with new schema on app startup.")
+            return True
+
+        # Check if file_hash column already exists
+        if column_exists(cursor, 'content', 'file_hash'):
+            print("  file_hash column already exists in content table")
+        else:
+            print("  Adding file_hash column to content table...")
+            cursor.execute("""
+                ALTER TABLE content
+                ADD COLUMN file_hash VARCHAR(64)
+            """)
+            print("  file_hash column added successfully")
+
+        # Create index if it doesn't exist
+        index_name = 'ix_content_file_hash'
+        if not index_exists(cursor, index_name):
+            print(f"  Creating index {index_name}...")
+            cursor.execute(f"""
+                CREATE INDEX {index_name}
+                ON content(file_hash)
+            """)
+            print(f"  Index {index_name} created successfully")
+        else:
+            print(f"  Index {index_name} already exists")
+
+        # Backfill hashes for files present in the uploads folder
+        uploads_path = get_uploads_path()
+        cursor.execute("SELECT id, filename FROM content WHERE file_hash IS NULL")
+        rows = cursor.fetchall()
+        backfilled = 0
+        for content_id, filename in rows:
+            file_path = os.path.join(uploads_path, filename)
+            if not os.path.isfile(file_path):
+                continue
+            cursor.execute(
+                "UPDATE content SET file_hash = ? WHERE id = ?",
+                (calculate_sha256(file_path), content_id)
+            )
+            backfilled += 1
+        print(f"  Backfilled file_hash for {backfilled} of {len(rows)} content items")
+
+        conn.commit()
+        print("\nMigration completed successfully!")
+        return True
+
+    except Exception as e:
+        conn.rollback()
+        print(f"\nMigration failed: {e}")
+        return False
+
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    success = migrate()
+    sys.exit(0 if success else 1)
@@ -18,6 +18,7 @@ SQLAlchemy models for the Content Management System including:
 - Layer Playlist Assignments (playlist assignments to layers)
 - Device Layouts (device-specific layout configurations)
 - Synced Content (cached content from Content Catalog)
+- Content Sync Watermarks (incremental content sync progress)
 """
 
 from datetime import datetime, timezone
@@ -82,7 +83,7 @@ from cms.models.user_session import UserSession
 from cms.models.user_invitation import UserInvitation
 from cms.models.audit_log import AuditLog
 from cms.models.layout import ScreenLayout, ScreenLayer, LayerContent, LayerPlaylistAssignment, DeviceLayout
-from cms.models.synced_content import SyncedContent
+from cms.models.synced_content import SyncedContent, ContentSyncWatermark
 from cms.models.folder import Folder
 
 __all__ = [
@@ -113,6 +114,7 @@ __all__ = [
     'LayerPlaylistAssignment',
     'DeviceLayout',
     'SyncedContent',
+    'ContentSyncWatermark',
     'Folder',
 ]
 # NCMEC Alert models
@@ -57,6 +57,19 @@ class AuditLog(db.Model):
     session_id = db.Column(db.String(36), nullable=True)
     created_at = db.Column(DateTimeUTC(), default=lambda: datetime.now(timezone.utc), index=True)
 
+    # Composite indexes serve the filtered, newest-first listings and their
+    # (created_at, id) keyset cursor; lower(user_email), lower(action) and
+    # lower(ip_address) back the case-insensitive prefix-match filters
+    __table_args__ = (
+        db.Index('ix_audit_logs_created_at_id', 'created_at', 'id'),
+        db.Index('ix_audit_logs_category_created_at', 'action_category', 'created_at', 'id'),
+        db.Index('ix_audit_logs_user_created_at', 'user_id', 'created_at', 'id'),
+        db.Index('ix_audit_logs_resource_type_created_at', 'resource_type', 'created_at', 'id'),
+        db.Index('ix_audit_logs_user_email_lower', db.func.lower(user_email)),
+        db.Index('ix_audit_logs_action_lower', db.func.lower(action)),
+        db.Index('ix_audit_logs_ip_address_lower', db.func.lower(ip_address)),
+    )
+
     # Relationship to User (optional - user may be deleted)
     user = db.relationship('User', backref=db.backref('audit_logs', lazy='dynamic'))
 
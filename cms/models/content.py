@@ -2,7 +2,7 @@
 Content Model for CMS Service.
 
 Represents uploaded media content with file metadata including:
-- File info: filename, original_name, mime_type, file_size
+- File info: filename, original_name, mime_type, file_size, file_hash
 - Dimensions: width, height (for 16:9 aspect ratio preview)
 - Duration: duration in seconds (for video/audio content)
 - Organization: network_id for content ownership
@@ -43,6 +43,7 @@ class Content(db.Model):
         original_name: Original filename as uploaded by user
         mime_type: MIME type of the file (e.g., video/mp4, image/jpeg)
         file_size: File size in bytes
+        file_hash: SHA256 hash of the file contents (hex)
         width: Content width in pixels (for images/video)
         height: Content height in pixels (for images/video)
         duration: Duration in seconds (for video/audio content)
@@ -58,6 +59,8 @@ class Content(db.Model):
     original_name = db.Column(db.String(500), nullable=False)
     mime_type = db.Column(db.String(100), nullable=False)
     file_size = db.Column(db.Integer, nullable=False)
+    # SHA256 of the stored file; hubs use it to skip files they already hold
+    file_hash = db.Column(db.String(64), nullable=True, index=True)
     width = db.Column(db.Integer, nullable=True)
     height = db.Column(db.Integer, nullable=True)
     duration = db.Column(db.Integer, nullable=True)
@@ -90,6 +93,7 @@ class Content(db.Model):
             'original_name': self.original_name,
             'mime_type': self.mime_type,
             'file_size': self.file_size,
+            'file_hash': self.file_hash,
             'width': self.width,
             'height': self.height,
             'duration': self.duration,
@@ -109,7 +113,9 @@ class Content(db.Model):
         Return data for content manifest endpoint.
 
         This is the data returned in hub content manifests
-        for content distribution to devices.
+        for content distribution to devices. The file_hash lets
+        hubs reuse a file they already hold under another ID
+        instead of downloading it again.
 
         Returns:
             Dictionary with essential content metadata
@@ -119,6 +125,7 @@ class Content(db.Model):
             'filename': self.filename,
             'mime_type': self.mime_type,
             'file_size': self.file_size,
+            'file_hash': self.file_hash,
             'duration': self.duration
         }
 
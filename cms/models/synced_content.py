@@ -279,6 +279,25 @@ class SyncedContent(db.Model):
         """
         return cls.query.filter_by(source_uuid=source_uuid).first()
 
+    @classmethod
+    def get_by_source_uuids(cls, source_uuids):
+        """
+        Get synced content for many Content Catalog UUIDs in one query.
+
+        Args:
+            source_uuids: Iterable of UUIDs from Content Catalog
+
+        Returns:
+            dict: Mapping of source_uuid to SyncedContent for those found
+        """
+        source_uuids = [source_uuid for source_uuid in set(source_uuids) if source_uuid]
+        if not source_uuids:
+            return {}
+        return {
+            synced.source_uuid: synced
+            for synced in cls.query.filter(cls.source_uuid.in_(source_uuids))
+        }
+
     @classmethod
     def get_by_network(cls, network_id):
         """
@@ -342,7 +361,8 @@ class SyncedContent(db.Model):
         return [{'id': r.organization_id, 'name': r.organization_name} for r in results]
 
     @classmethod
-    def upsert_from_catalog(cls, db_session, catalog_data, organization_name=None, content_catalog_url=None):
+    def upsert_from_catalog(cls, db_session, catalog_data, organization_name=None,
+                            content_catalog_url=None, known=None):
         """
         Insert or update synced content from Content Catalog API response.
 
@@ -351,6 +371,9 @@ class SyncedContent(db.Model):
             catalog_data: Dictionary from Content Catalog API (ContentAsset.to_dict())
             organization_name: Cached organization name for display
             content_catalog_url: Base URL of Content Catalog
+            known: Optional dict of source_uuid to already loaded instances.
+                   When given, the database lookup is skipped, UUIDs missing
+                   from it are created, and created instances are added to it.
 
         Returns:
             SyncedContent: The created or updated instance
@@ -360,13 +383,18 @@ class SyncedContent(db.Model):
             raise ValueError("source_uuid (uuid) is required in catalog_data")
 
         # Try to find existing synced content
-        synced = cls.query.filter_by(source_uuid=source_uuid).first()
+        if known is not None:
+            synced = known.get(source_uuid)
+        else:
+            synced = cls.query.filter_by(source_uuid=source_uuid).first()
 
         if synced is None:
             synced = cls(
                 source_uuid=source_uuid
             )
             db_session.add(synced)
+            if known is not None:
+                known[source_uuid] = synced
 
         # Update fields from catalog data
         synced.title = catalog_data.get('title', 'Untitled')
@@ -408,3 +436,78 @@ class SyncedContent(db.Model):
     def __repr__(self):
         """String representation for debugging."""
         return f'<SyncedContent {self.title}>'
+
+
+class ContentSyncWatermark(db.Model):
+    """
+    SQLAlchemy model recording how far content sync has progressed.
+
+    Each sync scope (the network, organization and category filters a sync
+    runs with) keeps the Content Catalog updated_at of the newest asset it
+    has fully synced. The next sync for that scope only asks the Content
+    Catalog for assets updated since then.
+
+    Attributes:
+        scope: Key built from the sync filters
+        updated_since: Content Catalog updated_at of the newest synced asset
+        synced_at: When the watermark was last advanced
+    """
+
+    __tablename__ = 'content_sync_watermarks'
+
+    scope = db.Column(db.String(255), primary_key=True)
+    updated_since = db.Column(DateTimeUTC(), nullable=True)
+    synced_at = db.Column(DateTimeUTC(), default=lambda: datetime.now(timezone.utc))
+
+    @staticmethod
+    def scope_for(network_id=None, organization_id=None, category=None):
+        """
+        Build the scope key for a set of sync filters.
+
+        Returns:
+            str: Scope key, e.g. 'network=abc;organization=;category='
+        """
+        return (
+            f'network={network_id or ""};'
+            f'organization={organization_id or ""};'
+            f'category={category or ""}'
+        )
+
+    @classmethod
+    def get_updated_since(cls, scope):
+        """
+        Get the watermark for a scope.
+
+        Args:
+            scope: Scope key from scope_for()
+
+        Returns:
+            datetime or None if the scope has never synced
+        """
+        watermark = db.session.get(cls, scope)
+        return watermark.updated_since if watermark else None
+
+    @classmethod
+    def advance(cls, db_session, scope, updated_since):
+        """
+        Move a scope's watermark forward (never backward).
+
+        The change is added to the session but not committed, so it lands
+        in the same transaction as the synced content it covers.
+
+        Args:
+            db_session: SQLAlchemy database session
+            scope: Scope key from scope_for()
+            updated_since: Content Catalog updated_at of the newest synced asset
+        """
+        watermark = db_session.get(cls, scope)
+        if watermark is None:
+            watermark = cls(scope=scope)
+            db_session.add(watermark)
+        if watermark.updated_since is None or updated_since > watermark.updated_since:
+            watermark.updated_since = updated_since
+        watermark.synced_at = datetime.now(timezone.utc)
+
+    def __repr__(self):
+        """String representation for debugging."""
+        return f'<ContentSyncWatermark {self.scope} {self.updated_since}>'
@@ -13,14 +13,15 @@ All endpoints are prefixed with /api/v1/audit-logs when registered with the app.
 All endpoints require authentication and admin+ role.
 """
 
-import csv
-import io
+import base64
 from datetime import datetime, timezone, timedelta
 
-from flask import Blueprint, request, jsonify, Response
+from flask import Blueprint, request, jsonify
+from sqlalchemy import and_, literal, tuple_
 
 from cms.models import db, AuditLog, User
 from cms.utils.auth import login_required, get_current_user
+from cms.utils.csv_export import EXPORT_BATCH_SIZE, stream_csv_response
 from cms.utils.permissions import require_role
 
 
@@ -28,6 +29,123 @@ from cms.utils.permissions import require_role
 audit_bp = Blueprint('audit', __name__)
 
 
+# Prefixes matching at most this many rows are range-scanned on their own
+# index and sorted; broader prefixes are left to the newest-first scan,
+# which fills a page sooner than sorting every match
+PREFIX_RANGE_SCAN_LIMIT = 5000
+
+
+def _starts_with(column, prefix):
+    """
+    Build a case-insensitive prefix-match filter that avoids a
+    leading-wildcard scan.
+
+    lower(column) is compared with the lowercased prefix on every path, so
+    the result does not depend on the dialect or on which SQLite plan is
+    picked; the lower() expression indexes on the model back it.
+
+    SQLite only range-scans LIKE on NOCASE columns, so there the prefix is
+    bounded as an explicit half-open range on lower(column) whenever a
+    cheap, capped probe shows it is selective.
+
+    Args:
+        column: Column to match
+        prefix: Required prefix, in any case
+
+    Returns:
+        SQLAlchemy filter expression
+    """
+    expression = db.func.lower(column)
+    prefix = prefix.lower()
+    condition = expression.startswith(prefix, autoescape=True)
+    if db.engine.dialect.name != 'sqlite':
+        return condition
+
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    in_range = and_(expression >= prefix, expression < upper)
+
+    probe = db.session.query(literal(1)).select_from(AuditLog).filter(
+        in_range
+    ).limit(PREFIX_RANGE_SCAN_LIMIT + 1).subquery()
+    matches = db.session.query(db.func.count()).select_from(probe).scalar()
+    if matches > PREFIX_RANGE_SCAN_LIMIT:
+        return condition
+
+    return and_(in_range, condition)
+
+
+def _encode_cursor(log):
+    """Encode the keyset position (created_at, id) of an audit log."""
+    position = f'{log.created_at.isoformat()}|{log.id}'
+    return base64.urlsafe_b64encode(position.encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(cursor):
+    """
+    Decode a cursor produced by _encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    position = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+    created_at, log_id = position.split('|', 1)
+    return datetime.fromisoformat(created_at), log_id
+
+
+def _paginate_audit_logs(query, page, per_page):
+    """
+    Paginate an audit log query newest first.
+
+    When the request has a ``cursor`` parameter (empty for the first page)
+    rows are fetched by keyset on (created_at, id), which costs the same at
+    any depth and skips the total count. Otherwise the page number is used
+    with OFFSET pagination. Both modes return ``next_cursor``.
+
+    Args:
+        query: Filtered AuditLog query
+        page: Page number for OFFSET pagination
+        per_page: Items per page
+
+    Returns:
+        Tuple of (audit logs, pagination dict), or (None, error response)
+        if the cursor is invalid
+    """
+    query = query.order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+
+    if 'cursor' in request.args:
+        cursor = request.args['cursor']
+        if cursor:
+            try:
+                created_at, log_id = _decode_cursor(cursor)
+            except ValueError:
+                return None, (jsonify({'error': 'Invalid cursor'}), 400)
+            query = query.filter(
+                tuple_(AuditLog.created_at, AuditLog.id) < (created_at, log_id)
+            )
+
+        logs = query.limit(per_page + 1).all()
+        has_next = len(logs) > per_page
+        logs = logs[:per_page]
+
+        return logs, {
+            'per_page': per_page,
+            'has_next': has_next,
+            'next_cursor': _encode_cursor(logs[-1]) if has_next else None
+        }
+
+    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+
+    return pagination.items, {
+        'page': pagination.page,
+        'per_page': pagination.per_page,
+        'total': pagination.total,
+        'pages': pagination.pages,
+        'has_next': pagination.has_next,
+        'has_prev': pagination.has_prev,
+        'next_cursor': _encode_cursor(pagination.items[-1]) if pagination.has_next else None
+    }
+
+
 @audit_bp.route('', methods=['GET'])
 @login_required
 @require_role('admin')
@@ -38,15 +156,17 @@ def list_audit_logs():
     Query Parameters:
         page: Page number (default: 1)
         per_page: Items per page (default: 50, max: 100)
-        user_email: Filter by user email (partial match)
+        cursor: Keyset cursor from a previous next_cursor; pass it empty
+                for the first page. Replaces page and omits totals.
+        user_email: Filter by user email (case-insensitive prefix match)
         user_id: Filter by exact user ID
-        action: Filter by action name (partial match)
+        action: Filter by action name (case-insensitive prefix match)
         action_category: Filter by action category
         resource_type: Filter by resource type
         resource_id: Filter by resource ID
         start_date: Filter logs after this date (ISO 8601)
         end_date: Filter logs before this date (ISO 8601)
-        ip_address: Filter by IP address (partial match)
+        ip_address: Filter by IP address (case-insensitive prefix match)
 
     Returns:
         200: Paginated list of audit logs
@@ -58,7 +178,8 @@ def list_audit_logs():
                     "total": 150,
                     "pages": 3,
                     "has_next": true,
-                    "has_prev": false
+                    "has_prev": false,
+                    "next_cursor": "opaque"
                 }
             }
     """
@@ -77,20 +198,20 @@ def list_audit_logs():
     # Build query with filters
     query = AuditLog.query
 
-    # Filter by user email (partial match)
+    # Filter by user email (case-insensitive prefix match)
     user_email = request.args.get('user_email')
     if user_email:
-        query = query.filter(AuditLog.user_email.ilike(f'%{user_email}%'))
+        query = query.filter(_starts_with(AuditLog.user_email, user_email))
 
     # Filter by user ID (exact match)
     user_id = request.args.get('user_id')
     if user_id:
         query = query.filter_by(user_id=user_id)
 
-    # Filter by action (partial match)
+    # Filter by action (case-insensitive prefix match, e.g. "user." or "login.failed")
     action = request.args.get('action')
     if action:
-        query = query.filter(AuditLog.action.ilike(f'%{action}%'))
+        query = query.filter(_starts_with(AuditLog.action, action))
 
     # Filter by action category (exact match)
     action_category = request.args.get('action_category')
@@ -111,10 +232,10 @@ def list_audit_logs():
     if resource_id:
         query = query.filter_by(resource_id=resource_id)
 
-    # Filter by IP address (partial match)
+    # Filter by IP address (case-insensitive prefix match, e.g. "10.0.")
     ip_address = request.args.get('ip_address')
     if ip_address:
-        query = query.filter(AuditLog.ip_address.ilike(f'%{ip_address}%'))
+        query = query.filter(_starts_with(AuditLog.ip_address, ip_address))
 
     # Filter by date range
     start_date = request.args.get('start_date')
@@ -133,22 +254,14 @@ def list_audit_logs():
         except ValueError:
             return jsonify({'error': 'Invalid end_date format. Use ISO 8601.'}), 400
 
-    # Order by created_at descending (newest first)
-    query = query.order_by(AuditLog.created_at.desc())
-
-    # Execute paginated query
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    # Newest first, by page number or keyset cursor
+    audit_logs, pagination = _paginate_audit_logs(query, page, per_page)
+    if audit_logs is None:
+        return pagination
 
     return jsonify({
-        'audit_logs': [log.to_dict() for log in pagination.items],
-        'pagination': {
-            'page': pagination.page,
-            'per_page': pagination.per_page,
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'has_next': pagination.has_next,
-            'has_prev': pagination.has_prev
-        }
+        'audit_logs': [log.to_dict() for log in audit_logs],
+        'pagination': pagination
     }), 200
 
 
@@ -205,7 +318,9 @@ def list_login_history():
     Query Parameters:
         page: Page number (default: 1)
         per_page: Items per page (default: 50, max: 100)
-        user_email: Filter by user email (partial match)
+        cursor: Keyset cursor from a previous next_cursor; pass it empty
+                for the first page. Replaces page and omits totals.
+        user_email: Filter by user email (case-insensitive prefix match)
         start_date: Filter logs after this date (ISO 8601)
         end_date: Filter logs before this date (ISO 8601)
         success_only: If 'true', only show successful logins
@@ -235,7 +350,7 @@ def list_login_history():
     # Filter by user email
     user_email = request.args.get('user_email')
     if user_email:
-        query = query.filter(AuditLog.user_email.ilike(f'%{user_email}%'))
+        query = query.filter(_starts_with(AuditLog.user_email, user_email))
 
     # Filter by success only
     success_only = request.args.get('success_only')
@@ -259,22 +374,14 @@ def list_login_history():
         except ValueError:
             return jsonify({'error': 'Invalid end_date format. Use ISO 8601.'}), 400
 
-    # Order by created_at descending
-    query = query.order_by(AuditLog.created_at.desc())
-
-    # Execute paginated query
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    # Newest first, by page number or keyset cursor
+    logins, pagination = _paginate_audit_logs(query, page, per_page)
+    if logins is None:
+        return pagination
 
     return jsonify({
-        'logins': [log.to_dict() for log in pagination.items],
-        'pagination': {
-            'page': pagination.page,
-            'per_page': pagination.per_page,
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'has_next': pagination.has_next,
-            'has_prev': pagination.has_prev
-        }
+        'logins': [log.to_dict() for log in logins],
+        'pagination': pagination
     }), 200
 
 
@@ -285,11 +392,12 @@ def export_audit_logs():
     """
     Export audit logs as CSV.
 
-    Exports audit logs based on filter criteria. Limited to 10,000 records
-    for performance reasons.
+    Exports audit logs based on filter criteria. The CSV is streamed in
+    batches as it is read from the database, so exports are not capped
+    in size. The body is gzip-encoded when Accept-Encoding allows it.
 
     Query Parameters:
-        user_email: Filter by user email (partial match)
+        user_email: Filter by user email (case-insensitive prefix match)
         action_category: Filter by action category
         resource_type: Filter by resource type
         start_date: Filter logs after this date (ISO 8601)
@@ -305,7 +413,7 @@ def export_audit_logs():
     # Filter by user email
     user_email = request.args.get('user_email')
     if user_email:
-        query = query.filter(AuditLog.user_email.ilike(f'%{user_email}%'))
+        query = query.filter(_starts_with(AuditLog.user_email, user_email))
 
     # Filter by action category
     action_category = request.args.get('action_category')
@@ -338,18 +446,24 @@ def export_audit_logs():
         except ValueError:
             return jsonify({'error': 'Invalid end_date format. Use ISO 8601.'}), 400
 
-    # Order by created_at descending and limit to 10,000 records
-    query = query.order_by(AuditLog.created_at.desc()).limit(10000)
-
-    # Execute query
-    audit_logs = query.all()
-
-    # Create CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Write header
-    writer.writerow([
+    # Stream rows newest first; only the exported columns are loaded
+    rows = query.with_entities(
+        AuditLog.id,
+        AuditLog.created_at,
+        AuditLog.user_email,
+        AuditLog.user_name,
+        AuditLog.user_role,
+        AuditLog.action,
+        AuditLog.action_category,
+        AuditLog.resource_type,
+        AuditLog.resource_id,
+        AuditLog.resource_name,
+        AuditLog.ip_address,
+        AuditLog.user_agent,
+        AuditLog.details
+    ).order_by(AuditLog.created_at.desc(), AuditLog.id.desc()).yield_per(EXPORT_BATCH_SIZE)
+
+    header = [
         'ID',
         'Timestamp',
         'User Email',
@@ -363,38 +477,30 @@ def export_audit_logs():
         'IP Address',
         'User Agent',
         'Details'
-    ])
-
-    # Write data rows
-    for log in audit_logs:
-        writer.writerow([
-            log.id,
-            log.created_at.isoformat() if log.created_at else '',
-            log.user_email,
-            log.user_name or '',
-            log.user_role or '',
-            log.action,
-            log.action_category,
-            log.resource_type or '',
-            log.resource_id or '',
-            log.resource_name or '',
-            log.ip_address or '',
-            log.user_agent or '',
-            log.details or ''
-        ])
-
-    # Prepare response
-    output.seek(0)
+    ]
+
+    def csv_rows():
+        for log in rows:
+            yield [
+                log.id,
+                log.created_at.isoformat() if log.created_at else '',
+                log.user_email,
+                log.user_name or '',
+                log.user_role or '',
+                log.action,
+                log.action_category,
+                log.resource_type or '',
+                log.resource_id or '',
+                log.resource_name or '',
+                log.ip_address or '',
+                log.user_agent or '',
+                log.details or ''
+            ]
+
     timestamp = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
     filename = f'audit_logs_{timestamp}.csv'
 
-    return Response(
-        output.getvalue(),
-        mimetype='text/csv',
-        headers={
-            'Content-Disposition': f'attachment; filename={filename}'
-        }
-    )
+    return stream_csv_response(header, csv_rows(), filename)
 
 
 @audit_bp.route('/summary', methods=['GET'])
@@ -522,6 +628,8 @@ def get_user_activity(user_id):
     Query Parameters:
         page: Page number (default: 1)
         per_page: Items per page (default: 50, max: 100)
+        cursor: Keyset cursor from a previous next_cursor; pass it empty
+                for the first page. Replaces page and omits totals.
         action_category: Filter by action category
         start_date: Filter logs after this date (ISO 8601)
         end_date: Filter logs before this date (ISO 8601)
@@ -585,11 +693,10 @@ def get_user_activity(user_id):
         except ValueError:
             return jsonify({'error': 'Invalid end_date format. Use ISO 8601.'}), 400
 
-    # Order by created_at descending
-    query = query.order_by(AuditLog.created_at.desc())
-
-    # Execute paginated query
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    # Newest first, by page number or keyset cursor
+    activity, pagination = _paginate_audit_logs(query, page, per_page)
+    if activity is None:
+        return pagination
 
     return jsonify({
         'user': {
@@ -597,13 +704,6 @@ def get_user_activity(user_id):
             'email': user.email,
             'name': user.name
         },
-        'activity': [log.to_dict() for log in pagination.items],
-        'pagination': {
-            'page': pagination.page,
-            'per_page': pagination.per_page,
-            'total': pagination.total,
-            'pages': pagination.pages,
-            'has_next': pagination.has_next,
-            'has_prev': pagination.has_prev
-        }
+        'activity': [log.to_dict() for log in activity],
+        'pagination': pagination
     }), 200
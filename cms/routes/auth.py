@@ -23,6 +23,7 @@ from cms.utils.auth import (
     get_client_ip,
     get_user_agent,
     cleanup_expired_sessions,
+    invalidate_session_cache,
 )
 from cms.utils.audit import log_auth_action
 
@@ -262,6 +263,9 @@ def login():
         except Exception:
             db.session.rollback()
 
+        if user.is_locked():
+            invalidate_session_cache(user_id=user.id)
+
         log_auth_action(
             action='login',
             user_email=email,
@@ -369,6 +373,8 @@ def logout():
             'error': f'Failed to logout: {str(e)}'
         }), 500
 
+    invalidate_session_cache(token=session.token)
+
     # Log logout
     log_auth_action(
         action='logout',
@@ -517,6 +523,8 @@ def change_password():
             'error': f'Failed to change password: {str(e)}'
         }), 500
 
+    invalidate_session_cache(user_id=user.id)
+
     # Log successful password change
     log_auth_action(
         action='password_change',
@@ -191,8 +191,9 @@ def upload_content():
             'error': f'Failed to save file: {str(e)}'
         }), 500
 
-    # Get file size
+    # Get file size and content hash
     file_size = os.path.getsize(str(file_path))
+    file_hash = calculate_sha256(str(file_path))
 
     # Get MIME type
     mime_type = get_mime_type(original_filename)
@@ -227,6 +228,7 @@ def upload_content():
         original_name=original_filename,
         mime_type=mime_type,
         file_size=file_size,
+        file_hash=file_hash,
         width=width,
         height=height,
         duration=duration,
@@ -602,14 +604,17 @@ def sync_content():
     """
     Trigger content sync from Content Catalog.
 
-    Fetches all approved/published content from the Content Catalog service
+    Fetches approved/published content from the Content Catalog service
     and caches it locally in the SyncedContent table. This enables the CMS
-    to display content without direct upload capability.
+    to display content without direct upload capability. After the first
+    sync for a set of filters, only content changed since the last sync
+    is fetched.
 
     Query Parameters:
         network_id: Filter sync to specific network (optional)
         organization_id: Filter sync to specific organization (optional)
         category: Filter sync to specific category (optional)
+        full: 'true' to ignore the last sync and fetch all content (optional)
 
     Returns:
         200: Sync completed successfully
@@ -619,6 +624,7 @@ def sync_content():
                 "created_count": 10,
                 "updated_count": 32,
                 "total_in_catalog": 42,
+                "updated_since": "2024-01-14T10:00:00+00:00",
                 "synced_at": "2024-01-15T10:00:00Z",
                 "errors": []
             }
@@ -638,6 +644,7 @@ def sync_content():
     network_id = request.args.get('network_id')
     organization_id = request.args.get('organization_id')
     category = request.args.get('category')
+    full = request.args.get('full', '').lower() in ('1', 'true', 'yes')
 
     # Convert organization_id to int if provided
     if organization_id:
@@ -659,7 +666,8 @@ def sync_content():
         result = sync_service.sync_approved_content(
             network_id=network_id,
             organization_id=organization_id,
-            category=category
+            category=category,
+            full=full
         )
 
         # Include network sync info in response
@@ -1186,6 +1194,7 @@ def checkout_asset(asset_id):
         original_name=asset_title or asset_filename,
         mime_type=mime_type,
         file_size=actual_file_size,
+        file_hash=calculated_hash,
         width=width,
         height=height,
         duration=duration,
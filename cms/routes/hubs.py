@@ -378,7 +378,8 @@ def get_content_manifest(hub_id):
                         "filename": "promo1.mp4",
                         "url": "/api/v1/content/uuid/download",
                         "mime_type": "video/mp4",
-                        "file_size": 52428800
+                        "file_size": 52428800,
+                        "file_hash": "sha256 hex digest"
                     }
                 ]
             }
@@ -550,12 +551,18 @@ def receive_heartbeats(hub_id):
                 {
                     "device_id": "SKZ-H-WM-0001" (required),
                     "status": "active" (optional),
-                    "timestamp": "2024-01-15T10:00:00Z" (optional, defaults to now)
+                    "timestamp": "2024-01-15T10:00:00Z" (optional, defaults to now),
+                    "gap": {...} (optional, informational)
                 },
                 ...
             ]
         }
 
+    Hubs compact heartbeats queued during an outage to the latest one per
+    device; "gap" then summarizes the folded heartbeats (count, first_at,
+    last_at, status_changes). Only the latest timestamp and status are
+    applied to the device.
+
     Returns:
         200: Heartbeats processed successfully
             {
@@ -11,7 +11,12 @@ All endpoints are prefixed with /api/v1/sessions when registered with the app.
 from flask import Blueprint, jsonify
 
 from cms.models import db, UserSession
-from cms.utils.auth import login_required, get_current_user, get_current_session
+from cms.utils.auth import (
+    login_required,
+    get_current_user,
+    get_current_session,
+    invalidate_session_cache,
+)
 from cms.utils.audit import log_action
 
 
@@ -146,6 +151,8 @@ def revoke_session(session_id):
             'error': f'Failed to revoke session: {str(e)}'
         }), 500
 
+    invalidate_session_cache(token=session.token)
+
     return jsonify({
         'message': 'Session revoked successfully',
         'was_current_session': was_current
@@ -204,6 +211,9 @@ def revoke_all_other_sessions():
                 'error': f'Failed to revoke sessions: {str(e)}'
             }), 500
 
+        for session in other_sessions:
+            invalidate_session_cache(token=session.token)
+
     return jsonify({
         'message': f'{revoked_count} session(s) revoked successfully',
         'revoked_count': revoked_count
@@ -25,7 +25,7 @@ from flask import Blueprint, request, jsonify
 
 from cms.models import db, User, UserSession
 from cms.models.user import ROLE_HIERARCHY, USER_STATUSES
-from cms.utils.auth import login_required, get_current_user
+from cms.utils.auth import login_required, get_current_user, invalidate_session_cache
 from cms.utils.permissions import (
     require_role,
     can_manage_user,
@@ -341,6 +341,8 @@ def update_user(user_id):
             'error': f'Failed to update user: {str(e)}'
         }), 500
 
+    invalidate_session_cache(user_id=user.id)
+
     # Log the action
     log_user_management_action(
         action='update',
@@ -405,6 +407,8 @@ def approve_user(user_id):
             'error': f'Failed to approve user: {str(e)}'
         }), 500
 
+    invalidate_session_cache(user_id=user.id)
+
     # Log the action
     log_user_management_action(
         action='approve',
@@ -482,6 +486,8 @@ def reject_user(user_id):
             'error': f'Failed to reject user: {str(e)}'
         }), 500
 
+    invalidate_session_cache(user_id=user.id)
+
     # Log the action
     log_user_management_action(
         action='reject',
@@ -565,6 +571,8 @@ def suspend_user(user_id):
             'error': f'Failed to suspend user: {str(e)}'
         }), 500
 
+    invalidate_session_cache(user_id=user.id)
+
     # Log the action
     log_user_management_action(
         action='suspend',
@@ -636,6 +644,8 @@ def reactivate_user(user_id):
             'error': f'Failed to reactivate user: {str(e)}'
         }), 500
 
+    invalidate_session_cache(user_id=user.id)
+
     # Log the action
     log_user_management_action(
         action='reactivate',
@@ -740,6 +750,8 @@ def deactivate_user(user_id):
             'error': f'Failed to deactivate user: {str(e)}'
         }), 500
 
+    invalidate_session_cache(user_id=user.id)
+
     # Log the action
     log_user_management_action(
         action='deactivate',
@@ -824,6 +836,8 @@ def reset_user_password(user_id):
             'error': f'Failed to reset password: {str(e)}'
         }), 500
 
+    invalidate_session_cache(user_id=user.id)
+
     # Log the action (don't include the password itself)
     log_user_management_action(
         action='reset_password',
@@ -924,6 +938,8 @@ def revoke_all_user_sessions(user_id):
             'error': f'Failed to revoke sessions: {str(e)}'
         }), 500
 
+    invalidate_session_cache(user_id=user.id)
+
     # Log the action
     log_user_management_action(
         action='revoke_all_sessions',
@@ -985,6 +1001,8 @@ def revoke_user_session(user_id, session_id):
             'error': f'Failed to revoke session: {str(e)}'
         }), 500
 
+    invalidate_session_cache(token=session.token)
+
     # Log the action
     log_user_management_action(
         action='revoke_session',
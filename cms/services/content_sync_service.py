@@ -5,6 +5,8 @@ Provides content synchronization from the Content Catalog service including:
 - Fetching approved/published content via REST API
 - Caching content metadata in SyncedContent model
 - Network-based filtering for multi-tenant content isolation
+- Incremental sync from an updated_since watermark per sync scope
+- Parallel, resumable, checksum-verified asset file downloads
 - Handling Content Catalog unavailability gracefully
 
 This service enables the CMS to display content from the Content Catalog
@@ -12,8 +14,11 @@ without requiring direct upload capability. All content management happens
 in the Content Catalog/Partner Portal.
 """
 
+import hashlib
 import os
 import logging
+import uuid as uuid_module
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 
@@ -22,7 +27,7 @@ from requests.exceptions import RequestException, Timeout, ConnectionError
 
 from flask import current_app
 from cms.models import db
-from cms.models.synced_content import SyncedContent
+from cms.models.synced_content import SyncedContent, ContentSyncWatermark
 from cms.models.network import Network
 
 
@@ -40,6 +45,11 @@ class ContentCatalogUnavailableError(ContentSyncError):
     pass
 
 
+class AssetDownloadError(ContentSyncError):
+    """Raised when an asset file cannot be downloaded or fails verification."""
+    pass
+
+
 class ContentSyncService:
     """
     Service class for syncing content from Content Catalog.
@@ -51,6 +61,8 @@ class ContentSyncService:
     The service handles:
     - API communication with Content Catalog
     - Pagination for large content sets
+    - Incremental sync from a per-scope updated_since watermark
+    - Parallel, resumable file downloads verified against the catalog checksum
     - Network filtering for multi-tenant isolation
     - Graceful handling of Content Catalog unavailability
     - Upsert logic to avoid duplicate entries
@@ -69,6 +81,15 @@ class ContentSyncService:
     # Request timeout settings (in seconds)
     REQUEST_TIMEOUT = 30
     CONNECT_TIMEOUT = 10
+    DOWNLOAD_TIMEOUT = 120
+
+    # File download settings
+    DOWNLOAD_WORKERS = int(os.environ.get('CONTENT_SYNC_DOWNLOAD_WORKERS', 4))
+    DOWNLOAD_ATTEMPTS = 3
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+    # Partial downloads are kept here between attempts so they can resume
+    PARTIAL_DIRNAME = '.partial'
 
 
     # ==========================================================================
@@ -245,14 +266,24 @@ class ContentSyncService:
     # ==========================================================================
 
     @classmethod
-    def download_asset_file(cls, asset_id, filename, uploads_path):
+    def download_asset_file(cls, asset_id, filename, uploads_path, expected_hash=None,
+                            expected_size=None, partial_key=None):
         """
         Download an asset file from Content Catalog to local CMS storage.
 
+        The file is written to a partial file first. Interrupted downloads
+        are retried, resuming from the bytes already received with a Range
+        request, and the finished file is checked against the expected
+        SHA256 and size before it is moved into place.
+
         Args:
             asset_id: Integer ID of the asset in Content Catalog
             filename: Original filename to save as
             uploads_path: Path to CMS uploads directory
+            expected_hash: SHA256 hex digest from the catalog (optional)
+            expected_size: File size in bytes from the catalog (optional)
+            partial_key: Stable name for the partial file, so a later sync
+                         can resume it (defaults to the asset ID)
 
         Returns:
             Local file path if successful, None if failed
@@ -261,46 +292,143 @@ class ContentSyncService:
             logger.warning("No asset_id provided for download")
             return None
 
-        download_url = f"{cls.CONTENT_CATALOG_URL}/api/v1/assets/{asset_id}/download"
-        
         try:
-            logger.info(f"Downloading asset {asset_id} from {download_url}")
-            
-            response = requests.get(
-                download_url,
-                stream=True,
-                timeout=(cls.CONNECT_TIMEOUT, 120)
+            return cls._download_verified(
+                asset_id, filename, uploads_path,
+                expected_hash, expected_size, partial_key or str(asset_id)
             )
-            
-            if response.status_code != 200:
-                logger.error(f"Failed to download asset {asset_id}: HTTP {response.status_code}")
-                return None
-            
-            os.makedirs(uploads_path, exist_ok=True)
-            
-            import uuid as uuid_module
-            file_ext = os.path.splitext(filename)[1] if filename else ""
-            unique_filename = f"{uuid_module.uuid4()}{file_ext}"
-            local_path = os.path.join(uploads_path, unique_filename)
-            
-            with open(local_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-            
-            logger.info(f"Downloaded asset {asset_id} to {local_path}")
-            return local_path
-            
-        except Timeout:
-            logger.error(f"Timeout downloading asset {asset_id}")
-            return None
-        except ConnectionError:
-            logger.error(f"Connection error downloading asset {asset_id}")
+        except AssetDownloadError as e:
+            logger.error(str(e))
             return None
         except Exception as e:
             logger.error(f"Error downloading asset {asset_id}: {str(e)}")
             return None
 
+    @classmethod
+    def _download_verified(cls, asset_id, filename, uploads_path, expected_hash,
+                           expected_size, partial_key):
+        """
+        Download, resume and verify one asset file.
+
+        Raises:
+            AssetDownloadError: If every attempt fails or verification fails
+        """
+        download_url = f"{cls.CONTENT_CATALOG_URL}/api/v1/assets/{asset_id}/download"
+        partial_dir = os.path.join(uploads_path, cls.PARTIAL_DIRNAME)
+        partial_path = os.path.join(partial_dir, f"{partial_key}.part")
+        os.makedirs(partial_dir, exist_ok=True)
+
+        error = None
+        for attempt in range(1, cls.DOWNLOAD_ATTEMPTS + 1):
+            try:
+                cls._fetch_to_partial(asset_id, download_url, partial_path)
+            except (Timeout, ConnectionError, RequestException) as e:
+                error = f"{type(e).__name__}: {e}"
+                logger.warning(
+                    f"Download of asset {asset_id} interrupted "
+                    f"(attempt {attempt}/{cls.DOWNLOAD_ATTEMPTS}): {error}"
+                )
+                continue
+
+            problem = cls._verify_file(partial_path, expected_hash, expected_size)
+            if problem is None:
+                file_ext = os.path.splitext(filename)[1] if filename else ""
+                local_path = os.path.join(uploads_path, f"{uuid_module.uuid4()}{file_ext}")
+                os.replace(partial_path, local_path)
+                logger.info(f"Downloaded asset {asset_id} to {local_path}")
+                return local_path
+
+            # Corrupt or mismatched file: start over from the first byte
+            error = problem
+            logger.warning(f"Download of asset {asset_id} failed verification: {problem}")
+            os.remove(partial_path)
+
+        raise AssetDownloadError(f"Failed to download asset {asset_id}: {error}")
+
+    @classmethod
+    def _fetch_to_partial(cls, asset_id, download_url, partial_path):
+        """
+        Stream an asset into its partial file, resuming if bytes exist.
+
+        Raises:
+            AssetDownloadError: If the catalog refuses the download
+            RequestException: If the transfer is interrupted
+        """
+        offset = os.path.getsize(partial_path) if os.path.exists(partial_path) else 0
+        headers = {'Range': f'bytes={offset}-'} if offset else {}
+
+        logger.info(f"Downloading asset {asset_id} from {download_url} at byte {offset}")
+        response = requests.get(
+            download_url,
+            headers=headers,
+            stream=True,
+            timeout=(cls.CONNECT_TIMEOUT, cls.DOWNLOAD_TIMEOUT)
+        )
+
+        try:
+            if response.status_code == 416 and offset:
+                # Nothing left to fetch; the partial file is already complete
+                return
+            if response.status_code == 206 and offset:
+                mode = 'ab'
+            elif response.status_code == 200:
+                mode = 'wb'
+            else:
+                raise AssetDownloadError(
+                    f"Failed to download asset {asset_id}: HTTP {response.status_code}"
+                )
+
+            with open(partial_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=cls.DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+        finally:
+            response.close()
+
+    @classmethod
+    def _verify_file(cls, path, expected_hash, expected_size):
+        """
+        Check a downloaded file against the catalog's size and SHA256.
+
+        Returns:
+            None if the file matches, otherwise a description of the mismatch
+        """
+        size = os.path.getsize(path)
+        if expected_size is not None and size != expected_size:
+            return f"size {size} != expected {expected_size}"
+
+        if expected_hash:
+            sha256_hash = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(cls.DOWNLOAD_CHUNK_SIZE), b''):
+                    sha256_hash.update(chunk)
+            if sha256_hash.hexdigest() != expected_hash:
+                return "SHA256 mismatch"
+
+        return None
+
+    @staticmethod
+    def _expected_hash(asset_data):
+        """
+        Get the SHA256 digest for an asset from catalog data.
+
+        Uses file_hash, or the legacy checksum field when it holds a
+        SHA256 hex digest (optionally prefixed with 'sha256:').
+
+        Returns:
+            Lowercase hex digest or None if unknown
+        """
+        for field in ('file_hash', 'checksum'):
+            value = asset_data.get(field)
+            if not value or not isinstance(value, str):
+                continue
+            value = value.lower()
+            if value.startswith('sha256:'):
+                value = value[len('sha256:'):]
+            if len(value) == 64 and all(c in '0123456789abcdef' for c in value):
+                return value
+        return None
+
     # ==========================================================================
     # Core Sync Operations
     # ==========================================================================
@@ -311,18 +439,29 @@ class ContentSyncService:
         network_id: Optional[str] = None,
         organization_id: Optional[int] = None,
         category: Optional[str] = None,
+        full: bool = False,
     ) -> Dict[str, Any]:
         """
-        Sync all approved content from Content Catalog.
+        Sync approved content from Content Catalog.
+
+        Fetches approved/published content from the Content Catalog API and
+        upserts it into the SyncedContent table. Each set of filters keeps
+        an updated_since watermark, so after the first sync only content
+        changed since the previous sync is fetched.
 
-        Fetches all approved/published content from the Content Catalog API
-        and upserts it into the SyncedContent table. Handles pagination
-        automatically to fetch all matching content.
+        Each page is handled as one batch: existing records are loaded in
+        one query, files for new content are downloaded in parallel, and
+        the batch is committed together with the advanced watermark. If a
+        later page fails, earlier batches stay committed and the next sync
+        resumes from the watermark. New content whose file cannot be
+        downloaded is skipped and reported in errors; the watermark is not
+        advanced past it, so the next sync retries it.
 
         Args:
             network_id: Optional network ID to filter content
             organization_id: Optional organization ID to filter content
             category: Optional category to filter content
+            full: If True, ignore the watermark and fetch all content
 
         Returns:
             Dictionary containing:
@@ -330,94 +469,87 @@ class ContentSyncService:
                 - created_count: Number of new items created
                 - updated_count: Number of existing items updated
                 - total_in_catalog: Total items available in Content Catalog
+                  (items fetched, for incremental syncs)
+                - updated_since: Watermark the sync started from (or None)
                 - synced_at: Timestamp of sync completion
                 - errors: List of any errors encountered
 
         Raises:
             ContentCatalogUnavailableError: If Content Catalog is unreachable
+            ContentSyncError: If the sync fails; batches already committed
+                are kept
         """
-        logger.info("Starting content sync from Content Catalog")
+        scope = ContentSyncWatermark.scope_for(network_id, organization_id, category)
+        updated_since = None if full else ContentSyncWatermark.get_updated_since(scope)
+
+        logger.info(
+            "Starting content sync from Content Catalog"
+            + (f" (changes since {updated_since.isoformat()})" if updated_since else "")
+        )
 
         result = {
             'synced_count': 0,
             'created_count': 0,
             'updated_count': 0,
             'total_in_catalog': 0,
+            'updated_since': updated_since.isoformat() if updated_since else None,
             'synced_at': None,
             'errors': [],
         }
 
-        try:
-            # Fetch all pages of content
-            page = 1
-            total_pages = None
-            all_assets = []
+        uploads_path = str(current_app.config.get('UPLOADS_PATH', './uploads'))
+
+        # Cursor paging is requested; catalogs without it answer with page numbers
+        page = 1
+        cursor = ''
+        fetched = 0
+        requests_made = 0
+        # Set once an asset is skipped, so the watermark stays before it
+        watermark_held = False
 
-            while total_pages is None or page <= total_pages:
+        try:
+            while True:
                 response = cls.fetch_approved_content(
                     network_id=network_id,
                     organization_id=organization_id,
                     category=category,
                     page=page,
                     per_page=cls.DEFAULT_PAGE_SIZE,
+                    updated_since=updated_since,
+                    cursor=cursor,
                 )
 
+                requests_made += 1
                 assets = response.get('assets', [])
-                all_assets.extend(assets)
+                fetched += len(assets)
+                result['total_in_catalog'] = response.get('total', fetched)
 
-                # Update pagination info
-                result['total_in_catalog'] = response.get('total', len(assets))
-                total_pages = response.get('pages', 1)
+                newest, complete = cls._sync_batch(assets, uploads_path, result)
+                watermark_held = watermark_held or not complete
+                if newest and not watermark_held:
+                    ContentSyncWatermark.advance(db.session, scope, newest)
 
-                page += 1
+                try:
+                    db.session.commit()
+                except Exception:
+                    db.session.rollback()
+                    raise
+
+                if 'next_cursor' in response:
+                    cursor = response.get('next_cursor')
+                    if not cursor:
+                        break
+                else:
+                    cursor = None
+                    page += 1
+                    if page > response.get('pages', 1):
+                        break
 
                 # Safety check to prevent infinite loops
-                if page > 1000:
+                if requests_made >= 1000:
                     logger.warning("Exceeded maximum page limit during sync")
                     break
 
-            # Upsert all fetched content
-            uploads_path = str(current_app.config.get('UPLOADS_PATH', './uploads'))
-
-            for asset_data in all_assets:
-                try:
-                    existing = SyncedContent.get_by_source_uuid(asset_data.get('uuid'))
-                    
-                    # Download file for new content (not existing)
-                    local_file_path = None
-                    if not existing:
-                        asset_id = asset_data.get('id')
-                        filename = asset_data.get('filename', 'unknown')
-                        local_file_path = cls.download_asset_file(asset_id, filename, uploads_path)
-                        
-                        if local_file_path:
-                            # Update asset_data with local path
-                            asset_data['file_path'] = local_file_path
-                        else:
-                            logger.warning(f"Could not download file for asset {asset_data.get('uuid')}, using remote path")
-                    
-                    synced = SyncedContent.upsert_from_catalog(
-                        db_session=db.session,
-                        catalog_data=asset_data,
-                        organization_name=asset_data.get('organization_name'),
-                        content_catalog_url=cls.CONTENT_CATALOG_URL,
-                    )
-
-                    if existing:
-                        result['updated_count'] += 1
-                    else:
-                        result['created_count'] += 1
-
-                    result['synced_count'] += 1
-
-                except Exception as e:
-                    error_msg = f"Failed to sync asset {asset_data.get('uuid')}: {str(e)}"
-                    logger.error(error_msg)
-                    result['errors'].append(error_msg)
-
-            # Commit all changes
-            db.session.commit()
-
             result['synced_at'] = datetime.now(timezone.utc).isoformat()
             logger.info(
                 f"Content sync completed: {result['synced_count']} items synced "
@@ -433,6 +565,106 @@ class ContentSyncService:
 
         return result
 
+    @classmethod
+    def _sync_batch(cls, assets, uploads_path, result):
+        """
+        Upsert one page of catalog assets into the session.
+
+        Existing records are loaded in one query and files for new content
+        are downloaded in parallel before any record is written. Nothing is
+        committed here.
+
+        Args:
+            assets: List of catalog asset dictionaries
+            uploads_path: Path to CMS uploads directory
+            result: Sync result dictionary to update
+
+        Returns:
+            Tuple of (newest catalog updated_at among synced assets or None,
+            whether every asset in the batch was synced)
+        """
+        known = SyncedContent.get_by_source_uuids(a.get('uuid') for a in assets)
+
+        # Download files for new content concurrently
+        to_download = [
+            asset_data for asset_data in assets
+            if asset_data.get('uuid') and asset_data.get('uuid') not in known
+            and asset_data.get('id')
+        ]
+        downloads = {}
+        if to_download:
+            workers = max(1, min(cls.DOWNLOAD_WORKERS, len(to_download)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    asset_data['uuid']: executor.submit(
+                        cls.download_asset_file,
+                        asset_data.get('id'),
+                        asset_data.get('filename', 'unknown'),
+                        uploads_path,
+                        expected_hash=cls._expected_hash(asset_data),
+                        expected_size=asset_data.get('file_size'),
+                        partial_key=asset_data['uuid'],
+                    )
+                    for asset_data in to_download
+                }
+                downloads = {source_uuid: future.result() for source_uuid, future in futures.items()}
+
+        newest = None
+        complete = True
+        for asset_data in assets:
+            source_uuid = asset_data.get('uuid')
+            try:
+                existing = source_uuid in known
+
+                if source_uuid in downloads:
+                    local_file_path = downloads[source_uuid]
+                    if not local_file_path:
+                        raise AssetDownloadError("file download failed")
+                    asset_data['file_path'] = local_file_path
+
+                SyncedContent.upsert_from_catalog(
+                    db_session=db.session,
+                    catalog_data=asset_data,
+                    organization_name=asset_data.get('organization_name'),
+                    content_catalog_url=cls.CONTENT_CATALOG_URL,
+                    known=known,
+                )
+
+                if existing:
+                    result['updated_count'] += 1
+                else:
+                    result['created_count'] += 1
+
+                result['synced_count'] += 1
+
+            except Exception as e:
+                error_msg = f"Failed to sync asset {source_uuid}: {str(e)}"
+                logger.error(error_msg)
+                result['errors'].append(error_msg)
+                # Only skipped downloads are worth retrying from the watermark
+                if isinstance(e, AssetDownloadError):
+                    complete = False
+                continue
+
+            updated_at = cls._parse_timestamp(asset_data.get('updated_at'))
+            if updated_at and (newest is None or updated_at > newest):
+                newest = updated_at
+
+        return newest, complete
+
+    @staticmethod
+    def _parse_timestamp(value):
+        """Parse a catalog ISO timestamp as an aware UTC datetime, or None."""
+        if not value or not isinstance(value, str):
+            return None
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed
+
     @classmethod
     def fetch_approved_content(
         cls,
@@ -441,6 +673,8 @@ class ContentSyncService:
         category: Optional[str] = None,
         page: int = 1,
         per_page: int = None,
+        updated_since: Optional[datetime] = None,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Fetch approved content from Content Catalog API.
@@ -454,14 +688,18 @@ class ContentSyncService:
             category: Optional category to filter content
             page: Page number (1-indexed)
             per_page: Items per page (default: 100)
+            updated_since: Only fetch content updated at or after this time
+            cursor: Keyset cursor from a previous next_cursor ('' for the
+                    first page); selects cursor paging instead of page
 
         Returns:
             Dictionary containing:
                 - assets: List of content asset dictionaries
                 - count: Number of items in this page
-                - total: Total number of matching items
-                - page: Current page number
-                - pages: Total number of pages
+                - total: Total number of matching items (page paging)
+                - page: Current page number (page paging)
+                - pages: Total number of pages (page paging)
+                - next_cursor: Cursor for the next page or None (cursor paging)
 
         Raises:
             ContentCatalogUnavailableError: If Content Catalog is unreachable
@@ -485,6 +723,12 @@ class ContentSyncService:
         if category:
             params['category'] = category
 
+        if updated_since:
+            params['updated_since'] = updated_since.isoformat()
+
+        if cursor is not None:
+            params['cursor'] = cursor
+
         # Build URL
         url = f"{cls.CONTENT_CATALOG_URL}{cls.APPROVED_CONTENT_ENDPOINT}"
 
@@ -15,7 +15,8 @@ gi.require_version('Gdk', '3.0')
 gi.require_version('Gst', '1.0')
 gi.require_version('GstVideo', '1.0')
 
-from gi.repository import Gtk, Gdk, GLib, Gst, GstVideo, Pango, GdkPixbuf
+from gi.repository import Gtk, Gdk, GLib, Gst, GstVideo, Pango, PangoCairo, GdkPixbuf
+import cairo
 import json
 import logging
 import os
@@ -77,7 +78,9 @@ class LayerConfig:
 class VideoZone:
     """
     Handles video playback in a layer zone.
-    Uses GStreamer playbin3 for gapless playback.
+    Uses GStreamer playbin3 for gapless playback: the next item is queued
+    in about-to-finish, and a single looping item is repeated with
+    segment seeks so the pipeline never reaches EOS.
     """
 
     def __init__(
@@ -96,6 +99,9 @@ class VideoZone:
         self._items: List[ContentItem] = layer_config.items
         self._current_index = 0
         self._next_uri_queued = False
+        # Single-item zones loop with non-flushing segment seeks
+        self._segment_loop = False
+        self._segment_started = False
 
         # GStreamer
         self._player: Optional[Gst.Element] = None
@@ -167,6 +173,8 @@ class VideoZone:
             self._bus.connect('message::error', self._on_error)
             self._bus.connect('message::eos', self._on_eos)
             self._bus.connect('message::element', self._on_element_message)
+            self._bus.connect('message::async-done', self._on_async_done)
+            self._bus.connect('message::segment-done', self._on_segment_done)
 
     def _on_element_message(self, bus: Gst.Bus, message: Gst.Message) -> None:
         """Handle element messages (for window handle setup)."""
@@ -208,23 +216,35 @@ class VideoZone:
         self._current_index = next_index
         self._next_uri_queued = True
 
+    def _on_async_done(self, bus: Gst.Bus, message: Gst.Message) -> None:
+        """Once prerolled, switch a single looping item into segment playback."""
+        if self._segment_loop and not self._segment_started:
+            self._segment_started = True
+            self._player.seek(
+                1.0, Gst.Format.TIME,
+                Gst.SeekFlags.FLUSH | Gst.SeekFlags.SEGMENT,
+                Gst.SeekType.SET, 0,
+                Gst.SeekType.NONE, -1
+            )
+
+    def _on_segment_done(self, bus: Gst.Bus, message: Gst.Message) -> None:
+        """Loop without EOS: a non-flushing segment seek keeps the last frame up."""
+        self._player.seek_simple(Gst.Format.TIME, Gst.SeekFlags.SEGMENT, 0)
+        if self._on_video_end:
+            self._on_video_end(self)
+
     def _on_eos(self, bus: Gst.Bus, message: Gst.Message) -> None:
-        """Handle end-of-stream for looping."""
-        if not self._next_uri_queued:
-            # Loop current or play next
-            if self._items:
-                self._current_index = (self._current_index + 1) % len(self._items)
-                item = self._items[self._current_index]
-                uri = self._get_content_url(item)
-                logger.info(f"Looping to: {item.filename}")
-                # Seek back to start for seamless loop
-                self._player.seek_simple(
-                    Gst.Format.TIME,
-                    Gst.SeekFlags.FLUSH | Gst.SeekFlags.KEY_UNIT,
-                    0
-                )
-                self._player.set_property('uri', uri)
-                self._player.set_state(Gst.State.PLAYING)
+        """Handle end-of-stream when no next item was queued."""
+        if not self._next_uri_queued and self._items:
+            # Only reached when the next item has the same URI as the
+            # current one; restart from READY rather than flush-seeking a
+            # finished pipeline, which showed black frames
+            self._current_index = (self._current_index + 1) % len(self._items)
+            item = self._items[self._current_index]
+            logger.info(f"Restarting with: {item.filename}")
+            self._player.set_state(Gst.State.READY)
+            self._player.set_property('uri', self._get_content_url(item))
+            self._player.set_state(Gst.State.PLAYING)
 
         if self._on_video_end:
             self._on_video_end(self)
@@ -251,8 +271,11 @@ class VideoZone:
         uri = self._get_content_url(item)
 
         logger.info(f"Playing: {item.filename} in {self.config.name}")
+        self._player.set_state(Gst.State.READY)
         self._player.set_property('uri', uri)
         self._next_uri_queued = False
+        self._segment_loop = len(self._items) == 1
+        self._segment_started = False
 
         ret = self._player.set_state(Gst.State.PLAYING)
         return ret != Gst.StateChangeReturn.FAILURE
@@ -358,26 +381,100 @@ class ImageZone:
 
 
 class TickerZone:
-    """Handles scrolling ticker text in a layer zone."""
+    """
+    Handles scrolling ticker text in a layer zone.
+
+    The text is laid out once per text or font change and rendered to an
+    offscreen surface; each frame only paints that surface at the current
+    offset. Scrolling is driven by the widget's frame clock, so it runs at
+    the display rate and stops while the widget is not mapped.
+    """
+
+    # Cairo image surfaces cannot be wider than this
+    MAX_SURFACE_WIDTH = 32767
 
     def __init__(
         self,
         layer_config: LayerConfig,
         ticker_items: List[str],
         ticker_speed: int = 100,
-        ticker_direction: str = 'left'
+        ticker_direction: str = 'left',
+        ticker_font: str = 'Sans Bold 32'
     ):
         self.config = layer_config
-        self._items = ticker_items or ['Welcome to Skillz Media']
         self._speed = ticker_speed
         self._direction = ticker_direction
 
-        self._text = '    '.join(self._items) + '    '
-        self._offset = 0
-        self._animation_id: Optional[int] = None
+        self._text = ''
+        self._font_desc: Optional[Pango.FontDescription] = None
+        self._offset = 0.0
+        self._drawn_offset: Optional[int] = None
+        self._tick_id: Optional[int] = None
+        self._last_frame_time: Optional[int] = None
+
+        # Rebuilt by _ensure_rendered() after a text or font change
+        self._layout: Optional[Pango.Layout] = None
+        self._surface: Optional[cairo.ImageSurface] = None
+        self._text_width = 0
+        self._text_height = 0
 
         self.widget: Optional[Gtk.DrawingArea] = None
 
+        self.set_items(ticker_items)
+        self.set_font(ticker_font)
+
+    def set_items(self, items: List[str]) -> None:
+        """Replace the ticker text."""
+        text = '    '.join(items or ['Welcome to Skillz Media']) + '    '
+        if text != self._text:
+            self._text = text
+            self._invalidate()
+
+    def set_font(self, font: str) -> None:
+        """Replace the ticker font (Pango font description string)."""
+        self._font_desc = Pango.FontDescription.from_string(font)
+        self._invalidate()
+
+    @property
+    def text_width(self) -> int:
+        """Pixel width of the laid-out ticker text."""
+        self._ensure_rendered()
+        return self._text_width
+
+    def _invalidate(self) -> None:
+        """Drop the cached layout and surface."""
+        self._layout = None
+        self._surface = None
+        self._drawn_offset = None
+        if self.widget:
+            self.widget.queue_draw()
+
+    def _ensure_rendered(self) -> None:
+        """Lay out the text and render it offscreen if the cache is empty."""
+        if self._layout is not None:
+            return
+
+        if self.widget:
+            layout = self.widget.create_pango_layout(self._text)
+        else:
+            scratch = cairo.Context(cairo.ImageSurface(cairo.FORMAT_ARGB32, 1, 1))
+            layout = PangoCairo.create_layout(scratch)
+            layout.set_text(self._text, -1)
+        layout.set_font_description(self._font_desc)
+        self._layout = layout
+        self._text_width, self._text_height = layout.get_pixel_size()
+
+        # Very long tickers fall back to drawing the cached layout directly
+        self._surface = None
+        if 0 < self._text_width <= self.MAX_SURFACE_WIDTH and self._text_height > 0:
+            surface = cairo.ImageSurface(
+                cairo.FORMAT_ARGB32, self._text_width, self._text_height
+            )
+            cr = cairo.Context(surface)
+            cr.set_source_rgb(1, 1, 1)
+            PangoCairo.show_layout(cr, layout)
+            self._surface = surface
+
     def create_widget(self) -> Gtk.DrawingArea:
         """Create the GTK widget for ticker display."""
         self.widget = Gtk.DrawingArea()
@@ -394,73 +491,81 @@ class TickerZone:
             css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
 
+        # Lay out again with the widget's Pango context
+        self._invalidate()
         return self.widget
 
     def _on_draw(self, widget: Gtk.DrawingArea, cr) -> bool:
         """Draw the ticker text."""
-        # Set text color (white)
-        cr.set_source_rgb(1, 1, 1)
-
-        # Create Pango layout
-        layout = widget.create_pango_layout(self._text)
-        font_desc = Pango.FontDescription.from_string("Sans Bold 32")
-        layout.set_font_description(font_desc)
-
-        # Get text dimensions
-        text_width, text_height = layout.get_pixel_size()
+        self.render(cr)
+        return True
 
-        # Calculate position
-        y = (self.config.height - text_height) // 2
+    def render(self, cr) -> None:
+        """Paint the ticker at the current offset onto a cairo context."""
+        self._ensure_rendered()
 
+        offset = int(self._offset)
+        y = (self.config.height - self._text_height) // 2
         if self._direction == 'left':
-            x = self.config.width - self._offset
+            x = self.config.width - offset
         elif self._direction == 'right':
-            x = self._offset - text_width
+            x = offset - self._text_width
         else:
             x = 0
 
-        cr.move_to(x, y)
-        PangoCairo = __import__('gi.repository.PangoCairo', fromlist=['PangoCairo']).PangoCairo
-        PangoCairo.show_layout(cr, layout)
-
-        return True
-
-    def _animate(self) -> bool:
-        """Animate the ticker."""
-        if not self.widget:
+        if self._surface is not None:
+            cr.set_source_surface(self._surface, x, y)
+            cr.rectangle(0, y, self.config.width, self._text_height)
+            cr.fill()
+        else:
+            cr.set_source_rgb(1, 1, 1)
+            cr.move_to(x, y)
+            PangoCairo.show_layout(cr, self._layout)
+        self._drawn_offset = offset
+
+    def advance(self, seconds: float) -> bool:
+        """
+        Scroll the ticker by ``seconds`` worth of movement.
+
+        Args:
+            seconds: Time since the previous frame
+
+        Returns:
+            True if the visible position changed and needs redrawing
+        """
+        if self._direction not in ('left', 'right'):
             return False
 
-        layout = self.widget.create_pango_layout(self._text)
-        font_desc = Pango.FontDescription.from_string("Sans Bold 32")
-        layout.set_font_description(font_desc)
-        text_width, _ = layout.get_pixel_size()
+        self._offset += self._speed * seconds
+        if self._offset > self.text_width + self.config.width:
+            self._offset = 0.0
+        return int(self._offset) != self._drawn_offset
 
-        if self._direction == 'left':
-            self._offset += self._speed // 30
-            if self._offset > text_width + self.config.width:
-                self._offset = 0
-        elif self._direction == 'right':
-            self._offset += self._speed // 30
-            if self._offset > text_width + self.config.width:
-                self._offset = 0
-
-        self.widget.queue_draw()
-        return True
+    def _on_tick(self, widget: Gtk.DrawingArea, frame_clock: Gdk.FrameClock) -> bool:
+        """Frame clock callback: scroll by the time since the last frame."""
+        now = frame_clock.get_frame_time()  # microseconds
+        if self._last_frame_time is not None:
+            if self.advance((now - self._last_frame_time) / 1_000_000):
+                widget.queue_draw()
+        self._last_frame_time = now
+        return GLib.SOURCE_CONTINUE
 
     def play(self) -> None:
         """Start ticker animation."""
-        if not self._animation_id:
-            self._animation_id = GLib.timeout_add(33, self._animate)  # ~30 FPS
+        if self.widget and not self._tick_id:
+            self._last_frame_time = None
+            self._tick_id = self.widget.add_tick_callback(self._on_tick)
 
     def stop(self) -> None:
         """Stop ticker animation."""
-        if self._animation_id:
-            GLib.source_remove(self._animation_id)
-            self._animation_id = None
+        if self._tick_id:
+            self.widget.remove_tick_callback(self._tick_id)
+            self._tick_id = None
 
     def cleanup(self) -> None:
         """Clean up resources."""
         self.stop()
+        self._invalidate()
 
 
 class LayoutRenderer:
@@ -617,7 +722,8 @@ class LayoutRenderer:
                 layer,
                 ticker_items=config.get('items', ['Welcome to Skillz Media']),
                 ticker_speed=config.get('speed', 100),
-                ticker_direction=config.get('direction', 'left')
+                ticker_direction=config.get('direction', 'left'),
+                ticker_font=config.get('font', 'Sans Bold 32')
             )
             widget = zone.create_widget()
             self._ticker_zones[layer.id] = zone
@@ -14,7 +14,11 @@ endpoint validation including success cases, error handling,
 and permission enforcement.
 """
 
+import gc
+import gzip
 import json
+import os
+
 import pytest
 from datetime import datetime, timezone, timedelta
 
@@ -129,6 +133,69 @@ class TestListAuditLogsAPI:
         data = response.get_json()
         assert data['pagination']['per_page'] == 100
 
+    def test_list_audit_logs_cursor_pagination(
+        self, client, app, db_session, sample_super_admin
+    ):
+        """GET /audit-logs?cursor= should walk every log once, newest first."""
+        session = create_test_session(db_session, sample_super_admin.id)
+        _create_multiple_audit_logs(db_session, sample_super_admin, count=12)
+        headers = _get_auth_headers(session)
+
+        response = client.get('/api/v1/audit-logs?per_page=100', headers=headers)
+        expected_ids = [log['id'] for log in response.get_json()['audit_logs']]
+
+        seen_ids = []
+        cursor = ''
+        while True:
+            response = client.get(
+                f'/api/v1/audit-logs?per_page=5&cursor={cursor}',
+                headers=headers
+            )
+            assert response.status_code == 200
+            data = response.get_json()
+            assert 'total' not in data['pagination']
+            seen_ids.extend(log['id'] for log in data['audit_logs'])
+            if not data['pagination']['has_next']:
+                assert data['pagination']['next_cursor'] is None
+                break
+            cursor = data['pagination']['next_cursor']
+
+        assert len(expected_ids) >= 12
+        assert seen_ids == expected_ids
+
+    def test_list_audit_logs_page_mode_returns_next_cursor(
+        self, client, app, db_session, sample_super_admin
+    ):
+        """GET /audit-logs?page=1 should return a cursor for the next page."""
+        session = create_test_session(db_session, sample_super_admin.id)
+        _create_multiple_audit_logs(db_session, sample_super_admin, count=6)
+        headers = _get_auth_headers(session)
+
+        first = client.get('/api/v1/audit-logs?per_page=3', headers=headers).get_json()
+        cursor = first['pagination']['next_cursor']
+        by_cursor = client.get(
+            f'/api/v1/audit-logs?per_page=3&cursor={cursor}', headers=headers
+        ).get_json()
+        by_page = client.get(
+            '/api/v1/audit-logs?per_page=3&page=2', headers=headers
+        ).get_json()
+
+        assert [log['id'] for log in by_cursor['audit_logs']] == \
+            [log['id'] for log in by_page['audit_logs']]
+
+    def test_list_audit_logs_invalid_cursor(
+        self, client, app, db_session, sample_super_admin
+    ):
+        """GET /audit-logs?cursor=invalid should return 400."""
+        session = create_test_session(db_session, sample_super_admin.id)
+
+        response = client.get(
+            '/api/v1/audit-logs?cursor=not-a-cursor',
+            headers=_get_auth_headers(session)
+        )
+
+        assert response.status_code == 400
+
     # -------------------------------------------------------------------------
     # Filter Tests
     # -------------------------------------------------------------------------
@@ -158,6 +225,61 @@ class TestListAuditLogsAPI:
         for log in data['audit_logs']:
             assert sample_admin.email in log['user_email']
 
+    def test_list_audit_logs_filter_by_user_email_prefix(
+        self, client, app, db_session, sample_super_admin
+    ):
+        """GET /audit-logs?user_email=X should match email prefixes case-insensitively."""
+        session = create_test_session(db_session, sample_super_admin.id)
+
+        for email in ('Susan.Croom@example.com', 'susanna@example.com', 'bob.susan@example.com'):
+            create_test_audit_log(
+                db_session,
+                user_id=None,
+                user_email=email,
+                action='user.test',
+                action_category='users'
+            )
+
+        response = client.get(
+            '/api/v1/audit-logs?user_email=SUSAN',
+            headers=_get_auth_headers(session)
+        )
+
+        assert response.status_code == 200
+        emails = {log['user_email'] for log in response.get_json()['audit_logs']}
+        assert emails == {'Susan.Croom@example.com', 'susanna@example.com'}
+
+    @pytest.mark.parametrize('scan_limit', [5000, 0], ids=['range-scan', 'like-fallback'])
+    @pytest.mark.parametrize('param,term,values,expected', [
+        ('user_email', 'sUsAn', ['Susan.Croom@example.com', 'SUSANNA@example.com', 'bob.susan@example.com'],
+         {'Susan.Croom@example.com', 'SUSANNA@example.com'}),
+        ('action', 'USER.', ['User.Create', 'user.delete', 'device.user.sync'],
+         {'User.Create', 'user.delete'}),
+        ('ip_address', 'fe80:', ['FE80::1', 'fe80::2', '10.0.0.1'],
+         {'FE80::1', 'fe80::2'}),
+    ])
+    def test_list_audit_logs_prefix_filters_ignore_case(
+        self, client, app, db_session, sample_super_admin, monkeypatch,
+        scan_limit, param, term, values, expected
+    ):
+        """Prefix filters should ignore case on both the range-scan and LIKE paths."""
+        monkeypatch.setattr('cms.routes.audit.PREFIX_RANGE_SCAN_LIMIT', scan_limit)
+        session = create_test_session(db_session, sample_super_admin.id)
+
+        for value in values:
+            fields = {'user_email': 'system', 'action': 'user.test', 'ip_address': None}
+            fields[param] = value
+            create_test_audit_log(db_session, user_id=None, action_category='users', **fields)
+
+        response = client.get(
+            f'/api/v1/audit-logs?{param}={term}',
+            headers=_get_auth_headers(session)
+        )
+
+        assert response.status_code == 200
+        matched = {log[param] for log in response.get_json()['audit_logs']}
+        assert matched == expected
+
     def test_list_audit_logs_filter_by_user_id(
         self, client, app, db_session, sample_super_admin, sample_admin
     ):
@@ -776,6 +898,132 @@ class TestExportAuditLogsAPI:
 
         assert response.status_code == 403
 
+    def test_export_audit_logs_gzip(
+        self, client, app, db_session, sample_super_admin
+    ):
+        """GET /audit-logs/export should gzip the CSV when the client accepts it."""
+        session = create_test_session(db_session, sample_super_admin.id)
+
+        create_test_audit_log(
+            db_session,
+            user_id=sample_super_admin.id,
+            user_email=sample_super_admin.email,
+            action='login.success',
+            action_category='auth'
+        )
+
+        headers = _get_auth_headers(session)
+        headers['Accept-Encoding'] = 'gzip'
+        response = client.get('/api/v1/audit-logs/export', headers=headers)
+
+        assert response.status_code == 200
+        assert response.headers['Content-Encoding'] == 'gzip'
+        csv_content = gzip.decompress(response.data).decode('utf-8')
+        assert csv_content.startswith('ID,Timestamp,User Email')
+        assert 'login.success' in csv_content
+
+
+# =============================================================================
+# Audit Export Streaming Tests
+# =============================================================================
+
+def _rss_bytes():
+    """Return the resident set size of this process in bytes."""
+    with open('/proc/self/statm') as statm:
+        resident_pages = int(statm.read().split()[1])
+    return resident_pages * os.sysconf('SC_PAGE_SIZE')
+
+
+def _insert_bulk_audit_logs(db_session, row_count, batch_size=20_000):
+    """Insert row_count minimal audit logs straight into the table."""
+    start = datetime(2024, 1, 1)
+    table = AuditLog.__table__
+    for offset in range(0, row_count, batch_size):
+        db_session.execute(table.insert(), [
+            {
+                'id': f'{n:036d}',
+                'user_email': 'bulk@example.com',
+                'action': 'content.view',
+                'action_category': 'content',
+                'created_at': start + timedelta(seconds=n),
+            }
+            for n in range(offset, min(offset + batch_size, row_count))
+        ])
+    db_session.commit()
+
+
+class TestExportAuditLogsStreaming:
+    """Streaming tests for GET /api/v1/audit-logs/export."""
+
+    ROW_COUNT = 1_000_000
+    RSS_CEILING = 64 * 1024 * 1024
+
+    def test_export_streams_in_chunks(
+        self, client, app, db_session, sample_super_admin
+    ):
+        """The export body should arrive as several chunks holding every row."""
+        session = create_test_session(db_session, sample_super_admin.id)
+        # About 3 MB of CSV, several EXPORT_CHUNK_SIZE chunks
+        row_count = 5_000
+        _insert_bulk_audit_logs(db_session, row_count)
+
+        response = client.get(
+            '/api/v1/audit-logs/export',
+            headers=_get_auth_headers(session),
+            buffered=False
+        )
+        assert response.status_code == 200
+        assert response.is_streamed
+
+        chunks = list(response.response)
+        response.close()
+
+        assert len(chunks) > 1
+        assert chunks[0].startswith(b'ID,Timestamp,User Email')
+        assert sum(chunk.count(b'\n') for chunk in chunks) == row_count + 1
+
+    @pytest.mark.skipif(
+        not os.environ.get('RUN_SLOW_TESTS'),
+        reason='Inserts 1M rows; set RUN_SLOW_TESTS=1 to run'
+    )
+    @pytest.mark.skipif(
+        not os.path.exists('/proc/self/statm'),
+        reason='RSS measurement requires /proc'
+    )
+    def test_export_one_million_rows_under_rss_ceiling(
+        self, client, app, db_session, sample_super_admin
+    ):
+        """Exporting 1M rows should stream with bounded memory growth."""
+        session = create_test_session(db_session, sample_super_admin.id)
+        headers = _get_auth_headers(session)
+
+        _insert_bulk_audit_logs(db_session, self.ROW_COUNT)
+        gc.collect()
+
+        response = client.get(
+            '/api/v1/audit-logs/export', headers=headers, buffered=False
+        )
+        assert response.status_code == 200
+
+        baseline_rss = _rss_bytes()
+        peak_rss = baseline_rss
+        lines = 0
+        for chunk in response.response:
+            lines += chunk.count(b'\n')
+            peak_rss = max(peak_rss, _rss_bytes())
+        response.close()
+
+        # Header row plus every audit log (the session fixture adds none)
+        assert lines == self.ROW_COUNT + 1
+        assert peak_rss - baseline_rss < self.RSS_CEILING
+
+    def test_csv_export_copies_match(self):
+        """The CMS and Content Catalog copies of csv_export must not drift."""
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        with open(os.path.join(root, 'cms', 'utils', 'csv_export.py')) as cms_copy:
+            with open(os.path.join(root, 'content_catalog', 'utils', 'csv_export.py')) as catalog_copy:
+                assert cms_copy.read() == catalog_copy.read()
+
 
 # =============================================================================
 # Audit Summary API Tests (GET /api/v1/audit-logs/summary)
@@ -0,0 +1,234 @@
+"""
+Integration tests for the CMS background audit log writer.
+
+Tests AuditLogWriter and its use by log_action():
+- Queued entries are written in batches by the background thread
+- Security-critical categories and failed auth attempts stay synchronous
+- Entries that do not fit in the queue are spooled to disk
+- Spooled entries are replayed into the database
+- Writers in several processes can share one spool safely
+- Entries that keep failing are moved to a dead-letter file
+"""
+
+import json
+import subprocess
+import sys
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from cms.models import AuditLog
+from cms.utils.audit import (
+    AuditLogWriter,
+    log_action,
+    log_auth_action,
+    log_user_management_action,
+)
+
+
+@pytest.fixture
+def spool_path(tmp_path):
+    """Path of the writer's spool file."""
+    return tmp_path / 'audit_spool.jsonl'
+
+
+@pytest.fixture
+def audit_writer(app, spool_path):
+    """Attach a background AuditLogWriter to the test app."""
+    writer = AuditLogWriter(app, batch_size=10, flush_interval=0.05, spool_path=spool_path)
+    app.extensions['audit_log_writer'] = writer
+    yield writer
+    app.extensions.pop('audit_log_writer', None)
+
+
+def _entry(n):
+    """Build queued AuditLog column values."""
+    return {
+        'id': f'spooled-{n}',
+        'user_id': None,
+        'user_email': 'system',
+        'user_name': None,
+        'user_role': None,
+        'action': 'device.sync_requested',
+        'action_category': 'devices',
+        'resource_type': 'device',
+        'resource_id': None,
+        'resource_name': None,
+        'details': None,
+        'ip_address': None,
+        'user_agent': None,
+        'session_id': None,
+        'created_at': datetime.now(timezone.utc),
+    }
+
+
+class TestAuditLogWriter:
+    """Tests for queued audit logging through AuditLogWriter."""
+
+    def test_log_action_is_queued_and_written(self, app, db_session, audit_writer):
+        """log_action() should return immediately and the writer should persist the entry."""
+        entry = log_action(
+            action='device.sync_requested',
+            action_category='devices',
+            user_email='system',
+        )
+
+        assert entry.id is not None
+        db_session.expunge_all()
+
+        audit_writer.flush()
+
+        stored = db_session.get(AuditLog, entry.id)
+        assert stored is not None
+        assert stored.action == 'device.sync_requested'
+        assert stored.created_at is not None
+
+    def test_many_entries_written_in_batches(self, app, db_session, audit_writer):
+        """All queued entries should be written when more than one batch is queued."""
+        for i in range(35):
+            log_action(
+                action=f'playlist.update_{i}',
+                action_category='playlists',
+                user_email='system',
+            )
+
+        audit_writer.flush()
+
+        assert AuditLog.query.filter(AuditLog.action.like('playlist.update_%')).count() == 35
+
+    def test_sync_categories_committed_immediately(self, app, db_session, audit_writer):
+        """User management entries should be committed before log_action returns."""
+        entry = log_user_management_action(
+            action='suspend',
+            target_user_id='user-1',
+            target_user_email='user@example.com',
+        )
+
+        assert db_session.get(AuditLog, entry.id) is not None
+
+    def test_failed_auth_committed_immediately(self, app, db_session, audit_writer):
+        """Failed authentication attempts should be committed synchronously."""
+        entry = log_auth_action(action='login', user_email='user@example.com', success=False)
+
+        assert db_session.get(AuditLog, entry.id) is not None
+
+    def test_explicit_sync_overrides_category(self, app, db_session, audit_writer):
+        """sync=True should bypass the queue for any category."""
+        entry = log_action(
+            action='device.reboot',
+            action_category='devices',
+            user_email='system',
+            sync=True,
+        )
+
+        assert db_session.get(AuditLog, entry.id) is not None
+
+    def test_full_queue_spools_to_disk(self, app, db_session, spool_path):
+        """Entries that do not fit in the queue should be appended to the spool file."""
+        writer = AuditLogWriter(app, max_queue_size=1, spool_path=spool_path)
+        writer._ensure_started = lambda: None  # Keep the queue from draining
+
+        writer.enqueue(_entry(1))
+        writer.enqueue(_entry(2))
+
+        lines = spool_path.read_text().splitlines()
+        assert [json.loads(line)['id'] for line in lines] == ['spooled-2']
+
+    def test_spool_replayed_into_database(self, app, db_session, audit_writer, spool_path):
+        """Spooled entries should be written when the writer runs."""
+        audit_writer._spool([_entry(1), _entry(2)])
+
+        log_action(action='device.update', action_category='devices', user_email='system')
+        audit_writer.flush()
+
+        assert db_session.get(AuditLog, 'spooled-1') is not None
+        assert db_session.get(AuditLog, 'spooled-2') is not None
+        assert not spool_path.exists()
+
+    def test_failed_write_spools_batch(self, app, db_session, spool_path):
+        """A batch that cannot be inserted should be kept in the spool file."""
+        writer = AuditLogWriter(app, spool_path=spool_path)
+        bad = _entry(1)
+        bad['action'] = None  # Violates NOT NULL
+
+        assert writer._write([bad]) is False
+        assert json.loads(spool_path.read_text())['id'] == 'spooled-1'
+
+
+class TestAuditSpoolReplay:
+    """Tests for replaying a spool shared between writers."""
+
+    def test_two_writers_share_spool(self, app, db_session, spool_path):
+        """A replay in one writer should not lose entries spooled and replayed by another."""
+        first = AuditLogWriter(app, spool_path=spool_path)
+        second = AuditLogWriter(app, spool_path=spool_path)
+        first._spool([_entry(1), _entry(2)])
+
+        inserting = threading.Event()
+        release = threading.Event()
+        insert = first._insert
+
+        def slow_insert(batch):
+            inserting.set()
+            release.wait(5)
+            return insert(batch)
+
+        first._insert = slow_insert
+        replay = threading.Thread(target=first._replay_spool)
+        replay.start()
+        try:
+            assert inserting.wait(5)
+            # While the first writer is replaying, the second spools and replays its own
+            second._spool([_entry(3), _entry(4)])
+            second._replay_spool()
+        finally:
+            release.set()
+            replay.join(5)
+
+        for n in range(1, 5):
+            assert db_session.get(AuditLog, f'spooled-{n}') is not None
+        assert list(spool_path.parent.glob(spool_path.name + '*')) == [
+            spool_path.with_name(spool_path.name + '.lock')
+        ]
+
+    def test_replay_file_of_dead_process_is_claimed(self, app, db_session, spool_path):
+        """Replay files left by a process that died mid-replay should be replayed."""
+        child = subprocess.run([sys.executable, '-c', 'import os; print(os.getpid())'],
+                               capture_output=True, text=True, check=True)
+        orphan = spool_path.with_name(f'{spool_path.name}.replay.{child.stdout.strip()}.deadbeef')
+        orphan.write_text(json.dumps(_entry(1), default=str) + '\n')
+
+        AuditLogWriter(app, spool_path=spool_path)._replay_spool()
+
+        assert db_session.get(AuditLog, 'spooled-1') is not None
+        assert not orphan.exists()
+
+    def test_failing_entry_moved_to_dead_letter_file(self, app, db_session, spool_path):
+        """An entry the database keeps rejecting should stop being replayed."""
+        writer = AuditLogWriter(app, spool_path=spool_path, max_replay_attempts=2)
+        bad = _entry(1)
+        bad['action'] = None  # Violates NOT NULL
+        writer._spool([bad, _entry(2)])
+
+        writer._replay_spool()
+        assert db_session.get(AuditLog, 'spooled-2') is not None
+        assert json.loads(spool_path.read_text())['_replay_attempts'] == 1
+
+        writer._replay_spool()
+        dead_path = spool_path.with_name(spool_path.name + '.dead')
+        assert not spool_path.exists()
+        dead = json.loads(dead_path.read_text())
+        assert dead['id'] == 'spooled-1' and dead['_replay_attempts'] == 2
+
+    def test_unavailable_database_does_not_count_attempts(self, app, db_session, spool_path):
+        """Entries replayed while the database is down should keep their attempt count."""
+        writer = AuditLogWriter(app, spool_path=spool_path, max_replay_attempts=1)
+        writer._spool([_entry(1)])
+        writer._insert = lambda batch: False
+        writer._database_available = lambda: False
+
+        writer._replay_spool()
+
+        assert '_replay_attempts' not in json.loads(spool_path.read_text())
+        assert not spool_path.with_name(spool_path.name + '.dead').exists()
@@ -7,6 +7,8 @@ Tests all authentication API routes:
 - GET /api/v1/auth/me - Get current user info
 - PUT /api/v1/auth/password - Change own password
 
+Also covers the session validation cache and throttled activity updates.
+
 Each test class covers a specific operation with comprehensive
 endpoint validation including success cases and error handling.
 """
@@ -14,6 +16,8 @@ endpoint validation including success cases and error handling.
 import pytest
 from datetime import datetime, timedelta, timezone
 
+from sqlalchemy import delete, event, update
+
 from cms.models import db, User, UserSession
 from cms.tests.conftest import create_test_user, create_test_session
 
@@ -769,3 +773,174 @@ class TestChangePasswordAPI:
         data = response.get_json()
         assert data['error'] == 'Invalid or expired session'
         assert data['code'] == 'invalid_session'
+
+
+# =============================================================================
+# Session Validation Cache Tests
+# =============================================================================
+
+@pytest.fixture
+def session_cache(app):
+    """Enable the session validation cache and activity throttling."""
+    app.config['SESSION_CACHE_TTL'] = 30
+    app.config['SESSION_ACTIVITY_UPDATE_INTERVAL'] = 60
+    yield
+    app.extensions.pop('session_cache', None)
+
+
+@pytest.fixture
+def session_queries(app, db_session):
+    """Record SQL statements that touch the user_sessions or users tables."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if 'user_sessions' in statement or 'FROM users' in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    yield statements
+    event.remove(db.engine, 'before_cursor_execute', record)
+
+
+class TestSessionValidationCache:
+    """Tests for cached session validation and throttled last_active writes."""
+
+    def test_cached_session_costs_one_read(self, client, app, sample_admin, sample_user_session,
+                                           session_cache, session_queries):
+        """A cache hit should only re-check the session and user with one SELECT."""
+        headers = {'Authorization': f'Bearer {sample_user_session.token}'}
+
+        assert client.get('/api/v1/auth/me', headers=headers).status_code == 200
+        session_queries.clear()
+
+        response = client.get('/api/v1/auth/me', headers=headers)
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['user']['email'] == 'admin@test.com'
+        assert data['session']['id'] == sample_user_session.id
+        assert len(session_queries) == 1
+        assert session_queries[0].startswith('SELECT')
+
+    def test_session_deleted_by_other_worker_rejected(self, client, app, sample_admin,
+                                                      sample_user_session, db_session,
+                                                      session_cache):
+        """A logout handled by another process should reject the cached token."""
+        headers = {'Authorization': f'Bearer {sample_user_session.token}'}
+        assert client.get('/api/v1/auth/me', headers=headers).status_code == 200
+
+        # Another worker deletes the session; this process's cache is untouched
+        db_session.execute(delete(UserSession).where(UserSession.id == sample_user_session.id))
+        db_session.commit()
+
+        assert client.get('/api/v1/auth/me', headers=headers).status_code == 401
+
+    def test_lock_by_other_worker_rejected(self, client, app, sample_admin, sample_user_session,
+                                           db_session, session_cache):
+        """An account locked by another process should reject the cached token."""
+        headers = {'Authorization': f'Bearer {sample_user_session.token}'}
+        assert client.get('/api/v1/auth/me', headers=headers).status_code == 200
+
+        db_session.execute(
+            update(User).where(User.id == sample_admin.id)
+            .values(locked_until=datetime.now(timezone.utc) + timedelta(minutes=15))
+        )
+        db_session.commit()
+
+        assert client.get('/api/v1/auth/me', headers=headers).status_code == 401
+
+    def test_role_change_by_other_worker_applies(self, client, app, sample_admin,
+                                                 sample_user_session, db_session, session_cache):
+        """A role demotion made by another process should apply to the next request."""
+        headers = {'Authorization': f'Bearer {sample_user_session.token}'}
+        assert client.get('/api/v1/auth/me', headers=headers).get_json()['user']['role'] == 'admin'
+
+        db_session.execute(update(User).where(User.id == sample_admin.id).values(role='viewer'))
+        db_session.commit()
+
+        response = client.get('/api/v1/auth/me', headers=headers)
+        assert response.status_code == 200
+        assert response.get_json()['user']['role'] == 'viewer'
+
+    def test_last_active_written_once_per_interval(self, client, app, sample_admin, db_session,
+                                                   session_cache, session_queries):
+        """last_active should not be rewritten within the update interval."""
+        session = create_test_session(db_session, sample_admin.id)
+        session.last_active = datetime.now(timezone.utc) - timedelta(minutes=5)
+        db_session.commit()
+        headers = {'Authorization': f'Bearer {session.token}'}
+        session_queries.clear()
+
+        for _ in range(3):
+            assert client.get('/api/v1/auth/me', headers=headers).status_code == 200
+
+        updates = [s for s in session_queries if s.startswith('UPDATE user_sessions')]
+        assert len(updates) == 1
+
+        db_session.expire_all()
+        refreshed = db_session.get(UserSession, session.id)
+        assert datetime.now(timezone.utc) - refreshed.last_active < timedelta(minutes=1)
+
+    def test_logout_invalidates_cached_session(self, client, app, sample_admin, sample_user_session,
+                                               session_cache):
+        """A cached token should be rejected after logout."""
+        headers = {'Authorization': f'Bearer {sample_user_session.token}'}
+        assert client.get('/api/v1/auth/me', headers=headers).status_code == 200
+
+        assert client.post('/api/v1/auth/logout', headers=headers).status_code == 200
+
+        assert client.get('/api/v1/auth/me', headers=headers).status_code == 401
+
+    def test_lockout_invalidates_cached_session(self, client, app, sample_admin, sample_user_session,
+                                                db_session, session_cache):
+        """A cached token should be rejected once the account is locked."""
+        headers = {'Authorization': f'Bearer {sample_user_session.token}'}
+        assert client.get('/api/v1/auth/me', headers=headers).status_code == 200
+
+        sample_admin.failed_login_attempts = 4
+        db_session.commit()
+        response = client.post('/api/v1/auth/login', json={
+            'email': 'admin@test.com',
+            'password': 'WrongPassword123!'
+        })
+        assert response.status_code == 423
+
+        assert client.get('/api/v1/auth/me', headers=headers).status_code == 401
+
+    def test_password_change_refreshes_cached_user(self, client, app,
+                                                   sample_user_with_must_change_password,
+                                                   db_session, session_cache):
+        """Changing password should drop the cached copy of the user."""
+        session = create_test_session(db_session, sample_user_with_must_change_password.id)
+        headers = {'Authorization': f'Bearer {session.token}'}
+        assert client.get('/api/v1/auth/me', headers=headers).status_code == 200
+
+        response = client.put('/api/v1/auth/password', headers=headers, json={
+            'current_password': 'TempPassword123!',
+            'new_password': 'NewSecurePass456@'
+        })
+        assert response.status_code == 200
+
+        # The old password must no longer be accepted from a stale cached user
+        response = client.put('/api/v1/auth/password', headers=headers, json={
+            'current_password': 'TempPassword123!',
+            'new_password': 'OtherSecurePass789#'
+        })
+        assert response.status_code == 401
+        assert response.get_json()['code'] == 'invalid_password'
+
+    def test_session_revoke_invalidates_cached_session(self, client, app, sample_admin,
+                                                       sample_user_session, db_session,
+                                                       session_cache):
+        """Revoking another session should reject its cached token."""
+        other = create_test_session(db_session, sample_admin.id)
+        other_headers = {'Authorization': f'Bearer {other.token}'}
+        assert client.get('/api/v1/auth/me', headers=other_headers).status_code == 200
+
+        response = client.delete(
+            f'/api/v1/sessions/{other.id}',
+            headers={'Authorization': f'Bearer {sample_user_session.token}'}
+        )
+        assert response.status_code == 200
+
+        assert client.get('/api/v1/auth/me', headers=other_headers).status_code == 401
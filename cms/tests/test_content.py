@@ -54,6 +54,26 @@ class TestContentUploadAPI:
         assert 'filename' in result
         assert 'created_at' in result
 
+    def test_upload_content_records_file_hash(self, client, app, sample_admin):
+        """POST /content/upload should store the SHA256 of the uploaded file."""
+        import hashlib
+
+        with client.session_transaction() as session:
+            session['_user_id'] = str(sample_admin.id)
+
+        data = {
+            'file': (io.BytesIO(b'test video content'), 'test_video.mp4')
+        }
+        response = client.post(
+            '/api/v1/content/upload',
+            data=data,
+            content_type='multipart/form-data'
+        )
+
+        assert response.status_code == 201
+        result = response.get_json()
+        assert result['file_hash'] == hashlib.sha256(b'test video content').hexdigest()
+
     def test_upload_content_via_post_route(self, client, app):
         """POST /content should also accept file uploads."""
         data = {
@@ -4,6 +4,7 @@ Unit tests for ContentSyncService.
 Tests all content sync operations:
 - fetch_approved_content - API calls to Content Catalog
 - sync_approved_content - Full sync workflow
+- sync_approved_content - Incremental sync against a local Content Catalog stand-in
 - get_synced_content - Local cache query with filtering
 - get_content_by_uuid - Single item retrieval
 - get_organizations - Organization list retrieval
@@ -16,14 +17,19 @@ Each test class covers a specific operation with comprehensive
 endpoint validation including success cases and error handling.
 """
 
+import hashlib
 import json
+import socket
+import threading
 from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch, MagicMock
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 
 from cms.models import db
-from cms.models.synced_content import SyncedContent
+from cms.models.synced_content import SyncedContent, ContentSyncWatermark
 from cms.services.content_sync_service import (
     ContentSyncService,
     ContentSyncError,
@@ -500,6 +506,242 @@ class TestSyncApprovedContent:
             assert len(result['errors']) == 1
 
 
+# =============================================================================
+# Incremental Sync Tests (local Content Catalog stand-in)
+# =============================================================================
+
+class CatalogStandIn:
+    """
+    Minimal Content Catalog serving approved content and asset downloads.
+
+    Implements the updated_since/cursor contract of
+    GET /api/v1/approvals/content/approved and Range requests on
+    GET /api/v1/assets/<id>/download, and records every request.
+    """
+
+    def __init__(self):
+        self.assets = []
+        self.files = {}
+        self.requests = []
+        self.interrupt = set()
+        self.fail_cursors = set()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def add_asset(self, asset_id, content, updated_at, **fields):
+        """Add an approved asset with file content."""
+        asset = {
+            'id': asset_id,
+            'uuid': f'uuid-{asset_id}',
+            'title': f'Asset {asset_id}',
+            'filename': f'asset_{asset_id}.mp4',
+            'file_size': len(content),
+            'file_hash': hashlib.sha256(content).hexdigest(),
+            'format': 'mp4',
+            'status': 'approved',
+            'networks': json.dumps(['network-1']),
+            'updated_at': updated_at,
+        }
+        asset.update(fields)
+        self.assets = [a for a in self.assets if a['id'] != asset_id] + [asset]
+        self.files[asset_id] = content
+        return asset
+
+    def downloads(self):
+        """Return (asset_id, Range header) for each download request."""
+        return [
+            (int(path.split('/')[4]), headers.get('Range'))
+            for path, params, headers in self.requests if path.endswith('/download')
+        ]
+
+    def listings(self):
+        """Return the query parameters of each approved content request."""
+        return [params for path, params, headers in self.requests if path.endswith('/approved')]
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = {k: v[0] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+                stand_in.requests.append((url.path, params, dict(self.headers)))
+                if url.path.endswith('/approved'):
+                    self._approved(params)
+                else:
+                    self._download(int(url.path.split('/')[4]))
+
+            def _approved(self, params):
+                cursor = params.get('cursor') or '0'
+                if cursor in stand_in.fail_cursors:
+                    self.send_error(500)
+                    return
+                since = params.get('updated_since')
+                assets = sorted(
+                    (a for a in stand_in.assets
+                     if not since or datetime.fromisoformat(a['updated_at']).replace(tzinfo=timezone.utc)
+                     >= datetime.fromisoformat(since)),
+                    key=lambda a: (a['updated_at'], a['id'])
+                )
+                start, per_page = int(cursor), int(params.get('per_page', 100))
+                page = assets[start:start + per_page]
+                more = start + per_page < len(assets)
+                self._json({
+                    'assets': page,
+                    'count': len(page),
+                    'per_page': per_page,
+                    'has_next': more,
+                    'next_cursor': str(start + per_page) if more else None,
+                })
+
+            def _download(self, asset_id):
+                content = stand_in.files[asset_id]
+                offset = 0
+                if self.headers.get('Range'):
+                    offset = int(self.headers['Range'].split('=')[1].rstrip('-'))
+                    self.send_response(206)
+                else:
+                    self.send_response(200)
+                body = content[offset:]
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if asset_id in stand_in.interrupt:
+                    # Drop the connection halfway through, once
+                    stand_in.interrupt.discard(asset_id)
+                    self.wfile.write(body[:len(body) // 2])
+                    self.wfile.flush()
+                    self.close_connection = True
+                    self.connection.shutdown(socket.SHUT_RDWR)
+                    return
+                self.wfile.write(body)
+
+            def _json(self, data):
+                body = json.dumps(data).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+@pytest.fixture
+def catalog(monkeypatch):
+    """Run a local Content Catalog stand-in for the sync service."""
+    stand_in = CatalogStandIn()
+    monkeypatch.setattr(ContentSyncService, 'CONTENT_CATALOG_URL', stand_in.url)
+    yield stand_in
+    stand_in.close()
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+class TestIncrementalSync:
+    """Tests for watermark-driven sync against a Content Catalog stand-in."""
+
+    def test_first_sync_downloads_verified_files(self, app, db_session, catalog):
+        """The first sync should fetch everything and verify each file."""
+        for asset_id in (1, 2, 3):
+            catalog.add_asset(asset_id, bytes([asset_id]) * 5000, f'2026-01-0{asset_id}T10:00:00')
+
+        result = ContentSyncService.sync_approved_content()
+
+        assert result['created_count'] == 3
+        assert result['updated_since'] is None
+        assert result['errors'] == []
+        assert sorted(asset_id for asset_id, _ in catalog.downloads()) == [1, 2, 3]
+        for asset_id in (1, 2, 3):
+            synced = SyncedContent.get_by_source_uuid(f'uuid-{asset_id}')
+            assert _read(synced.file_path) == bytes([asset_id]) * 5000
+
+        scope = ContentSyncWatermark.scope_for()
+        assert ContentSyncWatermark.get_updated_since(scope) == datetime(2026, 1, 3, 10, tzinfo=timezone.utc)
+
+    def test_next_sync_fetches_only_changes(self, app, db_session, catalog):
+        """A later sync should ask for changes since the watermark only."""
+        catalog.add_asset(1, b'first', '2026-01-01T10:00:00')
+        catalog.add_asset(2, b'second', '2026-01-02T10:00:00')
+        ContentSyncService.sync_approved_content()
+
+        catalog.add_asset(1, b'first', '2026-01-05T10:00:00', title='Renamed')
+        catalog.add_asset(3, b'third', '2026-01-06T10:00:00')
+        catalog.requests.clear()
+
+        result = ContentSyncService.sync_approved_content()
+
+        assert catalog.listings()[0]['updated_since'] == '2026-01-02T10:00:00+00:00'
+        assert result['updated_count'] == 2  # asset 1 and the boundary asset 2
+        assert result['created_count'] == 1
+        assert catalog.downloads() == [(3, None)]
+        assert SyncedContent.get_by_source_uuid('uuid-1').title == 'Renamed'
+
+    def test_full_sync_ignores_watermark(self, app, db_session, catalog):
+        """full=True should fetch all content again."""
+        catalog.add_asset(1, b'first', '2026-01-01T10:00:00')
+        ContentSyncService.sync_approved_content()
+        catalog.requests.clear()
+
+        ContentSyncService.sync_approved_content(full=True)
+
+        assert 'updated_since' not in catalog.listings()[0]
+
+    def test_interrupted_download_resumes(self, app, db_session, catalog):
+        """A dropped transfer should resume with a Range request."""
+        content = bytes(range(256)) * 2000
+        catalog.add_asset(1, content, '2026-01-01T10:00:00')
+        catalog.interrupt.add(1)
+
+        result = ContentSyncService.sync_approved_content()
+
+        assert result['created_count'] == 1
+        downloads = catalog.downloads()
+        assert downloads[0] == (1, None)
+        assert downloads[-1][1].startswith('bytes=') and downloads[-1][1] != 'bytes=0-'
+        assert _read(SyncedContent.get_by_source_uuid('uuid-1').file_path) == content
+
+    def test_checksum_mismatch_skips_asset_and_holds_watermark(self, app, db_session, catalog):
+        """A file failing verification should be skipped and retried next sync."""
+        catalog.add_asset(1, b'good', '2026-01-01T10:00:00')
+        catalog.add_asset(2, b'corrupt', '2026-01-02T10:00:00', file_hash='0' * 64)
+        catalog.add_asset(3, b'later', '2026-01-03T10:00:00')
+
+        result = ContentSyncService.sync_approved_content()
+
+        assert result['created_count'] == 2
+        assert len(result['errors']) == 1
+        assert SyncedContent.get_by_source_uuid('uuid-2') is None
+        assert ContentSyncWatermark.get_updated_since(ContentSyncWatermark.scope_for()) is None
+
+    def test_failed_page_keeps_committed_batches(self, app, db_session, catalog, monkeypatch):
+        """Batches committed before a failure should survive it."""
+        monkeypatch.setattr(ContentSyncService, 'DEFAULT_PAGE_SIZE', 2)
+        for asset_id in (1, 2, 3):
+            catalog.add_asset(asset_id, b'data', f'2026-01-0{asset_id}T10:00:00')
+        catalog.fail_cursors.add('2')
+
+        with pytest.raises(ContentSyncError):
+            ContentSyncService.sync_approved_content()
+
+        assert SyncedContent.get_by_source_uuid('uuid-1') is not None
+        assert SyncedContent.get_by_source_uuid('uuid-2') is not None
+        assert SyncedContent.get_by_source_uuid('uuid-3') is None
+        scope = ContentSyncWatermark.scope_for()
+        assert ContentSyncWatermark.get_updated_since(scope) == datetime(2026, 1, 2, 10, tzinfo=timezone.utc)
+
+
 # =============================================================================
 # Get Synced Content Tests
 # =============================================================================
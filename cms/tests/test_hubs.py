@@ -506,6 +506,25 @@ class TestHubContentManifestAPI:
         # Verify only hub's network content is included
         assert data['content'][0]['id'] == network_content.id
 
+    def test_get_manifest_includes_file_hash(self, client, app, db_session, sample_hub, sample_network):
+        """GET /hubs/<hub_id>/content-manifest items should carry the file hash."""
+        content = Content(
+            filename='hashed_abc.mp4',
+            original_name='hashed.mp4',
+            mime_type='video/mp4',
+            file_size=5000000,
+            file_hash='ab' * 32,
+            network_id=sample_network.id
+        )
+        db_session.add(content)
+        db_session.commit()
+
+        response = client.get(f'/api/v1/hubs/{sample_hub.id}/content-manifest')
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['content'][0]['file_hash'] == 'ab' * 32
+
     def test_get_manifest_not_found(self, client, app):
         """GET /hubs/<hub_id>/content-manifest should return 404 for non-existent hub."""
         response = client.get('/api/v1/hubs/non-existent-hub-id/content-manifest')
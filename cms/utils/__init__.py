@@ -4,10 +4,11 @@ CMS Utility Functions.
 This package contains utility functions and decorators used across the CMS:
 - auth: Authentication decorators and session validation
 - permissions: Role-based permission checking
-- audit: Audit logging helpers
+- audit: Audit logging helpers and the batched background writer
+- csv_export: Streaming CSV download responses
 """
 
-from cms.utils.auth import login_required, get_current_user
+from cms.utils.auth import login_required, get_current_user, invalidate_session_cache
 from cms.utils.permissions import (
     has_permission,
     require_role,
@@ -24,12 +25,16 @@ from cms.utils.audit import (
     log_user_management_action,
     log_resource_action,
     ACTION_CATEGORIES,
+    AuditLogWriter,
+    get_audit_writer,
 )
+from cms.utils.csv_export import stream_csv_response
 
 __all__ = [
     # Auth
     'login_required',
     'get_current_user',
+    'invalidate_session_cache',
     # Permissions
     'has_permission',
     'require_role',
@@ -45,4 +50,8 @@ __all__ = [
     'log_user_management_action',
     'log_resource_action',
     'ACTION_CATEGORIES',
+    'AuditLogWriter',
+    'get_audit_writer',
+    # CSV export
+    'stream_csv_response',
 ]
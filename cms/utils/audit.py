@@ -9,6 +9,8 @@ Features:
 - Automatic capture of user, session, IP, and user agent information
 - JSON serialization for action details
 - Support for both authenticated and system-level actions
+- AuditLogWriter background sink that writes entries in batches, with a
+  bounded queue and an on-disk spool file as the durable fallback
 
 Usage:
     from cms.utils.audit import log_action, ACTION_CATEGORIES
@@ -32,18 +34,357 @@ Usage:
     )
 """
 
+import atexit
+import fcntl
 import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Optional, Any
 
-from flask import has_request_context
+from flask import current_app, has_app_context, has_request_context
 
 from cms.models import db, AuditLog
 from cms.utils.auth import get_current_user, get_current_session, get_client_ip, get_user_agent
 
 
+logger = logging.getLogger(__name__)
+
 # Re-export action categories from the AuditLog model for convenience
 ACTION_CATEGORIES = AuditLog.VALID_CATEGORIES
 
+# Categories whose entries are always committed before log_action returns
+# (account, role and permission changes)
+SYNC_ACTION_CATEGORIES = ('users',)
+
+
+class AuditLogWriter:
+    """
+    Background sink that writes queued audit log entries in batches.
+
+    log_action() hands entries to enqueue() instead of committing them in
+    the request. A daemon thread collects up to batch_size entries, waiting
+    at most flush_interval seconds after the first, and inserts them in one
+    transaction. Entries that cannot be queued (queue full) or written
+    (database error) are appended to a JSON-lines spool file, which is
+    replayed into the database when the writer starts and after later
+    successful writes.
+
+    The spool may be shared by several worker processes: appends and the
+    hand-off of the spool to a replaying process happen under an flock on
+    a sibling ``.lock`` file, and each replay works on its own
+    ``.replay.<pid>.<token>`` file (files left by dead processes are picked
+    up by the next replay). An entry that still cannot be inserted
+    after max_replay_attempts replays is moved to a ``.dead`` file.
+
+    The thread is started lazily on first use, and restarted in a forked
+    worker process, so the writer can be created before a pre-fork server
+    forks.
+    """
+
+    def __init__(self, app, max_queue_size=10000, batch_size=200,
+                 flush_interval=0.5, spool_path=None, max_replay_attempts=5):
+        """
+        Create a writer bound to a Flask application.
+
+        Args:
+            app: Flask application whose database receives the entries
+            max_queue_size: Entries held in memory before spooling to disk
+            batch_size: Maximum entries inserted per transaction
+            flush_interval: Seconds to wait for a batch to fill
+            spool_path: JSON-lines file for entries that could not be written
+            max_replay_attempts: Failed replays before an entry is dead-lettered
+        """
+        self._app = app
+        self._max_queue_size = max_queue_size
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._spool_path = Path(spool_path) if spool_path else None
+        self._max_replay_attempts = max_replay_attempts
+        self._spool_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._thread = None
+        self._pid = None
+
+    def enqueue(self, values: dict) -> None:
+        """
+        Queue an entry for the background writer.
+
+        Args:
+            values: AuditLog column values, including id and created_at
+        """
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(values)
+        except queue.Full:
+            self._spool([values])
+
+    def flush(self) -> None:
+        """Block until every entry queued so far has been written or spooled."""
+        self._ensure_started()
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write out entries still queued; registered to run at exit."""
+        if self._pid != os.getpid():
+            return
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._write(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _ensure_started(self) -> None:
+        """Start the writer thread in this process if it is not running."""
+        if self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid() and self._thread.is_alive():
+                return
+            if self._pid is not None and self._pid != os.getpid():
+                # Forked: the parent's queue and its locks are not usable here
+                self._queue = queue.Queue(maxsize=self._max_queue_size)
+            if self._pid is None:
+                atexit.register(self.close)
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run, name='audit-log-writer', daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Writer thread main loop."""
+        self._replay_spool()
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._flush_interval
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            if self._write(batch):
+                self._replay_spool()
+            for _ in batch:
+                self._queue.task_done()
+
+    def _write(self, batch: list) -> bool:
+        """
+        Insert a batch of entries in one transaction, spooling on failure.
+
+        Returns:
+            True if the batch was written to the database
+        """
+        if self._insert(batch):
+            return True
+        self._spool(batch)
+        return False
+
+    def _insert(self, batch: list) -> bool:
+        """
+        Insert a batch of entries in one transaction.
+
+        Returns:
+            True if the batch was written to the database
+        """
+        with self._app.app_context():
+            try:
+                db.session.execute(AuditLog.__table__.insert(), batch)
+                db.session.commit()
+                return True
+            except Exception:
+                db.session.rollback()
+                logger.exception('Audit log batch write failed (%d entries)', len(batch))
+                return False
+            finally:
+                db.session.remove()
+
+    def _database_available(self) -> bool:
+        """Check whether the database accepts queries at all."""
+        with self._app.app_context():
+            try:
+                db.session.execute(db.text('SELECT 1'))
+                return True
+            except Exception:
+                return False
+            finally:
+                db.session.remove()
+
+    @contextmanager
+    def _spool_locked(self):
+        """Hold the spool lock against other threads and other processes."""
+        with self._spool_lock:
+            self._spool_path.parent.mkdir(parents=True, exist_ok=True)
+            lock_path = self._spool_path.with_name(self._spool_path.name + '.lock')
+            with open(lock_path, 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _spool(self, entries: list, path: Optional[Path] = None) -> None:
+        """Append entries to the spool file (or ``path``) and sync it to disk."""
+        if not entries:
+            return
+        if self._spool_path is None:
+            logger.error('Audit log spool not configured, dropping %d entries', len(entries))
+            return
+
+        lines = ''.join(
+            json.dumps(entry, default=_json_serializer) + '\n' for entry in entries
+        )
+        try:
+            with self._spool_locked():
+                with open(path or self._spool_path, 'a', encoding='utf-8') as spool:
+                    spool.write(lines)
+                    spool.flush()
+                    os.fsync(spool.fileno())
+        except OSError:
+            logger.exception('Audit log spool write failed, dropping %d entries', len(entries))
+
+    def _claim_spool(self) -> list:
+        """
+        Take the spool, and replay files left by dead processes, for replay.
+
+        Returns:
+            Replay files now owned by this process
+        """
+        if self._spool_path is None:
+            return []
+
+        pattern = self._spool_path.name + '.replay.*'
+        with self._spool_locked():
+            claimed = [
+                path for path in self._spool_path.parent.glob(pattern)
+                if not _process_alive(_replay_owner(path))
+            ]
+            if self._spool_path.exists():
+                replay_path = self._spool_path.with_name(
+                    f'{self._spool_path.name}.replay.{os.getpid()}.{uuid.uuid4().hex[:8]}'
+                )
+                os.replace(self._spool_path, replay_path)
+                claimed.append(replay_path)
+        return claimed
+
+    def _replay_spool(self) -> None:
+        """Move spooled entries into the database."""
+        for replay_path in self._claim_spool():
+            self._replay_file(replay_path)
+
+    def _replay_file(self, replay_path: Path) -> None:
+        """Insert the entries of one replay file, respooling those that fail."""
+        entries = []
+        with open(replay_path, encoding='utf-8') as replay:
+            for line in replay:
+                if line.strip():
+                    entry = json.loads(line)
+                    entry['created_at'] = datetime.fromisoformat(entry['created_at'])
+                    entries.append(entry)
+
+        written = 0
+        failed = []
+        for start in range(0, len(entries), self._batch_size):
+            batch = entries[start:start + self._batch_size]
+            if self._insert([_without_attempts(entry) for entry in batch]):
+                written += len(batch)
+                continue
+            if not self._database_available():
+                # Nothing to blame on the entries; keep the rest for later
+                self._spool(entries[start:])
+                break
+            # Isolate the entries the database rejects
+            for entry in batch:
+                if self._insert([_without_attempts(entry)]):
+                    written += 1
+                else:
+                    failed.append(entry)
+
+        retry, dead = [], []
+        for entry in failed:
+            entry['_replay_attempts'] = entry.get('_replay_attempts', 0) + 1
+            if entry['_replay_attempts'] >= self._max_replay_attempts:
+                dead.append(entry)
+            else:
+                retry.append(entry)
+        self._spool(retry)
+        if dead:
+            self._spool(dead, path=self._spool_path.with_name(self._spool_path.name + '.dead'))
+            logger.error('Moved %d audit log entries to the dead-letter file', len(dead))
+
+        os.remove(replay_path)
+        if written:
+            logger.info('Replayed %d spooled audit log entries', written)
+
+
+def _without_attempts(entry: dict) -> dict:
+    """Return an entry's column values without its replay bookkeeping."""
+    return {key: value for key, value in entry.items() if key != '_replay_attempts'}
+
+
+def _replay_owner(path: Path) -> int:
+    """Return the pid in a ``<spool>.replay.<pid>.<token>`` file name, or 0."""
+    try:
+        return int(path.name.rsplit('.', 2)[-2])
+    except (IndexError, ValueError):
+        return 0
+
+
+def _process_alive(pid: int) -> bool:
+    """Check whether a process with this pid exists."""
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def init_audit_writer(app) -> None:
+    """
+    Attach a background AuditLogWriter to the app if AUDIT_LOG_ASYNC is set.
+
+    Args:
+        app: Flask application instance
+    """
+    if not app.config.get('AUDIT_LOG_ASYNC', False):
+        return
+
+    app.extensions['audit_log_writer'] = AuditLogWriter(
+        app,
+        max_queue_size=app.config.get('AUDIT_LOG_QUEUE_SIZE', 10000),
+        batch_size=app.config.get('AUDIT_LOG_BATCH_SIZE', 200),
+        flush_interval=app.config.get('AUDIT_LOG_FLUSH_INTERVAL', 0.5),
+        spool_path=app.config.get('AUDIT_LOG_SPOOL_PATH'),
+        max_replay_attempts=app.config.get('AUDIT_LOG_MAX_REPLAY_ATTEMPTS', 5),
+    )
+
+
+def get_audit_writer() -> Optional[AuditLogWriter]:
+    """Return the current app's AuditLogWriter, or None in synchronous mode."""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get('audit_log_writer')
+
 
 def log_action(
     action: str,
@@ -59,6 +400,7 @@ def log_action(
     ip_address: Optional[str] = None,
     user_agent: Optional[str] = None,
     session_id: Optional[str] = None,
+    sync: Optional[bool] = None,
 ) -> Optional[AuditLog]:
     """
     Create an audit log entry for a privileged action.
@@ -67,6 +409,10 @@ def log_action(
     including the authenticated user, session, IP address, and user agent.
     These values can be overridden by passing explicit parameters.
 
+    When the app has an AuditLogWriter (AUDIT_LOG_ASYNC) the entry is queued
+    and written in the background; otherwise, and for SYNC_ACTION_CATEGORIES,
+    it is committed before returning.
+
     Args:
         action: Specific action performed (e.g., 'user.create', 'device.update')
         action_category: Category of the action - must be one of ACTION_CATEGORIES
@@ -82,9 +428,12 @@ def log_action(
         ip_address: Override for the IP address
         user_agent: Override for the user agent
         session_id: Override for the session ID
+        sync: True to commit before returning, False to queue; None decides
+              by action_category
 
     Returns:
-        The created AuditLog entry, or None if creation failed
+        The created AuditLog entry (not yet persisted if it was queued),
+        or None if creation failed
 
     Examples:
         # Log user creation by an admin
@@ -185,23 +534,35 @@ def log_action(
             # If serialization fails, store error message
             details_json = json.dumps({'_serialization_error': str(e)})
 
+    values = {
+        'id': str(uuid.uuid4()),
+        'user_id': audit_user_id,
+        'user_email': audit_user_email,
+        'user_name': audit_user_name,
+        'user_role': audit_user_role,
+        'action': action,
+        'action_category': action_category,
+        'resource_type': resource_type,
+        'resource_id': resource_id,
+        'resource_name': resource_name,
+        'details': details_json,
+        'ip_address': audit_ip_address,
+        'user_agent': audit_user_agent,
+        'session_id': audit_session_id,
+        'created_at': datetime.now(timezone.utc),
+    }
+
+    # Queue for the background writer unless a synchronous write is needed
+    if sync is None:
+        sync = action_category in SYNC_ACTION_CATEGORIES
+    writer = get_audit_writer()
+    if writer is not None and not sync:
+        writer.enqueue(values)
+        return AuditLog(**values)
+
     # Create the audit log entry
     try:
-        audit_log = AuditLog(
-            user_id=audit_user_id,
-            user_email=audit_user_email,
-            user_name=audit_user_name,
-            user_role=audit_user_role,
-            action=action,
-            action_category=action_category,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            resource_name=resource_name,
-            details=details_json,
-            ip_address=audit_ip_address,
-            user_agent=audit_user_agent,
-            session_id=audit_session_id,
-        )
+        audit_log = AuditLog(**values)
 
         db.session.add(audit_log)
         db.session.commit()
@@ -271,6 +632,7 @@ def log_auth_action(
     if details:
         auth_details.update(details)
 
+    # Failed attempts are security evidence; record them before responding
     return log_action(
         action=f'auth.{action}',
         action_category='auth',
@@ -279,6 +641,7 @@ def log_auth_action(
         user_name=user_name,
         user_role=user_role,
         details=auth_details,
+        sync=not success,
     )
 
 
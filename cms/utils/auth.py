@@ -7,7 +7,8 @@ Features:
 - @login_required decorator for protecting routes
 - Session token validation from Authorization header
 - Current user retrieval via Flask's g object
-- Automatic session activity tracking
+- Automatic session activity tracking, written at most once per interval
+- Short-lived cache of validated sessions, re-checked with one read per request
 - Support for both active and must_change_password states
 
 Usage:
@@ -20,15 +21,234 @@ Usage:
         return jsonify({'user': user.to_dict()})
 """
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from functools import wraps
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 
-from flask import request, jsonify, g
+from flask import request, jsonify, g, current_app
 from flask_login import current_user as flask_login_user
+from sqlalchemy import inspect, update
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 
 from cms.models import db, User, UserSession
 
 
+class SessionCache:
+    """
+    In-process TTL/LRU cache of validated sessions.
+
+    Entries are keyed by a SHA-256 hash of the session token, so raw
+    tokens are never held in memory beyond the request. Each entry keeps
+    column snapshots of the UserSession and its User, which are attached
+    to the request's database session without querying.
+
+    Other processes cannot invalidate this cache, so _validate_session()
+    re-reads the session and user rows on every hit (see
+    _cached_entry_current()) before trusting an entry. Entries expire after
+    `ttl` seconds; changes made in this process should call
+    invalidate_session_cache() so the entry is not even consulted.
+
+    Args:
+        ttl: Seconds an entry stays valid
+        max_size: Entries kept before the least recently used is evicted
+    """
+
+    def __init__(self, ttl, max_size=1024):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached (session_state, user_state) for a key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry['expires'] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry['session'], entry['user']
+
+    def put(self, key, session_state, user_state):
+        """Cache column snapshots of a validated session and its user."""
+        with self._lock:
+            self._entries[key] = {
+                'expires': time.monotonic() + self.ttl,
+                'session': session_state,
+                'user': user_state,
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key=None, user_id=None):
+        """
+        Drop cached entries.
+
+        Args:
+            key: Token hash of a single entry to drop
+            user_id: Drop every entry belonging to this user
+        """
+        with self._lock:
+            if key is not None:
+                self._entries.pop(key, None)
+            if user_id is not None:
+                stale = [
+                    k for k, entry in self._entries.items()
+                    if entry['user']['id'] == user_id
+                ]
+                for k in stale:
+                    del self._entries[k]
+
+    def clear(self):
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _hash_token(token):
+    """Return the cache key for a session token."""
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+
+def get_session_cache():
+    """
+    Get the session cache for the current app.
+
+    The cache is created on first use from SESSION_CACHE_TTL and
+    SESSION_CACHE_SIZE.
+
+    Returns:
+        SessionCache, or None if SESSION_CACHE_TTL is 0
+    """
+    ttl = current_app.config.get('SESSION_CACHE_TTL', 0)
+    if not ttl:
+        return None
+
+    cache = current_app.extensions.get('session_cache')
+    if cache is None:
+        cache = SessionCache(ttl, current_app.config.get('SESSION_CACHE_SIZE', 1024))
+        current_app.extensions['session_cache'] = cache
+    return cache
+
+
+def invalidate_session_cache(token=None, user_id=None):
+    """
+    Drop cached session validations.
+
+    Call after logging out, revoking sessions, or changing anything about a
+    user that authentication depends on (status, lock, password, role).
+
+    Args:
+        token: Session token whose cached validation should be dropped
+        user_id: Drop cached validations for all of this user's sessions
+    """
+    cache = current_app.extensions.get('session_cache')
+    if cache is None:
+        return
+    cache.invalidate(
+        key=_hash_token(token) if token else None,
+        user_id=user_id
+    )
+
+
+def _snapshot(instance):
+    """Return the column values of a model instance."""
+    return {
+        attr.key: getattr(instance, attr.key)
+        for attr in inspect(type(instance)).column_attrs
+    }
+
+
+# Built on first use: SELECT session id, expiry and the user's row by token
+_current_entry_query = None
+
+
+def _cached_entry_current(token, session_state, user_state):
+    """
+    Check a cached validation against the database with one read.
+
+    Logout, session revocation, lockout, password and role changes handled
+    by another worker only invalidate that worker's cache. This re-reads
+    the session's expiry and the user's columns by token (one indexed
+    SELECT, no write) and reports whether they still match the snapshot.
+
+    Args:
+        token: The session token
+        session_state: Cached column snapshot of the session
+        user_state: Cached column snapshot of the user
+
+    Returns:
+        True if the session still exists and neither row has changed
+    """
+    global _current_entry_query
+    if _current_entry_query is None:
+        _current_entry_query = (
+            db.select(UserSession.id, UserSession.expires_at, *User.__table__.c)
+            .join(User, User.id == UserSession.user_id)
+            .where(UserSession.token == db.bindparam('token'))
+        )
+    row = db.session.execute(_current_entry_query, {'token': token}).first()
+    if row is None:
+        return False
+
+    session_id, expires_at, *user_values = row
+    if session_id != session_state['id'] or expires_at != session_state['expires_at']:
+        return False
+    return all(
+        user_state[column.key] == value
+        for column, value in zip(User.__table__.c, user_values)
+    )
+
+
+def _attach(model, state):
+    """
+    Attach a cached model snapshot to the current database session.
+
+    The instance is merged without loading, so it behaves like a row read
+    in this request (relationships load lazily, changes are flushed) but
+    no query is issued.
+    """
+    instance = inspect(model).class_manager.new_instance()
+    for key, value in state.items():
+        set_committed_value(instance, key, value)
+    make_transient_to_detached(instance)
+    return db.session.merge(instance, load=False)
+
+
+def _record_activity(session_state):
+    """
+    Update a session's last_active, at most once per configured interval.
+
+    Args:
+        session_state: Column snapshot of the session; its last_active is
+                       updated in place when a write is made
+    """
+    interval = current_app.config.get('SESSION_ACTIVITY_UPDATE_INTERVAL', 0)
+    now = datetime.now(timezone.utc)
+    last_active = session_state.get('last_active')
+    if last_active is not None and now - last_active < timedelta(seconds=interval):
+        return
+
+    try:
+        db.session.execute(
+            update(UserSession)
+            .where(UserSession.id == session_state['id'])
+            .values(last_active=now)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        session_state['last_active'] = now
+    except Exception:
+        db.session.rollback()
+
+
 def get_current_user():
     """
     Get the currently authenticated user.
@@ -85,7 +305,11 @@ def _validate_session(token):
     3. User exists and is in an allowed state (active or must change password)
     4. User account is not locked
 
-    Also updates the session's last_active timestamp on successful validation.
+    Successful validations are cached for SESSION_CACHE_TTL seconds. A
+    cache hit costs one read that confirms the session and user rows are
+    unchanged, so changes made by other workers apply to the next request.
+    The session's last_active timestamp is written at most once every
+    SESSION_ACTIVITY_UPDATE_INTERVAL seconds.
 
     Args:
         token: The session token to validate
@@ -96,6 +320,24 @@ def _validate_session(token):
     if not token:
         return None, None
 
+    cache = get_session_cache()
+    key = _hash_token(token)
+    cached = cache.get(key) if cache is not None else None
+
+    if cached:
+        session_state, user_state = cached
+        now = datetime.now(timezone.utc)
+        locked_until = user_state['locked_until']
+        if (session_state['expires_at'] <= now or (locked_until and now < locked_until)
+                or not _cached_entry_current(token, session_state, user_state)):
+            # Fall through to the database checks (which also clean up)
+            cache.invalidate(key=key)
+            cached = None
+
+    if cached:
+        _record_activity(session_state)
+        return _attach(User, user_state), _attach(UserSession, session_state)
+
     # Find session by token
     session = UserSession.query.filter_by(token=token).first()
     if not session:
@@ -126,12 +368,12 @@ def _validate_session(token):
     if user.is_locked():
         return None, None
 
+    session_state = _snapshot(session)
+    if cache is not None:
+        cache.put(key, session_state, _snapshot(user))
+
     # Update session activity
-    try:
-        session.update_activity()
-        db.session.commit()
-    except Exception:
-        db.session.rollback()
+    _record_activity(session_state)
 
     return user, session
 
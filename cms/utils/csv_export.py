@@ -0,0 +1,108 @@
+"""
+CSV Export Helpers.
+
+Streams query results to the client as CSV instead of building the whole
+file in memory:
+- Rows are fetched from the database in batches (yield_per)
+- CSV is written to a small buffer and flushed in chunks
+- The body is gzip-encoded on the fly when the client accepts it
+
+cms/utils/csv_export.py and content_catalog/utils/csv_export.py are kept
+identical. The Content Catalog is deployed on its own from its directory
+and the CMS imports it only optionally, so neither app can import this
+module from the other; change both copies together.
+"""
+
+import csv
+import io
+import zlib
+
+from flask import Response, request, stream_with_context
+
+
+# Rows fetched from the database per round trip
+EXPORT_BATCH_SIZE = 1000
+
+# Approximate size of each chunk written to the response
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# zlib wbits value producing a gzip container
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def iter_csv(header, rows, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Encode rows as CSV, yielding UTF-8 chunks of roughly chunk_size bytes.
+
+    Args:
+        header: List of column names for the first row
+        rows: Iterable of row sequences
+        chunk_size: Buffer size that triggers a flush
+
+    Yields:
+        bytes: CSV data
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate(0)
+
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+def iter_gzip(chunks):
+    """
+    Gzip-compress a stream of byte chunks incrementally.
+
+    Args:
+        chunks: Iterable of bytes
+
+    Yields:
+        bytes: Gzip-encoded data
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, GZIP_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def stream_csv_response(header, rows, filename):
+    """
+    Build a streaming CSV attachment response.
+
+    The rows iterable is consumed lazily while the response is sent, so
+    memory stays flat regardless of export size. The body is gzip-encoded
+    when the request's Accept-Encoding allows it.
+
+    Args:
+        header: List of column names
+        rows: Iterable of row sequences (typically a yield_per query)
+        filename: Attachment filename
+
+    Returns:
+        Response: Streaming text/csv response
+    """
+    chunks = iter_csv(header, rows)
+    headers = {
+        'Content-Disposition': f'attachment; filename={filename}',
+        'Vary': 'Accept-Encoding',
+    }
+
+    if request.accept_encodings['gzip']:
+        chunks = iter_gzip(chunks)
+        headers['Content-Encoding'] = 'gzip'
+
+    return Response(
+        stream_with_context(chunks),
+        mimetype='text/csv',
+        headers=headers
+    )
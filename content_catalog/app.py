@@ -28,7 +28,9 @@ from flask_jwt_extended import JWTManager
 from flask_mail import Mail
 
 from content_catalog.config import get_config
+from content_catalog.migrations.add_asset_networks import migrate as migrate_asset_networks
 from content_catalog.models import db
+from content_catalog.services.search_service import SearchService
 
 
 # Initialize extensions outside of create_app for import access
@@ -110,6 +112,10 @@ def create_app(config_name: Optional[str] = None) -> Flask:
     # Create database tables
     with app.app_context():
         db.create_all()
+        # Create (and fill on first run) the asset full-text search index
+        SearchService.ensure_index(db.engine)
+        # Index existing assets' networks and sync timestamps
+        migrate_asset_networks(db.engine)
         # Seed Super Admin user for initial system setup
         _seed_super_admin(app)
         # Seed default catalog for folder/category support
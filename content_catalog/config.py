@@ -84,6 +84,10 @@ class Config:
     SESSION_COOKIE_HTTPONLY = True
     SESSION_COOKIE_SAMESITE = 'Lax'
 
+    # Visibility Settings
+    VISIBILITY_CACHE_TTL = int(os.environ.get('VISIBILITY_CACHE_TTL', 30))  # Seconds; 0 disables the cache
+    VISIBILITY_CACHE_SIZE = 1024  # Max user visibility contexts held per process
+
     @classmethod
     def init_app(cls, app):
         """Initialize application with this configuration."""
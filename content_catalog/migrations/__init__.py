@@ -0,0 +1 @@
+"""Database migrations for Content Catalog."""
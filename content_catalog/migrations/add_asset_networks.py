@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Migration: Add content_asset_networks table and approved-content indexes.
+
+Network filtering on approved content used LIKE over the networks JSON
+string, which scanned every asset and matched IDs that are substrings of
+other IDs. This migration moves the lookup onto an indexed table.
+
+Changes:
+- Creates content_asset_networks (asset_id, network_id, status, created_at)
+  with an index on (status, network_id, created_at)
+- Creates ix_content_assets_status_created_at and
+  ix_content_assets_status_updated_at_id on content_assets
+- Backfills updated_at from created_at where it was never set, so the
+  updated_since cursor sees every asset
+- Backfills content_asset_networks from each asset's networks JSON
+
+The migration is idempotent and runs automatically on app startup. Run
+this script to upgrade an existing database by hand:
+    python -m content_catalog.migrations.add_asset_networks
+
+Or import and call migrate() from Python:
+    from content_catalog.migrations.add_asset_networks import migrate
+    migrate(db.engine)
+"""
+
+import logging
+import os
+import sys
+
+from sqlalchemy import inspect, select, text
+from sqlalchemy.schema import CreateIndex
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from content_catalog.models import ContentAsset, ContentAssetNetwork
+
+
+logger = logging.getLogger(__name__)
+
+# Assets read per backfill batch
+BATCH_SIZE = 1000
+
+
+def backfill_asset_networks(connection):
+    """
+    Fill content_asset_networks from every asset's networks value.
+
+    Args:
+        connection: SQLAlchemy Connection
+
+    Returns:
+        int: Number of network rows written
+    """
+    assets = ContentAsset.__table__
+    table = ContentAssetNetwork.__table__
+
+    result = connection.execute(
+        select(assets.c.id, assets.c.networks, assets.c.status, assets.c.created_at)
+        .where(assets.c.networks.isnot(None), assets.c.networks != '')
+        .execution_options(yield_per=BATCH_SIZE)
+    )
+
+    written = 0
+    for batch in result.partitions():
+        rows = [
+            {
+                'asset_id': asset_id,
+                'network_id': network_id,
+                'status': status,
+                'created_at': created_at,
+            }
+            for asset_id, networks, status, created_at in batch
+            for network_id in ContentAssetNetwork.parse_networks(networks)
+        ]
+        if rows:
+            connection.execute(table.insert(), rows)
+            written += len(rows)
+    return written
+
+
+def migrate(engine=None):
+    """
+    Run the migration.
+
+    Args:
+        engine: SQLAlchemy Engine (defaults to the app's database)
+
+    Returns:
+        bool: True if the migration succeeded
+    """
+    if engine is None:
+        from content_catalog.app import create_app
+        from content_catalog.models import db
+
+        with create_app().app_context():
+            return migrate(db.engine)
+
+    try:
+        with engine.begin() as connection:
+            if not inspect(connection).has_table(ContentAsset.__tablename__):
+                return True
+
+            ContentAssetNetwork.__table__.create(connection, checkfirst=True)
+            for index in ContentAsset.__table__.indexes | ContentAssetNetwork.__table__.indexes:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+
+            updated = connection.execute(text(
+                'UPDATE content_assets SET updated_at = created_at '
+                'WHERE updated_at IS NULL'
+            )).rowcount
+            if updated:
+                logger.info(f'Migration: Backfilled updated_at for {updated} content assets')
+
+            has_rows = connection.execute(
+                select(ContentAssetNetwork.__table__.c.asset_id).limit(1)
+            ).first()
+            if not has_rows:
+                written = backfill_asset_networks(connection)
+                if written:
+                    logger.info(f'Migration: Backfilled {written} content asset network rows')
+        return True
+
+    except Exception as e:
+        logger.error(f'Migration: content_asset_networks failed: {e}')
+        return False
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    success = migrate()
+    sys.exit(0 if success else 1)
@@ -9,6 +9,7 @@ SQLAlchemy models for the Content Catalog service including:
 - Admin Sessions (session management)
 - Audit Logs (compliance and security tracking)
 - Content Assets (media files with metadata)
+- Content Asset Networks (indexed asset-to-network distribution)
 - Content Approval Requests (content workflow tracking)
 """
 
@@ -36,7 +37,12 @@ db = SQLAlchemy(model_class=Base)
 from content_catalog.models.organization import Organization
 from content_catalog.models.user import User, UserInvitation, UserApprovalRequest, AdminSession
 from content_catalog.models.audit import AuditLog
-from content_catalog.models.content import ContentAsset, ContentApprovalRequest, MagicLinkToken
+from content_catalog.models.content import (
+    ContentAsset,
+    ContentAssetNetwork,
+    ContentApprovalRequest,
+    MagicLinkToken,
+)
 from content_catalog.models.checkout import CheckoutToken, ApprovalTask
 from content_catalog.models.catalog import Catalog, Category
 from content_catalog.models.tenant import Tenant
@@ -52,6 +58,7 @@ __all__ = [
     'AdminSession',
     'AuditLog',
     'ContentAsset',
+    'ContentAssetNetwork',
     'ContentApprovalRequest',
     'MagicLinkToken',
     'CheckoutToken',
@@ -6,8 +6,11 @@ and approval workflow status for the content catalog system.
 """
 
 from datetime import datetime, timezone
+import json
 import uuid
 
+from sqlalchemy import event, inspect
+
 from content_catalog.models import db
 
 
@@ -49,13 +52,20 @@ class ContentAsset(db.Model):
         published_at: Timestamp when published
         tags: Comma-separated tags for categorization
         category: Content category
-        networks: JSON string of network IDs for distribution
+        networks: JSON string of network IDs for distribution (mirrored
+                  into content_asset_networks for indexed lookups)
         zoho_campaign_id: External reference to ZOHO CRM campaign
         created_at: Timestamp when asset was created
-        updated_at: Timestamp of last update
+        updated_at: Timestamp of last change (set on creation)
     """
 
     __tablename__ = 'content_assets'
+    __table_args__ = (
+        # Approved-content listing, newest first
+        db.Index('ix_content_assets_status_created_at', 'status', 'created_at'),
+        # Incremental sync of approved content (updated_since / cursor)
+        db.Index('ix_content_assets_status_updated_at_id', 'status', 'updated_at', 'id'),
+    )
 
     # Status constants for workflow (extended for Thea spec)
     STATUS_DRAFT = 'draft'
@@ -193,7 +203,12 @@ class ContentAsset(db.Model):
 
     # Timestamps
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = db.Column(db.DateTime, nullable=True, onupdate=lambda: datetime.now(timezone.utc))
+    updated_at = db.Column(
+        db.DateTime,
+        nullable=True,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc)
+    )
 
     # Relationships
     organization = db.relationship(
@@ -251,6 +266,7 @@ class ContentAsset(db.Model):
             'content_type': self.content_type,
             'thumbnail_path': self.thumbnail_path,
             'checksum': self.checksum,
+            'file_hash': self.file_hash,
             'organization_id': self.organization_id,
             'tenant_id': self.tenant_id,
             'location_id': self.location_id,
@@ -457,6 +473,145 @@ class ContentAsset(db.Model):
         return f'<ContentAsset {self.title}>'
 
 
+class ContentAssetNetwork(db.Model):
+    """
+    SQLAlchemy model linking a content asset to a network it is distributed to.
+
+    Mirrors the asset's networks JSON string as one row per network so
+    network filtering is an indexed equality match instead of a LIKE over
+    JSON text. The asset's status and created_at are copied onto each row
+    so approved content for a network can be listed from a single index.
+
+    Rows are written automatically whenever an asset's networks, status or
+    created_at change; they should not be edited directly.
+
+    Attributes:
+        asset_id: Foreign key to the content asset
+        network_id: Network identifier from the asset's networks list
+        status: Copy of the asset's workflow status
+        created_at: Copy of the asset's creation timestamp
+    """
+
+    __tablename__ = 'content_asset_networks'
+    __table_args__ = (
+        db.Index(
+            'ix_content_asset_networks_status_network_created',
+            'status', 'network_id', 'created_at'
+        ),
+    )
+
+    asset_id = db.Column(
+        db.Integer,
+        db.ForeignKey('content_assets.id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    network_id = db.Column(db.String(255), primary_key=True)
+    status = db.Column(db.String(50), nullable=False)
+    created_at = db.Column(db.DateTime, nullable=True)
+
+    @staticmethod
+    def parse_networks(networks):
+        """
+        Parse an asset's networks value into a list of network IDs.
+
+        Accepts a JSON list (the documented format), a single JSON value,
+        or a plain comma-separated string.
+
+        Args:
+            networks: Value of ContentAsset.networks
+
+        Returns:
+            list: Unique, non-empty network ID strings in original order
+        """
+        if not networks:
+            return []
+
+        try:
+            values = json.loads(networks)
+        except (TypeError, ValueError):
+            values = networks.split(',')
+
+        if not isinstance(values, list):
+            values = [values]
+
+        network_ids = []
+        for value in values:
+            if value is None or isinstance(value, (dict, list)):
+                continue
+            network_id = str(value).strip()
+            if network_id and network_id not in network_ids:
+                network_ids.append(network_id)
+        return network_ids
+
+    @classmethod
+    def sync_asset(cls, connection, asset):
+        """
+        Replace the rows for an asset from its current networks value.
+
+        Args:
+            connection: SQLAlchemy Connection in the flushing transaction
+            asset: ContentAsset instance
+        """
+        table = cls.__table__
+        connection.execute(table.delete().where(table.c.asset_id == asset.id))
+
+        rows = [
+            {
+                'asset_id': asset.id,
+                'network_id': network_id,
+                'status': asset.status,
+                'created_at': asset.created_at,
+            }
+            for network_id in cls.parse_networks(asset.networks)
+        ]
+        if rows:
+            connection.execute(table.insert(), rows)
+
+    @classmethod
+    def sync_status(cls, connection, asset):
+        """
+        Copy an asset's status onto its rows.
+
+        Args:
+            connection: SQLAlchemy Connection in the flushing transaction
+            asset: ContentAsset instance
+        """
+        table = cls.__table__
+        connection.execute(
+            table.update()
+            .where(table.c.asset_id == asset.id)
+            .values(status=asset.status)
+        )
+
+    def __repr__(self):
+        """String representation for debugging."""
+        return f'<ContentAssetNetwork asset={self.asset_id} network={self.network_id}>'
+
+
+@event.listens_for(ContentAsset, 'after_insert')
+def _sync_inserted_asset_networks(mapper, connection, target):
+    """Write network rows for a new asset."""
+    if target.networks:
+        ContentAssetNetwork.sync_asset(connection, target)
+
+
+@event.listens_for(ContentAsset, 'after_update')
+def _sync_updated_asset_networks(mapper, connection, target):
+    """Keep network rows in step with the asset's networks and status."""
+    state = inspect(target)
+    if state.attrs.networks.history.has_changes() or state.attrs.created_at.history.has_changes():
+        ContentAssetNetwork.sync_asset(connection, target)
+    elif state.attrs.status.history.has_changes():
+        ContentAssetNetwork.sync_status(connection, target)
+
+
+@event.listens_for(ContentAsset, 'after_delete')
+def _delete_asset_networks(mapper, connection, target):
+    """Remove network rows for a deleted asset (SQLite does not cascade)."""
+    table = ContentAssetNetwork.__table__
+    connection.execute(table.delete().where(table.c.asset_id == target.id))
+
+
 class ContentApprovalRequest(db.Model):
     """
     SQLAlchemy model representing a content approval request.
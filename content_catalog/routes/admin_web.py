@@ -23,6 +23,7 @@ from content_catalog.models import (
 )
 from content_catalog.services.auth_service import AuthService
 from content_catalog.services.audit_service import AuditService
+from content_catalog.services.search_service import SearchService
 
 
 # Create admin web blueprint
@@ -304,12 +305,7 @@ def assets():
             query = query.filter_by(category_id=folder_filter)
 
     if search:
-        query = query.filter(
-            or_(
-                ContentAsset.title.ilike(f'%{search}%'),
-                ContentAsset.description.ilike(f'%{search}%')
-            )
-        )
+        query = SearchService.search(query, search, rank=True)
 
     if status_filter:
         query = query.filter_by(status=status_filter)
@@ -399,12 +395,7 @@ def approved_assets():
         query = query.filter_by(synced_to_cms=False)
 
     if search:
-        query = query.filter(
-            or_(
-                ContentAsset.title.ilike(f'%{search}%'),
-                ContentAsset.description.ilike(f'%{search}%')
-            )
-        )
+        query = SearchService.search(query, search, rank=True)
 
     query = query.order_by(ContentAsset.created_at.desc())
     pagination = query.paginate(page=page, per_page=per_page, error_out=False)
@@ -20,6 +20,7 @@ All endpoints are prefixed with /api/v1/approvals when registered with the app.
 All endpoints except magic link routes require JWT authentication with appropriate permissions.
 """
 
+import base64
 from datetime import datetime, timezone
 
 from flask import Blueprint, jsonify, request, render_template
@@ -58,6 +59,24 @@ def _get_current_user():
     return db.session.get(User, current_user_id)
 
 
+def _encode_cursor(asset):
+    """Encode the keyset position (updated_at, id) of a content asset."""
+    position = f'{asset.updated_at.isoformat()}|{asset.id}'
+    return base64.urlsafe_b64encode(position.encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(cursor):
+    """
+    Decode a cursor produced by _encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    position = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+    updated_at, asset_id = position.split('|', 1)
+    return datetime.fromisoformat(updated_at), int(asset_id)
+
+
 def _can_approve_users(user):
     """
     Check if the user has permission to approve/reject other users.
@@ -555,11 +574,21 @@ def list_approved_content():
     This endpoint is designed for CMS integration to fetch approved content
     for playlist building without needing direct upload capability.
 
+    Passing updated_since or cursor switches to incremental mode: assets
+    changed at or after updated_since are returned oldest change first and
+    paged by keyset cursor, so a sync only reads what changed. Pass each
+    response's next_cursor back until it is null; the page and total
+    fields are omitted in this mode.
+
     Query Parameters:
-        network_id: Filter by network ID (optional). Matches assets where
-                   the networks JSON field contains this ID.
+        network_id: Filter by network ID (optional). Matches assets whose
+                   networks list contains exactly this ID.
         organization_id: Filter by organization ID (optional)
         category: Filter by content category (optional)
+        updated_since: ISO 8601 timestamp; only return assets updated at
+                      or after it (optional, incremental mode)
+        cursor: next_cursor from a previous incremental response
+               (optional, incremental mode)
         page: Page number (default: 1)
         per_page: Items per page (default: 20, max: 100)
 
@@ -570,8 +599,18 @@ def list_approved_content():
                 "count": 5,
                 "page": 1,
                 "per_page": 20,
-                "total": 10
+                "pages": 1,
+                "total": 5
             }
+            or, in incremental mode:
+            {
+                "assets": [ { asset data }, ... ],
+                "count": 20,
+                "per_page": 20,
+                "has_next": true,
+                "next_cursor": "opaque"
+            }
+        400: Invalid organization_id, updated_since or cursor
         401: Unauthorized (missing or invalid token)
         404: Current user not found
     """
@@ -580,7 +619,7 @@ def list_approved_content():
     if not current_user:
         return jsonify({'error': 'User not found'}), 404
 
-    # Parse network_id filter (string, used for JSON field matching)
+    # Parse network_id filter (exact match against the asset's networks list)
     network_id = request.args.get('network_id')
 
     # Parse organization_id filter
@@ -611,6 +650,43 @@ def list_approved_content():
     except ValueError:
         per_page = 20
 
+    # Incremental mode: changed assets by (updated_at, id) keyset
+    if 'updated_since' in request.args or 'cursor' in request.args:
+        updated_since = request.args.get('updated_since')
+        if updated_since:
+            try:
+                updated_since = datetime.fromisoformat(updated_since.replace('Z', '+00:00'))
+            except ValueError:
+                return jsonify({'error': 'updated_since must be an ISO 8601 timestamp'}), 400
+        else:
+            updated_since = None
+
+        after = None
+        cursor = request.args.get('cursor')
+        if cursor:
+            try:
+                after = _decode_cursor(cursor)
+            except ValueError:
+                return jsonify({'error': 'Invalid cursor'}), 400
+
+        assets, has_next = ContentService.get_approved_content_changes(
+            db_session=db.session,
+            updated_since=updated_since,
+            after=after,
+            network_id=network_id,
+            organization_id=organization_id,
+            category=category,
+            per_page=per_page
+        )
+
+        return jsonify({
+            'assets': [asset.to_dict() for asset in assets],
+            'count': len(assets),
+            'per_page': per_page,
+            'has_next': has_next,
+            'next_cursor': _encode_cursor(assets[-1]) if has_next else None
+        }), 200
+
     # Get approved content using the ContentService
     assets, total = ContentService.get_approved_content(
         db_session=db.session,
@@ -626,6 +702,7 @@ def list_approved_content():
         'count': len(assets),
         'page': page,
         'per_page': per_page,
+        'pages': (total + per_page - 1) // per_page,
         'total': total
     }), 200
 
@@ -35,6 +35,7 @@ from werkzeug.utils import secure_filename
 
 from content_catalog.models import db, ContentAsset, ContentApprovalRequest, Organization, User
 from content_catalog.services.audit_service import AuditService
+from content_catalog.services.search_service import SearchService
 
 
 # Create assets blueprint
@@ -550,8 +551,8 @@ def list_assets():
         per_page: Items per page (default: 20, max: 100)
         status: Filter by status (DRAFT, SUBMITTED, APPROVED, PUBLISHED)
         organization_id: Filter by organization ID
-        search: Search in title and description
-        sort: Sort field (created_at, title, file_size) with optional :asc/:desc
+        search: Search terms matched against title, description, tags and category
+        sort: Sort field (created_at, title, file_size, relevance) with optional :asc/:desc
         category: Filter by category
 
     Returns:
@@ -596,10 +597,8 @@ def list_assets():
 
     search = request.args.get('search')
     if search:
-        query = query.filter(
-            (ContentAsset.title.ilike(f'%{search}%')) |
-            (ContentAsset.description.ilike(f'%{search}%'))
-        )
+        rank = request.args.get('sort', '').split(':')[0] == 'relevance'
+        query = SearchService.search(query, search, rank=rank)
 
     category = request.args.get('category')
     if category:
@@ -612,13 +611,16 @@ def list_assets():
         sort_field = parts[0]
         sort_direction = parts[1] if len(parts) > 1 else 'asc'
 
-        valid_sorts = ['created_at', 'title', 'file_size', 'status']
+        valid_sorts = ['created_at', 'title', 'file_size', 'status', 'relevance']
         if sort_field not in valid_sorts:
             return jsonify({
                 'error': f'Invalid sort field. Valid fields: {", ".join(valid_sorts)}'
             }), 400
 
-        if sort_direction.lower() == 'desc':
+        if sort_field == 'relevance':
+            # Search results are already ranked; break ties newest first
+            query = query.order_by(ContentAsset.created_at.desc())
+        elif sort_direction.lower() == 'desc':
             query = query.order_by(getattr(ContentAsset, sort_field).desc())
         else:
             query = query.order_by(getattr(ContentAsset, sort_field).asc())
@@ -1243,10 +1245,10 @@ def list_approved_assets():
     Query Parameters:
         page: Page number (default: 1)
         per_page: Items per page (default: 50, max: 100)
-        search: Search in title and description
+        search: Search terms matched against title, description, tags and category
         category: Filter by category
         organization_id: Filter by organization
-        sort: Sort field (created_at, title, published_at) with optional :asc/:desc
+        sort: Sort field (created_at, title, published_at, relevance) with optional :asc/:desc
 
     Returns:
         200: List of approved/published assets
@@ -1287,10 +1289,8 @@ def list_approved_assets():
     # Apply filters
     search = request.args.get('search')
     if search:
-        query = query.filter(
-            (ContentAsset.title.ilike(f'%{search}%')) |
-            (ContentAsset.description.ilike(f'%{search}%'))
-        )
+        rank = request.args.get('sort', '').split(':')[0] == 'relevance'
+        query = SearchService.search(query, search, rank=rank)
 
     category = request.args.get('category')
     if category:
@@ -1307,13 +1307,16 @@ def list_approved_assets():
         sort_field = parts[0]
         sort_direction = parts[1] if len(parts) > 1 else 'asc'
 
-        valid_sorts = ['created_at', 'title', 'published_at']
+        valid_sorts = ['created_at', 'title', 'published_at', 'relevance']
         if sort_field not in valid_sorts:
             return jsonify({
                 'error': f'Invalid sort field. Valid fields: {", ".join(valid_sorts)}'
             }), 400
 
-        if sort_direction.lower() == 'desc':
+        if sort_field == 'relevance':
+            # Search results are already ranked; break ties newest first
+            query = query.order_by(ContentAsset.created_at.desc())
+        elif sort_direction.lower() == 'desc':
             query = query.order_by(getattr(ContentAsset, sort_field).desc())
         else:
             query = query.order_by(getattr(ContentAsset, sort_field).asc())
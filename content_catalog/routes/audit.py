@@ -3,6 +3,7 @@ Content Catalog Audit Routes.
 
 Blueprint for audit log API endpoints:
 - GET /: List all audit logs with optional filtering
+- GET /export: Export filtered audit logs as CSV
 
 Blueprints:
 - audit_bp: Prefixed with /admin/api/audit-logs when registered with the app
@@ -11,12 +12,13 @@ Blueprints:
 All endpoints require JWT authentication and admin permissions.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
 
 from content_catalog.models import db, User, AuditLog
+from content_catalog.utils.csv_export import EXPORT_BATCH_SIZE, stream_csv_response
 
 
 # Create audit blueprint (legacy endpoint at /admin/api/audit-logs)
@@ -57,51 +59,20 @@ def _can_view_audit_logs(user):
     ]
 
 
-@audit_bp.route('', methods=['GET'])
-@jwt_required()
-def list_audit_logs():
+def _filter_audit_logs(query):
     """
-    List all audit logs with optional filtering.
+    Apply the audit log query-string filters to a query.
 
-    Returns a paginated list of audit logs with optional filtering by user,
-    action type, resource type, date range, or IP address.
+    Filters: user_id, user_email, action, resource_type, resource_id,
+    ip_address, start_date and end_date (see list_audit_logs).
 
-    Query Parameters:
-        user_id: Filter by user ID who performed the action
-        user_email: Filter by user email (partial match)
-        action: Filter by action type (e.g., 'user.login', 'content.uploaded')
-        resource_type: Filter by resource type (user, organization, content, etc.)
-        resource_id: Filter by specific resource ID
-        ip_address: Filter by IP address
-        start_date: Filter logs from this date (ISO format: YYYY-MM-DD)
-        end_date: Filter logs until this date (ISO format: YYYY-MM-DD)
-        page: Page number (default: 1)
-        per_page: Items per page (default: 50, max: 100)
+    Args:
+        query: AuditLog query to filter
 
     Returns:
-        200: List of audit logs
-            {
-                "audit_logs": [ { audit log data }, ... ],
-                "count": 50,
-                "page": 1,
-                "per_page": 50,
-                "total": 500
-            }
-        401: Unauthorized (missing or invalid token)
-        403: Forbidden (insufficient permissions)
+        Tuple of (filtered query, None) or (None, error response) if a
+        filter value is invalid
     """
-    current_user = _get_current_user()
-
-    if not current_user:
-        return jsonify({'error': 'User not found'}), 404
-
-    # Check if user has permission to view audit logs
-    if not _can_view_audit_logs(current_user):
-        return jsonify({'error': 'Insufficient permissions to view audit logs'}), 403
-
-    # Build query with optional filters
-    query = AuditLog.query
-
     # Filter by user_id
     user_id_filter = request.args.get('user_id')
     if user_id_filter:
@@ -109,7 +80,7 @@ def list_audit_logs():
             user_id = int(user_id_filter)
             query = query.filter_by(user_id=user_id)
         except ValueError:
-            return jsonify({'error': 'user_id must be an integer'}), 400
+            return None, (jsonify({'error': 'user_id must be an integer'}), 400)
 
     # Filter by user_email (partial match, case-insensitive)
     user_email_filter = request.args.get('user_email')
@@ -127,9 +98,9 @@ def list_audit_logs():
     resource_type_filter = request.args.get('resource_type')
     if resource_type_filter:
         if resource_type_filter not in AuditLog.VALID_RESOURCE_TYPES:
-            return jsonify({
+            return None, (jsonify({
                 'error': f"Invalid resource_type. Must be one of: {', '.join(AuditLog.VALID_RESOURCE_TYPES)}"
-            }), 400
+            }), 400)
         query = query.filter_by(resource_type=resource_type_filter)
 
     # Filter by resource_id
@@ -149,9 +120,9 @@ def list_audit_logs():
             start_date = datetime.fromisoformat(start_date_str)
             query = query.filter(AuditLog.created_at >= start_date)
         except ValueError:
-            return jsonify({
+            return None, (jsonify({
                 'error': 'Invalid start_date format. Use ISO format: YYYY-MM-DD'
-            }), 400
+            }), 400)
 
     end_date_str = request.args.get('end_date')
     if end_date_str:
@@ -162,9 +133,61 @@ def list_audit_logs():
             end_date = end_date.replace(hour=23, minute=59, second=59)
             query = query.filter(AuditLog.created_at <= end_date)
         except ValueError:
-            return jsonify({
+            return None, (jsonify({
                 'error': 'Invalid end_date format. Use ISO format: YYYY-MM-DD'
-            }), 400
+            }), 400)
+
+    return query, None
+
+
+@audit_bp.route('', methods=['GET'])
+@jwt_required()
+def list_audit_logs():
+    """
+    List all audit logs with optional filtering.
+
+    Returns a paginated list of audit logs with optional filtering by user,
+    action type, resource type, date range, or IP address.
+
+    Query Parameters:
+        user_id: Filter by user ID who performed the action
+        user_email: Filter by user email (partial match)
+        action: Filter by action type (e.g., 'user.login', 'content.uploaded')
+        resource_type: Filter by resource type (user, organization, content, etc.)
+        resource_id: Filter by specific resource ID
+        ip_address: Filter by IP address
+        start_date: Filter logs from this date (ISO format: YYYY-MM-DD)
+        end_date: Filter logs until this date (ISO format: YYYY-MM-DD)
+        page: Page number (default: 1)
+        per_page: Items per page (default: 50, max: 100)
+
+    Returns:
+        200: List of audit logs
+            {
+                "audit_logs": [ { audit log data }, ... ],
+                "count": 50,
+                "page": 1,
+                "per_page": 50,
+                "total": 500
+            }
+        401: Unauthorized (missing or invalid token)
+        403: Forbidden (insufficient permissions)
+    """
+    current_user = _get_current_user()
+
+    if not current_user:
+        return jsonify({'error': 'User not found'}), 404
+
+    # Check if user has permission to view audit logs
+    if not _can_view_audit_logs(current_user):
+        return jsonify({'error': 'Insufficient permissions to view audit logs'}), 403
+
+    # Build query with optional filters
+    query = AuditLog.query
+
+    query, error = _filter_audit_logs(query)
+    if error:
+        return error
 
     # Pagination parameters
     try:
@@ -200,6 +223,84 @@ def list_audit_logs():
     }), 200
 
 
+@audit_bp.route('/export', methods=['GET'])
+@jwt_required()
+def export_audit_logs():
+    """
+    Export audit logs as a CSV download.
+
+    Accepts the same filters as the list endpoint. Rows are streamed in
+    batches as they are read, so large date ranges do not have to fit in
+    worker memory. The body is gzip-encoded when Accept-Encoding allows it.
+
+    Query Parameters:
+        user_id, user_email, action, resource_type, resource_id,
+        ip_address, start_date, end_date: See list_audit_logs
+
+    Returns:
+        200: CSV file download (most recent first)
+        400: Invalid filter parameters
+        401: Unauthorized (missing or invalid token)
+        403: Forbidden (insufficient permissions)
+    """
+    current_user = _get_current_user()
+
+    if not current_user:
+        return jsonify({'error': 'User not found'}), 404
+
+    # Check if user has permission to view audit logs
+    if not _can_view_audit_logs(current_user):
+        return jsonify({'error': 'Insufficient permissions to view audit logs'}), 403
+
+    query, error = _filter_audit_logs(AuditLog.query)
+    if error:
+        return error
+
+    rows = query.with_entities(
+        AuditLog.id,
+        AuditLog.created_at,
+        AuditLog.user_id,
+        AuditLog.user_email,
+        AuditLog.action,
+        AuditLog.resource_type,
+        AuditLog.resource_id,
+        AuditLog.ip_address,
+        AuditLog.user_agent,
+        AuditLog.details
+    ).order_by(AuditLog.created_at.desc()).yield_per(EXPORT_BATCH_SIZE)
+
+    header = [
+        'ID',
+        'Timestamp',
+        'User ID',
+        'User Email',
+        'Action',
+        'Resource Type',
+        'Resource ID',
+        'IP Address',
+        'User Agent',
+        'Details'
+    ]
+
+    def csv_rows():
+        for log in rows:
+            yield [
+                log.id,
+                log.created_at.isoformat() if log.created_at else '',
+                log.user_id or '',
+                log.user_email or '',
+                log.action,
+                log.resource_type or '',
+                log.resource_id or '',
+                log.ip_address or '',
+                log.user_agent or '',
+                log.details or ''
+            ]
+
+    timestamp = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
+    return stream_csv_response(header, csv_rows(), f'audit_logs_{timestamp}.csv')
+
+
 @audit_admin_bp.route('/audit', methods=['GET'])
 @jwt_required()
 def query_audit_logs():
@@ -247,69 +348,9 @@ def query_audit_logs():
     # Build query with optional filters
     query = AuditLog.query
 
-    # Filter by user_id
-    user_id_filter = request.args.get('user_id')
-    if user_id_filter:
-        try:
-            user_id = int(user_id_filter)
-            query = query.filter_by(user_id=user_id)
-        except ValueError:
-            return jsonify({'error': 'user_id must be an integer'}), 400
-
-    # Filter by user_email (partial match, case-insensitive)
-    user_email_filter = request.args.get('user_email')
-    if user_email_filter:
-        query = query.filter(
-            AuditLog.user_email.ilike(f'%{user_email_filter}%')
-        )
-
-    # Filter by action
-    action_filter = request.args.get('action')
-    if action_filter:
-        query = query.filter_by(action=action_filter)
-
-    # Filter by resource_type
-    resource_type_filter = request.args.get('resource_type')
-    if resource_type_filter:
-        if resource_type_filter not in AuditLog.VALID_RESOURCE_TYPES:
-            return jsonify({
-                'error': f"Invalid resource_type. Must be one of: {', '.join(AuditLog.VALID_RESOURCE_TYPES)}"
-            }), 400
-        query = query.filter_by(resource_type=resource_type_filter)
-
-    # Filter by resource_id
-    resource_id_filter = request.args.get('resource_id')
-    if resource_id_filter:
-        query = query.filter_by(resource_id=str(resource_id_filter))
-
-    # Filter by ip_address
-    ip_address_filter = request.args.get('ip_address')
-    if ip_address_filter:
-        query = query.filter_by(ip_address=ip_address_filter)
-
-    # Filter by date range
-    start_date_str = request.args.get('start_date')
-    if start_date_str:
-        try:
-            start_date = datetime.fromisoformat(start_date_str)
-            query = query.filter(AuditLog.created_at >= start_date)
-        except ValueError:
-            return jsonify({
-                'error': 'Invalid start_date format. Use ISO format: YYYY-MM-DD'
-            }), 400
-
-    end_date_str = request.args.get('end_date')
-    if end_date_str:
-        try:
-            # Add 1 day to include the entire end date
-            end_date = datetime.fromisoformat(end_date_str)
-            # Set to end of day
-            end_date = end_date.replace(hour=23, minute=59, second=59)
-            query = query.filter(AuditLog.created_at <= end_date)
-        except ValueError:
-            return jsonify({
-                'error': 'Invalid end_date format. Use ISO format: YYYY-MM-DD'
-            }), 400
+    query, error = _filter_audit_logs(query)
+    if error:
+        return error
 
     # Pagination parameters
     try:
@@ -26,8 +26,9 @@ from datetime import datetime, timedelta, timezone
 from flask import Blueprint, render_template, request, redirect, url_for, jsonify
 
 from sqlalchemy import func
+from sqlalchemy.orm import joinedload, selectinload
 
-from content_catalog.models import db, UserInvitation, User, ContentAsset, AdminSession, ContentApprovalRequest, Catalog, Category
+from content_catalog.models import db, UserInvitation, User, ContentAsset, AdminSession, ContentApprovalRequest, Catalog, Category, ContentVenueApproval
 from content_catalog.services.auth_service import AuthService
 from content_catalog.services.audit_service import AuditService
 from content_catalog.services.visibility_service import VisibilityService
@@ -263,11 +264,14 @@ def assets():
 
     Query Parameters:
         status: Filter by status (draft, pending_review, approved, rejected, published, archived)
+        folder: Filter by folder ID, or 'uncategorized'
+        page: Page number (default: 1)
+        per_page: Assets per page (default: 48)
 
     Requires authentication - redirects to login if not authenticated.
 
     Returns:
-        Rendered assets.html template with visibility-filtered assets list
+        Rendered assets.html template with a page of visibility-filtered assets
     """
     current_user = get_current_partner()
     if not current_user:
@@ -276,45 +280,50 @@ def assets():
     # Get filter parameters
     status_filter = request.args.get('status', None)
     folder_filter = request.args.get('folder', '', type=str)
+    page = request.args.get('page', 1, type=int)
+    per_page = request.args.get('per_page', 48, type=int)
 
-    # Use VisibilityService to get assets visible to this user
+    # Use VisibilityService to scope the query to assets visible to this user
     # Include drafts since partners need to see their own drafts
-    visible_assets = VisibilityService.filter_assets_for_user(
+    visible = VisibilityService.visible_assets_query(
         db_session=db.session,
         user_id=current_user.id,
+        query=ContentAsset.query,
         include_drafts=True
     )
 
-    # Apply folder filter
+    # Apply folder and status filters
+    query = visible
     if folder_filter == 'uncategorized':
-        visible_assets = [a for a in visible_assets if a.category_id is None]
+        query = query.filter(ContentAsset.category_id.is_(None))
     elif folder_filter:
-        try:
-            fid = int(folder_filter)
-            visible_assets = [a for a in visible_assets if a.category_id == fid]
-        except (ValueError, TypeError):
-            pass
+        query = query.filter(ContentAsset.category_id == folder_filter)
 
-    # Apply status filter if provided
     if status_filter and status_filter in ContentAsset.VALID_STATUSES:
-        visible_assets = [a for a in visible_assets if a.status == status_filter]
+        query = query.filter(ContentAsset.status == status_filter)
 
-    # Sort by creation date (newest first)
-    visible_assets.sort(key=lambda a: a.created_at or datetime.min, reverse=True)
+    # Sort by creation date (newest first) and paginate in the database,
+    # loading the folder and venue approvals shown on each card up front
+    pagination = query.options(
+        joinedload(ContentAsset.asset_category),
+        selectinload(ContentAsset.venue_approvals).joinedload(ContentVenueApproval.tenant)
+    ).order_by(
+        ContentAsset.created_at.desc(), ContentAsset.id.desc()
+    ).paginate(page=page, per_page=per_page, error_out=False)
 
     # Calculate status counts from visible assets (before folder filter)
-    all_visible = VisibilityService.filter_assets_for_user(
-        db_session=db.session,
-        user_id=current_user.id,
-        include_drafts=True
+    status_counts = dict(
+        visible.with_entities(ContentAsset.status, func.count(ContentAsset.id))
+        .group_by(ContentAsset.status)
+        .all()
     )
 
-    total_count = len(all_visible)
-    draft_count = len([a for a in all_visible if a.status == ContentAsset.STATUS_DRAFT])
-    pending_count = len([a for a in all_visible if a.status == ContentAsset.STATUS_PENDING_REVIEW])
-    approved_count = len([a for a in all_visible if a.status == ContentAsset.STATUS_APPROVED])
-    rejected_count = len([a for a in all_visible if a.status == ContentAsset.STATUS_REJECTED])
-    published_count = len([a for a in all_visible if a.status == ContentAsset.STATUS_PUBLISHED])
+    total_count = sum(status_counts.values())
+    draft_count = status_counts.get(ContentAsset.STATUS_DRAFT, 0)
+    pending_count = status_counts.get(ContentAsset.STATUS_PENDING_REVIEW, 0)
+    approved_count = status_counts.get(ContentAsset.STATUS_APPROVED, 0)
+    rejected_count = status_counts.get(ContentAsset.STATUS_REJECTED, 0)
+    published_count = status_counts.get(ContentAsset.STATUS_PUBLISHED, 0)
 
     # Load folders for sidebar
     default_catalog = Catalog.query.first()
@@ -329,16 +338,11 @@ def assets():
         ).order_by(Category.sort_order.asc(), Category.name.asc()).all()
 
         # Count assets per folder (scoped to this user's visible assets)
-        visible_ids = [a.id for a in all_visible]
-        if visible_ids:
-            counts = db.session.query(
-                ContentAsset.category_id, func.count(ContentAsset.id)
-            ).filter(
-                ContentAsset.id.in_(visible_ids),
-                ContentAsset.category_id.isnot(None)
-            ).group_by(ContentAsset.category_id).all()
-            folder_counts = {str(cid): cnt for cid, cnt in counts}
-            uncategorized_count = len([a for a in all_visible if a.category_id is None])
+        counts = visible.with_entities(
+            ContentAsset.category_id, func.count(ContentAsset.id)
+        ).group_by(ContentAsset.category_id).all()
+        folder_counts = {str(cid): cnt for cid, cnt in counts if cid is not None}
+        uncategorized_count = sum(cnt for cid, cnt in counts if cid is None)
 
     return render_template(
         'partner/assets.html',
@@ -346,7 +350,8 @@ def assets():
         current_user=current_user,
         partner_tenants=get_partner_tenants(current_user),
         pending_submissions_count=pending_count,
-        assets=visible_assets,
+        assets=pagination.items,
+        pagination=pagination,
         status_filter=status_filter,
         folder_filter=folder_filter,
         total_count=total_count,
@@ -1339,7 +1344,7 @@ def api_submit_asset(asset_uuid):
         return jsonify({'error': 'Asset not found'}), 404
 
     # Verify user can access this asset (visibility check)
-    can_view, reason = VisibilityService.can_view_asset(
+    can_view, reason = VisibilityService.can_view_asset_by_id(
         db_session=db.session,
         user_id=current_user.id,
         asset_id=asset.id
@@ -6,6 +6,7 @@ Business logic services for the Content Catalog:
 - AuditService: Audit logging for all system actions
 - ApprovalService: User approval workflow with role hierarchy enforcement
 - ContentService: Content CRUD and search operations
+- SearchService: Full-text search index for content assets
 - PartnerService: Partner onboarding and management
 - UserService: User management and role assignment
 - IngestionService: Asset processing and metadata extraction
@@ -18,6 +19,7 @@ from content_catalog.services.auth_service import AuthService
 from content_catalog.services.audit_service import AuditService
 from content_catalog.services.approval_service import ApprovalService
 from content_catalog.services.content_service import ContentService
+from content_catalog.services.search_service import SearchService
 from content_catalog.services.email_service import EmailService
 from content_catalog.services.user_service import UserService
 from content_catalog.services.visibility_service import VisibilityService
@@ -28,6 +30,7 @@ __all__ = [
     'AuditService',
     'ApprovalService',
     'ContentService',
+    'SearchService',
     'EmailService',
     'UserService',
     'VisibilityService',
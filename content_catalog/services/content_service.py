@@ -10,6 +10,8 @@ Key features:
 - Asset updates with validation
 - Asset deletion with proper cleanup
 - Asset listing with filtering, pagination, and sorting
+- Full-text search via SearchService, kept up to date on every flush
+- Incremental approved-content listing for CMS sync by (updated_at, id) keyset
 """
 
 from datetime import datetime, timezone
@@ -125,6 +127,7 @@ class ContentService:
         Note:
             The asset is added to the database session but not committed.
             The caller is responsible for committing the transaction.
+            The search index is updated in the same transaction on flush.
         """
         from content_catalog.models.content import ContentAsset
 
@@ -252,6 +255,7 @@ class ContentService:
         Note:
             Changes are made to the asset but not committed.
             The caller is responsible for committing the transaction.
+            The search index is updated in the same transaction on flush.
         """
         from content_catalog.models.content import ContentAsset
 
@@ -338,6 +342,7 @@ class ContentService:
         Note:
             The deletion is performed but not committed.
             The caller is responsible for committing the transaction.
+            The search index is updated in the same transaction on flush.
         """
         from content_catalog.models.content import ContentAsset
 
@@ -371,10 +376,12 @@ class ContentService:
             status: Filter by status (optional)
             uploaded_by: Filter by uploader user ID (optional)
             category: Filter by category (optional)
-            search: Search term for title or description (optional)
+            search: Search terms matched against title, description, tags
+                    and category (optional)
             page: Page number (1-indexed, default 1)
             per_page: Results per page (default 20, max 100)
-            sort_by: Field to sort by (default 'created_at')
+            sort_by: Field to sort by (default 'created_at'), or 'relevance'
+                     to order search results best match first
             sort_order: Sort order 'asc' or 'desc' (default 'desc')
 
         Returns:
@@ -390,6 +397,7 @@ class ContentService:
             )
         """
         from content_catalog.models.content import ContentAsset
+        from content_catalog.services.search_service import SearchService
 
         # Build the base query
         query = db_session.query(ContentAsset)
@@ -407,19 +415,19 @@ class ContentService:
         if category is not None:
             query = query.filter(ContentAsset.category == category)
 
+        rank = search is not None and sort_by == 'relevance'
         if search is not None:
-            search_pattern = f'%{search}%'
-            query = query.filter(
-                (ContentAsset.title.ilike(search_pattern)) |
-                (ContentAsset.description.ilike(search_pattern))
-            )
+            query = SearchService.search(query, search, rank=rank)
 
         # Get total count before pagination
         total = query.count()
 
         # Apply sorting
         sort_column = getattr(ContentAsset, sort_by, ContentAsset.created_at)
-        if sort_order.lower() == 'asc':
+        if rank:
+            # Equally relevant matches are listed newest first
+            query = query.order_by(ContentAsset.created_at.desc())
+        elif sort_order.lower() == 'asc':
             query = query.order_by(sort_column.asc())
         else:
             query = query.order_by(sort_column.desc())
@@ -741,7 +749,7 @@ class ContentService:
         Args:
             db_session: SQLAlchemy database session
             network_id: Filter by network ID (optional). Matches assets
-                       where networks JSON field contains this ID.
+                       whose networks list contains exactly this ID.
             organization_id: Filter by organization (optional)
             category: Filter by content category (optional)
             page: Page number (1-indexed, default 1)
@@ -759,20 +767,26 @@ class ContentService:
                 per_page=20
             )
         """
-        from content_catalog.models.content import ContentAsset
+        from content_catalog.models.content import ContentAsset, ContentAssetNetwork
 
-        # Build the base query for approved/published content only
-        query = db_session.query(ContentAsset).filter(
-            ContentAsset.status.in_([
-                ContentAsset.STATUS_APPROVED,
-                ContentAsset.STATUS_PUBLISHED
-            ])
-        )
+        statuses = [ContentAsset.STATUS_APPROVED, ContentAsset.STATUS_PUBLISHED]
 
-        # Apply network filter if provided
-        # Networks is stored as a JSON string, so we use LIKE for matching
+        # Network filter goes through the content_asset_networks index on
+        # (status, network_id, created_at), which also provides the ordering
         if network_id is not None:
-            query = query.filter(ContentAsset.networks.like(f'%{network_id}%'))
+            query = db_session.query(ContentAsset).join(
+                ContentAssetNetwork,
+                ContentAssetNetwork.asset_id == ContentAsset.id
+            ).filter(
+                ContentAssetNetwork.network_id == network_id,
+                ContentAssetNetwork.status.in_(statuses)
+            )
+            order_by = ContentAssetNetwork.created_at.desc()
+        else:
+            query = db_session.query(ContentAsset).filter(
+                ContentAsset.status.in_(statuses)
+            )
+            order_by = ContentAsset.created_at.desc()
 
         # Apply organization filter if provided
         if organization_id is not None:
@@ -785,8 +799,8 @@ class ContentService:
         # Get total count before pagination
         total = query.count()
 
-        # Apply sorting (newest first for approved, by published_at for published)
-        query = query.order_by(ContentAsset.created_at.desc())
+        # Apply sorting (newest first)
+        query = query.order_by(order_by)
 
         # Apply pagination
         per_page = min(per_page, cls.MAX_PER_PAGE)
@@ -794,3 +808,93 @@ class ContentService:
         assets = query.offset(offset).limit(per_page).all()
 
         return assets, total
+
+    @classmethod
+    def get_approved_content_changes(
+        cls,
+        db_session,
+        updated_since: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, int]] = None,
+        network_id: Optional[str] = None,
+        organization_id: Optional[int] = None,
+        category: Optional[str] = None,
+        per_page: int = DEFAULT_PER_PAGE
+    ) -> Tuple[List['ContentAsset'], bool]:
+        """
+        Get approved and published content changed since a point in time.
+
+        Used for incremental CMS syncs. Assets are returned oldest change
+        first, ordered by (updated_at, id), and pages are fetched by keyset
+        so each page is a single indexed range scan at any depth. No total
+        count is computed.
+
+        Args:
+            db_session: SQLAlchemy database session
+            updated_since: Only return assets updated at or after this time
+                          (optional; naive datetimes are treated as UTC)
+            after: (updated_at, id) of the last asset on the previous page
+                  (optional)
+            network_id: Filter by network ID (optional)
+            organization_id: Filter by organization (optional)
+            category: Filter by content category (optional)
+            per_page: Results per page (default 20, max 100)
+
+        Returns:
+            Tuple of (list of ContentAsset instances, whether more pages follow)
+
+        Example:
+            assets, has_next = ContentService.get_approved_content_changes(
+                db.session,
+                updated_since=last_sync,
+                network_id='network-1'
+            )
+            after = (assets[-1].updated_at, assets[-1].id)
+        """
+        from sqlalchemy import tuple_
+
+        from content_catalog.models.content import ContentAsset, ContentAssetNetwork
+
+        query = db_session.query(ContentAsset).filter(
+            ContentAsset.status.in_([
+                ContentAsset.STATUS_APPROVED,
+                ContentAsset.STATUS_PUBLISHED
+            ])
+        )
+
+        if network_id is not None:
+            query = query.join(
+                ContentAssetNetwork,
+                ContentAssetNetwork.asset_id == ContentAsset.id
+            ).filter(ContentAssetNetwork.network_id == network_id)
+
+        if organization_id is not None:
+            query = query.filter(ContentAsset.organization_id == organization_id)
+
+        if category is not None:
+            query = query.filter(ContentAsset.category == category)
+
+        if updated_since is not None:
+            query = query.filter(ContentAsset.updated_at >= cls._naive_utc(updated_since))
+
+        if after is not None:
+            updated_at, asset_id = after
+            query = query.filter(
+                tuple_(ContentAsset.updated_at, ContentAsset.id) >
+                (cls._naive_utc(updated_at), asset_id)
+            )
+
+        per_page = min(per_page, cls.MAX_PER_PAGE)
+        assets = query.order_by(
+            ContentAsset.updated_at.asc(),
+            ContentAsset.id.asc()
+        ).limit(per_page + 1).all()
+
+        has_next = len(assets) > per_page
+        return assets[:per_page], has_next
+
+    @staticmethod
+    def _naive_utc(value: datetime) -> datetime:
+        """Convert a datetime to naive UTC, matching stored timestamps."""
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
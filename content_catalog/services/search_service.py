@@ -0,0 +1,370 @@
+"""
+Search Service for Content Catalog.
+
+Provides full-text search over content assets using the database's own
+text search support:
+- SQLite: an FTS5 virtual table ranked with bm25()
+- PostgreSQL: a tsvector side table with a GIN index ranked with ts_rank_cd()
+
+Title, description, tags and category are indexed, with matches in the
+title weighted highest. Every search term is matched as a word prefix, so
+"prom vid" finds "Promo Video".
+
+The index is maintained incrementally: each inserted, updated or deleted
+ContentAsset updates its index row in the same flush, whether the change
+comes from ContentService or directly from a route. On other databases
+searches fall back to ILIKE filtering.
+
+Usage:
+    from content_catalog.services.search_service import SearchService
+
+    query = SearchService.search(ContentAsset.query, 'promo video', rank=True)
+"""
+
+import re
+import weakref
+from typing import List
+
+from sqlalchemy import Float, Integer, event, inspect, or_, select, text
+
+from content_catalog.models import ContentAsset
+
+
+class SearchService:
+    """
+    Full-text search index for content assets.
+
+    This service handles:
+    1. Creating the index alongside the content_assets table
+    2. Keeping index rows in step with asset inserts, updates and deletes
+    3. Filtering and ranking asset queries by search terms
+    4. Rebuilding the index from existing assets
+    """
+
+    # SQLite FTS5 virtual table (rowid is the asset id)
+    SQLITE_TABLE = 'content_assets_fts'
+
+    # PostgreSQL tsvector side table
+    POSTGRES_TABLE = 'content_assets_search'
+
+    # Asset columns copied into the index
+    INDEXED_FIELDS = ('title', 'description', 'tags', 'category')
+
+    # bm25() column weights, in INDEXED_FIELDS order
+    SQLITE_WEIGHTS = (10.0, 2.0, 5.0, 5.0)
+
+    # Engines whose index table is known to exist (True) or be unavailable (False)
+    _ready = weakref.WeakKeyDictionary()
+
+    SQLITE_DDL = (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_TABLE} USING fts5("
+        "title, description, tags, category, "
+        "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+    )
+
+    POSTGRES_DDL = (
+        f"CREATE TABLE IF NOT EXISTS {POSTGRES_TABLE} ("
+        "asset_id INTEGER PRIMARY KEY REFERENCES content_assets(id) ON DELETE CASCADE, "
+        "document TSVECTOR NOT NULL)",
+        f"CREATE INDEX IF NOT EXISTS ix_{POSTGRES_TABLE}_document "
+        f"ON {POSTGRES_TABLE} USING GIN (document)",
+    )
+
+    # Weighted document: title (A), tags and category (B), description (C)
+    POSTGRES_DOCUMENT = (
+        "setweight(to_tsvector('simple', coalesce({title}, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce({tags}, '') || ' ' || coalesce({category}, '')), 'B') || "
+        "setweight(to_tsvector('simple', coalesce({description}, '')), 'C')"
+    )
+
+    @classmethod
+    def supports(cls, connection) -> bool:
+        """
+        Check whether the database behind a connection can hold the index.
+
+        Args:
+            connection: SQLAlchemy Connection or Engine
+
+        Returns:
+            bool: True for PostgreSQL and for SQLite builds with FTS5
+        """
+        dialect = connection.dialect.name
+        if dialect == 'postgresql':
+            return True
+        if dialect != 'sqlite':
+            return False
+        options = connection.exec_driver_sql('PRAGMA compile_options').scalars().all()
+        return 'ENABLE_FTS5' in options
+
+    @classmethod
+    def create_index(cls, connection) -> bool:
+        """
+        Create the index table if the database supports it.
+
+        Args:
+            connection: SQLAlchemy Connection
+
+        Returns:
+            bool: True if the index exists after the call
+        """
+        if not cls.supports(connection):
+            cls._ready[connection.engine] = False
+            return False
+
+        if connection.dialect.name == 'sqlite':
+            connection.exec_driver_sql(cls.SQLITE_DDL)
+        else:
+            for statement in cls.POSTGRES_DDL:
+                connection.exec_driver_sql(statement)
+
+        cls._ready[connection.engine] = True
+        return True
+
+    @classmethod
+    def drop_index(cls, connection) -> None:
+        """Drop the index table, if present."""
+        table = cls.SQLITE_TABLE if connection.dialect.name == 'sqlite' else cls.POSTGRES_TABLE
+        if connection.dialect.name in ('sqlite', 'postgresql'):
+            connection.exec_driver_sql(f'DROP TABLE IF EXISTS {table}')
+        cls._ready.pop(connection.engine, None)
+
+    @classmethod
+    def ensure_index(cls, engine) -> bool:
+        """
+        Create the index for an existing database and fill it if empty.
+
+        Called at startup so databases created before the index existed
+        are indexed once; later changes are picked up incrementally.
+
+        Args:
+            engine: SQLAlchemy Engine
+
+        Returns:
+            bool: True if full-text search is available
+        """
+        with engine.begin() as connection:
+            if not inspect(connection).has_table(ContentAsset.__tablename__):
+                return False
+            if not cls.create_index(connection):
+                return False
+
+            table = cls._table(connection)
+            indexed = connection.execute(text(f'SELECT 1 FROM {table} LIMIT 1')).first()
+            has_assets = connection.execute(
+                text(f'SELECT 1 FROM {ContentAsset.__tablename__} LIMIT 1')
+            ).first()
+            if has_assets and not indexed:
+                cls._fill(connection)
+        return True
+
+    @classmethod
+    def rebuild_index(cls, engine) -> bool:
+        """
+        Rebuild the index from all existing assets.
+
+        Args:
+            engine: SQLAlchemy Engine
+
+        Returns:
+            bool: True if the index was rebuilt, False if unsupported
+        """
+        with engine.begin() as connection:
+            if not cls.create_index(connection):
+                return False
+            connection.execute(text(f'DELETE FROM {cls._table(connection)}'))
+            cls._fill(connection)
+        return True
+
+    @classmethod
+    def index_asset(cls, connection, asset) -> None:
+        """
+        Write an asset's index row, replacing any existing one.
+
+        Args:
+            connection: SQLAlchemy Connection in the flushing transaction
+            asset: ContentAsset instance
+        """
+        if not cls._is_ready(connection):
+            return
+
+        params = {field: getattr(asset, field) for field in cls.INDEXED_FIELDS}
+        params['asset_id'] = asset.id
+
+        if connection.dialect.name == 'sqlite':
+            connection.execute(
+                text(f'DELETE FROM {cls.SQLITE_TABLE} WHERE rowid = :asset_id'),
+                {'asset_id': asset.id}
+            )
+            connection.execute(
+                text(
+                    f'INSERT INTO {cls.SQLITE_TABLE} (rowid, title, description, tags, category) '
+                    'VALUES (:asset_id, :title, :description, :tags, :category)'
+                ),
+                params
+            )
+        else:
+            document = cls.POSTGRES_DOCUMENT.format(
+                title='CAST(:title AS TEXT)',
+                description='CAST(:description AS TEXT)',
+                tags='CAST(:tags AS TEXT)',
+                category='CAST(:category AS TEXT)',
+            )
+            connection.execute(
+                text(
+                    f'INSERT INTO {cls.POSTGRES_TABLE} (asset_id, document) '
+                    f'VALUES (:asset_id, {document}) '
+                    'ON CONFLICT (asset_id) DO UPDATE SET document = EXCLUDED.document'
+                ),
+                params
+            )
+
+    @classmethod
+    def remove_asset(cls, connection, asset_id: int) -> None:
+        """
+        Delete an asset's index row.
+
+        Args:
+            connection: SQLAlchemy Connection in the flushing transaction
+            asset_id: ID of the deleted asset
+        """
+        if not cls._is_ready(connection):
+            return
+
+        key = 'rowid' if connection.dialect.name == 'sqlite' else 'asset_id'
+        connection.execute(
+            text(f'DELETE FROM {cls._table(connection)} WHERE {key} = :asset_id'),
+            {'asset_id': asset_id}
+        )
+
+    @classmethod
+    def parse_terms(cls, search: str) -> List[str]:
+        """
+        Split a search string into lowercase word terms.
+
+        Args:
+            search: Raw search input
+
+        Returns:
+            List of terms; punctuation and search operators are dropped
+        """
+        return re.findall(r'\w+', search.lower()) if search else []
+
+    @classmethod
+    def search(cls, query, search: str, rank: bool = False):
+        """
+        Filter an asset query to assets matching every search term.
+
+        Args:
+            query: SQLAlchemy query selecting ContentAsset
+            search: Raw search input
+            rank: If True, order results best match first
+
+        Returns:
+            The filtered (and optionally ordered) query
+        """
+        terms = cls.parse_terms(search)
+        connection = query.session.connection()
+
+        if not terms or not cls._is_ready(connection):
+            return cls._ilike(query, search)
+
+        matches = cls._matches(connection, terms)
+        if rank:
+            return query.join(matches, ContentAsset.id == matches.c.asset_id).order_by(
+                matches.c.rank.asc()
+            )
+        return query.filter(ContentAsset.id.in_(select(matches.c.asset_id)))
+
+    @classmethod
+    def _matches(cls, connection, terms: List[str]):
+        """Return a subquery of (asset_id, rank) where lower rank is better."""
+        if connection.dialect.name == 'sqlite':
+            weights = ', '.join(str(weight) for weight in cls.SQLITE_WEIGHTS)
+            statement = text(
+                f'SELECT rowid AS asset_id, bm25({cls.SQLITE_TABLE}, {weights}) AS rank '
+                f'FROM {cls.SQLITE_TABLE} WHERE {cls.SQLITE_TABLE} MATCH :terms'
+            ).bindparams(terms=' '.join(f'"{term}"*' for term in terms))
+        else:
+            statement = text(
+                f'SELECT asset_id, -ts_rank_cd(document, query) AS rank '
+                f"FROM {cls.POSTGRES_TABLE}, to_tsquery('simple', :terms) AS query "
+                'WHERE document @@ query'
+            ).bindparams(terms=' & '.join(f'{term}:*' for term in terms))
+
+        return statement.columns(asset_id=Integer, rank=Float).subquery('search_matches')
+
+    @classmethod
+    def _ilike(cls, query, search: str):
+        """Substring search used where no full-text index is available."""
+        if not search:
+            return query
+        pattern = f'%{search}%'
+        return query.filter(or_(
+            *(getattr(ContentAsset, field).ilike(pattern) for field in cls.INDEXED_FIELDS)
+        ))
+
+    @classmethod
+    def _fill(cls, connection) -> None:
+        """Index every asset in one statement."""
+        if connection.dialect.name == 'sqlite':
+            connection.execute(text(
+                f'INSERT INTO {cls.SQLITE_TABLE} (rowid, title, description, tags, category) '
+                f'SELECT id, title, description, tags, category FROM {ContentAsset.__tablename__}'
+            ))
+        else:
+            document = cls.POSTGRES_DOCUMENT.format(
+                title='title', description='description', tags='tags', category='category'
+            )
+            connection.execute(text(
+                f'INSERT INTO {cls.POSTGRES_TABLE} (asset_id, document) '
+                f'SELECT id, {document} FROM {ContentAsset.__tablename__}'
+            ))
+
+    @classmethod
+    def _table(cls, connection) -> str:
+        """Return the index table name for a connection's dialect."""
+        return cls.SQLITE_TABLE if connection.dialect.name == 'sqlite' else cls.POSTGRES_TABLE
+
+    @classmethod
+    def _is_ready(cls, connection) -> bool:
+        """Check (once per engine) that the index table exists."""
+        engine = connection.engine
+        ready = cls._ready.get(engine)
+        if ready is None:
+            ready = cls.supports(connection) and inspect(connection).has_table(cls._table(connection))
+            cls._ready[engine] = ready
+        return ready
+
+
+def _index_inserted_asset(mapper, connection, target):
+    """Index a newly inserted asset."""
+    SearchService.index_asset(connection, target)
+
+
+def _index_updated_asset(mapper, connection, target):
+    """Re-index an updated asset if a searchable field changed."""
+    state = inspect(target)
+    if any(state.attrs[field].history.has_changes() for field in SearchService.INDEXED_FIELDS):
+        SearchService.index_asset(connection, target)
+
+
+def _unindex_deleted_asset(mapper, connection, target):
+    """Remove a deleted asset from the index."""
+    SearchService.remove_asset(connection, target.id)
+
+
+def _create_index(table, connection, **kwargs):
+    """Create the index together with the content_assets table."""
+    SearchService.create_index(connection)
+
+
+def _drop_index(table, connection, **kwargs):
+    """Drop the index before the content_assets table."""
+    SearchService.drop_index(connection)
+
+
+event.listen(ContentAsset, 'after_insert', _index_inserted_asset)
+event.listen(ContentAsset, 'after_update', _index_updated_asset)
+event.listen(ContentAsset, 'after_delete', _unindex_deleted_asset)
+event.listen(ContentAsset.__table__, 'after_create', _create_index)
+event.listen(ContentAsset.__table__, 'before_drop', _drop_index)
@@ -13,16 +13,200 @@ Key features:
 - Org-type based visibility rules (SKILLZ/RETAILER/BRAND/AGENCY)
 - Fast-track permission checking for privileged users
 - Query filtering for assets based on user visibility
+
+A user's role, organization, tenants and allowed brands are loaded once
+into a VisibilityContext with a single query. Contexts are reused for the
+rest of the request and cached per process for VISIBILITY_CACHE_TTL
+seconds; changes to users and organizations made in this process drop
+the cached entries. Asset visibility is applied as one SQL predicate, so
+filtering, counting and pagination run in the database.
 """
 
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Tuple
 import json
+import threading
+import time
 
-from sqlalchemy import or_, and_
+from flask import current_app, g, has_app_context, has_request_context, request
+from sqlalchemy import event, false, or_, and_, select
 
 from content_catalog.models import db, ContentAsset, User, Organization, Catalog
 
 
+def _parse_id_list(value) -> List:
+    """Parse a JSON-encoded ID list column, returning [] if unset or invalid."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return []
+    return list(value) if isinstance(value, (list, tuple)) else []
+
+
+class VisibilityContext:
+    """
+    Precomputed visibility facts for one user.
+
+    Holds plain values only (no ORM instances), so a context can be cached
+    and shared between requests, threads and database sessions.
+
+    Attributes:
+        user_id: ID of the user
+        role: User role
+        organization_id: ID of the user's organization, or None
+        org_type: Organization type (SKILLZ, RETAILER, BRAND, AGENCY) or None
+        tenant_ids: Tenant IDs from User.tenant_ids
+        allowed_brand_ids: Brand organization IDs an agency can access
+    """
+
+    ADMIN_ROLES = ('super_admin', 'admin')
+
+    def __init__(
+        self,
+        user_id: int,
+        role: Optional[str] = None,
+        organization_id: Optional[int] = None,
+        org_type: Optional[str] = None,
+        tenant_ids: Optional[List] = None,
+        allowed_brand_ids: Optional[List[int]] = None
+    ):
+        self.user_id = user_id
+        self.role = role
+        self.organization_id = organization_id
+        self.org_type = org_type
+        self.tenant_ids = tuple(tenant_ids or ())
+        self.allowed_brand_ids = tuple(allowed_brand_ids or ())
+
+    @property
+    def is_admin(self) -> bool:
+        """Check if the user is a super admin or admin."""
+        return self.role in self.ADMIN_ROLES
+
+    @property
+    def has_full_access(self) -> bool:
+        """Check if the user can see every asset."""
+        return self.is_admin or self.org_type == VisibilityService.ORG_TYPE_SKILLZ
+
+    def visible_organization_ids(self) -> Optional[List[int]]:
+        """
+        Get the organization IDs whose assets are listed for the user.
+
+        Returns:
+            List of organization IDs, or None if the user is not limited
+            by organization (full access, or no organization at all)
+        """
+        if self.has_full_access or self.organization_id is None:
+            return None
+        if self.org_type == VisibilityService.ORG_TYPE_AGENCY:
+            ids = [self.organization_id]
+            ids.extend(b for b in self.allowed_brand_ids if b != self.organization_id)
+            return ids
+        return [self.organization_id]
+
+    def asset_predicate(self):
+        """
+        Build the SQL condition selecting assets visible to the user.
+
+        Returns:
+            SQLAlchemy boolean expression, or None for full access
+        """
+        if self.has_full_access:
+            return None
+
+        if self.organization_id is None:
+            # User without organization can only see their own uploads
+            return ContentAsset.uploaded_by == self.user_id
+
+        if self.org_type == VisibilityService.ORG_TYPE_BRAND:
+            return ContentAsset.organization_id == self.organization_id
+
+        if self.org_type == VisibilityService.ORG_TYPE_AGENCY:
+            return ContentAsset.organization_id.in_(self.visible_organization_ids())
+
+        if self.org_type == VisibilityService.ORG_TYPE_RETAILER:
+            # Retailers see their organization's assets outside internal-only catalogs
+            # TODO: Add tenant_id filtering when tenant_id is added to ContentAsset
+            internal_catalogs = select(Catalog.id).where(Catalog.is_internal_only.is_(True))
+            return and_(
+                ContentAsset.organization_id == self.organization_id,
+                or_(
+                    ContentAsset.catalog_id.is_(None),
+                    ContentAsset.catalog_id.not_in(internal_catalogs)
+                )
+            )
+
+        # Default: only own uploads
+        return ContentAsset.uploaded_by == self.user_id
+
+
+class VisibilityCache:
+    """
+    In-process TTL/LRU cache of visibility contexts, keyed by user ID.
+
+    Entries expire after `ttl` seconds, which bounds how long a change made
+    by another process can go unnoticed. User and organization changes made
+    in this process drop entries as they are flushed.
+
+    Args:
+        ttl: Seconds an entry stays valid
+        max_size: Entries kept before the least recently used is evicted
+    """
+
+    def __init__(self, ttl, max_size=1024):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id) -> Optional[VisibilityContext]:
+        """Return the cached context for a user, or None."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires, context = entry
+            if expires <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return context
+
+    def put(self, context: VisibilityContext) -> None:
+        """Cache a user's context."""
+        with self._lock:
+            self._entries[context.user_id] = (time.monotonic() + self.ttl, context)
+            self._entries.move_to_end(context.user_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id=None, organization_id=None) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            user_id: Drop this user's entry
+            organization_id: Drop entries for members of this organization
+        """
+        with self._lock:
+            if user_id is not None:
+                self._entries.pop(user_id, None)
+            if organization_id is not None:
+                stale = [
+                    key for key, (_, context) in self._entries.items()
+                    if context.organization_id == organization_id
+                ]
+                for key in stale:
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
 class VisibilityService:
     """
     Service for filtering assets based on user visibility permissions.
@@ -56,7 +240,7 @@ class VisibilityService:
         self.user = user
         self.organization = user.organization if hasattr(user, 'organization') else None
         self.org_type = self._get_org_type()
-        self.tenant_ids = self._get_user_tenant_ids()
+        self.tenant_ids = self._get_tenant_ids()
         self.allowed_brand_ids = self._get_allowed_brand_ids()
 
     def _get_org_type(self) -> Optional[str]:
@@ -69,7 +253,7 @@ class VisibilityService:
                 return self.ORG_TYPE_SKILLZ
         return None
 
-    def _get_user_tenant_ids(self) -> List[str]:
+    def _get_tenant_ids(self) -> List[str]:
         """Get list of tenant IDs the user has access to."""
         if hasattr(self.user, 'tenant_ids') and self.user.tenant_ids:
             # tenant_ids might be stored as JSON string
@@ -251,6 +435,152 @@ class VisibilityService:
 
         return True
 
+    # ==========================================================================
+    # Visibility Context
+    # ==========================================================================
+
+    # Attribute on flask.g holding (request, {user_id: context}) for the current request
+    _REQUEST_CACHE_ATTR = '_visibility_contexts'
+
+    @classmethod
+    def get_context(cls, db_session, user_id: int) -> Optional[VisibilityContext]:
+        """
+        Get the visibility context for a user.
+
+        The context is built with one query, then reused for the rest of
+        the request and cached for VISIBILITY_CACHE_TTL seconds.
+
+        Args:
+            db_session: SQLAlchemy database session
+            user_id: ID of the user
+
+        Returns:
+            VisibilityContext, or None if the user does not exist
+        """
+        contexts = cls._request_contexts()
+        if contexts is not None and user_id in contexts:
+            return contexts[user_id]
+
+        cache = get_visibility_cache()
+        context = cache.get(user_id) if cache is not None else None
+        if context is None:
+            context = cls._build_context(db_session, user_id)
+            if context is not None and cache is not None:
+                cache.put(context)
+
+        if contexts is not None:
+            contexts[user_id] = context
+        return context
+
+    @classmethod
+    def _build_context(cls, db_session, user_id: int) -> Optional[VisibilityContext]:
+        """Load a user's visibility facts in a single query."""
+        row = db_session.query(
+            User.id,
+            User.role,
+            User.tenant_ids,
+            Organization.id,
+            Organization.org_type,
+            Organization.allowed_brand_ids,
+        ).outerjoin(
+            Organization, User.organization_id == Organization.id
+        ).filter(User.id == user_id).first()
+        if row is None:
+            return None
+
+        user_id, role, tenant_ids, organization_id, org_type, allowed_brand_ids = row
+        return VisibilityContext(
+            user_id=user_id,
+            role=role,
+            organization_id=organization_id,
+            org_type=org_type,
+            tenant_ids=_parse_id_list(tenant_ids),
+            allowed_brand_ids=_parse_id_list(allowed_brand_ids),
+        )
+
+    @classmethod
+    def _request_contexts(cls) -> Optional[Dict[int, Optional[VisibilityContext]]]:
+        """Return the per-request context dict, or None outside a request."""
+        if not has_request_context():
+            return None
+        # g lives as long as the app context, which can span several
+        # requests when the caller pushed it (e.g. tests), so tie the
+        # contexts to the request object itself
+        current = request._get_current_object()
+        holder = g.get(cls._REQUEST_CACHE_ATTR)
+        if holder is None or holder[0] is not current:
+            holder = (current, {})
+            setattr(g, cls._REQUEST_CACHE_ATTR, holder)
+        return holder[1]
+
+    @classmethod
+    def invalidate_cache(cls, user_id: Optional[int] = None,
+                         organization_id: Optional[int] = None) -> None:
+        """
+        Drop cached visibility contexts.
+
+        Called automatically when users or organizations are updated or
+        deleted in this process. With no arguments every entry is dropped.
+
+        Args:
+            user_id: Drop this user's context
+            organization_id: Drop contexts of this organization's members
+        """
+        contexts = cls._request_contexts()
+        if contexts is not None:
+            contexts.clear()
+
+        cache = get_visibility_cache()
+        if cache is None:
+            return
+        if user_id is None and organization_id is None:
+            cache.clear()
+        else:
+            cache.invalidate(user_id=user_id, organization_id=organization_id)
+
+    @classmethod
+    def visible_assets_query(
+        cls,
+        db_session,
+        user_id: int,
+        query=None,
+        include_drafts: bool = False
+    ):
+        """
+        Filter a content asset query to assets visible to the user.
+
+        Unlike filter_assets_for_user this returns the query, so callers
+        can add filters, ordering, counts and pagination in the database.
+
+        Args:
+            db_session: SQLAlchemy database session
+            user_id: ID of the user
+            query: Optional SQLAlchemy query to filter (defaults to all assets)
+            include_drafts: If True, include draft assets (default False)
+
+        Returns:
+            SQLAlchemy query with the visibility predicate applied
+        """
+        if query is None:
+            query = db_session.query(ContentAsset)
+
+        context = cls.get_context(db_session, user_id)
+        if context is None:
+            return query.filter(false())
+
+        # Filter by status (exclude drafts by default)
+        if not include_drafts:
+            query = query.filter(ContentAsset.status != ContentAsset.STATUS_DRAFT)
+
+        predicate = context.asset_predicate()
+        if predicate is not None:
+            query = query.filter(predicate)
+        return query
+
+    # ==========================================================================
+    # Permission Checks by ID
+    # ==========================================================================
+
     @classmethod
     def _get_user_tenant_ids(cls, db_session, user_id: int) -> List[int]:
         """
@@ -266,21 +596,10 @@ class VisibilityService:
         Returns:
             List of tenant IDs the user can access, or empty list if none
         """
-        user = db_session.query(User).filter_by(id=user_id).first()
-        if user is None:
+        context = cls.get_context(db_session, user_id)
+        if context is None:
             return []
-
-        if hasattr(user, 'get_tenant_ids_list'):
-            return user.get_tenant_ids_list()
-
-        if hasattr(user, 'tenant_ids') and user.tenant_ids:
-            if isinstance(user.tenant_ids, str):
-                try:
-                    return json.loads(user.tenant_ids)
-                except json.JSONDecodeError:
-                    return []
-            return user.tenant_ids
-        return []
+        return list(context.tenant_ids)
 
     @classmethod
     def _get_user_organization(cls, db_session, user_id: int) -> Optional[Organization]:
@@ -294,11 +613,11 @@ class VisibilityService:
         Returns:
             Organization instance or None if user has no organization
         """
-        user = db_session.query(User).filter_by(id=user_id).first()
-        if user is None or not hasattr(user, 'organization'):
+        context = cls.get_context(db_session, user_id)
+        if context is None or context.organization_id is None:
             return None
 
-        return user.organization
+        return db_session.get(Organization, context.organization_id)
 
     @classmethod
     def _get_user_org_type(cls, db_session, user_id: int) -> Optional[str]:
@@ -312,10 +631,10 @@ class VisibilityService:
         Returns:
             Org type string (SKILLZ, RETAILER, BRAND, AGENCY) or None
         """
-        org = cls._get_user_organization(db_session, user_id)
-        if org is None:
+        context = cls.get_context(db_session, user_id)
+        if context is None:
             return None
-        return getattr(org, 'org_type', None)
+        return context.org_type
 
     @classmethod
     def _is_skillz_user(cls, db_session, user_id: int) -> bool:
@@ -348,12 +667,10 @@ class VisibilityService:
         Returns:
             True if user is a super admin, False otherwise
         """
-        user = db_session.query(User).filter_by(id=user_id).first()
-        if user is None:
+        context = cls.get_context(db_session, user_id)
+        if context is None:
             return False
-        if hasattr(user, 'role'):
-            return user.role in ('super_admin', 'admin')
-        return False
+        return context.is_admin
 
     @classmethod
     def has_tenant_access(cls, db_session, user_id: int, tenant_id: int) -> bool:
@@ -372,13 +689,16 @@ class VisibilityService:
         Returns:
             True if user has access to the tenant, False otherwise
         """
+        context = cls.get_context(db_session, user_id)
+        if context is None:
+            return False
+
         # Super admins and SKILLZ users have full access
-        if cls._is_super_admin(db_session, user_id) or cls._is_skillz_user(db_session, user_id):
+        if context.has_full_access:
             return True
 
         # Check if tenant is in user's tenant_ids
-        user_tenant_ids = cls._get_user_tenant_ids(db_session, user_id)
-        return tenant_id in user_tenant_ids
+        return tenant_id in context.tenant_ids
 
     @classmethod
     def can_view_asset_by_id(
@@ -406,60 +726,58 @@ class VisibilityService:
             - If can_view is True, reason will be 'ok'
             - If can_view is False, reason explains why
         """
-        # Fetch user
-        user = db_session.query(User).filter_by(id=user_id).first()
-        if user is None:
+        context = cls.get_context(db_session, user_id)
+        if context is None:
             return False, 'User not found'
 
-        # Fetch asset
-        asset = db_session.query(ContentAsset).filter_by(id=asset_id).first()
+        # Fetch only the columns the rules need
+        asset = db_session.query(
+            ContentAsset.organization_id,
+            ContentAsset.uploaded_by,
+            Catalog.is_internal_only,
+        ).outerjoin(
+            Catalog, ContentAsset.catalog_id == Catalog.id
+        ).filter(ContentAsset.id == asset_id).first()
         if asset is None:
             return False, 'Asset not found'
 
         # Super admins can see everything
-        if hasattr(user, 'role') and user.role in ('super_admin', 'admin'):
+        if context.is_admin:
             return True, 'ok'
 
-        # Get user's organization
-        org = cls._get_user_organization(db_session, user_id)
-
         # If user has no organization, they can only see their own uploads
-        if org is None:
+        if context.organization_id is None:
             if asset.uploaded_by == user_id:
                 return True, 'ok'
             return False, 'User has no organization and is not the uploader'
 
         # SKILLZ users can see all assets
-        if getattr(org, 'org_type', None) == cls.ORG_TYPE_SKILLZ:
+        if context.org_type == cls.ORG_TYPE_SKILLZ:
             return True, 'ok'
 
         # BRAND users can only see their own organization's assets
-        if getattr(org, 'org_type', None) == cls.ORG_TYPE_BRAND:
-            if asset.organization_id == org.id:
+        if context.org_type == cls.ORG_TYPE_BRAND:
+            if asset.organization_id == context.organization_id:
                 return True, 'ok'
             return False, 'Brand users can only view their own assets'
 
         # AGENCY users can see assets from allowed brands
-        if getattr(org, 'org_type', None) == cls.ORG_TYPE_AGENCY:
-            if asset.organization_id == org.id:
-                return True, 'ok'
-            if hasattr(org, 'can_access_brand') and org.can_access_brand(asset.organization_id):
+        if context.org_type == cls.ORG_TYPE_AGENCY:
+            if asset.organization_id == context.organization_id:
                 return True, 'ok'
-            if hasattr(org, 'allowed_brand_ids') and asset.organization_id in (org.allowed_brand_ids or []):
+            if asset.organization_id in context.allowed_brand_ids:
                 return True, 'ok'
             return False, 'Agency does not have access to this brand\'s assets'
 
         # RETAILER users can see tenant assets (non-internal)
-        if getattr(org, 'org_type', None) == cls.ORG_TYPE_RETAILER:
+        if context.org_type == cls.ORG_TYPE_RETAILER:
             # Check if asset is in an internal-only catalog
-            if hasattr(asset, 'catalog') and asset.catalog and hasattr(asset.catalog, 'is_internal_only'):
-                if asset.catalog.is_internal_only:
-                    return False, 'Retailer cannot view internal-only assets'
+            if asset.is_internal_only:
+                return False, 'Retailer cannot view internal-only assets'
             # Check user has access to any tenant
-            user_tenant_ids = cls._get_user_tenant_ids(db_session, user_id)
-            if not user_tenant_ids:
+            if not context.tenant_ids:
                 # Fall back to organization-based check
-                if asset.organization_id == org.id:
+                if asset.organization_id == context.organization_id:
                     return True, 'ok'
                 return False, 'Retailer user has no tenant access'
             # Retailers can see assets within their tenant scope
@@ -479,6 +797,8 @@ class VisibilityService:
         Filter a content asset query to only show assets visible to the user.
 
         Applies org-type based visibility rules to filter the query results.
+        Use visible_assets_query to paginate or count in the database
+        instead of loading every visible asset.
 
         Args:
             db_session: SQLAlchemy database session
@@ -489,74 +809,11 @@ class VisibilityService:
         Returns:
             List of ContentAsset instances visible to the user
         """
-        if query is None:
-            query = db_session.query(ContentAsset)
-
-        # Fetch user
-        user = db_session.query(User).filter_by(id=user_id).first()
-        if user is None:
+        if cls.get_context(db_session, user_id) is None:
             return []
-
-        # Filter by status (exclude drafts by default)
-        if not include_drafts and hasattr(ContentAsset, 'STATUS_DRAFT'):
-            query = query.filter(ContentAsset.status != ContentAsset.STATUS_DRAFT)
-
-        # Super admins see everything
-        if hasattr(user, 'role') and user.role in ('super_admin', 'admin'):
-            return query.all()
-
-        # Get user's organization
-        org = cls._get_user_organization(db_session, user_id)
-
-        if org is None:
-            # User without organization can only see their own uploads
-            return query.filter(ContentAsset.uploaded_by == user_id).all()
-
-        org_type = getattr(org, 'org_type', None)
-
-        # SKILLZ users see all assets
-        if org_type == cls.ORG_TYPE_SKILLZ:
-            return query.all()
-
-        # BRAND users see only their organization's assets
-        if org_type == cls.ORG_TYPE_BRAND:
-            return query.filter(ContentAsset.organization_id == org.id).all()
-
-        # AGENCY users see their own + allowed brands
-        if org_type == cls.ORG_TYPE_AGENCY:
-            allowed_brand_ids = getattr(org, 'allowed_brand_ids', [])
-            if isinstance(allowed_brand_ids, str):
-                try:
-                    allowed_brand_ids = json.loads(allowed_brand_ids)
-                except json.JSONDecodeError:
-                    allowed_brand_ids = []
-            if hasattr(org, 'get_allowed_brand_ids'):
-                allowed_brand_ids = org.get_allowed_brand_ids()
-            allowed_org_ids = [org.id] + (allowed_brand_ids or [])
-            return query.filter(ContentAsset.organization_id.in_(allowed_org_ids)).all()
-
-        # RETAILER users see tenant assets
-        if org_type == cls.ORG_TYPE_RETAILER:
-            # Filter out internal-only catalogs
-            query = query.join(
-                Catalog, ContentAsset.catalog_id == Catalog.id, isouter=True
-            ).filter(
-                or_(
-                    Catalog.is_internal_only == False,
-                    Catalog.is_internal_only.is_(None),
-                    ContentAsset.catalog_id.is_(None)
-                )
-            )
-            user_tenant_ids = cls._get_user_tenant_ids(db_session, user_id)
-            if not user_tenant_ids:
-                # Fall back to organization-based filtering
-                return query.filter(ContentAsset.organization_id == org.id).all()
-            # For now, retailers see their organization's assets
-            # TODO: Add tenant_id filtering when tenant_id is added to ContentAsset
-            return query.filter(ContentAsset.organization_id == org.id).all()
-
-        # Default: only own uploads
-        return query.filter(ContentAsset.uploaded_by == user_id).all()
+        return cls.visible_assets_query(
+            db_session, user_id, query=query, include_drafts=include_drafts
+        ).all()
 
     @classmethod
     def get_visible_organization_ids(
@@ -574,55 +831,18 @@ class VisibilityService:
         Returns:
             List of organization IDs the user can see assets from
         """
-        user = db_session.query(User).filter_by(id=user_id).first()
-        if user is None:
+        context = cls.get_context(db_session, user_id)
+        if context is None or (context.organization_id is None and not context.is_admin):
             return []
 
-        # Super admins and SKILLZ users see all organizations
-        if hasattr(user, 'role') and user.role in ('super_admin', 'admin'):
-            orgs = db_session.query(Organization).filter(
-                or_(
-                    getattr(Organization, 'status', None) == 'active',
-                    ~hasattr(Organization, 'status')
-                )
+        # Super admins and SKILLZ users see all active organizations
+        if context.has_full_access:
+            rows = db_session.query(Organization.id).filter(
+                Organization.status == 'active'
             ).all()
-            return [o.id for o in orgs]
-
-        org = cls._get_user_organization(db_session, user_id)
-        if org is None:
-            return []
-
-        org_type = getattr(org, 'org_type', None)
-
-        if org_type == cls.ORG_TYPE_SKILLZ:
-            orgs = db_session.query(Organization).filter(
-                or_(
-                    getattr(Organization, 'status', None) == 'active',
-                    ~hasattr(Organization, 'status')
-                )
-            ).all()
-            return [o.id for o in orgs]
-
-        if org_type == cls.ORG_TYPE_BRAND:
-            return [org.id]
-
-        if org_type == cls.ORG_TYPE_AGENCY:
-            allowed_brand_ids = getattr(org, 'allowed_brand_ids', [])
-            if isinstance(allowed_brand_ids, str):
-                try:
-                    allowed_brand_ids = json.loads(allowed_brand_ids)
-                except json.JSONDecodeError:
-                    allowed_brand_ids = []
-            if hasattr(org, 'get_allowed_brand_ids'):
-                allowed_brand_ids = org.get_allowed_brand_ids()
-            return [org.id] + (allowed_brand_ids or [])
-
-        if org_type == cls.ORG_TYPE_RETAILER:
-            # Retailers see their own org for now
-            # TODO: Expand based on tenant memberships
-            return [org.id]
+            return [row.id for row in rows]
 
-        return [org.id]
+        return context.visible_organization_ids()
 
     @classmethod
     def can_access_catalog(
@@ -647,17 +867,15 @@ class VisibilityService:
         Returns:
             Tuple of (can_access: bool, reason: str)
         """
-        user = db_session.query(User).filter_by(id=user_id).first()
-        if user is None:
+        context = cls.get_context(db_session, user_id)
+        if context is None:
             return False, 'User not found'
 
-        # Super admins have full access
-        if hasattr(user, 'role') and user.role in ('super_admin', 'admin'):
+        # Super admins and SKILLZ users have full access
+        if context.has_full_access:
             return True, 'ok'
 
-        # SKILLZ users have full access
-        if cls._is_skillz_user(db_session, user_id):
-            return True, 'ok'
+        user = db_session.get(User, user_id)
 
         # Check allowed_catalog_ids if set
         if hasattr(user, 'get_allowed_catalog_ids_list'):
@@ -702,17 +920,15 @@ class VisibilityService:
         Returns:
             Tuple of (can_access: bool, reason: str)
         """
-        user = db_session.query(User).filter_by(id=user_id).first()
-        if user is None:
+        context = cls.get_context(db_session, user_id)
+        if context is None:
             return False, 'User not found'
 
-        # Super admins have full access
-        if hasattr(user, 'role') and user.role in ('super_admin', 'admin'):
+        # Super admins and SKILLZ users have full access
+        if context.has_full_access:
             return True, 'ok'
 
-        # SKILLZ users have full access
-        if cls._is_skillz_user(db_session, user_id):
-            return True, 'ok'
+        user = db_session.get(User, user_id)
 
         # Check allowed_category_ids if set
         if hasattr(user, 'get_allowed_category_ids_list'):
@@ -746,4 +962,44 @@ def get_visibility_service(user: User) -> VisibilityService:
     Returns:
         VisibilityService instance
     """
-    return VisibilityService(user)
\ No newline at end of file
+    return VisibilityService(user)
+
+
+def get_visibility_cache() -> Optional[VisibilityCache]:
+    """
+    Get the visibility context cache for the current app.
+
+    The cache is created on first use from VISIBILITY_CACHE_TTL and
+    VISIBILITY_CACHE_SIZE.
+
+    Returns:
+        VisibilityCache, or None outside an app context or if
+        VISIBILITY_CACHE_TTL is 0
+    """
+    if not has_app_context():
+        return None
+    ttl = current_app.config.get('VISIBILITY_CACHE_TTL', 0)
+    if not ttl:
+        return None
+
+    cache = current_app.extensions.get('visibility_cache')
+    if cache is None:
+        cache = VisibilityCache(ttl, current_app.config.get('VISIBILITY_CACHE_SIZE', 1024))
+        current_app.extensions['visibility_cache'] = cache
+    return cache
+
+
+def _invalidate_user(mapper, connection, target):
+    """Drop the cached context of an updated or deleted user."""
+    VisibilityService.invalidate_cache(user_id=target.id)
+
+
+def _invalidate_organization(mapper, connection, target):
+    """Drop cached contexts of an updated or deleted organization's members."""
+    VisibilityService.invalidate_cache(organization_id=target.id)
+
+
+event.listen(User, 'after_update', _invalidate_user)
+event.listen(User, 'after_delete', _invalidate_user)
+event.listen(Organization, 'after_update', _invalidate_organization)
+event.listen(Organization, 'after_delete', _invalidate_organization)
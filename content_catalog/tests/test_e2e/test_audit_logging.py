@@ -12,12 +12,16 @@ captured in the audit_logs table:
 These tests ensure compliance with security and audit requirements.
 """
 
+import csv
+import gzip
 import io
 import json
 import pytest
 from datetime import datetime, timezone
 from unittest.mock import patch
 
+from flask_jwt_extended import create_access_token
+
 from content_catalog.app import create_app
 from content_catalog.models import (
     db, User, Organization, AuditLog,
@@ -576,6 +580,82 @@ class TestAuditLogQueryEndpoint:
         for log in logs:
             assert log['action'] == 'user.login'
 
+    def _get_token_headers(self):
+        """
+        Get JWT authorization headers minted directly for the super admin.
+
+        The subject is the user id as a string, as PyJWT requires, so the
+        export tests do not depend on the login route.
+        """
+        token = create_access_token(identity=str(self.super_admin.id))
+        return {'Authorization': f'Bearer {token}'}
+
+    def _add_export_logs(self):
+        """Create two login entries and one upload entry for the export tests."""
+        for action, user_agent in (
+            (AuditLog.ACTION_USER_LOGIN, 'Browser A'),
+            (AuditLog.ACTION_USER_LOGIN, 'Browser, "B"'),
+            (AuditLog.ACTION_CONTENT_UPLOADED, 'Browser A'),
+        ):
+            self.db_session.add(AuditLog(
+                user_id=self.super_admin.id,
+                user_email=self.super_admin.email,
+                action=action,
+                resource_type=AuditLog.RESOURCE_USER,
+                resource_id=str(self.super_admin.id),
+                ip_address='127.0.0.1',
+                user_agent=user_agent
+            ))
+        self.db_session.commit()
+
+    def test_audit_logs_export_streams_csv(self):
+        """Test that filtered audit logs are exported as a CSV attachment."""
+        self._add_export_logs()
+        headers = self._get_token_headers()
+
+        response = self.client.get(
+            '/admin/api/audit-logs/export?action=user.login',
+            headers=headers
+        )
+
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert response.content_type == 'text/csv; charset=utf-8'
+        assert 'attachment' in response.headers['Content-Disposition']
+
+        rows = list(csv.reader(io.StringIO(response.data.decode('utf-8'))))
+        assert rows[0][:5] == ['ID', 'Timestamp', 'User ID', 'User Email', 'Action']
+        assert len(rows) == 3
+        assert all(row[3:5] == ['superadmin@test.com', 'user.login'] for row in rows[1:])
+        assert sorted(row[8] for row in rows[1:]) == ['Browser A', 'Browser, "B"']
+
+    def test_audit_logs_export_rejects_invalid_filter(self):
+        """Test that the export validates filters like the list endpoint."""
+        headers = self._get_token_headers()
+
+        response = self.client.get(
+            '/admin/api/audit-logs/export?user_id=abc',
+            headers=headers
+        )
+
+        assert response.status_code == 400
+
+    def test_audit_logs_export_gzip(self):
+        """Test that the export is gzip-encoded when the client accepts it."""
+        self._add_export_logs()
+        headers = self._get_token_headers()
+        headers['Accept-Encoding'] = 'gzip'
+
+        response = self.client.get('/admin/api/audit-logs/export', headers=headers)
+
+        assert response.status_code == 200
+        assert response.headers['Content-Encoding'] == 'gzip'
+        rows = list(csv.reader(io.StringIO(gzip.decompress(response.data).decode('utf-8'))))
+        assert len(rows) == 4
+        assert sorted(row[4] for row in rows[1:]) == [
+            'content.uploaded', 'user.login', 'user.login'
+        ]
+
 
 class TestAllCriticalActionsLogged:
     """
@@ -16,6 +16,7 @@ Test categories:
 - Pagination tests
 - Authentication error tests
 - Invalid parameter tests
+- Incremental sync tests (updated_since and cursor)
 """
 
 import json
@@ -870,3 +871,96 @@ class TestApprovedContentUserNotFound:
         assert response.status_code == 404
         data = response.get_json()
         assert 'User not found' in data['error']
+
+
+# =============================================================================
+# Incremental Sync Tests
+# =============================================================================
+
+SERVICE_HEADERS = {'X-Service-API-Key': 'skillz-cms-service-key-2026'}
+
+
+@pytest.fixture
+def sync_content(db_session):
+    """Create approved and published assets on network-1 for sync testing."""
+    assets = []
+    for title, status in [('Osprey Approved', ContentAsset.STATUS_APPROVED),
+                          ('Osprey Published', ContentAsset.STATUS_PUBLISHED)]:
+        asset = ContentAsset(
+            title=title,
+            filename=f'{title.lower().replace(" ", "_")}.mp4',
+            file_path=f'/uploads/{title.lower().replace(" ", "_")}.mp4',
+            status=status,
+            networks='["network-1"]'
+        )
+        db_session.add(asset)
+        assets.append(asset)
+    db_session.commit()
+    return assets
+
+
+class TestApprovedContentIncrementalSync:
+    """Tests for updated_since and cursor parameters."""
+
+    def test_page_count_returned(self, client, app, sync_content):
+        """Page-number responses should include the number of pages."""
+        response = client.get('/api/v1/approvals/content/approved?network_id=network-1&per_page=1',
+                              headers=SERVICE_HEADERS)
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['total'] == 2
+        assert data['pages'] == 2
+
+    def test_network_filter_matches_exact_id(self, client, app, db_session, sync_content):
+        """network_id=network-1 should not match assets only on network-10."""
+        for asset in sync_content:
+            asset.networks = '["network-10"]'
+        db_session.commit()
+
+        response = client.get('/api/v1/approvals/content/approved?network_id=network-1',
+                              headers=SERVICE_HEADERS)
+
+        assert response.status_code == 200
+        assert response.get_json()['total'] == 0
+
+    def test_updated_since_filters_unchanged_content(self, client, app, db_session, sync_content):
+        """updated_since should only return content changed at or after it."""
+        sync_content[0].updated_at = datetime(2020, 1, 1)
+        db_session.commit()
+
+        response = client.get(
+            '/api/v1/approvals/content/approved?network_id=network-1&updated_since=2021-01-01T00:00:00Z',
+            headers=SERVICE_HEADERS
+        )
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert [a['title'] for a in data['assets']] == ['Osprey Published']
+        assert data['has_next'] is False
+        assert data['next_cursor'] is None
+        assert 'total' not in data
+
+    def test_cursor_pages_through_changes(self, client, app, sync_content):
+        """Following next_cursor should return each changed asset once."""
+        titles = []
+        url = '/api/v1/approvals/content/approved?network_id=network-1&per_page=1&cursor='
+        for _ in range(3):
+            response = client.get(url, headers=SERVICE_HEADERS)
+            assert response.status_code == 200
+            data = response.get_json()
+            titles.extend(a['title'] for a in data['assets'])
+            if not data['next_cursor']:
+                break
+            url = ('/api/v1/approvals/content/approved?network_id=network-1&per_page=1'
+                   f"&cursor={data['next_cursor']}")
+
+        assert titles == ['Osprey Approved', 'Osprey Published']
+
+    @pytest.mark.parametrize('query', ['updated_since=yesterday', 'cursor=not-a-cursor'])
+    def test_invalid_sync_parameters_return_error(self, client, app, query):
+        """Malformed updated_since or cursor values should return 400."""
+        response = client.get(f'/api/v1/approvals/content/approved?{query}',
+                              headers=SERVICE_HEADERS)
+
+        assert response.status_code == 400
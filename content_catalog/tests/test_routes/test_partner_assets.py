@@ -0,0 +1,106 @@
+"""
+Route tests for the partner portal assets page.
+
+Tests the /partner/assets page including:
+- Listing only assets visible to the partner
+- Paging in the database with status counts for all visible assets
+- Status filtering
+"""
+
+import pytest
+
+from content_catalog.models import ContentAsset, Organization, User
+from content_catalog.services.auth_service import AuthService
+from content_catalog.tests.conftest import TEST_PASSWORD_HASH
+
+
+@pytest.fixture
+def partner_client(app, client, db_session):
+    """A brand partner with a session cookie and a few assets."""
+    brand = Organization(
+        name='Wren Brand',
+        type='partner',
+        contact_email='owner@wrenbrand.com',
+        status='active',
+        org_type=Organization.ORG_TYPE_BRAND
+    )
+    other = Organization(
+        name='Wren Rival',
+        type='partner',
+        contact_email='owner@wrenrival.com',
+        status='active',
+        org_type=Organization.ORG_TYPE_BRAND
+    )
+    db_session.add_all([brand, other])
+    db_session.flush()
+
+    user = User(
+        email='partner@wrenbrand.com',
+        password_hash=TEST_PASSWORD_HASH,
+        name='Wren Partner',
+        role=User.ROLE_PARTNER,
+        organization_id=brand.id,
+        status=User.STATUS_ACTIVE
+    )
+    db_session.add(user)
+    db_session.flush()
+
+    statuses = [ContentAsset.STATUS_DRAFT] * 2 + [ContentAsset.STATUS_APPROVED] * 3
+    for index, status in enumerate(statuses):
+        db_session.add(ContentAsset(
+            title=f'Wren Clip {index}',
+            filename=f'wren_{index}.mp4',
+            file_path=f'/uploads/wren_{index}.mp4',
+            status=status,
+            organization_id=brand.id
+        ))
+    db_session.add(ContentAsset(
+        title='Wren Rival Clip',
+        filename='rival.mp4',
+        file_path='/uploads/rival.mp4',
+        status=ContentAsset.STATUS_APPROVED,
+        organization_id=other.id
+    ))
+
+    session = AuthService.create_session(db_session, user.id)
+    db_session.commit()
+
+    client.set_cookie('partner_session', session.token)
+    return client
+
+
+class TestPartnerAssetsPage:
+    """Tests for GET /partner/assets."""
+
+    def test_lists_only_visible_assets(self, partner_client):
+        """Brand partners should see their own assets, drafts included."""
+        response = partner_client.get('/partner/assets')
+
+        assert response.status_code == 200
+        html = response.get_data(as_text=True)
+        assert 'Wren Clip 0' in html
+        assert 'Wren Clip 4' in html
+        assert 'Wren Rival Clip' not in html
+        assert '5 assets' in html
+
+    def test_pages_assets(self, partner_client):
+        """per_page should limit the cards while counts cover every asset."""
+        response = partner_client.get('/partner/assets?per_page=2&page=3')
+
+        assert response.status_code == 200
+        html = response.get_data(as_text=True)
+        assert 'Page 3 of 3' in html
+        assert html.count('class="asset-card"') == 1
+        # Oldest asset is last when sorted newest first
+        assert 'Wren Clip 0' in html
+        assert '5 assets' in html
+
+    def test_filters_by_status(self, partner_client):
+        """The status filter should apply in the database."""
+        response = partner_client.get('/partner/assets?status=approved')
+
+        assert response.status_code == 200
+        html = response.get_data(as_text=True)
+        assert '3 assets' in html
+        assert 'Wren Clip 0' not in html
+        assert 'Wren Clip 2' in html
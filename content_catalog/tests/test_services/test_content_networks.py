@@ -0,0 +1,171 @@
+"""
+Unit tests for network distribution lookups in Content Catalog service.
+
+Tests ContentAssetNetwork and ContentService functionality including:
+- Keeping content_asset_networks in step with asset networks and status
+- Exact network matching in get_approved_content
+- Incremental listing with get_approved_content_changes
+- Backfilling network rows for existing assets
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from content_catalog.migrations.add_asset_networks import migrate
+from content_catalog.models import db, ContentAsset, ContentAssetNetwork
+from content_catalog.services.content_service import ContentService
+
+
+def _create(db_session, title, networks=None, status=ContentAsset.STATUS_APPROVED, **kwargs):
+    """Create and commit an asset."""
+    asset = ContentAsset(
+        title=title,
+        filename=f'{title.lower().replace(" ", "_")}.mp4',
+        file_path=f'/uploads/{title.lower().replace(" ", "_")}.mp4',
+        status=status,
+        networks=networks,
+        **kwargs
+    )
+    db_session.add(asset)
+    db_session.commit()
+    return asset
+
+
+def _network_ids(db_session, asset):
+    """Return the network IDs stored for an asset."""
+    rows = db_session.query(ContentAssetNetwork).filter_by(asset_id=asset.id)
+    return sorted(row.network_id for row in rows)
+
+
+# =============================================================================
+# Network Row Maintenance Tests
+# =============================================================================
+
+class TestAssetNetworkMaintenance:
+    """Tests for keeping content_asset_networks in step with assets."""
+
+    def test_rows_written_on_insert(self, app, db_session):
+        """Creating an asset should write one row per network."""
+        asset = _create(db_session, 'Kestrel Clip', networks='["network-1", "network-2"]')
+
+        assert _network_ids(db_session, asset) == ['network-1', 'network-2']
+
+    def test_rows_replaced_when_networks_change(self, app, db_session):
+        """Changing networks should replace the asset's rows."""
+        asset = _create(db_session, 'Kestrel Clip', networks='["network-1"]')
+
+        asset.networks = '["network-3"]'
+        db_session.commit()
+
+        assert _network_ids(db_session, asset) == ['network-3']
+
+    def test_status_copied_to_rows(self, app, db_session):
+        """Changing status should update the status on the asset's rows."""
+        asset = _create(db_session, 'Kestrel Clip', networks='["network-1"]',
+                        status=ContentAsset.STATUS_PENDING_REVIEW)
+
+        asset.status = ContentAsset.STATUS_PUBLISHED
+        db_session.commit()
+
+        row = db_session.query(ContentAssetNetwork).filter_by(asset_id=asset.id).one()
+        assert row.status == ContentAsset.STATUS_PUBLISHED
+
+    def test_rows_removed_on_delete(self, app, db_session):
+        """Deleting an asset should delete its rows."""
+        asset = _create(db_session, 'Kestrel Clip', networks='["network-1"]')
+        asset_id = asset.id
+
+        db_session.delete(asset)
+        db_session.commit()
+
+        assert db_session.query(ContentAssetNetwork).filter_by(asset_id=asset_id).count() == 0
+
+    def test_migration_backfills_existing_assets(self, app, db_session):
+        """migrate should write rows for assets that have none."""
+        asset = _create(db_session, 'Kestrel Clip', networks='["network-1"]')
+        db_session.query(ContentAssetNetwork).delete()
+        db_session.commit()
+
+        assert migrate(db.engine) is True
+
+        assert _network_ids(db_session, asset) == ['network-1']
+
+    @pytest.mark.parametrize('networks, expected', [
+        ('["network-1", "network-2", "network-1"]', ['network-1', 'network-2']),
+        ('[7, null, ""]', ['7']),
+        ('"network-1"', ['network-1']),
+        ('network-1, network-2', ['network-1', 'network-2']),
+        (None, []),
+    ])
+    def test_parse_networks(self, networks, expected):
+        """parse_networks should accept JSON lists, single values and CSV."""
+        assert ContentAssetNetwork.parse_networks(networks) == expected
+
+
+# =============================================================================
+# Approved Content Query Tests
+# =============================================================================
+
+class TestApprovedContentQueries:
+    """Tests for get_approved_content and get_approved_content_changes."""
+
+    def test_network_filter_matches_exact_id(self, app, db_session):
+        """network-1 should not match assets only on network-10."""
+        _create(db_session, 'Kestrel One', networks='["network-1"]')
+        _create(db_session, 'Kestrel Ten', networks='["network-10"]')
+
+        assets, total = ContentService.get_approved_content(db_session, network_id='network-1')
+
+        assert total == 1
+        assert [asset.title for asset in assets] == ['Kestrel One']
+
+    def test_network_filter_excludes_unapproved(self, app, db_session):
+        """Only approved and published assets should be listed for a network."""
+        _create(db_session, 'Kestrel Draft', networks='["network-1"]',
+                status=ContentAsset.STATUS_DRAFT)
+        _create(db_session, 'Kestrel Live', networks='["network-1"]',
+                status=ContentAsset.STATUS_PUBLISHED)
+
+        assets, total = ContentService.get_approved_content(db_session, network_id='network-1')
+
+        assert [asset.title for asset in assets] == ['Kestrel Live']
+
+    def test_changes_since_timestamp(self, app, db_session):
+        """Only assets updated at or after updated_since should be returned."""
+        old = _create(db_session, 'Kestrel Old', networks='["network-1"]')
+        old.updated_at = datetime(2020, 1, 1)
+        db_session.commit()
+        _create(db_session, 'Kestrel New', networks='["network-1"]')
+
+        assets, has_next = ContentService.get_approved_content_changes(
+            db_session,
+            updated_since=datetime(2021, 1, 1),
+            network_id='network-1'
+        )
+
+        assert [asset.title for asset in assets] == ['Kestrel New']
+        assert has_next is False
+
+    def test_changes_paged_by_keyset(self, app, db_session):
+        """Pages after a keyset position should cover every asset once."""
+        start = datetime(2024, 1, 1)
+        for index in range(5):
+            asset = _create(db_session, f'Kestrel {index}', networks='["network-1"]')
+            # Two assets share each timestamp to exercise the id tiebreak
+            asset.updated_at = start + timedelta(minutes=index // 2)
+            db_session.commit()
+
+        titles, after, has_next = [], None, True
+        while has_next:
+            assets, has_next = ContentService.get_approved_content_changes(
+                db_session,
+                updated_since=start,
+                after=after,
+                network_id='network-1',
+                per_page=2
+            )
+            titles.extend(asset.title for asset in assets)
+            after = (assets[-1].updated_at, assets[-1].id)
+
+        assert titles == [f'Kestrel {index}' for index in range(5)]
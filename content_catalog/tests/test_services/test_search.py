@@ -0,0 +1,157 @@
+"""
+Unit tests for SearchService in Content Catalog service.
+
+Tests SearchService functionality including:
+- Indexing assets on upload, update and delete through ContentService
+- Indexing assets created directly through the model
+- Prefix matching across title, description, tags and category
+- Relevance ranking
+- Filling the index for existing assets
+"""
+
+import pytest
+from sqlalchemy import text
+
+from content_catalog.models import db, ContentAsset
+from content_catalog.services.content_service import ContentService
+from content_catalog.services.search_service import SearchService
+
+
+def _upload(db_session, title, **kwargs):
+    """Upload and commit an asset."""
+    asset = ContentService.upload_asset(
+        db_session,
+        title=title,
+        filename=f'{title.lower().replace(" ", "_")}.mp4',
+        file_path=f'/uploads/{title.lower().replace(" ", "_")}.mp4',
+        **kwargs
+    )
+    db_session.commit()
+    return asset
+
+
+def _search(db_session, search, **kwargs):
+    """Return titles of assets matching a search."""
+    assets, total = ContentService.list_assets(db_session, search=search, **kwargs)
+    return [asset.title for asset in assets]
+
+
+# =============================================================================
+# Index Maintenance Tests
+# =============================================================================
+
+class TestSearchIndexMaintenance:
+    """Tests for keeping the search index in step with assets."""
+
+    def test_index_is_available(self, app, db_session):
+        """The test database should support full-text search."""
+        assert SearchService.ensure_index(db.engine) is True
+
+    def test_uploaded_asset_is_searchable(self, app, db_session):
+        """upload_asset should make the asset searchable by every indexed field."""
+        _upload(
+            db_session,
+            'Summer Promo',
+            description='Beach themed campaign',
+            tags='seasonal,outdoor',
+            category='advertising'
+        )
+
+        assert _search(db_session, 'summer') == ['Summer Promo']
+        assert _search(db_session, 'beach') == ['Summer Promo']
+        assert _search(db_session, 'outdoor') == ['Summer Promo']
+        assert _search(db_session, 'advertising') == ['Summer Promo']
+
+    def test_terms_match_word_prefixes(self, app, db_session):
+        """Each term should match the start of a word, and all terms must match."""
+        _upload(db_session, 'Zephyr Video')
+        _upload(db_session, 'Zephyr Poster')
+
+        assert _search(db_session, 'zeph vid') == ['Zephyr Video']
+        assert sorted(_search(db_session, 'ZEPHYR')) == ['Zephyr Poster', 'Zephyr Video']
+
+    def test_updated_asset_is_reindexed(self, app, db_session):
+        """update_asset should replace the asset's indexed text."""
+        asset = _upload(db_session, 'Winter Sale')
+
+        ContentService.update_asset(db_session, asset.id, title='Spring Sale', tags='flowers')
+        db_session.commit()
+
+        assert _search(db_session, 'winter') == []
+        assert _search(db_session, 'spring') == ['Spring Sale']
+        assert _search(db_session, 'flowers') == ['Spring Sale']
+
+    def test_deleted_asset_is_removed(self, app, db_session):
+        """delete_asset should remove the asset from the index."""
+        asset = _upload(db_session, 'Retired Banner')
+
+        ContentService.delete_asset(db_session, asset.id)
+        db_session.commit()
+
+        assert _search(db_session, 'retired') == []
+        count = db_session.execute(
+            text(f'SELECT count(*) FROM {SearchService.SQLITE_TABLE} WHERE rowid = :id'),
+            {'id': asset.id}
+        ).scalar()
+        assert count == 0
+
+    def test_model_created_asset_is_indexed(self, app, db_session):
+        """Assets created without ContentService should also be indexed."""
+        asset = ContentAsset(
+            title='Direct Upload',
+            filename='direct.mp4',
+            file_path='/uploads/direct.mp4',
+        )
+        db_session.add(asset)
+        db_session.commit()
+
+        assert _search(db_session, 'direct') == ['Direct Upload']
+
+    def test_ensure_index_fills_existing_assets(self, app, db_session):
+        """ensure_index should index assets that predate the index."""
+        _upload(db_session, 'Legacy Clip')
+        db_session.execute(text(f'DELETE FROM {SearchService.SQLITE_TABLE}'))
+        db_session.commit()
+        assert _search(db_session, 'legacy') == []
+
+        SearchService.ensure_index(db.engine)
+
+        assert _search(db_session, 'legacy') == ['Legacy Clip']
+
+
+# =============================================================================
+# Search Query Tests
+# =============================================================================
+
+class TestSearchQueries:
+    """Tests for filtering and ranking with SearchService."""
+
+    def test_relevance_ranks_title_matches_first(self, app, db_session):
+        """Title matches should rank above description-only matches."""
+        _upload(db_session, 'Store Tour', description='A look at the coffee bar')
+        _upload(db_session, 'Coffee Special')
+
+        assert _search(db_session, 'coffee', sort_by='relevance') == ['Coffee Special', 'Store Tour']
+
+    def test_search_combines_with_filters(self, app, db_session):
+        """Search should apply alongside the other list filters."""
+        _upload(db_session, 'Holiday Ad', category='seasonal')
+        _upload(db_session, 'Holiday Menu', category='menus')
+
+        assert _search(db_session, 'holiday', category='menus') == ['Holiday Menu']
+
+    def test_punctuation_only_search_falls_back(self, app, db_session):
+        """Searches without word characters should use substring matching."""
+        _upload(db_session, 'Big Sale!')
+        _upload(db_session, 'Full Price')
+
+        assert _search(db_session, '!') == ['Big Sale!']
+
+    @pytest.mark.parametrize('search, expected', [
+        ('Promo  Video!', ['promo', 'video']),
+        ('"quoted" OR -minus*', ['quoted', 'or', 'minus']),
+        ('', []),
+    ])
+    def test_parse_terms(self, search, expected):
+        """parse_terms should keep only lowercase word terms."""
+        assert SearchService.parse_terms(search) == expected
@@ -0,0 +1,359 @@
+"""
+Unit tests for VisibilityService in Content Catalog service.
+
+Tests VisibilityService functionality including:
+- Building a user's visibility context in one query
+- Reusing contexts within a request and across requests (TTL cache)
+- Dropping cached contexts when users and organizations change
+- Org-type visibility rules applied as a single SQL predicate
+- Bounded query counts for listing, paging and per-asset checks
+"""
+
+import json
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from content_catalog.models import db, Catalog, ContentAsset, Organization, User
+from content_catalog.services.visibility_service import VisibilityService
+from content_catalog.tests.conftest import TEST_PASSWORD_HASH
+
+
+BRAND_COUNT = 300
+
+
+@contextmanager
+def count_queries():
+    """Count SQL statements executed on the test engine."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def _org(db_session, name, org_type, **kwargs):
+    """Create and commit an organization."""
+    org = Organization(
+        name=name,
+        type='partner',
+        contact_email=f'{name.lower().replace(" ", ".")}@example.com',
+        status='active',
+        org_type=org_type,
+        **kwargs
+    )
+    db_session.add(org)
+    db_session.commit()
+    return org
+
+
+def _user(db_session, email, organization=None, role=User.ROLE_PARTNER, **kwargs):
+    """Create and commit an active user."""
+    user = User(
+        email=email,
+        password_hash=TEST_PASSWORD_HASH,
+        name=email.split('@')[0],
+        role=role,
+        organization_id=organization.id if organization else None,
+        status=User.STATUS_ACTIVE,
+        **kwargs
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def _asset(db_session, title, organization=None, status=ContentAsset.STATUS_APPROVED, **kwargs):
+    """Create an asset without committing."""
+    asset = ContentAsset(
+        title=title,
+        filename=f'{title.lower().replace(" ", "_")}.mp4',
+        file_path=f'/uploads/{title.lower().replace(" ", "_")}.mp4',
+        status=status,
+        organization_id=organization.id if organization else None,
+        **kwargs
+    )
+    db_session.add(asset)
+    return asset
+
+
+def _titles(query):
+    """Return sorted asset titles from a query."""
+    return sorted(asset.title for asset in query)
+
+
+@pytest.fixture
+def agency_setup(app, db_session):
+    """
+    An agency allowed to access BRAND_COUNT brands, each with one asset,
+    plus one brand the agency cannot access.
+    """
+    brands = []
+    for index in range(BRAND_COUNT):
+        brand = Organization(
+            name=f'Heron Brand {index}',
+            type='partner',
+            contact_email=f'heron{index}@example.com',
+            status='active',
+            org_type=Organization.ORG_TYPE_BRAND
+        )
+        db_session.add(brand)
+        brands.append(brand)
+    other = Organization(
+        name='Heron Outsider',
+        type='partner',
+        contact_email='outsider@example.com',
+        status='active',
+        org_type=Organization.ORG_TYPE_BRAND
+    )
+    db_session.add(other)
+    db_session.flush()
+
+    agency = _org(
+        db_session, 'Heron Agency', Organization.ORG_TYPE_AGENCY,
+        allowed_brand_ids=json.dumps([brand.id for brand in brands])
+    )
+    user = _user(db_session, 'agent@heronagency.com', agency)
+
+    for index, brand in enumerate(brands):
+        _asset(db_session, f'Heron Clip {index:03d}', brand)
+    _asset(db_session, 'Heron Agency Reel', agency)
+    _asset(db_session, 'Heron Outsider Clip', other)
+    db_session.commit()
+
+    return {'agency': agency, 'user': user, 'brands': brands, 'other': other}
+
+
+# =============================================================================
+# Visibility Context Tests
+# =============================================================================
+
+class TestVisibilityContext:
+    """Tests for building, reusing and dropping visibility contexts."""
+
+    def test_context_built_in_one_query(self, app, db_session, agency_setup):
+        """The role, organization and allowed brands should load together."""
+        user_id = agency_setup['user'].id
+        db_session.expire_all()
+
+        with count_queries() as statements:
+            context = VisibilityService.get_context(db_session, user_id)
+
+        assert len(statements) == 1
+        assert context.org_type == Organization.ORG_TYPE_AGENCY
+        assert context.organization_id == agency_setup['agency'].id
+        assert len(context.allowed_brand_ids) == BRAND_COUNT
+
+    def test_unknown_user_has_no_context(self, app, db_session):
+        """get_context should return None for a missing user."""
+        assert VisibilityService.get_context(db_session, 999999) is None
+
+    def test_context_reused_within_request(self, app, db_session, agency_setup):
+        """A request should build each user's context once, even uncached."""
+        app.config['VISIBILITY_CACHE_TTL'] = 0
+        user_id = agency_setup['user'].id
+
+        with app.test_request_context('/partner/assets'):
+            with count_queries() as statements:
+                first = VisibilityService.get_context(db_session, user_id)
+                second = VisibilityService.get_context(db_session, user_id)
+
+        assert first is second
+        assert len(statements) == 1
+
+    def test_context_not_shared_between_requests_without_cache(self, app, db_session, agency_setup):
+        """With the cache disabled each request should load a fresh context."""
+        app.config['VISIBILITY_CACHE_TTL'] = 0
+        user = agency_setup['user']
+
+        with app.test_request_context('/partner/assets'):
+            first = VisibilityService.get_context(db_session, user.id)
+        with app.test_request_context('/partner/assets'):
+            second = VisibilityService.get_context(db_session, user.id)
+
+        assert first is not second
+
+    def test_context_cached_across_requests(self, app, db_session, agency_setup):
+        """Within VISIBILITY_CACHE_TTL the context should not be reloaded."""
+        app.config['VISIBILITY_CACHE_TTL'] = 30
+        user_id = agency_setup['user'].id
+        VisibilityService.get_context(db_session, user_id)
+
+        with count_queries() as statements:
+            with app.test_request_context('/partner/assets'):
+                context = VisibilityService.get_context(db_session, user_id)
+
+        assert statements == []
+        assert context.user_id == user_id
+
+    def test_organization_change_drops_cached_context(self, app, db_session, agency_setup):
+        """Changing an organization's allowed brands should take effect at once."""
+        app.config['VISIBILITY_CACHE_TTL'] = 30
+        agency, user = agency_setup['agency'], agency_setup['user']
+        VisibilityService.get_context(db_session, user.id)
+
+        agency.set_allowed_brand_ids([agency_setup['other'].id])
+        db_session.commit()
+
+        context = VisibilityService.get_context(db_session, user.id)
+        assert context.allowed_brand_ids == (agency_setup['other'].id,)
+
+    def test_user_change_drops_cached_context(self, app, db_session, agency_setup):
+        """Moving a user to another organization should take effect at once."""
+        app.config['VISIBILITY_CACHE_TTL'] = 30
+        user, other = agency_setup['user'], agency_setup['other']
+        VisibilityService.get_context(db_session, user.id)
+
+        user.organization_id = other.id
+        db_session.commit()
+
+        context = VisibilityService.get_context(db_session, user.id)
+        assert context.org_type == Organization.ORG_TYPE_BRAND
+        assert context.organization_id == other.id
+
+
+# =============================================================================
+# Visible Assets Query Tests
+# =============================================================================
+
+class TestVisibleAssetsQuery:
+    """Tests for visibility rules applied as a SQL predicate."""
+
+    def test_agency_sees_own_and_allowed_brands(self, app, db_session, agency_setup):
+        """Agency users should see allowed brands' assets and their own."""
+        query = VisibilityService.visible_assets_query(db_session, agency_setup['user'].id)
+        titles = _titles(query)
+
+        assert len(titles) == BRAND_COUNT + 1
+        assert 'Heron Agency Reel' in titles
+        assert 'Heron Outsider Clip' not in titles
+
+    def test_agency_listing_query_count_is_bounded(self, app, db_session, agency_setup):
+        """A page and its total should cost the same queries for any number of brands."""
+        user_id = agency_setup['user'].id
+        db_session.expire_all()
+
+        with count_queries() as statements:
+            query = VisibilityService.visible_assets_query(
+                db_session, user_id, query=ContentAsset.query
+            )
+            page = query.order_by(ContentAsset.created_at.desc()).paginate(
+                page=2, per_page=25, error_out=False
+            )
+            items = list(page.items)
+
+        assert len(items) == 25
+        assert page.total == BRAND_COUNT + 1
+        # Context, page of assets, total count
+        assert len(statements) == 3
+
+    def test_brand_sees_only_own_assets(self, app, db_session, agency_setup):
+        """Brand users should see only their organization's assets."""
+        brand = agency_setup['brands'][0]
+        user = _user(db_session, 'owner@heronbrand.com', brand)
+
+        query = VisibilityService.visible_assets_query(db_session, user.id)
+
+        assert _titles(query) == ['Heron Clip 000']
+
+    def test_retailer_excludes_internal_only_catalogs(self, app, db_session):
+        """Retailer users should not see assets in internal-only catalogs."""
+        retailer = _org(db_session, 'Egret Retail', Organization.ORG_TYPE_RETAILER)
+        user = _user(db_session, 'buyer@egretretail.com', retailer)
+        internal = Catalog(name='Egret Internal', is_internal_only=True)
+        public = Catalog(name='Egret Public')
+        db_session.add_all([internal, public])
+        db_session.flush()
+        _asset(db_session, 'Egret Internal Clip', retailer, catalog_id=str(internal.id))
+        _asset(db_session, 'Egret Public Clip', retailer, catalog_id=str(public.id))
+        _asset(db_session, 'Egret Loose Clip', retailer)
+        db_session.commit()
+
+        query = VisibilityService.visible_assets_query(db_session, user.id)
+
+        assert _titles(query) == ['Egret Loose Clip', 'Egret Public Clip']
+
+    def test_user_without_organization_sees_own_uploads(self, app, db_session):
+        """Users without an organization should see only what they uploaded."""
+        user = _user(db_session, 'solo@example.com')
+        _asset(db_session, 'Plover Mine', uploaded_by=user.id)
+        _asset(db_session, 'Plover Other')
+        db_session.commit()
+
+        query = VisibilityService.visible_assets_query(db_session, user.id)
+
+        assert _titles(query) == ['Plover Mine']
+
+    def test_drafts_excluded_by_default(self, app, db_session):
+        """Draft assets should only be listed when include_drafts is set."""
+        brand = _org(db_session, 'Plover Brand', Organization.ORG_TYPE_BRAND)
+        user = _user(db_session, 'owner@ploverbrand.com', brand)
+        _asset(db_session, 'Plover Draft', brand, status=ContentAsset.STATUS_DRAFT)
+        _asset(db_session, 'Plover Live', brand)
+        db_session.commit()
+
+        default = VisibilityService.visible_assets_query(db_session, user.id)
+        with_drafts = VisibilityService.visible_assets_query(db_session, user.id, include_drafts=True)
+
+        assert _titles(default) == ['Plover Live']
+        assert _titles(with_drafts) == ['Plover Draft', 'Plover Live']
+
+    def test_filter_assets_for_user_matches_query(self, app, db_session, agency_setup):
+        """filter_assets_for_user should return the query's assets as a list."""
+        user = agency_setup['user']
+
+        assets = VisibilityService.filter_assets_for_user(db_session, user.id)
+
+        assert isinstance(assets, list)
+        assert _titles(assets) == _titles(VisibilityService.visible_assets_query(db_session, user.id))
+        assert VisibilityService.filter_assets_for_user(db_session, 999999) == []
+
+
+# =============================================================================
+# Permission Check Tests
+# =============================================================================
+
+class TestPermissionChecks:
+    """Tests for per-asset and per-organization checks using the context."""
+
+    def test_can_view_asset_by_id(self, app, db_session, agency_setup):
+        """Agency users should be able to view allowed brands' assets only."""
+        user_id = agency_setup['user'].id
+        allowed_id = ContentAsset.query.filter_by(title='Heron Clip 150').one().id
+        denied_id = ContentAsset.query.filter_by(title='Heron Outsider Clip').one().id
+        db_session.expire_all()
+
+        with count_queries() as statements:
+            assert VisibilityService.can_view_asset_by_id(db_session, user_id, allowed_id) == (True, 'ok')
+            can_view, reason = VisibilityService.can_view_asset_by_id(db_session, user_id, denied_id)
+
+        assert can_view is False
+        assert 'Agency' in reason
+        # Context once (cached), then one query per asset
+        assert len(statements) == 3
+
+    def test_admin_sees_active_organizations(self, app, db_session):
+        """Admins should get the IDs of every active organization."""
+        admin = _user(db_session, 'ops@example.com', role=User.ROLE_ADMIN)
+        active = _org(db_session, 'Tern Active', Organization.ORG_TYPE_BRAND)
+        inactive = _org(db_session, 'Tern Inactive', Organization.ORG_TYPE_BRAND)
+        inactive.status = 'suspended'
+        db_session.commit()
+
+        org_ids = VisibilityService.get_visible_organization_ids(db_session, admin.id)
+
+        assert active.id in org_ids
+        assert inactive.id not in org_ids
+
+    def test_agency_visible_organization_ids(self, app, db_session, agency_setup):
+        """Agency users should see their own organization and allowed brands."""
+        org_ids = VisibilityService.get_visible_organization_ids(db_session, agency_setup['user'].id)
+
+        assert org_ids[0] == agency_setup['agency'].id
+        assert len(org_ids) == BRAND_COUNT + 1
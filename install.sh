@@ -79,6 +79,11 @@ install_system_deps() {
         gir1.2-gstreamer-1.0 \
         gir1.2-gst-plugins-base-1.0
 
+    # pycairo and its gi integration, used by the layout renderer's ticker
+    apt-get install -y \
+        python3-gi-cairo \
+        gir1.2-gtk-3.0
+
     # Additional Python tools
     apt-get install -y \
         python3-pip \
@@ -308,6 +313,14 @@ verify_python() {
         return 1
     fi
 
+    # Check for pycairo (ticker rendering in the layout renderer)
+    if python3 -c "import cairo; import gi; gi.require_version('PangoCairo', '1.0'); from gi.repository import PangoCairo" 2>/dev/null; then
+        log_info "pycairo (gi-cairo): Available"
+    else
+        log_error "pycairo (gi-cairo): Not available - run: apt install python3-gi-cairo"
+        return 1
+    fi
+
     # Check for GStreamer bindings
     if python3 -c "import gi; gi.require_version('Gst', '1.0'); from gi.repository import Gst" 2>/dev/null; then
         log_info "GStreamer Python bindings: Available"
@@ -8,10 +8,13 @@ including pipeline creation, lifecycle management, and health monitoring.
 import os
 import logging
 import threading
+import time
 from abc import ABC, abstractmethod
 from typing import Optional, Callable
 from enum import Enum
 
+from src.common.metrics import get_metrics_registry
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +37,9 @@ class BaseCamera(ABC):
     elements and probe callbacks.
     """
 
+    # Prefix for this pipeline's metric names (e.g. safety_probe_seconds)
+    metrics_prefix = "camera"
+
     def __init__(
         self,
         sensor_id: int,
@@ -61,6 +67,15 @@ class BaseCamera(ABC):
         self.detections_count = 0
         self.errors_count = 0
 
+        # Latency metrics (also exported on the health server's /metrics)
+        registry = get_metrics_registry()
+        self.probe_latency = registry.histogram(
+            f"{self.metrics_prefix}_probe_seconds", "Duration of the pipeline probe callback"
+        )
+        self.search_latency = registry.histogram(
+            f"{self.metrics_prefix}_faiss_search_seconds", "Duration of FAISS index searches"
+        )
+
     @property
     def state(self) -> PipelineState:
         return self._state
@@ -202,6 +217,19 @@ class BaseCamera(ABC):
         """Set a callback for pipeline errors."""
         self._error_callback = callback
 
+    def _timed_probe(self, callback: Callable) -> Callable:
+        """Wrap a pad probe callback so each call is recorded in probe_latency."""
+        histogram = self.probe_latency
+
+        def timed_callback(pad, info, user_data):
+            start = time.perf_counter()
+            try:
+                return callback(pad, info, user_data)
+            finally:
+                histogram.observe(time.perf_counter() - start)
+
+        return timed_callback
+
     def get_health(self) -> dict:
         """Return health metrics for this camera pipeline."""
         return {
@@ -214,6 +242,8 @@ class BaseCamera(ABC):
             "detections_count": self.detections_count,
             "errors_count": self.errors_count,
             "restart_count": self._restart_count,
+            "probe_latency": self.probe_latency.summary(),
+            "search_latency": self.search_latency.summary(),
         }
 
     # GStreamer bus message handlers
@@ -97,6 +97,8 @@ class CommercialCamera(BaseCamera):
     - No face images or embeddings are stored
     """
 
+    metrics_prefix = "commercial"
+
     def __init__(
         self,
         sensor_id: int = 1,
@@ -300,7 +302,7 @@ class CommercialCamera(BaseCamera):
             logger.error("Could not get src pad")
             return
 
-        srcpad.add_probe(1, self._commercial_probe_callback, None)
+        srcpad.add_probe(1, self._timed_probe(self._commercial_probe_callback), None)
         logger.info("Commercial probe attached")
 
     def _commercial_probe_callback(self, pad, info, user_data):
@@ -484,7 +486,8 @@ class CommercialCamera(BaseCamera):
             import faiss
 
             embedding_2d = embedding.reshape(1, -1).astype(np.float32)
-            distances, indices = self._loyalty_index.search(embedding_2d, 1)
+            with self.search_latency.time():
+                distances, indices = self._loyalty_index.search(embedding_2d, 1)
 
             similarity = 1.0 - (distances[0][0] / 2.0)
 
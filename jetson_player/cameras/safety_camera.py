@@ -33,6 +33,8 @@ class SafetyCamera(BaseCamera):
     Only match alert metadata is emitted.
     """
 
+    metrics_prefix = "safety"
+
     def __init__(
         self,
         sensor_id: int = 0,
@@ -232,7 +234,7 @@ class SafetyCamera(BaseCamera):
 
         srcpad.add_probe(
             1,  # GST_PAD_PROBE_TYPE_BUFFER
-            self._safety_probe_callback,
+            self._timed_probe(self._safety_probe_callback),
             None,
         )
         logger.info("Safety probe attached to ArcFace output")
@@ -358,7 +360,8 @@ class SafetyCamera(BaseCamera):
 
             # Search FAISS index
             embedding_2d = embedding.reshape(1, -1).astype(np.float32)
-            distances, indices = self._ncmec_index.search(embedding_2d, 1)
+            with self.search_latency.time():
+                distances, indices = self._ncmec_index.search(embedding_2d, 1)
 
             # Convert L2 distance to cosine similarity
             # For normalized vectors: cosine_sim = 1 - (L2^2 / 2)
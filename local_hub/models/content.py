@@ -3,7 +3,8 @@ Content database model for tracking cached media files.
 
 This model tracks media content downloaded from HQ and cached locally:
 - Identity: content_id (unique from HQ), filename
-- Storage: local_path (where file is stored on disk)
+- Storage: local_path (where file is stored on disk; content with
+  identical bytes shares one file in the hub's blob store)
 - Integrity: file_hash (SHA256 for verification), file_size
 - Metadata: content_type, duration_seconds
 - Timestamps: cached_at, last_accessed, updated_at
@@ -48,7 +49,7 @@ class Content(db.Model):
 
     # Storage tracking
     local_path = db.Column(db.String(512), nullable=True)
-    file_hash = db.Column(db.String(64), nullable=True)  # SHA256 hash
+    file_hash = db.Column(db.String(64), nullable=True, index=True)  # SHA256 hash
     file_size = db.Column(db.Integer, nullable=True)
 
     # Content metadata
@@ -116,7 +117,8 @@ class Content(db.Model):
         """
         Update last_accessed timestamp when content is served.
 
-        Call this when serving the content file to a screen.
+        Commits immediately. The download endpoint records access through
+        services.content_access instead so it does not write per request.
         """
         self.last_accessed = datetime.utcnow()
         db.session.commit()
@@ -175,6 +177,61 @@ class Content(db.Model):
         """
         return cls.query.filter(cls.cached_at.isnot(None)).all()
 
+    @classmethod
+    def get_cached_by_hash(cls, file_hash):
+        """
+        Find a cached content item holding the file with the given hash.
+
+        Used during sync to link new content to a file the hub already
+        stores instead of downloading the same bytes again.
+
+        Args:
+            file_hash: SHA256 hash to search for
+
+        Returns:
+            Content or None: A cached content record with that hash
+        """
+        if not file_hash:
+            return None
+        return cls.query.filter(
+            cls.file_hash == file_hash,
+            cls.cached_at.isnot(None),
+            cls.local_path.isnot(None)
+        ).first()
+
+    @classmethod
+    def count_references(cls, local_path):
+        """
+        Count cached content items that reference a stored file.
+
+        Args:
+            local_path: Path of the stored file
+
+        Returns:
+            int: Number of content items using the file
+        """
+        return cls.query.filter(
+            cls.local_path == local_path,
+            cls.cached_at.isnot(None)
+        ).count()
+
+    @classmethod
+    def get_path_refcounts(cls):
+        """
+        Count how many cached content items reference each stored file.
+
+        Content with identical bytes shares one file in the blob store,
+        so a file may only be removed once its count drops to zero.
+
+        Returns:
+            dict: Mapping of local_path to number of referencing items
+        """
+        rows = db.session.query(cls.local_path, db.func.count(cls.id)).filter(
+            cls.cached_at.isnot(None),
+            cls.local_path.isnot(None)
+        ).group_by(cls.local_path).all()
+        return {local_path: count for local_path, count in rows}
+
     @classmethod
     def get_manifest(cls):
         """
@@ -186,6 +243,41 @@ class Content(db.Model):
         items = cls.query.filter(cls.cached_at.isnot(None)).all()
         return [item.to_manifest_item() for item in items]
 
+    @classmethod
+    def bulk_mark_accessed(cls, accessed):
+        """
+        Apply batched last_accessed timestamps in a single UPDATE.
+
+        Downloads record access times in memory (see
+        services.content_access) and flush them here periodically,
+        so serving a file never writes to the database.
+
+        Args:
+            accessed: Dict mapping Content.id to the latest access time
+
+        Returns:
+            int: Number of content items updated
+        """
+        if not accessed:
+            return 0
+
+        # Core executemany: content deleted since it was served is skipped
+        table = cls.__table__
+        stmt = (
+            db.update(table)
+            .where(table.c.id == db.bindparam('content_pk'))
+            .values(last_accessed=db.bindparam('accessed_at'))
+        )
+        result = db.session.execute(
+            stmt,
+            [
+                {'content_pk': content_pk, 'accessed_at': accessed_at}
+                for content_pk, accessed_at in accessed.items()
+            ]
+        )
+        db.session.commit()
+        return result.rowcount
+
     @classmethod
     def create_or_update(cls, content_id, filename, content_type='video',
                          duration_seconds=None, playlist_ids=None):
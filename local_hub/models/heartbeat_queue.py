@@ -12,12 +12,39 @@ Key reliability guarantees:
 - Heartbeats are only deleted after CMS confirmation
 - Retry counter tracks forwarding attempts for monitoring
 
-The queue supports batched forwarding to reduce network overhead.
+The queue supports batched forwarding to reduce network overhead. State
+transitions for a batch are applied as single set-based UPDATE statements
+(see mark_batch_sending/mark_batch_sent/mark_batch_failed) so forwarding a
+large backlog costs a few transactions per batch rather than one per entry.
 """
 
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timedelta
 from models import db
 
+# Backoff cap for failed forwards, in seconds
+MAX_RETRY_BACKOFF_SECONDS = 300
+
+# Maximum IDs bound into a single IN (...) clause
+ID_CHUNK_SIZE = 500
+
+# Most recent status changes kept in a compacted heartbeat's gap summary
+MAX_STATUS_CHANGES = 20
+
+
+def _retry_backoff_seconds(attempts, retry_delay_seconds):
+    """
+    Exponential backoff for a heartbeat that has made `attempts` attempts.
+
+    Args:
+        attempts: Number of forwarding attempts made so far
+        retry_delay_seconds: Base delay in seconds
+
+    Returns:
+        int: Seconds until the next retry (30s, 60s, 120s, 240s, max 300s)
+    """
+    return min(retry_delay_seconds * (2 ** (attempts - 1)), MAX_RETRY_BACKOFF_SECONDS)
+
 
 class HeartbeatQueue(db.Model):
     """
@@ -40,6 +67,13 @@ class HeartbeatQueue(db.Model):
         error_message: Last error message if forwarding failed
     """
     __tablename__ = 'heartbeat_queue'
+    __table_args__ = (
+        # Covers get_pending(): status filter, retry-time range, FIFO order
+        db.Index(
+            'ix_heartbeat_queue_status_retry_created',
+            'status', 'next_retry_at', 'created_at',
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     device_id = db.Column(db.String(64), nullable=False, index=True)
@@ -80,21 +114,37 @@ class HeartbeatQueue(db.Model):
             'error_message': self.error_message
         }
 
-    def to_cms_payload(self):
+    def to_cms_payload(self, gap=None):
         """
         Return data formatted for CMS API forwarding.
 
+        The heartbeat's own time and reported status are also exposed at the
+        top level as 'timestamp' and 'status', which is what CMS uses to set
+        the device's last_seen and status.
+
+        Args:
+            gap: Optional gap summary from get_pending_compacted() when this
+                entry stands in for several queued heartbeats
+
         Returns:
             dict: Heartbeat data in CMS API format
         """
         import json
-        return {
+        data = json.loads(self.payload) if self.payload else {}
+        created_at = self.created_at.isoformat() if self.created_at else None
+        cms_payload = {
             'queue_id': self.id,
             'device_id': self.device_id,
             'device_type': self.device_type,
-            'data': json.loads(self.payload) if self.payload else {},
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'data': data,
+            'created_at': created_at,
+            'timestamp': created_at,
         }
+        if isinstance(data, dict) and data.get('status'):
+            cms_payload['status'] = data['status']
+        if gap:
+            cms_payload['gap'] = gap
+        return cms_payload
 
     def mark_sending(self):
         """
@@ -119,11 +169,10 @@ class HeartbeatQueue(db.Model):
             error_message: Optional error description
             retry_delay_seconds: Base seconds until next retry (default 30)
         """
-        from datetime import timedelta
         self.status = 'failed'
         self.error_message = error_message
         # Exponential backoff: 30s, 60s, 120s, 240s, max 300s
-        backoff = min(retry_delay_seconds * (2 ** (self.attempts - 1)), 300)
+        backoff = _retry_backoff_seconds(self.attempts, retry_delay_seconds)
         self.next_retry_at = datetime.utcnow() + timedelta(seconds=backoff)
         db.session.commit()
 
@@ -141,6 +190,108 @@ class HeartbeatQueue(db.Model):
         self.error_message = None
         db.session.commit()
 
+    @classmethod
+    def mark_batch_sending(cls, ids):
+        """
+        Mark a batch of heartbeats as being sent in one UPDATE.
+
+        Set-based equivalent of mark_sending() for every id in the batch.
+
+        Args:
+            ids: Queue entry IDs about to be forwarded
+
+        Returns:
+            int: Number of rows updated
+        """
+        return cls._update_by_ids(
+            ids,
+            status='sending',
+            last_attempt_at=datetime.utcnow(),
+            attempts=cls.attempts + 1,
+        )
+
+    @classmethod
+    def mark_batch_sent(cls, ids):
+        """
+        Mark a batch of heartbeats as sent in one UPDATE.
+
+        Call this ONLY after CMS confirms receipt of the whole batch.
+
+        Args:
+            ids: Queue entry IDs confirmed by CMS
+
+        Returns:
+            int: Number of rows updated
+        """
+        return cls._update_by_ids(ids, status='sent', error_message=None)
+
+    @classmethod
+    def mark_batch_failed(cls, ids, error_message=None, retry_delay_seconds=30):
+        """
+        Mark a batch of heartbeats as failed and schedule retries in one UPDATE.
+
+        Each entry keeps its own exponential backoff: next_retry_at is
+        computed from the entry's attempt count with a CASE expression,
+        which only needs a branch per attempt count below the backoff cap.
+
+        Args:
+            ids: Queue entry IDs whose forwarding failed
+            error_message: Optional error description
+            retry_delay_seconds: Base seconds until next retry (default 30)
+
+        Returns:
+            int: Number of rows updated
+        """
+        if not ids:
+            return 0
+
+        now = datetime.utcnow()
+        branches = []
+        attempts = 0
+        while _retry_backoff_seconds(attempts, retry_delay_seconds) < MAX_RETRY_BACKOFF_SECONDS:
+            delay = _retry_backoff_seconds(attempts, retry_delay_seconds)
+            branches.append((cls.attempts <= attempts, now + timedelta(seconds=delay)))
+            attempts += 1
+        capped = now + timedelta(seconds=MAX_RETRY_BACKOFF_SECONDS)
+        next_retry_at = db.case(*branches, else_=capped) if branches else capped
+
+        return cls._update_by_ids(
+            ids,
+            status='failed',
+            error_message=error_message,
+            next_retry_at=next_retry_at,
+        )
+
+    @classmethod
+    def _update_by_ids(cls, ids, **values):
+        """
+        Apply the same column values to every listed entry in one transaction.
+
+        IDs are bound in chunks to stay under SQLite's bound-parameter limit
+        when a compacted batch covers a long outage.
+
+        Args:
+            ids: Queue entry IDs to update
+            **values: Column values (or SQL expressions) to set
+
+        Returns:
+            int: Number of rows updated
+        """
+        ids = list(ids)
+        if not ids:
+            return 0
+        updated = 0
+        for start in range(0, len(ids), ID_CHUNK_SIZE):
+            result = db.session.execute(
+                db.update(cls)
+                .where(cls.id.in_(ids[start:start + ID_CHUNK_SIZE]))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            updated += result.rowcount
+        db.session.commit()
+        return updated
+
     @property
     def is_pending(self):
         """
@@ -212,6 +363,100 @@ class HeartbeatQueue(db.Model):
             cls.next_retry_at <= now
         ).order_by(cls.created_at.asc()).limit(limit).all()
 
+    @classmethod
+    def get_pending_compacted(cls, device_limit=50, max_status_changes=MAX_STATUS_CHANGES):
+        """
+        Get ready heartbeats compacted to the latest entry per device.
+
+        CMS only keeps each device's last_seen and status, so after an outage
+        there is no need to replay every queued heartbeat. All ready entries
+        of a device are folded into its latest entry plus a gap summary:
+
+            {
+                'count': 720,
+                'first_at': '2024-01-15T04:00:00',
+                'last_at': '2024-01-15T10:00:00',
+                'status_change_count': 2,
+                'status_changes': [
+                    {'at': '...', 'from': 'online', 'to': 'error'},
+                    ...
+                ]
+            }
+
+        Devices are taken in FIFO order of their oldest ready heartbeat.
+        Only id, device_id, created_at and the payload's status are read for
+        folded entries; full payloads are loaded for the latest entries only.
+
+        Args:
+            device_limit: Maximum number of devices to compact per call
+            max_status_changes: Most recent status changes kept per device
+
+        Returns:
+            tuple: (list of latest HeartbeatQueue entry per device,
+                    dict of device_id -> gap summary,
+                    list of every queue ID the compacted entries cover)
+        """
+        now = datetime.utcnow()
+        rows = db.session.execute(
+            db.select(
+                cls.id,
+                cls.device_id,
+                cls.created_at,
+                db.func.json_extract(cls.payload, '$.status'),
+            ).where(
+                cls.status.in_(['pending', 'failed']),
+                cls.next_retry_at <= now
+            ).order_by(cls.created_at.asc(), cls.id.asc())
+        )
+
+        gaps = {}
+        latest_ids = {}
+        last_status = {}
+        covered_ids = []
+        for queue_id, device_id, created_at, status in rows:
+            gap = gaps.get(device_id)
+            if gap is None:
+                if len(gaps) >= device_limit:
+                    continue
+                gap = gaps[device_id] = {
+                    'count': 0,
+                    'first_at': created_at.isoformat(),
+                    'last_at': None,
+                    'status_change_count': 0,
+                    'status_changes': deque(maxlen=max_status_changes),
+                }
+
+            gap['count'] += 1
+            gap['last_at'] = created_at.isoformat()
+            previous = last_status.get(device_id)
+            if status is not None:
+                if previous is not None and status != previous:
+                    gap['status_change_count'] += 1
+                    gap['status_changes'].append(
+                        {'at': gap['last_at'], 'from': previous, 'to': status}
+                    )
+                last_status[device_id] = status
+
+            latest_ids[device_id] = queue_id
+            covered_ids.append(queue_id)
+
+        if not gaps:
+            return [], {}, []
+
+        for gap in gaps.values():
+            gap['status_changes'] = list(gap['status_changes'])
+
+        by_id = {
+            entry.id: entry
+            for entry in cls.query.filter(cls.id.in_(list(latest_ids.values())))
+        }
+        entries = [
+            by_id[latest_ids[device_id]]
+            for device_id in gaps
+            if latest_ids[device_id] in by_id
+        ]
+        return entries, gaps, covered_ids
+
     @classmethod
     def get_all_pending(cls):
         """
@@ -282,7 +527,6 @@ class HeartbeatQueue(db.Model):
         Returns:
             int: Number of heartbeats deleted
         """
-        from datetime import timedelta
         cutoff = datetime.utcnow() - timedelta(hours=older_than_hours)
         result = cls.query.filter(
             cls.status == 'sent',
@@ -310,17 +554,19 @@ class HeartbeatQueue(db.Model):
         if pending_count <= max_size:
             return 0
 
-        # Get IDs of oldest entries to remove
+        # Delete the oldest excess entries in a single statement
         excess = pending_count - max_size
-        oldest = cls.query.filter(
+        oldest_ids = db.select(cls.id).where(
             cls.status.in_(['pending', 'failed'])
-        ).order_by(cls.created_at.asc()).limit(excess).all()
-
-        for entry in oldest:
-            db.session.delete(entry)
+        ).order_by(cls.created_at.asc()).limit(excess)
 
+        result = db.session.execute(
+            db.delete(cls)
+            .where(cls.id.in_(oldest_ids.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
         db.session.commit()
-        return len(oldest)
+        return result.rowcount
 
     def delete(self):
         """
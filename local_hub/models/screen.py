@@ -46,7 +46,7 @@ class Screen(db.Model):
     name = db.Column(db.String(128), nullable=True)
 
     # Status tracking
-    status = db.Column(db.String(20), default='online', nullable=False)
+    status = db.Column(db.String(20), default='online', nullable=False, index=True)
     last_heartbeat = db.Column(db.DateTime, default=datetime.utcnow)
 
     # Feature flags
@@ -10,10 +10,12 @@ All endpoints are prefixed with /api/v1 when registered with the app.
 
 import os
 
-from flask import jsonify, send_file
+from flask import jsonify
 
 from models import Content
 from routes import content_bp
+from routes.file_serving import send_cached_file
+from services.content_access import record_content_access
 
 
 @content_bp.route('', methods=['GET'])
@@ -61,11 +63,18 @@ def download_content(content_id):
     from the hub's local cache. The file is streamed directly
     from the local storage path.
 
+    The response carries the content's file_hash as a strong ETag and
+    supports Range requests, so screens can resume interrupted downloads
+    and revalidate cached files with If-None-Match.
+
     Args:
         content_id: Content identifier from HQ
 
     Returns:
         200: File streamed with appropriate content type
+        206: Requested byte range of the file
+        304: File unchanged (If-None-Match / If-Modified-Since)
+        416: Requested range not satisfiable
         404: Content not found or not cached
             {
                 "success": false,
@@ -103,8 +112,8 @@ def download_content(content_id):
             'error': 'Content file not found on disk'
         }), 404
 
-    # Update last accessed timestamp
-    content.mark_accessed()
+    # Record access in memory; flushed to the database in batches
+    record_content_access(content.id)
 
     # Determine MIME type based on content type
     mime_types = {
@@ -115,11 +124,12 @@ def download_content(content_id):
     mime_type = mime_types.get(content.content_type, 'application/octet-stream')
 
     # Stream the file
-    return send_file(
+    return send_cached_file(
         local_path,
         mimetype=mime_type,
-        as_attachment=True,
-        download_name=content.filename
+        download_name=content.filename,
+        file_hash=content.file_hash,
+        last_modified=content.cached_at
     )
 
 
@@ -16,10 +16,11 @@ These FAISS databases are used for facial recognition:
 
 import os
 
-from flask import jsonify, send_file, current_app
+from flask import jsonify, current_app
 
 from models import SyncStatus
 from routes import databases_bp
+from routes.file_serving import send_cached_file
 
 
 # FAISS database file names
@@ -86,6 +87,8 @@ def download_ncmec_database():
 
     Returns:
         200: FAISS file streamed with application/octet-stream type
+        206: Requested byte range of the file
+        304: File unchanged (ETag is the synced file_hash)
         404: Database not available
             {
                 "success": false,
@@ -112,11 +115,12 @@ def download_ncmec_database():
         }), 404
 
     # Stream the file
-    return send_file(
+    return send_cached_file(
         file_path,
         mimetype='application/octet-stream',
-        as_attachment=True,
-        download_name=NCMEC_DB_FILENAME
+        download_name=NCMEC_DB_FILENAME,
+        file_hash=status.file_hash,
+        last_modified=status.last_sync_at
     )
 
 
@@ -169,6 +173,8 @@ def download_loyalty_database():
 
     Returns:
         200: FAISS file streamed with application/octet-stream type
+        206: Requested byte range of the file
+        304: File unchanged (ETag is the synced file_hash)
         404: Database not available
             {
                 "success": false,
@@ -195,11 +201,12 @@ def download_loyalty_database():
         }), 404
 
     # Stream the file
-    return send_file(
+    return send_cached_file(
         file_path,
         mimetype='application/octet-stream',
-        as_attachment=True,
-        download_name=LOYALTY_DB_FILENAME
+        download_name=LOYALTY_DB_FILENAME,
+        file_hash=status.file_hash,
+        last_modified=status.last_sync_at
     )
 
 
@@ -0,0 +1,143 @@
+"""
+Conditional and byte-range file responses for screen downloads.
+
+Screens download content and FAISS databases from the hub, often
+several hundred megabytes at a time over store Wi-Fi. This module
+builds those responses so that:
+- Interrupted downloads can resume with a Range request (206)
+- Unchanged files are revalidated with ETag/Last-Modified (304)
+  instead of being downloaded again
+- The body is handed to the WSGI server as a file wrapper positioned
+  at the start of the range, so gunicorn can send it with sendfile(2)
+  without copying it through Python
+
+The ETag is the stored SHA256 file_hash when one is known, so it is
+the same value screens already compare against the content manifest.
+"""
+
+import os
+from datetime import datetime, timezone
+from typing import Optional
+
+from flask import current_app, jsonify, request
+from werkzeug.http import is_resource_modified, parse_range_header
+from werkzeug.wsgi import wrap_file
+
+
+# Read size when the WSGI server cannot send the file itself
+STREAM_CHUNK_SIZE = 256 * 1024
+
+
+class _BoundedFileIterator:
+    """
+    Iterate over at most length bytes of a file from its current position.
+
+    Used for partial ranges when the WSGI server provides no
+    wsgi.file_wrapper that honors Content-Length (e.g. the development
+    server), so only the requested bytes are sent.
+    """
+
+    def __init__(self, file, length: int, chunk_size: int = STREAM_CHUNK_SIZE):
+        self.file = file
+        self.remaining = length
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> bytes:
+        if self.remaining <= 0:
+            raise StopIteration
+        data = self.file.read(min(self.chunk_size, self.remaining))
+        if not data:
+            raise StopIteration
+        self.remaining -= len(data)
+        return data
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def send_cached_file(
+    file_path: str,
+    mimetype: str,
+    download_name: str,
+    file_hash: Optional[str] = None,
+    last_modified: Optional[datetime] = None,
+):
+    """
+    Send a file from hub storage with conditional and range support.
+
+    Handles If-None-Match/If-Modified-Since (304), Range and If-Range
+    (206 or a full 200 if the file changed), and unsatisfiable ranges
+    (416). Full and partial bodies are returned as a file wrapper
+    seeked to the first byte so the WSGI server can use sendfile(2).
+
+    Args:
+        file_path: Path to the file on disk (must exist)
+        mimetype: Content type of the response
+        download_name: Filename for the Content-Disposition header
+        file_hash: SHA256 hash of the file, used as a strong ETag.
+                   Falls back to an mtime/size tag when not known.
+        last_modified: When the file was stored (defaults to file mtime)
+
+    Returns:
+        Response: 200, 206, 304 or 416 response
+    """
+    stat = os.stat(file_path)
+    file_size = stat.st_size
+    etag = file_hash or f'{stat.st_mtime_ns:x}-{file_size:x}'
+    if last_modified is None:
+        last_modified = datetime.fromtimestamp(stat.st_mtime, timezone.utc)
+
+    response = current_app.response_class(mimetype=mimetype)
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.accept_ranges = 'bytes'
+    # Screens keep their own copy; make them revalidate instead of guessing
+    response.cache_control.no_cache = True
+    response.headers.set('Content-Disposition', 'attachment', filename=download_name)
+
+    environ = request.environ
+
+    if not is_resource_modified(environ, etag=etag, last_modified=last_modified):
+        response.status_code = 304
+        return response
+
+    start, end = 0, file_size
+    range_requested = 'HTTP_RANGE' in environ and (
+        'HTTP_IF_RANGE' not in environ
+        or not is_resource_modified(
+            environ, etag=etag, last_modified=last_modified, ignore_if_range=False
+        )
+    )
+
+    if range_requested and file_size:
+        byte_range = parse_range_header(environ.get('HTTP_RANGE'))
+        bounds = byte_range.range_for_length(file_size) if byte_range else None
+
+        if bounds is None:
+            error = jsonify({
+                'success': False,
+                'error': 'Requested range not satisfiable'
+            })
+            error.status_code = 416
+            error.headers['Content-Range'] = f'bytes */{file_size}'
+            return error
+
+        start, end = bounds
+        response.status_code = 206
+        response.content_range = byte_range.to_content_range_header(file_size)
+
+    length = end - start
+    file = open(file_path, 'rb')
+    file.seek(start)
+
+    if end < file_size and 'wsgi.file_wrapper' not in environ:
+        response.response = _BoundedFileIterator(file, length)
+    else:
+        response.response = wrap_file(environ, file, STREAM_CHUNK_SIZE)
+
+    response.direct_passthrough = True
+    response.content_length = length
+    return response
@@ -15,6 +15,7 @@ from flask import jsonify, request
 
 from models import db, Screen
 from routes import screens_bp
+from services.screen_monitor import record_heartbeat
 
 
 @screens_bp.route('/register', methods=['POST'])
@@ -84,6 +85,7 @@ def register_screen():
 
     # Register or get existing screen
     screen, created = Screen.register(hardware_id, name)
+    record_heartbeat(screen.id)
 
     if created:
         return jsonify({
@@ -191,6 +193,7 @@ def screen_heartbeat(screen_id):
 
     # Update heartbeat timestamp and status
     screen.update_heartbeat()
+    record_heartbeat(screen_id)
 
     return jsonify({
         'success': True,
@@ -9,7 +9,7 @@ Key jobs scheduled:
 - Content sync: Syncs content manifest from HQ (every 5 minutes)
 - Playlist sync: Syncs playlist data from HQ (every 5 minutes)
 - Alert forwarding: Forwards pending alerts to HQ (every 30 seconds)
-- Screen monitoring: Checks screen heartbeats for offline detection (every 30 seconds)
+- Screen monitoring: Checks expired screen heartbeats for offline detection (every 5 seconds)
 - HQ heartbeat: Reports hub status to HQ (every 60 seconds)
 - Heartbeat batch: Forwards queued device heartbeats to HQ (every 60 seconds)
 
@@ -354,9 +354,10 @@ def is_scheduler_running(scheduler: Optional[BackgroundScheduler] = None) -> boo
 CONTENT_SYNC_INTERVAL_MINUTES = 5
 PLAYLIST_SYNC_INTERVAL_MINUTES = 5
 ALERT_FORWARD_INTERVAL_SECONDS = 30
-SCREEN_MONITOR_INTERVAL_SECONDS = 30
+SCREEN_MONITOR_INTERVAL_SECONDS = 5
 HQ_HEARTBEAT_INTERVAL_SECONDS = 60
 HEARTBEAT_BATCH_INTERVAL_SECONDS = 60
+CONTENT_ACCESS_FLUSH_INTERVAL_SECONDS = 30
 
 
 def register_jobs(scheduler: BackgroundScheduler, app: Any) -> None:
@@ -367,9 +368,10 @@ def register_jobs(scheduler: BackgroundScheduler, app: Any) -> None:
     - content_sync: Syncs content manifest from HQ (every 5 minutes)
     - playlist_sync: Syncs playlist data from HQ (every 5 minutes)
     - alert_forward: Forwards pending alerts to HQ (every 30 seconds)
-    - screen_monitor: Checks screen heartbeats for offline detection (every 30 seconds)
+    - screen_monitor: Checks expired screen heartbeats for offline detection (every 5 seconds)
     - hq_heartbeat: Reports hub status to HQ (every 60 seconds)
     - heartbeat_batch: Forwards queued device heartbeats to HQ (every 60 seconds)
+    - content_access_flush: Writes batched content last_accessed times (every 30 seconds)
 
     All jobs run within the Flask application context to ensure proper
     database access through Flask-SQLAlchemy.
@@ -387,6 +389,7 @@ def register_jobs(scheduler: BackgroundScheduler, app: Any) -> None:
     # Import services here to avoid circular imports
     from services import HQClient, SyncService, AlertForwarder, ScreenMonitor
     from services.heartbeat_queue import HeartbeatQueueService
+    from services.content_access import content_access
     from models.hub_config import HubConfig
 
     # Job: Content Sync (every 5 minutes)
@@ -458,7 +461,7 @@ def register_jobs(scheduler: BackgroundScheduler, app: Any) -> None:
             except Exception as e:
                 logger.error(f"Alert forwarding failed: {e}")
 
-    # Job: Screen Monitor (every 30 seconds)
+    # Job: Screen Monitor (every 5 seconds)
     def job_screen_monitor() -> None:
         """Background job to check screen heartbeats."""
         with app.app_context():
@@ -547,6 +550,18 @@ def register_jobs(scheduler: BackgroundScheduler, app: Any) -> None:
             except Exception as e:
                 logger.error(f"Heartbeat batch processing failed: {e}")
 
+    # Job: Content Access Flush (every 30 seconds)
+    def job_content_access_flush() -> None:
+        """Background job to write batched content access times."""
+        with app.app_context():
+            try:
+                updated = content_access.flush()
+
+                if updated > 0:
+                    logger.debug(f"Content access flush: {updated} item(s) updated")
+            except Exception as e:
+                logger.error(f"Content access flush failed: {e}")
+
     # Register all jobs with the scheduler
     add_job(
         scheduler,
@@ -596,12 +611,21 @@ def register_jobs(scheduler: BackgroundScheduler, app: Any) -> None:
         seconds=HEARTBEAT_BATCH_INTERVAL_SECONDS,
     )
 
+    add_job(
+        scheduler,
+        job_content_access_flush,
+        job_id='content_access_flush',
+        trigger='interval',
+        seconds=CONTENT_ACCESS_FLUSH_INTERVAL_SECONDS,
+    )
+
     logger.info(
-        f"Registered 6 background jobs: "
+        f"Registered 7 background jobs: "
         f"content_sync ({CONTENT_SYNC_INTERVAL_MINUTES}min), "
         f"playlist_sync ({PLAYLIST_SYNC_INTERVAL_MINUTES}min), "
         f"alert_forward ({ALERT_FORWARD_INTERVAL_SECONDS}s), "
         f"screen_monitor ({SCREEN_MONITOR_INTERVAL_SECONDS}s), "
         f"hq_heartbeat ({HQ_HEARTBEAT_INTERVAL_SECONDS}s), "
-        f"heartbeat_batch ({HEARTBEAT_BATCH_INTERVAL_SECONDS}s)"
+        f"heartbeat_batch ({HEARTBEAT_BATCH_INTERVAL_SECONDS}s), "
+        f"content_access_flush ({CONTENT_ACCESS_FLUSH_INTERVAL_SECONDS}s)"
     )
@@ -0,0 +1,114 @@
+"""
+Content Access Recorder - Batched last_accessed tracking.
+
+Screens download content from the hub constantly, and updating
+Content.last_accessed with a commit on every download puts a database
+write (and SQLite's single write lock) on the request path. Downloads
+instead record the access time here in memory; the content_access_flush
+background job writes all pending timestamps in one UPDATE.
+
+last_accessed is only used to judge how recently content was served,
+so losing the last few seconds of access times on a crash is harmless.
+
+Example:
+    from services.content_access import record_content_access, content_access
+
+    # In the download endpoint
+    record_content_access(content.id)
+
+    # In the background job
+    updated = content_access.flush()
+"""
+
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class ContentAccessRecorder:
+    """
+    In-memory buffer of the latest access time of each content item.
+
+    Recording is a dict assignment under a lock, so it is cheap enough
+    to call on every download. Repeated downloads of the same content
+    between flushes collapse into one row update.
+
+    Attributes:
+        _pending: Dict mapping Content.id to latest access time
+        _lock: Lock protecting _pending across request threads
+    """
+
+    def __init__(self):
+        """Initialize an empty recorder."""
+        self._pending: Dict[int, datetime] = {}
+        self._lock = threading.Lock()
+
+    def record(self, content_pk: int, accessed_at: Optional[datetime] = None) -> None:
+        """
+        Record that a content item was served.
+
+        Args:
+            content_pk: Content.id of the served content
+            accessed_at: Access time (defaults to now)
+        """
+        accessed_at = accessed_at or datetime.utcnow()
+        with self._lock:
+            current = self._pending.get(content_pk)
+            if current is None or accessed_at > current:
+                self._pending[content_pk] = accessed_at
+
+    def flush(self) -> int:
+        """
+        Write all pending access times to the database.
+
+        Must be called within a Flask application context. If the write
+        fails the pending times are kept for the next flush.
+
+        Returns:
+            int: Number of content items updated
+        """
+        from models import Content, db
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if not pending:
+            return 0
+
+        try:
+            return Content.bulk_mark_accessed(pending)
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Failed to flush content access times: {e}")
+            for content_pk, accessed_at in pending.items():
+                self.record(content_pk, accessed_at)
+            return 0
+
+    def reset(self) -> None:
+        """Discard all pending access times."""
+        with self._lock:
+            self._pending.clear()
+
+    def __len__(self) -> int:
+        """Return the number of content items with pending access times."""
+        with self._lock:
+            return len(self._pending)
+
+
+# Shared recorder for this process (each gunicorn worker flushes its own)
+content_access = ContentAccessRecorder()
+
+
+def record_content_access(content_pk: int, accessed_at: Optional[datetime] = None) -> None:
+    """
+    Record a content download in the shared access recorder.
+
+    Args:
+        content_pk: Content.id of the served content
+        accessed_at: Access time (defaults to now)
+    """
+    content_access.record(content_pk, accessed_at)
@@ -47,6 +47,9 @@ DEFAULT_BATCH_SIZE = 50
 # Maximum queue size before dropping oldest entries
 DEFAULT_MAX_QUEUE_SIZE = 1000
 
+# Enforce the max queue size once every N enqueues rather than on every insert
+DEFAULT_ENFORCE_INTERVAL = 50
+
 
 class HeartbeatQueueService:
     """
@@ -68,6 +71,8 @@ class HeartbeatQueueService:
         retry_interval: Seconds between retry attempts (default 30)
         batch_size: Maximum heartbeats per batch (default 50)
         max_queue_size: Maximum queue size before dropping oldest (default 1000)
+        enforce_interval: Enqueues between queue size checks (default 50)
+        compact: Forward only the latest heartbeat per device (default True)
     """
 
     def __init__(
@@ -77,6 +82,8 @@ class HeartbeatQueueService:
         retry_interval: int = DEFAULT_RETRY_INTERVAL_SECONDS,
         batch_size: int = DEFAULT_BATCH_SIZE,
         max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        enforce_interval: int = DEFAULT_ENFORCE_INTERVAL,
+        compact: bool = True,
     ):
         """
         Initialize the heartbeat queue service.
@@ -87,12 +94,18 @@ class HeartbeatQueueService:
             retry_interval: Seconds to wait before retrying failed heartbeats
             batch_size: Maximum heartbeats to send in one batch
             max_queue_size: Maximum queue size (oldest dropped when exceeded)
+            enforce_interval: Check the queue size once every N enqueues
+            compact: Fold each device's queued heartbeats into its latest
+                one plus a gap summary before forwarding
         """
         self.hq_client = hq_client
         self.config = config
         self.retry_interval = retry_interval
         self.batch_size = batch_size
         self.max_queue_size = max_queue_size
+        self.enforce_interval = max(1, enforce_interval)
+        self.compact = compact
+        self._enqueue_count = 0
 
         logger.info(
             f"HeartbeatQueueService initialized with retry_interval={retry_interval}s, "
@@ -122,6 +135,9 @@ class HeartbeatQueueService:
         Note:
             This method should be called when a device heartbeat is received.
             The heartbeat will be forwarded to HQ by process_pending_heartbeats().
+            The max queue size is checked on the first enqueue and then once
+            every enforce_interval enqueues, so a long-lived service may let
+            the queue briefly exceed it by up to that many entries.
         """
         from models.heartbeat_queue import HeartbeatQueue
 
@@ -133,10 +149,12 @@ class HeartbeatQueueService:
 
         logger.debug(f"Heartbeat enqueued for device {device_id} (queue_id={entry.id})")
 
-        # Enforce max queue size
-        dropped = HeartbeatQueue.enforce_max_queue_size(self.max_queue_size)
-        if dropped > 0:
-            logger.warning(f"Queue size exceeded, dropped {dropped} oldest heartbeats")
+        # Enforce max queue size (amortized over enforce_interval enqueues)
+        if self._enqueue_count % self.enforce_interval == 0:
+            dropped = HeartbeatQueue.enforce_max_queue_size(self.max_queue_size)
+            if dropped > 0:
+                logger.warning(f"Queue size exceeded, dropped {dropped} oldest heartbeats")
+        self._enqueue_count += 1
 
         return entry
 
@@ -144,6 +162,8 @@ class HeartbeatQueueService:
         self,
         entries: List[Any],
         hub_id: str,
+        gaps: Optional[Dict[str, Dict[str, Any]]] = None,
+        covered_ids: Optional[List[int]] = None,
     ) -> bool:
         """
         Forward a batch of heartbeats to HQ.
@@ -155,12 +175,17 @@ class HeartbeatQueueService:
         Args:
             entries: List of HeartbeatQueue instances to forward
             hub_id: Hub ID for the HQ API call
+            gaps: Optional device_id -> gap summary for compacted entries
+                (see HeartbeatQueue.get_pending_compacted)
+            covered_ids: Optional queue IDs the entries stand in for; these
+                are transitioned together with the entries themselves
 
         Returns:
             True if forwarding succeeded, False otherwise
 
         Note:
             Heartbeat status is updated in the database by this method.
+            Each state transition is a single UPDATE over the whole batch.
             Heartbeats are NEVER deleted on failure - they will be retried.
         """
         from models.heartbeat_queue import HeartbeatQueue
@@ -168,20 +193,28 @@ class HeartbeatQueueService:
         if not entries:
             return True
 
-        entry_ids = [e.id for e in entries]
-        logger.debug(f"Forwarding {len(entries)} heartbeats to HQ (ids={entry_ids})")
+        entry_ids = covered_ids if covered_ids else [e.id for e in entries]
+        logger.debug(
+            f"Forwarding {len(entries)} heartbeats to HQ "
+            f"covering {len(entry_ids)} queue entries"
+        )
 
-        # Mark all entries as being sent
+        # Build payload for HQ before the status commit expires the entries
+        gaps = gaps or {}
+        heartbeats = []
         for entry in entries:
-            try:
-                entry.mark_sending()
-            except Exception as e:
-                logger.error(f"Failed to mark heartbeat {entry.id} as sending: {e}")
+            gap = gaps.get(entry.device_id)
+            heartbeats.append(
+                entry.to_cms_payload(gap=gap if gap and gap['count'] > 1 else None)
+            )
 
+        # Mark all entries as being sent
         try:
-            # Build payload for HQ
-            heartbeats = [entry.to_cms_payload() for entry in entries]
+            HeartbeatQueue.mark_batch_sending(entry_ids)
+        except Exception as e:
+            logger.error(f"Failed to mark heartbeats {entry_ids} as sending: {e}")
 
+        try:
             # Send to HQ
             response = self.hq_client.send_batched_heartbeats(
                 hub_id=hub_id,
@@ -191,22 +224,22 @@ class HeartbeatQueueService:
             # Check for successful acknowledgement
             if response.get('success') or response.get('ack') or response.get('processed'):
                 # HQ confirmed receipt - mark all as sent
-                for entry in entries:
-                    entry.mark_sent()
+                HeartbeatQueue.mark_batch_sent(entry_ids)
 
                 logger.info(
                     f"Forwarded {len(entries)} heartbeats successfully to HQ "
+                    f"covering {len(entry_ids)} queue entries "
                     f"(processed={response.get('processed', len(entries))})"
                 )
                 return True
             else:
                 # HQ did not confirm - treat as failure
                 error_msg = response.get('error', 'HQ did not acknowledge heartbeats')
-                for entry in entries:
-                    entry.mark_failed(
-                        error_message=error_msg,
-                        retry_delay_seconds=self.retry_interval,
-                    )
+                HeartbeatQueue.mark_batch_failed(
+                    entry_ids,
+                    error_message=error_msg,
+                    retry_delay_seconds=self.retry_interval,
+                )
 
                 logger.warning(
                     f"Heartbeat batch not acknowledged by HQ: {error_msg}"
@@ -216,11 +249,11 @@ class HeartbeatQueueService:
         except (HQConnectionError, HQTimeoutError) as e:
             # Network-level errors - mark for retry, NEVER delete
             error_msg = str(e)
-            for entry in entries:
-                entry.mark_failed(
-                    error_message=error_msg,
-                    retry_delay_seconds=self.retry_interval,
-                )
+            HeartbeatQueue.mark_batch_failed(
+                entry_ids,
+                error_message=error_msg,
+                retry_delay_seconds=self.retry_interval,
+            )
 
             logger.warning(
                 f"Failed to forward heartbeats to HQ: {error_msg} "
@@ -231,11 +264,11 @@ class HeartbeatQueueService:
         except Exception as e:
             # Any other error - mark for retry, NEVER delete
             error_msg = str(e)
-            for entry in entries:
-                entry.mark_failed(
-                    error_message=error_msg,
-                    retry_delay_seconds=self.retry_interval,
-                )
+            HeartbeatQueue.mark_batch_failed(
+                entry_ids,
+                error_message=error_msg,
+                retry_delay_seconds=self.retry_interval,
+            )
 
             logger.error(
                 f"Failed to forward heartbeats to HQ: {error_msg} "
@@ -254,15 +287,21 @@ class HeartbeatQueueService:
         to be forwarded (pending/failed with retry time passed) and attempts
         to forward them to HQ in batches.
 
+        With compaction enabled, each batch holds up to batch_size devices,
+        each represented by its latest heartbeat plus a gap summary, so a
+        backlog from a long outage drains in a single small request per
+        batch_size devices.
+
         Args:
             hub_id: Optional hub ID override (defaults to config hub_id)
 
         Returns:
             Dictionary with processing results:
-            - processed: Number of heartbeats attempted
+            - processed: Number of queued heartbeats attempted
             - succeeded: Number successfully forwarded
             - failed: Number that failed (will be retried)
             - batches: Number of batches sent
+            - compacted: Number of heartbeats folded into a newer one
             - errors: List of error messages
 
         Note:
@@ -277,6 +316,7 @@ class HeartbeatQueueService:
             'succeeded': 0,
             'failed': 0,
             'batches': 0,
+            'compacted': 0,
             'errors': [],
             'started_at': datetime.utcnow().isoformat(),
             'completed_at': None,
@@ -295,22 +335,31 @@ class HeartbeatQueueService:
             # Process heartbeats in batches
             while True:
                 # Get next batch of pending heartbeats
-                entries = HeartbeatQueue.get_pending(limit=self.batch_size)
+                if self.compact:
+                    entries, gaps, covered_ids = HeartbeatQueue.get_pending_compacted(
+                        device_limit=self.batch_size,
+                    )
+                else:
+                    entries = HeartbeatQueue.get_pending(limit=self.batch_size)
+                    gaps, covered_ids = None, [e.id for e in entries]
 
                 if not entries:
                     break
 
                 result['batches'] += 1
-                result['processed'] += len(entries)
+                result['processed'] += len(covered_ids)
+                result['compacted'] += len(covered_ids) - len(entries)
 
                 try:
-                    success = self.forward_heartbeat_batch(entries, hub_id)
+                    success = self.forward_heartbeat_batch(
+                        entries, hub_id, gaps=gaps, covered_ids=covered_ids,
+                    )
                     if success:
-                        result['succeeded'] += len(entries)
+                        result['succeeded'] += len(covered_ids)
                     else:
-                        result['failed'] += len(entries)
+                        result['failed'] += len(covered_ids)
                 except Exception as e:
-                    result['failed'] += len(entries)
+                    result['failed'] += len(covered_ids)
                     error_msg = f"Batch {result['batches']}: {str(e)}"
                     result['errors'].append(error_msg)
                     logger.error(f"Error processing heartbeat batch: {e}")
@@ -478,23 +527,18 @@ class HeartbeatQueueService:
         from models.heartbeat_queue import HeartbeatQueue
         from models import db
 
-        # Get all pending heartbeats
-        all_pending = HeartbeatQueue.get_all_pending()
-
-        if not all_pending:
-            return 0
-
-        now = datetime.utcnow()
-        for entry in all_pending:
-            entry.next_retry_at = now
-            # Reset sending status to pending in case it got stuck
-            if entry.status == 'sending':
-                entry.status = 'pending'
-
+        result = db.session.execute(
+            db.update(HeartbeatQueue)
+            .where(HeartbeatQueue.status.in_(['pending', 'failed']))
+            .values(next_retry_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
         db.session.commit()
+        count = result.rowcount
 
-        logger.info(f"Reset {len(all_pending)} heartbeats for immediate retry")
-        return len(all_pending)
+        if count:
+            logger.info(f"Reset {count} heartbeats for immediate retry")
+        return count
 
     def get_device_heartbeats(
         self,
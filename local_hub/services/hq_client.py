@@ -823,6 +823,8 @@ class HQClient:
                 - status: 'online', 'offline', or 'unknown'
                 - timestamp: ISO timestamp of heartbeat
                 - metrics: Optional dict with device metrics (cpu, memory, etc.)
+                - gap: Optional summary of older heartbeats folded into
+                  this one while HQ was unreachable
 
         Returns:
             Response from HQ, may contain:
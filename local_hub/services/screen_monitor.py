@@ -7,8 +7,12 @@ and detecting offline screens. It handles:
 - Marking screens as offline when heartbeat timeout expires (2 minutes)
 - Providing screen health statistics
 
-The monitor runs periodically (every 30 seconds by default) to check
-all screens and update their status accordingly.
+Offline detection is driven by a min-heap of heartbeat deadlines
+(HeartbeatDeadlines) that the heartbeat endpoint updates, so a check only
+touches screens whose deadline has passed. The monitor runs frequently
+(every 5 seconds by default); a check with nothing due costs a heap peek
+and no database queries, and offline detection happens within a few seconds
+of the timeout rather than up to a full check interval later.
 
 Example:
     from services.screen_monitor import ScreenMonitor
@@ -24,7 +28,9 @@ Example:
     stats = monitor.get_monitor_stats()
 """
 
+import heapq
 import logging
+import threading
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
@@ -39,22 +45,162 @@ logger = logging.getLogger(__name__)
 DEFAULT_OFFLINE_TIMEOUT_SECONDS = 120
 
 # Default interval for monitoring checks
-DEFAULT_CHECK_INTERVAL_SECONDS = 30
+DEFAULT_CHECK_INTERVAL_SECONDS = 5
+
+# Default interval for rebuilding the deadline heap from the database
+DEFAULT_RESYNC_INTERVAL_SECONDS = 300
+
+
+class HeartbeatDeadlines:
+    """
+    Min-heap of the latest heartbeat time of each tracked screen.
+
+    Each heartbeat pushes (heartbeat_at, screen_id); older entries for the
+    same screen are left in place and skipped when they reach the top. The
+    screen whose heartbeat is oldest is always at the top, so finding the
+    screens past their deadline costs O(k log n) for k expired screens.
+
+    The heap is per process and is only an index of candidates: the
+    database stays authoritative, and ScreenMonitor re-checks candidates
+    against it before marking anything offline.
+    """
+
+    def __init__(self):
+        """Initialize an empty, unsynced deadline heap."""
+        self._heap: List[Any] = []
+        self._latest: Dict[int, datetime] = {}
+        self._lock = threading.Lock()
+        self.synced_at: Optional[datetime] = None
+
+    def touch(self, screen_id: int, heartbeat_at: Optional[datetime]) -> None:
+        """
+        Record a heartbeat for a screen.
+
+        Args:
+            screen_id: ID of the screen
+            heartbeat_at: Heartbeat time, or None if the screen never sent one
+        """
+        heartbeat_at = heartbeat_at or datetime.min
+        with self._lock:
+            self._latest[screen_id] = heartbeat_at
+            heapq.heappush(self._heap, (heartbeat_at, screen_id))
+            # Drop superseded entries once they dominate the heap
+            if len(self._heap) > 4 * len(self._latest) + 64:
+                self._heap = [(at, sid) for sid, at in self._latest.items()]
+                heapq.heapify(self._heap)
+
+    def discard(self, screen_id: int) -> None:
+        """Stop tracking a screen (its heap entries are skipped lazily)."""
+        with self._lock:
+            self._latest.pop(screen_id, None)
+
+    def pop_expired(self, threshold: datetime) -> List[int]:
+        """
+        Remove and return screens whose latest heartbeat is before threshold.
+
+        Args:
+            threshold: Heartbeats older than this have missed their deadline
+
+        Returns:
+            List of expired screen IDs (no longer tracked)
+        """
+        expired = []
+        with self._lock:
+            while self._heap and self._heap[0][0] < threshold:
+                heartbeat_at, screen_id = heapq.heappop(self._heap)
+                if self._latest.get(screen_id) == heartbeat_at:
+                    del self._latest[screen_id]
+                    expired.append(screen_id)
+        return expired
+
+    def requeue(self, screen_ids: List[int]) -> None:
+        """
+        Track popped screens again so the next check re-examines them.
+
+        Used when a check fails after pop_expired(). Screens that sent a
+        heartbeat in the meantime are already tracked again and keep that
+        entry; the rest are due immediately.
+
+        Args:
+            screen_ids: Screen IDs returned by pop_expired()
+        """
+        with self._lock:
+            for screen_id in screen_ids:
+                if screen_id not in self._latest:
+                    self._latest[screen_id] = datetime.min
+                    heapq.heappush(self._heap, (datetime.min, screen_id))
+
+    def next_heartbeat(self) -> Optional[datetime]:
+        """Return the oldest tracked heartbeat time, or None if empty."""
+        with self._lock:
+            while self._heap:
+                heartbeat_at, screen_id = self._heap[0]
+                if self._latest.get(screen_id) == heartbeat_at:
+                    return heartbeat_at
+                heapq.heappop(self._heap)
+        return None
+
+    def replace(self, heartbeats: Dict[int, Optional[datetime]], synced_at: datetime) -> None:
+        """
+        Rebuild the heap from a full snapshot of screen heartbeats.
+
+        Args:
+            heartbeats: Mapping of screen_id -> last heartbeat time
+            synced_at: When the snapshot was taken
+        """
+        latest = {sid: (at or datetime.min) for sid, at in heartbeats.items()}
+        heap = [(at, sid) for sid, at in latest.items()]
+        heapq.heapify(heap)
+        with self._lock:
+            self._latest = latest
+            self._heap = heap
+            self.synced_at = synced_at
+
+    def reset(self) -> None:
+        """Clear all deadlines and force a resync on the next check."""
+        with self._lock:
+            self._heap = []
+            self._latest = {}
+            self.synced_at = None
+
+    def __len__(self) -> int:
+        """Number of screens currently tracked."""
+        return len(self._latest)
+
+
+# Deadlines shared by the heartbeat endpoint and every ScreenMonitor instance
+screen_deadlines = HeartbeatDeadlines()
+
+
+def record_heartbeat(screen_id: int, heartbeat_at: Optional[datetime] = None) -> None:
+    """
+    Record a screen heartbeat in the shared deadline heap.
+
+    Call this whenever a screen's last_heartbeat is updated.
+
+    Args:
+        screen_id: ID of the screen that sent the heartbeat
+        heartbeat_at: Heartbeat time (defaults to now)
+    """
+    screen_deadlines.touch(screen_id, heartbeat_at or datetime.utcnow())
 
 
 class ScreenMonitor:
     """
     Service for monitoring screen heartbeats and detecting offline screens.
 
-    This service periodically checks all registered screens to determine
+    This service periodically checks registered screens to determine
     if they have missed their heartbeat window (2 minutes by default).
     Screens that have not sent a heartbeat within the timeout period
-    are marked as offline.
+    are marked as offline. Only screens whose deadline has passed in the
+    shared HeartbeatDeadlines heap are examined on each check.
 
     Attributes:
         config: HubConfig instance for configuration
         offline_timeout: Seconds without heartbeat before marking offline
         check_interval: Seconds between monitoring checks
+        resync_interval: Seconds between full rebuilds of the deadline heap
+        deadlines: HeartbeatDeadlines heap (shared module instance by default)
     """
 
     def __init__(
@@ -62,6 +208,8 @@ class ScreenMonitor:
         config: Optional[HubConfig] = None,
         offline_timeout: int = DEFAULT_OFFLINE_TIMEOUT_SECONDS,
         check_interval: int = DEFAULT_CHECK_INTERVAL_SECONDS,
+        resync_interval: int = DEFAULT_RESYNC_INTERVAL_SECONDS,
+        deadlines: Optional[HeartbeatDeadlines] = None,
     ):
         """
         Initialize the screen monitor service.
@@ -69,11 +217,17 @@ class ScreenMonitor:
         Args:
             config: HubConfig instance with configuration (optional)
             offline_timeout: Seconds without heartbeat before marking offline (default 120)
-            check_interval: Seconds between monitoring checks (default 30)
+            check_interval: Seconds between monitoring checks (default 5)
+            resync_interval: Seconds between full heap rebuilds from the
+                database, which picks up heartbeats received by other
+                worker processes (default 300)
+            deadlines: Deadline heap to use (default: shared screen_deadlines)
         """
         self.config = config
         self.offline_timeout = offline_timeout
         self.check_interval = check_interval
+        self.resync_interval = resync_interval
+        self.deadlines = deadlines if deadlines is not None else screen_deadlines
 
         # Track last check time for statistics
         self._last_check_at: Optional[datetime] = None
@@ -86,24 +240,27 @@ class ScreenMonitor:
 
     def check_screens(self) -> Dict[str, Any]:
         """
-        Check all screens and update offline status.
+        Check screens whose heartbeat deadline has passed and mark them offline.
 
-        This method queries all screens and marks any screen that has not
-        sent a heartbeat within the offline_timeout period as offline.
-        Screens that were offline but have recently sent heartbeats are
-        not modified (their status should be updated by the heartbeat endpoint).
+        Expired candidates are popped from the deadline heap and re-read
+        from the database in one query. Candidates that did heartbeat in
+        time (e.g. via another worker process) are re-armed; the rest are
+        marked offline with a single bulk UPDATE. Screens that were offline
+        but have recently sent heartbeats are not modified (their status
+        should be updated by the heartbeat endpoint).
 
         Returns:
             Dictionary with check results:
-            - checked: Total number of screens checked
+            - checked: Number of expired candidates examined
             - marked_offline: Number of screens marked offline this check
-            - already_offline: Number of screens already marked offline
-            - online: Number of screens still online
+            - already_offline: Candidates already marked offline
+            - online: Candidates still within their heartbeat window
+            - tracked: Screens currently tracked in the deadline heap
             - errors: List of error messages
 
         Note:
             This method should be called periodically by the background
-            scheduler (every 30 seconds by default).
+            scheduler (every 5 seconds by default).
         """
         from models.screen import Screen
         from models import db
@@ -113,86 +270,98 @@ class ScreenMonitor:
             'marked_offline': 0,
             'already_offline': 0,
             'online': 0,
+            'tracked': 0,
             'errors': [],
             'started_at': datetime.utcnow().isoformat(),
             'completed_at': None,
         }
+        candidates = []
 
         try:
-            # Get all screens
-            screens = Screen.query.all()
-
-            if not screens:
-                logger.debug("No screens registered to monitor")
-                result['completed_at'] = datetime.utcnow().isoformat()
-                self._update_last_check(result)
-                return result
+            now = datetime.utcnow()
+            self._resync_if_due(now)
 
             # Calculate timeout threshold
-            timeout_threshold = datetime.utcnow() - timedelta(seconds=self.offline_timeout)
+            timeout_threshold = now - timedelta(seconds=self.offline_timeout)
+            candidates = self.deadlines.pop_expired(timeout_threshold)
 
-            logger.debug(
-                f"Checking {len(screens)} screens with timeout threshold: {timeout_threshold}"
-            )
+            if candidates:
+                logger.debug(
+                    f"Checking {len(candidates)} expired screens with timeout "
+                    f"threshold: {timeout_threshold}"
+                )
 
-            # Check each screen
-            for screen in screens:
-                result['checked'] += 1
-
-                try:
-                    # Check if screen has missed heartbeat
-                    if screen.last_heartbeat is None:
-                        # No heartbeat ever received - mark offline
-                        if screen.status != 'offline':
-                            screen.status = 'offline'
-                            result['marked_offline'] += 1
+                rows = db.session.execute(
+                    db.select(
+                        Screen.id, Screen.hardware_id, Screen.status, Screen.last_heartbeat
+                    ).where(Screen.id.in_(candidates))
+                ).all()
+
+                expired_ids = []
+                for screen_id, hardware_id, status, last_heartbeat in rows:
+                    result['checked'] += 1
+                    if last_heartbeat is not None and last_heartbeat >= timeout_threshold:
+                        # Heartbeat arrived through another process - re-arm
+                        self.deadlines.touch(screen_id, last_heartbeat)
+                        result['online'] += 1
+                    elif status == 'offline':
+                        result['already_offline'] += 1
+                    else:
+                        expired_ids.append(screen_id)
+                        if last_heartbeat is None:
                             logger.info(
-                                f"Screen {screen.id} ({screen.hardware_id}) marked offline: "
+                                f"Screen {screen_id} ({hardware_id}) marked offline: "
                                 f"no heartbeat received"
                             )
                         else:
-                            result['already_offline'] += 1
-                    elif screen.last_heartbeat < timeout_threshold:
-                        # Heartbeat too old - mark offline if not already
-                        if screen.status != 'offline':
-                            screen.status = 'offline'
-                            result['marked_offline'] += 1
                             logger.info(
-                                f"Screen {screen.id} ({screen.hardware_id}) marked offline: "
-                                f"last heartbeat {screen.last_heartbeat.isoformat()}"
+                                f"Screen {screen_id} ({hardware_id}) marked offline: "
+                                f"last heartbeat {last_heartbeat.isoformat()}"
                             )
-                        else:
-                            result['already_offline'] += 1
-                    else:
-                        # Screen is still within heartbeat window
-                        result['online'] += 1
-
-                except Exception as e:
-                    error_msg = f"Screen {screen.id}: {str(e)}"
-                    result['errors'].append(error_msg)
-                    logger.error(f"Error checking screen {screen.id}: {e}")
-
-            # Commit all status changes
-            db.session.commit()
 
+                if expired_ids:
+                    # Guard on last_heartbeat so a heartbeat landing between
+                    # the read and the write is never overridden
+                    update = db.session.execute(
+                        db.update(Screen)
+                        .where(
+                            Screen.id.in_(expired_ids),
+                            Screen.status != 'offline',
+                            db.or_(
+                                Screen.last_heartbeat.is_(None),
+                                Screen.last_heartbeat < timeout_threshold,
+                            ),
+                        )
+                        .values(status='offline')
+                        .execution_options(synchronize_session=False)
+                    )
+                    result['marked_offline'] = update.rowcount
+
+                # Commit all status changes
+                db.session.commit()
+
+            result['tracked'] = len(self.deadlines)
             result['completed_at'] = datetime.utcnow().isoformat()
 
             # Log summary
             if result['marked_offline'] > 0:
                 logger.info(
                     f"Screen check completed: {result['marked_offline']} newly offline, "
-                    f"{result['online']} online, {result['already_offline']} already offline"
+                    f"{result['tracked']} tracked"
                 )
             else:
                 logger.debug(
-                    f"Screen check completed: {result['online']} online, "
-                    f"{result['already_offline']} offline"
+                    f"Screen check completed: {result['checked']} expired, "
+                    f"{result['tracked']} tracked"
                 )
 
             self._update_last_check(result)
             return result
 
         except Exception as e:
+            # The candidates left the heap before the database was checked;
+            # put them back or they wait for the next resync
+            self.deadlines.requeue(candidates)
             result['completed_at'] = datetime.utcnow().isoformat()
             result['errors'].append(str(e))
             logger.error(f"Error during screen monitoring: {e}")
@@ -202,6 +371,27 @@ class ScreenMonitor:
                 details={'error': str(e), 'result': result},
             )
 
+    def _resync_if_due(self, now: datetime) -> None:
+        """
+        Rebuild the deadline heap from the database when it is stale.
+
+        Runs on the first check in a process and then every resync_interval
+        seconds. Reads only id and last_heartbeat of screens not already
+        offline.
+        """
+        from models.screen import Screen
+        from models import db
+
+        synced_at = self.deadlines.synced_at
+        if synced_at is not None and (now - synced_at).total_seconds() < self.resync_interval:
+            return
+
+        rows = db.session.execute(
+            db.select(Screen.id, Screen.last_heartbeat).where(Screen.status != 'offline')
+        ).all()
+        self.deadlines.replace(dict(rows), synced_at=now)
+        logger.debug(f"Screen deadline heap resynced with {len(rows)} screens")
+
     def _update_last_check(self, result: Dict[str, Any]) -> None:
         """Update last check tracking data."""
         self._last_check_at = datetime.utcnow()
@@ -432,6 +622,7 @@ class ScreenMonitor:
         screen.status = 'online'
         screen.last_heartbeat = datetime.utcnow()
         db.session.commit()
+        self.deadlines.touch(screen_id, screen.last_heartbeat)
 
         logger.info(f"Screen {screen_id} manually marked online")
         return True
@@ -463,6 +654,7 @@ class ScreenMonitor:
 
         screen.status = 'offline'
         db.session.commit()
+        self.deadlines.discard(screen_id)
 
         logger.info(f"Screen {screen_id} manually marked offline")
         return True
@@ -5,7 +5,8 @@ This module provides the SyncService class for synchronizing content
 and databases from the cloud HQ to the local hub. It handles:
 - Fetching content manifests from HQ
 - Comparing manifests to detect new/changed/deleted content
-- Downloading new or updated content files
+- Downloading new or updated content files into a content-addressed
+  blob store, linking content whose bytes the hub already holds
 - Verifying file integrity via SHA256 hash
 - Cleaning up orphaned content no longer in manifest
 - Tracking sync status for all resource types
@@ -42,6 +43,11 @@ from config import HubConfig
 logger = logging.getLogger(__name__)
 
 
+# Subdirectories of content_path for the content-addressed blob store
+BLOB_DIRNAME = 'blobs'
+INCOMING_DIRNAME = '.incoming'
+
+
 class SyncService:
     """
     Service for synchronizing content and databases from HQ.
@@ -108,20 +114,66 @@ class SyncService:
                 details={'error': str(e)},
             )
 
-    def _get_content_local_path(self, content_id: str, filename: str) -> str:
+    def _get_content_local_path(self, file_hash: str) -> str:
         """
-        Get local file path for content item.
+        Get the blob store path for content with the given hash.
+
+        Content files are stored by SHA256 under content_path/blobs,
+        sharded by the first two hex digits. Content items with the
+        same bytes (the same creative under several content IDs, or a
+        re-upload that did not change the file) share one blob.
 
         Args:
-            content_id: Content identifier from HQ
-            filename: Original filename
+            file_hash: SHA256 hash of the file contents
 
         Returns:
-            Local file path for storing content
+            Local file path of the blob
+        """
+        return os.path.join(self.content_path, BLOB_DIRNAME, file_hash[:2], file_hash)
+
+    def _store_blob(self, temp_path: str, file_hash: str) -> str:
         """
-        # Use content_id as directory to avoid filename collisions
-        content_dir = os.path.join(self.content_path, content_id)
-        return os.path.join(content_dir, filename)
+        Move a downloaded file into the blob store.
+
+        If a blob with the same hash already exists the download is
+        discarded and the existing blob is kept.
+
+        Args:
+            temp_path: Path of the verified download
+            file_hash: SHA256 hash of the download
+
+        Returns:
+            Local file path of the blob
+        """
+        blob_path = self._get_content_local_path(file_hash)
+
+        if os.path.isfile(blob_path):
+            os.remove(temp_path)
+            return blob_path
+
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        os.replace(temp_path, blob_path)
+        return blob_path
+
+    def _release_blob(self, local_path: Optional[str]) -> bool:
+        """
+        Delete a stored file once no content item references it.
+
+        Args:
+            local_path: Path previously used by a content item
+
+        Returns:
+            True if the file was deleted, False if still referenced
+        """
+        from models.content import Content
+
+        if not local_path:
+            return False
+
+        if Content.count_references(local_path) > 0:
+            return False
+
+        return self.delete_content_file(local_path)
 
     # -------------------------------------------------------------------------
     # Content Sync
@@ -153,6 +205,11 @@ class SyncService:
             else:
                 manifest = response.get('content', response.get('items', []))
 
+            # CMS manifests identify content by 'id'
+            for item in manifest:
+                if isinstance(item, dict) and not item.get('content_id') and item.get('id'):
+                    item['content_id'] = item['id']
+
             logger.info(f"Received manifest with {len(manifest)} content items")
             return manifest
 
@@ -167,33 +224,46 @@ class SyncService:
         self,
         hq_manifest: List[Dict[str, Any]],
         local_content: List[Any],
-    ) -> Tuple[List[Dict], List[Dict], List[Any]]:
+    ) -> Tuple[List[Dict], List[Dict], List[Dict], List[Any]]:
         """
         Compare HQ manifest with local content to determine sync actions.
 
+        New or changed content is only downloaded when the hub does not
+        already hold a file with the same hash. Otherwise it is linked to
+        the stored blob. Items that repeat a hash being downloaded in the
+        same sync are linked too, so each distinct file is fetched once.
+
         Args:
             hq_manifest: Content manifest from HQ
             local_content: List of local Content model instances
 
         Returns:
-            Tuple of (to_download, to_update, to_delete):
+            Tuple of (to_download, to_update, to_link, to_delete):
             - to_download: New content items to download
-            - to_update: Existing content items with changed hash
+            - to_update: Existing content items with changed hash to download
+            - to_link: New or changed items whose file is already held
             - to_delete: Local content no longer in HQ manifest
         """
-        # Build lookup by content_id for local content
+        # Build lookup by content_id for local content, and the hashes
+        # of files already held
         local_by_id = {}
+        held_hashes = set()
         for content in local_content:
             if hasattr(content, 'content_id'):
                 local_by_id[content.content_id] = content
+                if content.file_hash and content.is_cached:
+                    held_hashes.add(content.file_hash)
             elif isinstance(content, dict):
                 local_by_id[content.get('content_id')] = content
+                if content.get('file_hash') and content.get('local_path'):
+                    held_hashes.add(content.get('file_hash'))
 
         # Track content IDs in HQ manifest
         hq_content_ids = set()
 
         to_download = []
         to_update = []
+        to_link = []
 
         for item in hq_manifest:
             content_id = item.get('content_id')
@@ -205,21 +275,32 @@ class SyncService:
 
             local = local_by_id.get(content_id)
 
-            if local is None:
-                # New content - needs download
-                to_download.append(item)
-                logger.debug(f"New content to download: {content_id}")
-
-            elif local is not None:
+            if local is not None:
                 # Check if content needs update
                 local_hash = (
                     local.file_hash if hasattr(local, 'file_hash')
                     else local.get('file_hash')
                 )
 
-                if hq_hash and local_hash != hq_hash:
-                    to_update.append(item)
-                    logger.debug(f"Content to update (hash changed): {content_id}")
+                if not hq_hash or local_hash == hq_hash:
+                    continue
+
+            if hq_hash and hq_hash in held_hashes:
+                # Same bytes already stored (or downloaded earlier in this sync)
+                to_link.append(item)
+                logger.debug(f"Content to link to held file: {content_id}")
+                continue
+
+            if local is None:
+                # New content - needs download
+                to_download.append(item)
+                logger.debug(f"New content to download: {content_id}")
+            else:
+                to_update.append(item)
+                logger.debug(f"Content to update (hash changed): {content_id}")
+
+            if hq_hash:
+                held_hashes.add(hq_hash)
 
         # Find orphaned content (in local but not in HQ manifest)
         to_delete = []
@@ -230,10 +311,11 @@ class SyncService:
 
         logger.info(
             f"Manifest comparison: {len(to_download)} new, "
-            f"{len(to_update)} updated, {len(to_delete)} orphaned"
+            f"{len(to_update)} updated, {len(to_link)} linked, "
+            f"{len(to_delete)} orphaned"
         )
 
-        return to_download, to_update, to_delete
+        return to_download, to_update, to_link, to_delete
 
     def download_content_item(
         self,
@@ -241,7 +323,10 @@ class SyncService:
         verify_hash: bool = True,
     ) -> Tuple[str, str, int]:
         """
-        Download a single content item from HQ.
+        Download a single content item from HQ into the blob store.
+
+        The file is downloaded to content_path/.incoming, verified and
+        then moved to its hash-addressed blob path.
 
         Args:
             content_item: Content item dict from manifest
@@ -259,13 +344,10 @@ class SyncService:
 
         logger.info(f"Downloading content: {content_id} ({filename})")
 
-        # Prepare local path
-        local_path = self._get_content_local_path(content_id, filename)
-        local_dir = os.path.dirname(local_path)
-        os.makedirs(local_dir, exist_ok=True)
-
         # Download to temporary file first
-        temp_path = f"{local_path}.tmp"
+        incoming_dir = os.path.join(self.content_path, INCOMING_DIRNAME)
+        os.makedirs(incoming_dir, exist_ok=True)
+        temp_path = os.path.join(incoming_dir, f"{content_id}.tmp")
 
         try:
             # Download file from HQ
@@ -288,8 +370,8 @@ class SyncService:
                     },
                 )
 
-            # Move temp file to final location
-            shutil.move(temp_path, local_path)
+            # Move temp file into the blob store
+            local_path = self._store_blob(temp_path, actual_hash)
 
             logger.info(f"Downloaded content {content_id}: {file_size} bytes, hash={actual_hash[:8]}...")
 
@@ -345,9 +427,10 @@ class SyncService:
         This method:
         1. Fetches content manifest from CMS
         2. Compares with local content to find changes
-        3. Downloads new/updated content
-        4. Deletes orphaned content
-        5. Updates database records and sync status
+        3. Downloads new/updated content whose file is not held yet
+        4. Links new/updated content to files already held (same hash)
+        5. Deletes orphaned content, removing files no longer referenced
+        6. Updates database records and sync status
 
         Args:
             app_context: Optional Flask app context for database operations
@@ -366,7 +449,9 @@ class SyncService:
         result = {
             'downloaded': 0,
             'updated': 0,
+            'linked': 0,
             'deleted': 0,
+            'bytes_downloaded': 0,
             'errors': [],
             'started_at': datetime.utcnow().isoformat(),
             'completed_at': None,
@@ -396,7 +481,7 @@ class SyncService:
             local_content = Content.query.all()
 
             # Compare manifests
-            to_download, to_update, to_delete = self.compare_manifest(
+            to_download, to_update, to_link, to_delete = self.compare_manifest(
                 hq_manifest, local_content
             )
 
@@ -416,6 +501,7 @@ class SyncService:
                     content.update_cache_info(local_path, file_hash, file_size)
 
                     result['downloaded'] += 1
+                    result['bytes_downloaded'] += file_size
 
                 except Exception as e:
                     error_msg = f"Failed to download {item.get('content_id')}: {e}"
@@ -427,18 +513,55 @@ class SyncService:
                 try:
                     local_path, file_hash, file_size = self.download_content_item(item)
 
-                    # Update content record
+                    # Update content record, releasing the previous file
                     content = Content.get_by_content_id(item.get('content_id'))
                     if content:
+                        previous_path = content.local_path
                         content.update_cache_info(local_path, file_hash, file_size)
+                        if previous_path != local_path:
+                            self._release_blob(previous_path)
 
                     result['updated'] += 1
+                    result['bytes_downloaded'] += file_size
 
                 except Exception as e:
                     error_msg = f"Failed to update {item.get('content_id')}: {e}"
                     logger.error(error_msg)
                     result['errors'].append(error_msg)
 
+            # Link content whose file is already held
+            for item in to_link:
+                try:
+                    source = Content.get_cached_by_hash(item.get('file_hash'))
+
+                    if source and os.path.isfile(source.local_path):
+                        local_path = source.local_path
+                        file_hash = source.file_hash
+                        file_size = source.file_size
+                        result['linked'] += 1
+                    else:
+                        # Held file went missing (or its download failed)
+                        local_path, file_hash, file_size = self.download_content_item(item)
+                        result['downloaded'] += 1
+                        result['bytes_downloaded'] += file_size
+
+                    content, _ = Content.create_or_update(
+                        content_id=item.get('content_id'),
+                        filename=item.get('filename', ''),
+                        content_type=item.get('content_type', 'video'),
+                        duration_seconds=item.get('duration_seconds'),
+                        playlist_ids=item.get('playlist_ids'),
+                    )
+                    previous_path = content.local_path
+                    content.update_cache_info(local_path, file_hash, file_size)
+                    if previous_path and previous_path != local_path:
+                        self._release_blob(previous_path)
+
+                except Exception as e:
+                    error_msg = f"Failed to link {item.get('content_id')}: {e}"
+                    logger.error(error_msg)
+                    result['errors'].append(error_msg)
+
             # Process deletions
             for content in to_delete:
                 try:
@@ -451,15 +574,15 @@ class SyncService:
                         else content.get('local_path')
                     )
 
-                    # Delete file from disk
-                    if local_path:
-                        self.delete_content_file(local_path)
-
                     # Delete database record
                     if hasattr(content, 'id'):
                         db.session.delete(content)
                         db.session.commit()
 
+                    # Delete file from disk once no other content shares it
+                    if local_path:
+                        self._release_blob(local_path)
+
                     result['deleted'] += 1
 
                 except Exception as e:
@@ -486,7 +609,8 @@ class SyncService:
 
             logger.info(
                 f"Content sync completed: {result['downloaded']} downloaded, "
-                f"{result['updated']} updated, {result['deleted']} deleted, "
+                f"{result['updated']} updated, {result['linked']} linked, "
+                f"{result['deleted']} deleted, "
                 f"{len(result['errors'])} errors"
             )
 
@@ -1285,11 +1409,18 @@ class SyncService:
 
         total_size = sum(c.file_size or 0 for c in cached_content)
 
+        # Content with identical bytes shares one stored file
+        stored = {c.local_path: c.file_size or 0 for c in cached_content if c.local_path}
+        stored_size = sum(stored.values())
+
         return {
             'total_items': len(all_content),
             'cached_items': len(cached_content),
             'total_size_bytes': total_size,
             'total_size_mb': round(total_size / (1024 * 1024), 2),
+            'stored_files': len(stored),
+            'stored_size_bytes': stored_size,
+            'stored_size_mb': round(stored_size / (1024 * 1024), 2),
         }
 
     def verify_content_integrity(self) -> Dict[str, Any]:
@@ -1309,6 +1440,9 @@ class SyncService:
 
         cached_content = Content.get_all_cached()
 
+        # Shared blobs are hashed once
+        hashes_by_path = {}
+
         for content in cached_content:
             if not content.local_path:
                 continue
@@ -1319,7 +1453,10 @@ class SyncService:
                 continue
 
             try:
-                actual_hash = self.calculate_file_hash(content.local_path)
+                actual_hash = hashes_by_path.get(content.local_path)
+                if actual_hash is None:
+                    actual_hash = self.calculate_file_hash(content.local_path)
+                    hashes_by_path[content.local_path] = actual_hash
                 if content.file_hash and actual_hash != content.file_hash:
                     results['corrupted'].append({
                         'content_id': content.content_id,
@@ -1344,7 +1481,11 @@ class SyncService:
 
     def cleanup_orphaned_files(self) -> int:
         """
-        Remove files from content directory that are not in database.
+        Garbage-collect files in the content directory by refcount.
+
+        A blob is kept while at least one cached content item references
+        it; files with a refcount of zero (including legacy per-content
+        files and abandoned downloads) are removed.
 
         Returns:
             Number of orphaned files removed
@@ -1352,22 +1493,24 @@ class SyncService:
         from models.content import Content
 
         removed = 0
-        cached_content = Content.get_all_cached()
+        freed_bytes = 0
 
-        # Build set of known local paths
-        known_paths = set()
-        for content in cached_content:
-            if content.local_path:
-                known_paths.add(os.path.normpath(content.local_path))
+        # Refcount of each stored file from cached content records
+        refcounts = {
+            os.path.normpath(local_path): count
+            for local_path, count in Content.get_path_refcounts().items()
+        }
 
         # Walk content directory and find orphans
         for root, dirs, files in os.walk(self.content_path):
             for filename in files:
                 file_path = os.path.normpath(os.path.join(root, filename))
-                if file_path not in known_paths:
+                if refcounts.get(file_path, 0) == 0:
                     try:
+                        file_size = os.path.getsize(file_path)
                         os.remove(file_path)
                         removed += 1
+                        freed_bytes += file_size
                         logger.debug(f"Removed orphaned file: {file_path}")
                     except OSError as e:
                         logger.warning(f"Failed to remove orphaned file {file_path}: {e}")
@@ -1384,7 +1527,7 @@ class SyncService:
                         pass
 
         if removed > 0:
-            logger.info(f"Cleaned up {removed} orphaned files")
+            logger.info(f"Cleaned up {removed} orphaned files ({freed_bytes} bytes)")
 
         return removed
 
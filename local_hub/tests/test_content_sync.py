@@ -0,0 +1,204 @@
+"""
+Tests for content sync into the content-addressed blob store.
+
+Tests the content synchronization functionality to ensure:
+- Content with identical bytes is downloaded once and stored once
+- Manifest comparison links items whose hash the hub already holds
+- Deleting or updating content only removes files no longer referenced
+- Orphan cleanup garbage-collects blobs by refcount
+"""
+
+import hashlib
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from models.content import Content
+from services.sync_service import SyncService
+
+
+def _sha256(data):
+    """Hex SHA256 of bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _manifest_item(content_id, data):
+    """Build an HQ manifest item for the given bytes."""
+    return {
+        'content_id': content_id,
+        'filename': f'{content_id}.mp4',
+        'file_hash': _sha256(data),
+        'file_size': len(data),
+        'content_type': 'video',
+    }
+
+
+class FakeHQ:
+    """HQ client stand-in serving a manifest and file bodies."""
+
+    def __init__(self, files):
+        self.files = files
+        self.manifest = [_manifest_item(cid, data) for cid, data in files.items()]
+        self.downloads = []
+
+    def get(self, endpoint):
+        return {'content': [dict(item) for item in self.manifest]}
+
+    def download_file(self, endpoint, destination):
+        content_id = endpoint.split('/')[-2]
+        self.downloads.append(content_id)
+        with open(destination, 'wb') as f:
+            f.write(self.files[content_id])
+        return destination
+
+
+@pytest.fixture
+def make_service(tmp_path):
+    """Build a SyncService over a temporary content directory."""
+    def _make(hq):
+        config = MagicMock()
+        config.content_path = str(tmp_path / 'content')
+        config.databases_path = str(tmp_path / 'databases')
+        return SyncService(hq, config)
+    return _make
+
+
+def _stored_files(content_path):
+    """List every file under the content directory."""
+    return sorted(
+        os.path.join(root, name)
+        for root, _, names in os.walk(content_path)
+        for name in names
+    )
+
+
+# =============================================================================
+# Blob Store Sync Tests
+# =============================================================================
+
+class TestContentBlobStore:
+    """Tests for deduplicated content sync."""
+
+    def test_duplicate_content_downloaded_once(self, app, db_session, sample_hub_config, make_service):
+        """Items sharing a hash should be downloaded and stored once."""
+        hq = FakeHQ({'c1': b'creative-a', 'c2': b'creative-a', 'c3': b'creative-b'})
+        service = make_service(hq)
+
+        result = service.sync_content()
+
+        assert result['success'] is True
+        assert result['downloaded'] == 2
+        assert result['linked'] == 1
+        assert result['bytes_downloaded'] == len(b'creative-a') + len(b'creative-b')
+        assert sorted(hq.downloads) in (['c1', 'c3'], ['c2', 'c3'])
+        assert len(_stored_files(service.content_path)) == 2
+
+        c1 = Content.get_by_content_id('c1')
+        c2 = Content.get_by_content_id('c2')
+        assert c1.local_path == c2.local_path
+        assert c1.local_path == service._get_content_local_path(_sha256(b'creative-a'))
+
+    def test_resync_links_reuploaded_content(self, app, db_session, sample_hub_config, make_service):
+        """A new content ID with bytes already held should not be downloaded."""
+        hq = FakeHQ({'c1': b'creative-a'})
+        service = make_service(hq)
+        service.sync_content()
+
+        hq.files['c9'] = b'creative-a'
+        hq.manifest.append(_manifest_item('c9', b'creative-a'))
+        hq.downloads.clear()
+
+        result = service.sync_content()
+
+        assert hq.downloads == []
+        assert result['linked'] == 1
+        assert Content.get_by_content_id('c9').is_cached
+
+    def test_delete_keeps_shared_blob(self, app, db_session, sample_hub_config, make_service):
+        """Removing one of two items sharing a blob should keep the file."""
+        hq = FakeHQ({'c1': b'creative-a', 'c2': b'creative-a'})
+        service = make_service(hq)
+        service.sync_content()
+        blob_path = Content.get_by_content_id('c1').local_path
+
+        hq.manifest = [item for item in hq.manifest if item['content_id'] != 'c1']
+        result = service.sync_content()
+
+        assert result['deleted'] == 1
+        assert os.path.isfile(blob_path)
+
+        hq.manifest = []
+        service.sync_content()
+
+        assert not os.path.exists(blob_path)
+
+    def test_update_releases_previous_blob(self, app, db_session, sample_hub_config, make_service):
+        """Changing a content item's bytes should drop the unreferenced old blob."""
+        hq = FakeHQ({'c1': b'creative-a'})
+        service = make_service(hq)
+        service.sync_content()
+        old_path = Content.get_by_content_id('c1').local_path
+
+        hq.files['c1'] = b'creative-a-v2'
+        hq.manifest = [_manifest_item('c1', b'creative-a-v2')]
+        result = service.sync_content()
+
+        assert result['updated'] == 1
+        assert not os.path.exists(old_path)
+        assert Content.get_by_content_id('c1').file_hash == _sha256(b'creative-a-v2')
+
+    def test_cms_manifest_id_field(self, app, db_session, sample_hub_config, make_service):
+        """Manifest items identified by 'id' (CMS format) should sync."""
+        hq = FakeHQ({'c1': b'creative-a'})
+        hq.manifest = [{'id': 'c1', 'filename': 'c1.mp4', 'file_hash': _sha256(b'creative-a')}]
+        service = make_service(hq)
+
+        result = service.sync_content()
+
+        assert result['downloaded'] == 1
+        assert Content.get_by_content_id('c1').is_cached
+
+
+# =============================================================================
+# Manifest Comparison and Cleanup Tests
+# =============================================================================
+
+class TestCompareManifestAndCleanup:
+    """Tests for compare_manifest() and cleanup_orphaned_files()."""
+
+    def test_compare_manifest_links_held_hash(self, app, make_service):
+        """compare_manifest() should link items whose hash is already held."""
+        service = make_service(FakeHQ({}))
+        local = [{'content_id': 'old', 'file_hash': 'h1', 'local_path': '/x'}]
+        manifest = [
+            {'content_id': 'old', 'file_hash': 'h1'},
+            {'content_id': 'new-same', 'file_hash': 'h1'},
+            {'content_id': 'new-a', 'file_hash': 'h2'},
+            {'content_id': 'new-b', 'file_hash': 'h2'},
+        ]
+
+        to_download, to_update, to_link, to_delete = service.compare_manifest(manifest, local)
+
+        assert [i['content_id'] for i in to_download] == ['new-a']
+        assert to_update == []
+        assert [i['content_id'] for i in to_link] == ['new-same', 'new-b']
+        assert to_delete == []
+
+    def test_cleanup_removes_unreferenced_blobs(self, app, db_session, sample_hub_config, make_service):
+        """cleanup_orphaned_files() should keep referenced blobs only."""
+        hq = FakeHQ({'c1': b'creative-a'})
+        service = make_service(hq)
+        service.sync_content()
+
+        stray_hash = _sha256(b'stray')
+        stray_path = service._get_content_local_path(stray_hash)
+        os.makedirs(os.path.dirname(stray_path), exist_ok=True)
+        with open(stray_path, 'wb') as f:
+            f.write(b'stray')
+
+        removed = service.cleanup_orphaned_files()
+
+        assert removed == 1
+        assert not os.path.exists(stray_path)
+        assert os.path.isfile(Content.get_by_content_id('c1').local_path)
@@ -1374,3 +1374,222 @@ class TestHeartbeatQueueReliability:
         assert len(remaining) == 3
         # New entry should still exist
         assert HeartbeatQueue.query.get(new_entry.id) is not None
+
+
+# =============================================================================
+# Heartbeat Queue Batched Transition Tests
+# =============================================================================
+
+class _CommitCounter:
+    """Counts transactions committed on the hub's SQLite engine."""
+
+    def __init__(self):
+        self.commits = 0
+
+    def __call__(self, conn):
+        self.commits += 1
+
+    def __enter__(self):
+        db.event.listen(db.engine, 'commit', self)
+        return self
+
+    def __exit__(self, *exc):
+        db.event.remove(db.engine, 'commit', self)
+
+
+class TestHeartbeatQueueBatching:
+    """Tests for set-based heartbeat state transitions."""
+
+    def test_mark_batch_sending(self, app, db_session):
+        """mark_batch_sending() should update every entry in one statement."""
+        entries = [HeartbeatQueue.enqueue(f'd{i}', {'i': i}) for i in range(3)]
+        ids = [e.id for e in entries]
+
+        updated = HeartbeatQueue.mark_batch_sending(ids)
+
+        assert updated == 3
+        for entry in HeartbeatQueue.query.filter(HeartbeatQueue.id.in_(ids)):
+            assert entry.status == 'sending'
+            assert entry.attempts == 1
+            assert entry.last_attempt_at is not None
+
+    def test_mark_batch_failed_uses_per_entry_backoff(self, app, db_session):
+        """mark_batch_failed() should match mark_failed() backoff per entry."""
+        first = HeartbeatQueue.enqueue('d-first', {})
+        retried = HeartbeatQueue.enqueue('d-retried', {})
+        retried.attempts = 3
+        capped = HeartbeatQueue.enqueue('d-capped', {})
+        capped.attempts = 10
+        db_session.commit()
+
+        before = datetime.utcnow()
+        HeartbeatQueue.mark_batch_sending([first.id, retried.id, capped.id])
+        HeartbeatQueue.mark_batch_failed(
+            [first.id, retried.id, capped.id],
+            error_message='Refused',
+            retry_delay_seconds=30,
+        )
+
+        # attempts after sending: 1 -> 30s, 4 -> 240s, 11 -> capped at 300s
+        for entry, delay in ((first, 30), (retried, 240), (capped, 300)):
+            assert entry.status == 'failed'
+            assert entry.error_message == 'Refused'
+            expected = before + timedelta(seconds=delay)
+            assert abs((entry.next_retry_at - expected).total_seconds()) < 5
+
+    def test_mark_batch_sent_ignores_other_entries(self, app, db_session):
+        """mark_batch_sent() should only touch the given IDs."""
+        sent = HeartbeatQueue.enqueue('d-sent', {})
+        other = HeartbeatQueue.enqueue('d-other', {})
+
+        HeartbeatQueue.mark_batch_sent([sent.id])
+
+        assert sent.status == 'sent'
+        assert other.status == 'pending'
+
+    def test_enqueue_enforces_queue_size_periodically(self, app, db_session):
+        """enqueue_heartbeat() should check queue size every enforce_interval."""
+        service = HeartbeatQueueService(
+            MagicMock(),
+            MagicMock(),
+            max_queue_size=2,
+            enforce_interval=4,
+        )
+
+        with patch.object(
+            HeartbeatQueue, 'enforce_max_queue_size', return_value=0
+        ) as enforce:
+            for i in range(9):
+                service.enqueue_heartbeat(f'd{i}', {'i': i})
+
+        # Checked on enqueues 1, 5 and 9
+        assert enforce.call_count == 3
+
+    def test_forward_backlog_uses_few_transactions(self, app, db_session):
+        """Forwarding a 1,000-entry backlog should commit a few times per batch."""
+        db_session.add_all([
+            HeartbeatQueue(device_id=f'd{i % 40}', payload=json.dumps({'i': i}))
+            for i in range(1000)
+        ])
+        db_session.commit()
+
+        mock_hq_client = MagicMock()
+        mock_hq_client.send_batched_heartbeats.return_value = {'success': True}
+        service = HeartbeatQueueService(
+            mock_hq_client, MagicMock(), batch_size=500, compact=False,
+        )
+
+        with _CommitCounter() as counter:
+            result = service.process_pending_heartbeats(hub_id='hub-123')
+
+        assert result['succeeded'] == 1000
+        assert result['batches'] == 2
+        # get_pending read + sending + sent per batch, plus the final empty read
+        assert counter.commits <= 3 * result['batches'] + 1
+        assert HeartbeatQueue.get_pending_count() == 0
+
+
+# =============================================================================
+# Heartbeat Compaction Tests
+# =============================================================================
+
+def _queue_outage(db_session, devices, hours, interval_seconds=30, statuses=None):
+    """Insert the heartbeats a hub would queue during an HQ outage."""
+    start = datetime.utcnow() - timedelta(hours=hours)
+    per_device = int(hours * 3600 / interval_seconds)
+    rows = []
+    for n in range(per_device):
+        at = start + timedelta(seconds=n * interval_seconds)
+        for d in range(devices):
+            status = statuses(d, n) if statuses else 'online'
+            rows.append(HeartbeatQueue(
+                device_id=f'screen-{d:03d}',
+                payload=json.dumps({'status': status, 'cpu_percent': 12.5, 'n': n}),
+                created_at=at,
+                next_retry_at=at,
+            ))
+    db_session.add_all(rows)
+    db_session.commit()
+    return len(rows)
+
+
+class TestHeartbeatCompaction:
+    """Tests for forwarding only the latest heartbeat per device."""
+
+    def test_get_pending_compacted_keeps_latest_per_device(self, app, db_session):
+        """get_pending_compacted() should return one entry per device with a gap summary."""
+        def statuses(d, n):
+            return 'error' if d == 0 and 3 <= n < 5 else 'online'
+
+        _queue_outage(db_session, devices=2, hours=0.05, statuses=statuses)  # 6 each
+
+        entries, gaps, covered_ids = HeartbeatQueue.get_pending_compacted()
+
+        assert [e.device_id for e in entries] == ['screen-000', 'screen-001']
+        assert all(json.loads(e.payload)['n'] == 5 for e in entries)
+        assert len(covered_ids) == 12
+        assert gaps['screen-000']['count'] == 6
+        assert gaps['screen-000']['first_at'] < gaps['screen-000']['last_at']
+        assert gaps['screen-000']['status_change_count'] == 2
+        assert [(c['from'], c['to']) for c in gaps['screen-000']['status_changes']] == [
+            ('online', 'error'), ('error', 'online'),
+        ]
+        assert gaps['screen-001']['status_changes'] == []
+
+    def test_get_pending_compacted_respects_device_limit(self, app, db_session):
+        """get_pending_compacted() should only cover device_limit devices."""
+        _queue_outage(db_session, devices=5, hours=0.02)
+
+        entries, gaps, covered_ids = HeartbeatQueue.get_pending_compacted(device_limit=2)
+
+        assert len(entries) == 2
+        assert set(gaps) == {'screen-000', 'screen-001'}
+        covered = HeartbeatQueue.query.filter(HeartbeatQueue.id.in_(covered_ids))
+        assert {e.device_id for e in covered} == {'screen-000', 'screen-001'}
+
+    def test_compacted_payload_carries_gap_and_timestamp(self, app, db_session):
+        """Forwarded payloads should carry the latest timestamp, status and gap."""
+        _queue_outage(db_session, devices=1, hours=0.05)
+        latest = HeartbeatQueue.query.order_by(HeartbeatQueue.id.desc()).first()
+
+        mock_hq_client = MagicMock()
+        mock_hq_client.send_batched_heartbeats.return_value = {'success': True}
+        service = HeartbeatQueueService(mock_hq_client, MagicMock())
+        service.process_pending_heartbeats(hub_id='hub-123')
+
+        heartbeats = mock_hq_client.send_batched_heartbeats.call_args[1]['heartbeats']
+        assert len(heartbeats) == 1
+        assert heartbeats[0]['timestamp'] == latest.created_at.isoformat()
+        assert heartbeats[0]['status'] == 'online'
+        assert heartbeats[0]['gap']['count'] == 6
+
+    def test_compacted_failure_keeps_every_entry(self, app, db_session):
+        """A failed compacted batch must keep all covered entries for retry."""
+        queued = _queue_outage(db_session, devices=3, hours=0.05)
+
+        mock_hq_client = MagicMock()
+        mock_hq_client.send_batched_heartbeats.side_effect = HQConnectionError("Down")
+        service = HeartbeatQueueService(mock_hq_client, MagicMock())
+        result = service.process_pending_heartbeats(hub_id='hub-123')
+
+        assert result['failed'] == queued
+        assert HeartbeatQueue.get_pending_count() == queued
+        assert HeartbeatQueue.query.filter_by(status='failed').count() == queued
+
+    def test_six_hour_outage_drains_in_one_small_batch(self, app, db_session):
+        """After a 6-hour outage the hub should send one small batch."""
+        queued = _queue_outage(db_session, devices=25, hours=6)
+        assert queued == 25 * 720
+
+        mock_hq_client = MagicMock()
+        mock_hq_client.send_batched_heartbeats.return_value = {'success': True}
+        service = HeartbeatQueueService(mock_hq_client, MagicMock())
+        result = service.process_pending_heartbeats(hub_id='hub-123')
+
+        assert mock_hq_client.send_batched_heartbeats.call_count == 1
+        heartbeats = mock_hq_client.send_batched_heartbeats.call_args[1]['heartbeats']
+        assert len(heartbeats) == 25
+        assert len(json.dumps(heartbeats)) < 16 * 1024
+        assert result['succeeded'] == queued
+        assert result['compacted'] == queued - 25
+        assert HeartbeatQueue.get_pending_count() == 0
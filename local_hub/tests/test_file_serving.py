@@ -0,0 +1,223 @@
+"""
+Unit tests for conditional and byte-range download responses.
+
+Tests the content and database download endpoints to ensure:
+- Range requests return 206 with only the requested bytes
+- The stored file_hash is used as the ETag for 304 revalidation
+- If-Range with a stale ETag falls back to the full file
+- Downloads record access times in memory instead of committing
+"""
+
+import os
+from datetime import datetime
+
+import pytest
+from flask import url_for
+
+from models import db, Content, SyncStatus
+from services.content_access import ContentAccessRecorder, content_access
+
+
+FILE_DATA = bytes(range(256)) * 64
+FILE_HASH = 'a' * 64
+
+
+@pytest.fixture(autouse=True)
+def reset_content_access():
+    """Isolate the shared access recorder between tests."""
+    content_access.reset()
+    yield
+    content_access.reset()
+
+
+@pytest.fixture
+def cached_content(db_session, tmp_path):
+    """Create a cached content item backed by a file on disk."""
+    local_path = tmp_path / 'video.mp4'
+    local_path.write_bytes(FILE_DATA)
+
+    content = Content(
+        content_id='range-test',
+        filename='video.mp4',
+        local_path=str(local_path),
+        file_hash=FILE_HASH,
+        file_size=len(FILE_DATA),
+        content_type='video'
+    )
+    content.cached_at = datetime(2024, 1, 15, 10, 30)
+    db_session.add(content)
+    db_session.commit()
+    return content
+
+
+def _download_url(app, content_id='range-test'):
+    """Build the content download URL (blueprint prefix is set at registration)."""
+    with app.test_request_context():
+        return url_for('content.download_content', content_id=content_id)
+
+
+# =============================================================================
+# Content Download Tests
+# =============================================================================
+
+class TestContentDownload:
+    """Tests for GET /content/{content_id}/download."""
+
+    def test_full_download_has_validators(self, app, client, cached_content):
+        """A plain GET should return the file with ETag and Accept-Ranges."""
+        response = client.get(_download_url(app))
+
+        assert response.status_code == 200
+        assert response.data == FILE_DATA
+        assert response.headers['ETag'] == f'"{FILE_HASH}"'
+        assert response.headers['Accept-Ranges'] == 'bytes'
+        assert response.headers['Last-Modified'] == 'Mon, 15 Jan 2024 10:30:00 GMT'
+        assert 'video.mp4' in response.headers['Content-Disposition']
+
+    def test_range_returns_partial_content(self, app, client, cached_content):
+        """A Range request should return 206 with only the requested bytes."""
+        response = client.get(_download_url(app), headers={'Range': 'bytes=1000-1999'})
+
+        assert response.status_code == 206
+        assert response.data == FILE_DATA[1000:2000]
+        assert response.headers['Content-Length'] == '1000'
+        assert response.headers['Content-Range'] == f'bytes 1000-1999/{len(FILE_DATA)}'
+
+    def test_open_ended_range_resumes_download(self, app, client, cached_content):
+        """bytes=N- should return the remainder of the file."""
+        response = client.get(_download_url(app), headers={'Range': 'bytes=16000-'})
+
+        assert response.status_code == 206
+        assert response.data == FILE_DATA[16000:]
+
+    def test_unsatisfiable_range_returns_416(self, app, client, cached_content):
+        """A range past the end of the file should return 416."""
+        response = client.get(
+            _download_url(app),
+            headers={'Range': f'bytes={len(FILE_DATA) + 10}-'}
+        )
+
+        assert response.status_code == 416
+        assert response.headers['Content-Range'] == f'bytes */{len(FILE_DATA)}'
+
+    def test_matching_etag_returns_304(self, app, client, cached_content):
+        """If-None-Match with the file hash should return 304 and no body."""
+        response = client.get(
+            _download_url(app),
+            headers={'If-None-Match': f'"{FILE_HASH}"'}
+        )
+
+        assert response.status_code == 304
+        assert response.data == b''
+
+    def test_stale_etag_returns_full_file(self, app, client, cached_content):
+        """If-None-Match with an old hash should download the file."""
+        response = client.get(
+            _download_url(app),
+            headers={'If-None-Match': '"old-hash"'}
+        )
+
+        assert response.status_code == 200
+        assert response.data == FILE_DATA
+
+    def test_if_range_mismatch_returns_full_file(self, app, client, cached_content):
+        """A resume against a changed file should restart from byte 0."""
+        response = client.get(
+            _download_url(app),
+            headers={'Range': 'bytes=1000-', 'If-Range': '"old-hash"'}
+        )
+
+        assert response.status_code == 200
+        assert response.data == FILE_DATA
+
+    def test_if_range_match_returns_partial(self, app, client, cached_content):
+        """A resume against the same file should return the range."""
+        response = client.get(
+            _download_url(app),
+            headers={'Range': 'bytes=1000-', 'If-Range': f'"{FILE_HASH}"'}
+        )
+
+        assert response.status_code == 206
+        assert response.data == FILE_DATA[1000:]
+
+    def test_download_does_not_write_database(self, app, client, cached_content):
+        """Downloads should record access in memory without committing."""
+        url = _download_url(app)
+        statements = []
+
+        def capture(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        db.event.listen(db.engine, 'before_cursor_execute', capture)
+        try:
+            for _ in range(5):
+                client.get(url)
+        finally:
+            db.event.remove(db.engine, 'before_cursor_execute', capture)
+
+        assert not any(s.lstrip().upper().startswith('UPDATE') for s in statements)
+        assert len(content_access) == 1
+
+
+# =============================================================================
+# Database Download Tests
+# =============================================================================
+
+class TestDatabaseDownload:
+    """Tests for GET /databases/{type}/download."""
+
+    def test_ncmec_range_and_etag(self, app, client, db_session, tmp_path):
+        """FAISS downloads should use the synced hash as ETag and honor ranges."""
+        status = SyncStatus.get_or_create('ncmec_db')
+        status.mark_sync_success(version='v1.0.0', file_hash='ncmec-hash')
+        (tmp_path / 'ncmec.faiss').write_bytes(FILE_DATA)
+        app.config['DATABASES_PATH'] = str(tmp_path)
+
+        with app.test_request_context():
+            url = url_for('databases.download_ncmec_database')
+
+        partial = client.get(url, headers={'Range': 'bytes=0-99'})
+        cached = client.get(url, headers={'If-None-Match': '"ncmec-hash"'})
+
+        assert partial.status_code == 206
+        assert partial.data == FILE_DATA[:100]
+        assert partial.headers['ETag'] == '"ncmec-hash"'
+        assert cached.status_code == 304
+
+
+# =============================================================================
+# ContentAccessRecorder Tests
+# =============================================================================
+
+class TestContentAccessRecorder:
+    """Tests for batched last_accessed writes."""
+
+    def test_flush_writes_latest_access(self, app, cached_content):
+        """flush() should write the newest access time per content item."""
+        recorder = ContentAccessRecorder()
+        recorder.record(cached_content.id, datetime(2024, 2, 1, 12, 0))
+        recorder.record(cached_content.id, datetime(2024, 2, 1, 12, 5))
+        recorder.record(cached_content.id, datetime(2024, 2, 1, 11, 0))
+
+        assert recorder.flush() == 1
+        assert len(recorder) == 0
+
+        db.session.expire_all()
+        assert db.session.get(Content, cached_content.id).last_accessed == \
+            datetime(2024, 2, 1, 12, 5)
+
+    def test_flush_with_nothing_pending(self, app):
+        """flush() with no recorded access should not touch the database."""
+        assert ContentAccessRecorder().flush() == 0
+
+    def test_flush_ignores_deleted_content(self, app, cached_content):
+        """Content removed between download and flush should not fail the batch."""
+        recorder = ContentAccessRecorder()
+        recorder.record(cached_content.id)
+        recorder.record(cached_content.id + 1000)
+
+        recorder.flush()
+
+        assert len(recorder) == 0
+        db.session.expire_all()
+        assert db.session.get(Content, cached_content.id).last_accessed is not None
@@ -0,0 +1,222 @@
+"""
+Unit tests for ScreenMonitor offline detection.
+
+Tests the deadline-heap driven screen monitor to ensure:
+- Only screens whose heartbeat deadline passed are examined
+- Expired screens are marked offline in one bulk update
+- Heartbeats recorded by another process are re-armed, not marked offline
+- The heap is rebuilt from the database on first use
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from flask import url_for
+
+from models import db, Screen
+from services.screen_monitor import (
+    HeartbeatDeadlines,
+    ScreenMonitor,
+    ScreenMonitorError,
+    record_heartbeat,
+    screen_deadlines,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_deadlines():
+    """Isolate the shared deadline heap between tests."""
+    screen_deadlines.reset()
+    yield
+    screen_deadlines.reset()
+
+
+def _add_screen(db_session, hardware_id, seconds_ago, status='online'):
+    """Create a screen whose last heartbeat was seconds_ago seconds ago."""
+    screen = Screen(hardware_id=hardware_id, status=status)
+    db_session.add(screen)
+    db_session.flush()
+    if seconds_ago is None:
+        screen.last_heartbeat = None
+    else:
+        screen.last_heartbeat = datetime.utcnow() - timedelta(seconds=seconds_ago)
+    db_session.commit()
+    return screen
+
+
+# =============================================================================
+# HeartbeatDeadlines Tests
+# =============================================================================
+
+class TestHeartbeatDeadlines:
+    """Tests for the deadline min-heap."""
+
+    def test_pop_expired_returns_only_expired(self):
+        """pop_expired() should return screens older than the threshold."""
+        deadlines = HeartbeatDeadlines()
+        now = datetime.utcnow()
+        deadlines.touch(1, now - timedelta(seconds=300))
+        deadlines.touch(2, now - timedelta(seconds=10))
+        deadlines.touch(3, None)
+
+        expired = deadlines.pop_expired(now - timedelta(seconds=120))
+
+        assert sorted(expired) == [1, 3]
+        assert len(deadlines) == 1
+
+    def test_newer_heartbeat_supersedes_old_entry(self):
+        """A newer heartbeat should keep the screen from expiring."""
+        deadlines = HeartbeatDeadlines()
+        now = datetime.utcnow()
+        deadlines.touch(1, now - timedelta(seconds=300))
+        deadlines.touch(1, now)
+
+        assert deadlines.pop_expired(now - timedelta(seconds=120)) == []
+        assert deadlines.next_heartbeat() == now
+
+    def test_discard_stops_tracking(self):
+        """discard() should prevent a screen from being reported expired."""
+        deadlines = HeartbeatDeadlines()
+        deadlines.touch(1, datetime.utcnow() - timedelta(seconds=300))
+        deadlines.discard(1)
+
+        assert deadlines.pop_expired(datetime.utcnow()) == []
+
+    def test_heap_stays_bounded(self):
+        """Superseded entries should not grow the heap without bound."""
+        deadlines = HeartbeatDeadlines()
+        start = datetime.utcnow()
+        for i in range(10000):
+            deadlines.touch(i % 10, start + timedelta(seconds=i))
+
+        assert len(deadlines) == 10
+        assert len(deadlines._heap) <= 4 * 10 + 64 + 1
+
+
+# =============================================================================
+# ScreenMonitor.check_screens Tests
+# =============================================================================
+
+class TestCheckScreens:
+    """Tests for check_screens() offline detection."""
+
+    def test_marks_expired_screens_offline(self, app, db_session):
+        """check_screens() should mark screens past the timeout offline."""
+        stale = _add_screen(db_session, 'hw-stale', seconds_ago=300)
+        never = _add_screen(db_session, 'hw-never', seconds_ago=None)
+        fresh = _add_screen(db_session, 'hw-fresh', seconds_ago=10)
+
+        result = ScreenMonitor().check_screens()
+
+        assert result['marked_offline'] == 2
+        assert result['tracked'] == 1
+        assert db.session.get(Screen, stale.id).status == 'offline'
+        assert db.session.get(Screen, never.id).status == 'offline'
+        assert db.session.get(Screen, fresh.id).status == 'online'
+
+    def test_check_with_nothing_due_skips_database(self, app, db_session):
+        """A check with no expired deadlines should not query screens."""
+        _add_screen(db_session, 'hw-fresh', seconds_ago=10)
+        monitor = ScreenMonitor()
+        monitor.check_screens()  # initial resync
+
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        db.event.listen(db.engine, 'before_cursor_execute', count)
+        try:
+            result = monitor.check_screens()
+        finally:
+            db.event.remove(db.engine, 'before_cursor_execute', count)
+
+        assert result['checked'] == 0
+        assert statements == []
+
+    def test_recorded_heartbeat_keeps_screen_online(self, app, db_session):
+        """record_heartbeat() should push back a screen's deadline."""
+        screen = _add_screen(db_session, 'hw-beat', seconds_ago=100)
+        monitor = ScreenMonitor(offline_timeout=120)
+        monitor.check_screens()
+
+        screen.last_heartbeat = datetime.utcnow()
+        db_session.commit()
+        record_heartbeat(screen.id, screen.last_heartbeat)
+        screen_deadlines.synced_at = datetime.utcnow()
+
+        result = ScreenMonitor(offline_timeout=60).check_screens()
+
+        assert result['marked_offline'] == 0
+        assert db.session.get(Screen, screen.id).status == 'online'
+
+    def test_failed_check_requeues_candidates(self, app, db_session, monkeypatch):
+        """Screens popped by a check that fails should be retried by the next one."""
+        stale = _add_screen(db_session, 'hw-stale', seconds_ago=300)
+        monitor = ScreenMonitor()
+        monitor._resync_if_due(datetime.utcnow())
+
+        def fail(*args, **kwargs):
+            raise RuntimeError('database is locked')
+
+        with monkeypatch.context() as patch:
+            patch.setattr(db.session, 'execute', fail)
+            with pytest.raises(ScreenMonitorError):
+                monitor.check_screens()
+        db.session.rollback()
+
+        assert len(screen_deadlines) == 1
+        result = monitor.check_screens()
+
+        assert result['marked_offline'] == 1
+        assert db.session.get(Screen, stale.id).status == 'offline'
+
+    def test_heartbeat_from_other_process_is_rearmed(self, app, db_session):
+        """Candidates with a fresh heartbeat in the database should be re-armed."""
+        screen = _add_screen(db_session, 'hw-other', seconds_ago=10)
+        monitor = ScreenMonitor()
+        monitor.check_screens()
+
+        # Another worker stored a heartbeat this process never saw
+        screen_deadlines.touch(screen.id, datetime.utcnow() - timedelta(seconds=300))
+
+        result = monitor.check_screens()
+
+        assert result['checked'] == 1
+        assert result['online'] == 1
+        assert result['marked_offline'] == 0
+        assert db.session.get(Screen, screen.id).status == 'online'
+        assert len(screen_deadlines) == 1
+
+    def test_offline_screens_are_not_tracked(self, app, db_session):
+        """Screens already offline should not be loaded into the heap."""
+        _add_screen(db_session, 'hw-offline', seconds_ago=900, status='offline')
+
+        result = ScreenMonitor().check_screens()
+
+        assert result['checked'] == 0
+        assert result['tracked'] == 0
+
+    def test_heartbeat_endpoint_records_deadline(self, app, client, db_session):
+        """POST /screens/<id>/heartbeat should update the deadline heap."""
+        screen = _add_screen(db_session, 'hw-endpoint', seconds_ago=300, status='offline')
+
+        with app.test_request_context():
+            url = url_for('screens.screen_heartbeat', screen_id=screen.id)
+
+        response = client.post(url)
+
+        assert response.status_code == 200
+        assert len(screen_deadlines) == 1
+        assert screen_deadlines.pop_expired(datetime.utcnow() - timedelta(seconds=120)) == []
+
+    def test_mark_screen_offline_discards_deadline(self, app, db_session):
+        """mark_screen_offline() should stop tracking the screen."""
+        screen = _add_screen(db_session, 'hw-manual', seconds_ago=10)
+        monitor = ScreenMonitor(config=MagicMock())
+        monitor.check_screens()
+
+        monitor.mark_screen_offline(screen.id)
+
+        assert len(screen_deadlines) == 0
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-face versus batched age/gender inference in AgeDetector.
+
+For each face count, times estimate_demographics called once per face
+against a single estimate_demographics_batch call on the same frame, and
+checks that both paths return the same labels and confidences.
+
+Usage:
+    python scripts/benchmark_age_batching.py
+    python scripts/benchmark_age_batching.py --image photo.jpg --max-faces 12 --repeat 50
+
+Without --image a synthetic 1280x720 frame is used; the models only need
+pixels, not real faces, for timing. Needs OpenCV and the age/gender models
+under models/. Run from the project root.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import cv2  # noqa: E402
+import numpy as np  # noqa: E402
+
+from src.trigger_engine.age_detector import AgeDetector  # noqa: E402
+
+
+def face_grid(frame, count, size=120):
+    """Lay out ``count`` non-overlapping face boxes across the frame."""
+    height, width = frame.shape[:2]
+    columns = max(1, width // (size + 40))
+    bboxes = []
+    for index in range(count):
+        row, column = divmod(index, columns)
+        bboxes.append((20 + column * (size + 40), 20 + row * (size + 40), size, size))
+    return bboxes
+
+
+def time_ms(func, repeat):
+    """Median wall time of ``func`` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--image', help='Frame to crop faces from (default: synthetic)')
+    parser.add_argument('--max-faces', type=int, default=8, help='Largest face count to test')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed runs per face count')
+    args = parser.parse_args()
+
+    if args.image:
+        frame = cv2.imread(args.image)
+        if frame is None:
+            parser.error(f"Could not read image: {args.image}")
+    else:
+        frame = np.random.default_rng(0).integers(0, 256, (720, 1280, 3), dtype=np.uint8)
+
+    detector = AgeDetector(use_gpu=False)
+
+    print(f"{'faces':>5} {'per-face ms':>12} {'batched ms':>11} {'speedup':>8}  identical")
+    for count in range(1, args.max_faces + 1):
+        bboxes = face_grid(frame, count)
+
+        per_face = [detector.estimate_demographics(frame, bbox) for bbox in bboxes]
+        batched = detector.estimate_demographics_batch(frame, bboxes)
+        identical = all(
+            a[0] == b[0] and a[2] == b[2]
+            and np.isclose(a[1], b[1], atol=1e-5) and np.isclose(a[3], b[3], atol=1e-5)
+            for a, b in zip(per_face, batched)
+        )
+
+        per_face_ms = time_ms(
+            lambda: [detector.estimate_demographics(frame, bbox) for bbox in bboxes], args.repeat
+        )
+        batched_ms = time_ms(
+            lambda: detector.estimate_demographics_batch(frame, bboxes), args.repeat
+        )
+        print(
+            f"{count:>5} {per_face_ms:>12.1f} {batched_ms:>11.1f} "
+            f"{per_face_ms / batched_ms:>7.2f}x  {'yes' if identical else 'NO'}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Benchmark content catalog asset search at catalog scale.
+
+Bulk-inserts --assets assets with random word titles, descriptions, tags
+and categories into a file-backed SQLite database, rebuilds the search
+index once, then runs the same --searches search terms (single words,
+three-letter prefixes and two-word phrases) through:
+
+- ilike: the old ILIKE '%term%' filter over the indexed columns
+- fts: ContentService.list_assets(search=...), newest first
+- fts ranked: the same with sort_by='relevance'
+
+Each search counts the matches and loads the first page, as the asset
+list does. Reports mean/p50/max latency per mode, the rebuild time and
+the cost of keeping the index current on upload_asset, update_asset and
+delete_asset.
+
+Usage:
+    python scripts/benchmark_asset_search.py
+    python scripts/benchmark_asset_search.py --assets 20000 --searches 100
+
+Run from the project root.
+"""
+
+import argparse
+import logging
+import os
+import random
+import statistics
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import insert  # noqa: E402
+
+from content_catalog.app import create_app  # noqa: E402
+from content_catalog.config import TestingConfig  # noqa: E402
+from content_catalog.models import db, ContentAsset  # noqa: E402
+from content_catalog.services.content_service import ContentService  # noqa: E402
+from content_catalog.services.search_service import SearchService  # noqa: E402
+
+INSERT_BATCH = 10000
+UPDATE_ROUNDS = 200
+
+
+def make_vocabulary(rng: random.Random, size: int = 20000):
+    """Random lowercase words of 4-9 letters."""
+    return [
+        ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9)))
+        for _ in range(size)
+    ]
+
+
+def seed(rng: random.Random, words, assets: int) -> None:
+    """Bulk-insert assets without going through the ORM (or the index events)."""
+    categories = words[:200]
+    for start in range(0, assets, INSERT_BATCH):
+        db.session.execute(insert(ContentAsset), [
+            {
+                'uuid': f'00000000-0000-0000-0000-{index:012d}',
+                'title': ' '.join(rng.choices(words, k=4)).title(),
+                'description': ' '.join(rng.choices(words, k=30)),
+                'tags': ','.join(rng.choices(words, k=3)),
+                'category': rng.choice(categories),
+                'filename': f'asset_{index}.mp4',
+                'file_path': f'/uploads/asset_{index}.mp4',
+                'status': ContentAsset.STATUS_PUBLISHED,
+                'version': 1,
+                'synced_to_cms': False,
+            }
+            for index in range(start, min(start + INSERT_BATCH, assets))
+        ])
+    db.session.commit()
+
+
+def search_terms(rng: random.Random, words, count: int):
+    """Mostly whole words, plus short prefixes and two-word phrases."""
+    terms = []
+    for index in range(count):
+        kind = index % 5
+        if kind == 3:
+            terms.append(rng.choice(words)[:3])
+        elif kind == 4:
+            terms.append(' '.join(rng.choices(words, k=2)))
+        else:
+            terms.append(rng.choice(words))
+    return terms
+
+
+def ilike_search(term: str, per_page: int) -> int:
+    """The pre-index search: a substring filter over every indexed column."""
+    query = SearchService._ilike(ContentAsset.query, term)
+    total = query.count()
+    query.order_by(ContentAsset.created_at.desc()).limit(per_page).all()
+    return total
+
+
+def fts_search(term: str, per_page: int, sort_by: str = 'created_at') -> int:
+    """A search through ContentService, as the assets API runs it."""
+    _, total = ContentService.list_assets(
+        db.session, search=term, per_page=per_page, sort_by=sort_by
+    )
+    return total
+
+
+def report(name, latencies):
+    latencies = sorted(latencies)
+    print(f"{name:<12} {statistics.mean(latencies):>9.1f} {statistics.median(latencies):>9.1f} "
+          f"{latencies[-1]:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--assets', type=int, default=200000)
+    parser.add_argument('--searches', type=int, default=50)
+    parser.add_argument('--per-page', type=int, default=20)
+    args = parser.parse_args()
+
+    database = Path(tempfile.mkdtemp(prefix='search-bench-')) / 'catalog.db'
+    # The engine is bound in create_app(), so point the config at the
+    # scratch database first
+    TestingConfig.DATABASE_PATH = database
+    TestingConfig.SQLALCHEMY_DATABASE_URI = f'sqlite:///{database}'
+    os.environ['SEED_TEST_DATA'] = 'false'
+    logging.disable(logging.INFO)  # blueprint registration chatter
+    app = create_app(config_name='testing')
+
+    rng = random.Random(7)
+    words = make_vocabulary(rng)
+
+    with app.app_context():
+        start = time.perf_counter()
+        seed(rng, words, args.assets)
+        print(f"{args.assets} assets inserted in {time.perf_counter() - start:.1f} s, file SQLite")
+
+        start = time.perf_counter()
+        if not SearchService.rebuild_index(db.engine):
+            raise SystemExit('This SQLite build has no FTS5 support')
+        print(f"rebuild_index: {time.perf_counter() - start:.1f} s")
+
+        terms = search_terms(rng, words, args.searches)
+        modes = (
+            ('ilike', lambda term: ilike_search(term, args.per_page)),
+            ('fts', lambda term: fts_search(term, args.per_page)),
+            ('fts ranked', lambda term: fts_search(term, args.per_page, 'relevance')),
+        )
+
+        print(f"{args.searches} searches, page of {args.per_page}")
+        print(f"{'':<12} {'mean ms':>9} {'p50 ms':>9} {'max ms':>9}")
+        for name, run in modes:
+            run(terms[0])  # warm up SQLite's page cache
+            latencies = []
+            for term in terms:
+                start = time.perf_counter()
+                run(term)
+                latencies.append((time.perf_counter() - start) * 1000)
+                db.session.remove()
+            report(name, latencies)
+
+        # Index maintenance on the write path, one commit per call
+        timings = {'upload_asset': [], 'update_asset': [], 'delete_asset': []}
+        for index in range(UPDATE_ROUNDS):
+            start = time.perf_counter()
+            asset = ContentService.upload_asset(
+                db.session, title=f'Bench Upload {index}', filename='bench.mp4',
+                file_path='/uploads/bench.mp4', description='fresh upload', tags='bench'
+            )
+            db.session.commit()
+            timings['upload_asset'].append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            ContentService.update_asset(db.session, asset.id, title=f'Bench Renamed {index}')
+            db.session.commit()
+            timings['update_asset'].append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            ContentService.delete_asset(db.session, asset.id)
+            db.session.commit()
+            timings['delete_asset'].append((time.perf_counter() - start) * 1000)
+
+        print(f"{UPDATE_ROUNDS} writes each, committed individually")
+        for name, latencies in timings.items():
+            report(name, latencies)
+
+        db.session.remove()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Soak benchmark for trigger engine demographics aggregation.
+
+Feeds synthetic detections (fps x faces per frame) through one analytics
+interval of growing length, comparing the old per-detection buffer
+(a dict per detection, summarised by walking the list) with
+DemographicsAggregator. Reports peak traced memory, ns per detection and
+the size of the published payload.
+
+Usage:
+    python scripts/benchmark_demographics_soak.py
+    python scripts/benchmark_demographics_soak.py --fps 30 --faces 4 --intervals 60,300,900 --raw-samples 100
+
+Pure Python; no camera or models needed. Run from the project root.
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.trigger_engine.demographics import DemographicsAggregator  # noqa: E402
+
+
+def detections(count, seed=0):
+    """Yield ``count`` synthetic (age, age_conf, gender, gender_conf) tuples."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield rng.randint(1, 80), rng.random(), rng.choice(("male", "female")), rng.random()
+
+
+def buffered(stream, interval):
+    """The pre-aggregator path: one dict per detection, summarised at send time."""
+    buffer = []
+    for age, age_conf, gender, gender_conf in stream:
+        entry = {
+            "timestamp": time.time(),
+            "device_id": "bench",
+            "location": "bench",
+            "age": age,
+            "age_confidence": age_conf,
+            "age_range": "under_27" if age < 27 else "27-60" if age <= 60 else "61+",
+            "gender": gender,
+            "gender_confidence": gender_conf,
+        }
+        buffer.append(entry)
+
+    summary = {"total_detections": len(buffer), "time_window": interval}
+    age_ranges, genders = {}, {}
+    for entry in buffer:
+        age_ranges[entry["age_range"]] = age_ranges.get(entry["age_range"], 0) + 1
+    for entry in buffer:
+        genders[entry["gender"]] = genders.get(entry["gender"], 0) + 1
+    summary["age_distribution"] = age_ranges
+    summary["gender_distribution"] = genders
+    return {"type": "demographics", "entries": buffer, "summary": summary}
+
+
+def aggregated(stream, raw_samples):
+    """The DemographicsAggregator path."""
+    aggregator = DemographicsAggregator(max_samples=raw_samples)
+    for age, age_conf, gender, gender_conf in stream:
+        aggregator.add(age, age_conf, gender, gender_conf)
+    payload = {"type": "demographics", "summary": aggregator.summary()}
+    if raw_samples:
+        payload["entries"] = aggregator.samples
+    return payload
+
+
+def measure(func, count, extra):
+    """Return (payload, seconds, peak traced bytes).
+
+    Time is taken over pre-generated detections without tracing; memory is
+    traced separately over a generator so the input itself is not counted.
+    """
+    stream = list(detections(count))
+    start = time.perf_counter()
+    payload = func(stream, extra)
+    elapsed = time.perf_counter() - start
+    del stream
+
+    tracemalloc.start()
+    func(detections(count), extra)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return payload, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--fps', type=int, default=30)
+    parser.add_argument('--faces', type=int, default=4, help='Faces per frame')
+    parser.add_argument('--intervals', default='60,300,900', help='Interval lengths in seconds')
+    parser.add_argument('--raw-samples', type=int, default=0, help='Raw entries sampled per interval')
+    args = parser.parse_args()
+
+    print(f"{'interval':>8} {'detections':>10}  {'path':<10} {'peak MB':>8} {'ns/det':>7} {'payload KB':>11}")
+    for interval in (int(i) for i in args.intervals.split(',')):
+        count = interval * args.fps * args.faces
+        for name, func, extra in (
+            ("buffer", buffered, interval),
+            ("aggregate", aggregated, args.raw_samples),
+        ):
+            payload, elapsed, peak = measure(func, count, extra)
+            size = len(json.dumps(payload))
+            print(
+                f"{interval:>7}s {count:>10}  {name:<10} {peak / 1e6:>8.2f} "
+                f"{elapsed * 1e9 / count:>7.0f} {size / 1024:>11.1f}"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark face detector backends for speed and recall on a labeled image set.
+
+Runs each requested backend/input-width combination over the images in a
+labels file and reports median ms/frame, recall (labeled faces matched at
+IoU >= 0.5) and false positives per image.
+
+Labels file (default test_content/faces/labels.json), paths relative to it:
+
+    {
+      "images": [
+        {"file": "lobby_001.jpg", "faces": [[412, 220, 96, 110], [900, 260, 80, 92]]},
+        {"file": "empty_aisle.jpg", "faces": []}
+      ]
+    }
+
+Usage:
+    python scripts/benchmark_face_detectors.py
+    python scripts/benchmark_face_detectors.py --backends haar,yunet --widths 0,640,320
+
+Needs OpenCV; the ssd and yunet backends also need their models (paths
+from config/default_config.yaml). Run from the project root.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import cv2  # noqa: E402
+
+from src.common.config import get_config  # noqa: E402
+from src.trigger_engine.face_detectors import create_face_detector  # noqa: E402
+from src.trigger_engine.face_tracker import iou  # noqa: E402
+
+
+def load_labeled_set(labels_path):
+    """Return [(image, [bbox, ...]), ...] from a labels file."""
+    labels = json.loads(labels_path.read_text())
+    samples = []
+    for entry in labels.get('images', []):
+        image = cv2.imread(str(labels_path.parent / entry['file']))
+        if image is None:
+            print(f"warning: could not read {entry['file']}, skipping", file=sys.stderr)
+            continue
+        samples.append((image, [tuple(face) for face in entry.get('faces', [])]))
+    return samples
+
+
+def evaluate(detector, samples, warmup=3):
+    """Return (median ms/frame, recall, false positives per image)."""
+    for image, _ in samples[:warmup]:
+        detector.detect(image)
+
+    timings = []
+    matched = labeled = false_positives = 0
+    for image, truth in samples:
+        start = time.perf_counter()
+        boxes = detector.detect(image)
+        timings.append((time.perf_counter() - start) * 1000)
+
+        unmatched = list(boxes)
+        for face in truth:
+            best = max(unmatched, key=lambda box: iou(box, face), default=None)
+            if best is not None and iou(best, face) >= 0.5:
+                unmatched.remove(best)
+                matched += 1
+        labeled += len(truth)
+        false_positives += len(unmatched)
+
+    timings.sort()
+    recall = matched / labeled if labeled else 0.0
+    return timings[len(timings) // 2], recall, false_positives / len(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--labels', default=str(ROOT / 'test_content' / 'faces' / 'labels.json'))
+    parser.add_argument('--backends', default='haar,ssd,yunet', help='Comma-separated backends')
+    parser.add_argument('--widths', default='0,640,320', help='Comma-separated input widths (0 = full)')
+    args = parser.parse_args()
+
+    labels_path = Path(args.labels)
+    if not labels_path.exists():
+        parser.error(f"Labels file not found: {labels_path}")
+    samples = load_labeled_set(labels_path)
+    if not samples:
+        parser.error("No readable images in labels file")
+
+    settings = dict(get_config().get('ml.trigger.detector', {}) or {})
+    print(f"{len(samples)} images, {sum(len(t) for _, t in samples)} labeled faces\n")
+    print(f"{'backend':<8} {'width':>6} {'ms/frame':>9} {'recall':>7} {'FP/img':>7}")
+
+    for backend in args.backends.split(','):
+        for width in (int(w) for w in args.widths.split(',')):
+            try:
+                detector = create_face_detector({**settings, 'backend': backend, 'input_width': width})
+            except (cv2.error, AttributeError) as e:
+                print(f"{backend:<8} {width or 'full':>6}  unavailable: {e}")
+                break
+            ms, recall, fp = evaluate(detector, samples)
+            print(f"{backend:<8} {width or 'full':>6} {ms:>9.1f} {recall:>7.1%} {fp:>7.2f}")
+
+
+if __name__ == '__main__':
+    main()
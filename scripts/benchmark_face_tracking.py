@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark detect-once/track-between scheduling against per-frame detection.
+
+Replays a video twice: once running AgeDetector.detect_and_estimate on
+every frame (the reference), once through FaceTracker. Reports CPU time
+per frame for each and how often the scheduled run's determine_trigger
+result matches the reference on the same frame.
+
+Usage:
+    python scripts/benchmark_face_tracking.py --video test_content/sample_video.mp4
+    python scripts/benchmark_face_tracking.py --video clip.mp4 --interval 10 --tracker kcf
+
+Needs OpenCV and the age/gender models under models/. Run from the project root.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import cv2  # noqa: E402
+
+from src.trigger_engine.age_detector import AgeDetector  # noqa: E402
+from src.trigger_engine.face_tracker import FaceTracker  # noqa: E402
+
+
+def read_frames(video, max_frames):
+    """Decode up to ``max_frames`` frames into memory so decoding is not timed."""
+    capture = cv2.VideoCapture(video)
+    frames = []
+    while len(frames) < max_frames:
+        ret, frame = capture.read()
+        if not ret:
+            break
+        frames.append(frame)
+    capture.release()
+    return frames
+
+
+def run(frames, process, detector):
+    """Return (CPU ms per frame, trigger per frame) for a processing function."""
+    triggers = []
+    start = time.process_time()
+    for frame in frames:
+        triggers.append(detector.determine_trigger(process(frame))[0])
+    cpu_ms = (time.process_time() - start) * 1000 / max(1, len(frames))
+    return cpu_ms, triggers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--video', required=True, help='Recorded video file to replay')
+    parser.add_argument('--interval', type=int, default=5, help='Frames between detection passes')
+    parser.add_argument('--motion', type=float, default=8.0, help='Motion threshold (0 disables)')
+    parser.add_argument('--tracker', default='iou', choices=['iou', 'kcf', 'csrt'])
+    parser.add_argument('--max-frames', type=int, default=900)
+    args = parser.parse_args()
+
+    if not Path(args.video).exists():
+        parser.error(f"Video not found: {args.video}")
+
+    frames = read_frames(args.video, args.max_frames)
+    detector = AgeDetector(use_gpu=False)
+    tracker = FaceTracker(
+        detector,
+        detect_interval=args.interval,
+        motion_threshold=args.motion,
+        tracker_type=args.tracker
+    )
+
+    reference_ms, reference = run(frames, detector.detect_and_estimate, detector)
+    scheduled_ms, scheduled = run(frames, tracker.process, detector)
+
+    agreement = sum(a == b for a, b in zip(reference, scheduled)) / max(1, len(frames))
+    changes = lambda triggers: sum(a != b for a, b in zip(triggers, triggers[1:]))  # noqa: E731
+
+    print(f"frames:             {len(frames)}")
+    print(f"per-frame CPU:      {reference_ms:.1f} ms/frame")
+    print(
+        f"scheduled CPU:      {scheduled_ms:.1f} ms/frame "
+        f"({tracker.detection_passes} detection passes, tracker {tracker.tracker_type})"
+    )
+    print(f"CPU reduction:      {reference_ms / max(scheduled_ms, 1e-6):.1f}x")
+    print(f"trigger agreement:  {agreement:.1%}")
+    print(f"trigger changes:    {changes(reference)} per-frame, {changes(scheduled)} scheduled")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark the local hub's heartbeat queue against its SQLite database.
+
+Creates a file-backed hub database (as the hub uses in production), then
+times, counting commits and SQL statements:
+
+- forward ok: draining a --backlog heartbeat backlog from --devices
+  screens while HQ acknowledges every batch
+- forward failing: the same backlog while HQ rejects every batch, so
+  each entry is moved to failed with a retry time
+- enqueue: --enqueue single heartbeat inserts, as screens report in
+
+Heartbeat compaction is turned off where the service supports it, so
+every queued entry goes through the batch state transitions. Pass
+--compact to measure with it on.
+
+Pass --hub-dir to benchmark another checkout of local_hub, e.g. a git
+worktree of an older commit.
+
+Usage:
+    python scripts/benchmark_heartbeat_queue.py
+    python scripts/benchmark_heartbeat_queue.py --backlog 10000 --batch-size 100
+
+Run from the project root.
+"""
+
+import argparse
+import inspect
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class StandInHQ:
+    """HQ client that acknowledges, or rejects, every heartbeat batch."""
+
+    def __init__(self, accept: bool):
+        self.accept = accept
+        self.batches = 0
+
+    def send_batched_heartbeats(self, hub_id, heartbeats, **kwargs):
+        self.batches += 1
+        if self.accept:
+            return {'success': True, 'processed': len(heartbeats)}
+        return {'success': False, 'error': 'HQ unavailable'}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--backlog', type=int, default=1000)
+    parser.add_argument('--devices', type=int, default=40)
+    parser.add_argument('--batch-size', type=int, default=50)
+    parser.add_argument('--enqueue', type=int, default=500)
+    parser.add_argument('--compact', action='store_true')
+    parser.add_argument('--hub-dir', type=Path, default=ROOT / 'local_hub')
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(args.hub_dir.resolve()))
+    from flask import Flask
+    from sqlalchemy import event
+    from models import db
+    from models.heartbeat_queue import HeartbeatQueue
+    from models.hub_config import HubConfig
+    from services.heartbeat_queue import HeartbeatQueueService
+
+    # A bare app rather than create_app(), which would also start the
+    # scheduler and the pairing flow
+    database = Path(tempfile.mkdtemp(prefix='heartbeat-bench-')) / 'hub.db'
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{database}'
+    db.init_app(app)
+    logging.disable(logging.WARNING)  # per-batch forwarding messages
+
+    options = {'batch_size': args.batch_size}
+    if 'compact' in inspect.signature(HeartbeatQueueService).parameters:
+        options['compact'] = args.compact
+    elif args.compact:
+        raise SystemExit('This HeartbeatQueueService has no compaction')
+
+    with app.app_context():
+        db.create_all()
+        HubConfig.update_registration(hub_id='bench-hub', hub_token='bench', status='active')
+
+        counts = {'commits': 0, 'statements': 0}
+
+        def count_commit(conn):
+            counts['commits'] += 1
+
+        def count_statement(*args):
+            counts['statements'] += 1
+
+        event.listen(db.engine, 'commit', count_commit)
+        event.listen(db.engine, 'before_cursor_execute', count_statement)
+
+        def seed_backlog():
+            HeartbeatQueue.query.delete()
+            db.session.add_all(
+                HeartbeatQueue(
+                    device_id=f'screen-{index % args.devices}',
+                    payload=json.dumps({'sequence': index, 'status': 'online'}),
+                )
+                for index in range(args.backlog)
+            )
+            db.session.commit()
+
+        def measure(name, run, items):
+            counts.update(commits=0, statements=0)
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            print(f"{name:<16} {items:>7} {elapsed * 1000:>9.0f} {counts['commits']:>8} "
+                  f"{counts['statements']:>11}")
+
+        print(f"{args.backlog} queued heartbeats from {args.devices} devices, batch size "
+              f"{args.batch_size}, compaction {'on' if options.get('compact') else 'off'}, file SQLite")
+        print(f"{'':<16} {'entries':>7} {'total ms':>9} {'commits':>8} {'statements':>11}")
+
+        for name, accept in (('forward ok', True), ('forward failing', False)):
+            seed_backlog()
+            service = HeartbeatQueueService(StandInHQ(accept), None, **options)
+            measure(name, lambda: service.process_pending_heartbeats(hub_id='bench-hub'),
+                    args.backlog)
+
+        seed_backlog()
+        service = HeartbeatQueueService(StandInHQ(True), None, **options)
+
+        def enqueue():
+            for index in range(args.enqueue):
+                service.enqueue_heartbeat(f'screen-{index % args.devices}', {'sequence': index})
+
+        measure('enqueue', enqueue, args.enqueue)
+
+        db.session.remove()
+
+
+if __name__ == '__main__':
+    main()
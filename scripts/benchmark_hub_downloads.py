@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Benchmark concurrent screen downloads from the local hub.
+
+Sets up a scratch hub (config, SQLite database and one --size-mb content
+file registered with its SHA256 file_hash), starts the hub under
+gunicorn with the production settings from local_hub/install.sh, and has
+--screens concurrent curl clients download the file three ways:
+
+- full: a plain GET of the whole file
+- resume: a Range request for everything after --resume-from-mb
+- revalidate: a GET with If-None-Match set to the file hash, as a screen
+  checking a file it already has
+
+Reports wall time, gunicorn CPU time (master and workers), megabytes sent
+and the status codes returned for each scenario.
+
+Pass --hub-dir to benchmark another checkout of local_hub, e.g. a git
+worktree of an older commit, against the same file.
+
+Usage:
+    python scripts/benchmark_hub_downloads.py
+    python scripts/benchmark_hub_downloads.py --screens 20 --size-mb 100
+
+Needs gunicorn and curl, and reads CPU time from /proc (Linux). Run from
+the project root.
+"""
+
+import argparse
+import collections
+import hashlib
+import json
+import logging
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CHUNK_SIZE = 8 * 1024 * 1024
+CONTENT_ID = 'bench-video'
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def write_content(path: Path, size_mb: int) -> str:
+    """Write size_mb of random bytes to path; return the SHA256 hex digest."""
+    digest = hashlib.sha256()
+    remaining = size_mb * 1024 * 1024
+    with open(path, 'wb') as f:
+        while remaining:
+            chunk = os.urandom(min(CHUNK_SIZE, remaining))
+            digest.update(chunk)
+            f.write(chunk)
+            remaining -= len(chunk)
+    return digest.hexdigest()
+
+
+def setup_hub(hub_dir: Path, work: Path, port: int, size_mb: int):
+    """
+    Create the scratch hub and register one content file.
+
+    Returns:
+        Tuple of (config path, download path, file hash)
+    """
+    config_path = work / 'config.json'
+    config_path.write_text(json.dumps({
+        'cms_url': 'http://127.0.0.1:9',
+        'storage_path': str(work / 'storage'),
+        'log_path': str(work / 'logs'),
+        'port': port,
+    }))
+
+    sys.path.insert(0, str(hub_dir))
+    from flask import Flask, url_for
+    from app import create_app
+    from config import load_config
+    from models import db, Content
+    from models.hub_config import HubConfig
+    from scheduler import shutdown_scheduler
+
+    # Seed through a bare app first: create_app() starts the pairing
+    # thread, which would race the registration below
+    hub_config = load_config(str(config_path))
+    os.makedirs(hub_config.content_path, exist_ok=True)
+    seed_app = Flask(__name__)
+    seed_app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{hub_config.db_path}'
+    db.init_app(seed_app)
+    with seed_app.app_context():
+        db.create_all()
+        # Registered, so the hub skips the pairing flow
+        HubConfig.update_registration(
+            hub_id='bench-hub', hub_token='bench', hub_code='BEN', status='active'
+        )
+        content_file = Path(hub_config.content_path) / 'bench-video.mp4'
+        file_hash = write_content(content_file, size_mb)
+        content = Content(
+            content_id=CONTENT_ID,
+            filename=content_file.name,
+            local_path=str(content_file),
+            file_hash=file_hash,
+            file_size=content_file.stat().st_size,
+            content_type='video',
+        )
+        content.cached_at = datetime.utcnow()
+        db.session.add(content)
+        db.session.commit()
+
+    app = create_app(str(config_path))
+    with app.test_request_context():
+        path = url_for('content.download_content', content_id=CONTENT_ID)
+    # The gunicorn workers run their own jobs; keep this process idle
+    shutdown_scheduler(wait=False)
+    return config_path, path, file_hash
+
+
+def cpu_seconds(pid: int) -> float:
+    """User + system CPU time of a process and its direct children."""
+    children = subprocess.run(
+        ['pgrep', '-P', str(pid)], capture_output=True, text=True
+    ).stdout.split()
+    ticks = 0
+    for process in [pid, *map(int, children)]:
+        try:
+            fields = Path(f'/proc/{process}/stat').read_text().rsplit(')', 1)[1].split()
+        except FileNotFoundError:
+            continue
+        ticks += int(fields[11]) + int(fields[12])
+    return ticks / os.sysconf('SC_CLK_TCK')
+
+
+def scenario(name, url, screens, server_pid, headers=()):
+    """Run screens concurrent curl downloads and print one result row."""
+    args = []
+    for header in headers:
+        args += ['-H', header]
+
+    cpu_start, start = cpu_seconds(server_pid), time.perf_counter()
+    clients = [
+        subprocess.Popen(
+            ['curl', '-s', '-o', '/dev/null', '-w', '%{http_code} %{size_download}', *args, url],
+            stdout=subprocess.PIPE, text=True,
+        )
+        for _ in range(screens)
+    ]
+    results = [client.communicate()[0].split() for client in clients]
+    elapsed, cpu = time.perf_counter() - start, cpu_seconds(server_pid) - cpu_start
+
+    codes = collections.Counter(code for code, _ in results)
+    sent_mb = sum(int(size) for _, size in results) / (1024 * 1024)
+    codes_text = ' '.join(f'{count}x{code}' for code, count in sorted(codes.items()))
+    print(f"{name:<12} {elapsed:>8.1f} {cpu:>9.1f} {sent_mb:>9.0f}  {codes_text}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--screens', type=int, default=50)
+    parser.add_argument('--size-mb', type=int, default=500)
+    parser.add_argument('--resume-from-mb', type=int, default=250)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--hub-dir', type=Path, default=ROOT / 'local_hub')
+    args = parser.parse_args()
+
+    hub_dir = args.hub_dir.resolve()
+    work = Path(tempfile.mkdtemp(prefix='hub-download-bench-'))
+    port = free_port()
+    logging.disable(logging.WARNING)  # scheduler and blueprint chatter
+    config_path, path, file_hash = setup_hub(hub_dir, work, port, args.size_mb)
+
+    # Same gunicorn settings as the skillz-hub systemd unit
+    server = subprocess.Popen(
+        [
+            sys.executable, '-m', 'gunicorn',
+            '--workers', str(args.workers),
+            '--bind', f'127.0.0.1:{port}',
+            '--timeout', '120',
+            '--graceful-timeout', '30',
+            '--keep-alive', '5',
+            '--log-level', 'error',
+            'app:create_app()',
+        ],
+        cwd=hub_dir,
+        env={**os.environ, 'SKILLZ_HUB_CONFIG': str(config_path)},
+        stdout=subprocess.DEVNULL,
+        stderr=open(work / 'gunicorn.log', 'w'),
+    )
+    url = f'http://127.0.0.1:{port}{path}'
+    try:
+        for _ in range(100):
+            probe = subprocess.run(
+                ['curl', '-s', '-o', '/dev/null', '-w', '%{http_code}', '-r', '0-0', url],
+                capture_output=True, text=True,
+            )
+            if probe.stdout in ('200', '206'):
+                break
+            time.sleep(0.2)
+        else:
+            raise SystemExit(f"hub did not serve {url}; see {work / 'gunicorn.log'}")
+
+        print(f"{args.screens} screens, {args.size_mb} MB file, gunicorn {args.workers} sync workers, "
+              f"{os.cpu_count()} CPUs")
+        print(f"{'scenario':<12} {'wall s':>8} {'server s':>9} {'MB sent':>9}  codes")
+        scenario('full', url, args.screens, server.pid)
+        scenario('resume', url, args.screens, server.pid,
+                 [f'Range: bytes={args.resume_from_mb * 1024 * 1024}-'])
+        scenario('revalidate', url, args.screens, server.pid, [f'If-None-Match: "{file_hash}"'])
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == '__main__':
+    main()
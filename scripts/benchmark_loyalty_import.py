@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Benchmark the loyalty member import pipeline.
+
+Serves synthetic member photos from a local HTTP server with a fixed
+per-request latency and a share of 404s, then imports --rows CSV rows
+into an in-memory database twice:
+
+- serial: download and encode one member at a time, committing every 50
+  members (the import before the pipeline)
+- pipeline: _import_members(), with download threads feeding the
+  encoding pool and batched commits
+
+face_recognition is replaced by a CPU-bound stand-in that burns about
+--encode-ms per photo, so the numbers measure the pipeline rather than
+dlib. Reports wall time, rows/s and the final import statistics.
+
+Usage:
+    python scripts/benchmark_loyalty_import.py
+    python scripts/benchmark_loyalty_import.py --rows 1000 --latency-ms 80 --encode-workers 4
+
+Needs the central hub dependencies (Flask-SQLAlchemy, Celery,
+face_recognition). Run from the project root.
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import tempfile
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault('FLASK_ENV', 'testing')
+
+import numpy as np  # noqa: E402
+
+# Read from the environment so encoding worker processes see it as well
+ENCODE_SECONDS = float(os.environ.get('BENCH_ENCODE_MS', '100')) / 1000
+ENCODING = np.zeros(128, dtype=np.float32).tobytes()
+
+
+def stand_in_encode(photo_bytes):
+    """CPU-bound stand-in for extract_encoding_from_bytes."""
+    deadline = time.process_time() + ENCODE_SECONDS
+    digest = photo_bytes[:64]
+    while time.process_time() < deadline:
+        digest = hashlib.sha256(digest).digest()
+    return ENCODING
+
+
+class PhotoHandler(BaseHTTPRequestHandler):
+    """Serves /<n>.jpg after a delay; every missing_every-th photo is a 404."""
+
+    latency = 0.04
+    photo = b''
+    missing_every = 50
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        number = int(self.path.strip('/').split('.')[0])
+        if self.missing_every and number % self.missing_every == 0:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/jpeg')
+        self.send_header('Content-Length', str(len(self.photo)))
+        self.end_headers()
+        self.wfile.write(self.photo)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ProgressTask:
+    """Stand-in for a bound Celery task; keeps the last reported state."""
+
+    def __init__(self):
+        self.updates = 0
+
+    def update_state(self, state, meta):
+        self.updates += 1
+
+
+def run_serial(importer, rows, network_id):
+    """One member at a time: download, encode, insert; commit every 50."""
+    from central_hub.extensions import db
+    from central_hub.models.loyalty import LoyaltyMember
+
+    created = 0
+    batch = []
+    for row in rows:
+        member = importer._parse_member_row(row)
+        photo_bytes = importer._download_member_photo(member['photo_url'])
+        if not photo_bytes:
+            continue
+        encoding = stand_in_encode(photo_bytes)
+        member_id = uuid.uuid4()
+        batch.append(LoyaltyMember(
+            id=member_id,
+            network_id=network_id,
+            member_code=member['member_code'],
+            name=member['name'],
+            face_encoding=encoding,
+            photo_path=importer._save_photo_bytes(photo_bytes, member_id, network_id),
+        ))
+        created += 1
+        if len(batch) >= 50:
+            db.session.add_all(batch)
+            db.session.commit()
+            batch = []
+    db.session.add_all(batch)
+    db.session.commit()
+    return {'members_created': created}
+
+
+def run_pipeline(importer, rows, network_id):
+    stats = importer._new_import_stats(rows_total=len(rows))
+    importer._import_members(ProgressTask(), rows, network_id, stats)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--rows', type=int, default=300)
+    parser.add_argument('--latency-ms', type=float, default=40.0, help='Photo server delay per request')
+    parser.add_argument('--photo-kb', type=int, default=80)
+    parser.add_argument('--missing-every', type=int, default=50, help='Every Nth photo is a 404 (0: none)')
+    parser.add_argument('--encode-ms', type=float, default=100.0, help='CPU time per stand-in encoding')
+    parser.add_argument('--download-workers', type=int, default=16)
+    parser.add_argument('--encode-workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--batch-size', type=int, default=200)
+    args = parser.parse_args()
+
+    global ENCODE_SECONDS
+    ENCODE_SECONDS = args.encode_ms / 1000
+    os.environ['BENCH_ENCODE_MS'] = str(args.encode_ms)
+
+    PhotoHandler.latency = args.latency_ms / 1000
+    PhotoHandler.photo = os.urandom(args.photo_kb * 1024)
+    PhotoHandler.missing_every = args.missing_every
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PhotoHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_address[1]}'
+
+    from central_hub.app import create_app
+    from central_hub.config import get_config
+    from central_hub.extensions import db
+    from central_hub.tasks import import_loyalty_members as importer
+
+    config = get_config()
+    config.SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    config.UPLOADS_PATH = Path(tempfile.mkdtemp(prefix='loyalty-bench-'))
+    config.LOYALTY_IMPORT_DOWNLOAD_WORKERS = args.download_workers
+    config.LOYALTY_IMPORT_ENCODE_WORKERS = args.encode_workers
+    config.LOYALTY_IMPORT_BATCH_SIZE = args.batch_size
+    importer.extract_encoding_from_bytes = stand_in_encode
+
+    rows = [
+        {'member_code': f'BENCH-{n:06d}', 'name': f'Member {n}', 'photo_url': f'{base_url}/{n}.jpg'}
+        for n in range(1, args.rows + 1)
+    ]
+
+    app = create_app('testing')
+    logging.getLogger(importer.__name__).setLevel(logging.ERROR)
+    print(f"{args.rows} rows, {args.latency_ms:.0f} ms photo latency, {args.photo_kb} KB photos, "
+          f"{args.encode_ms:.0f} ms encode, {args.download_workers} download / "
+          f"{args.encode_workers} encode workers, batch {args.batch_size}")
+    print(f"{'mode':<9} {'seconds':>8} {'rows/s':>8}  stats")
+    for name, run in (('serial', run_serial), ('pipeline', run_pipeline)):
+        with app.app_context():
+            db.create_all()
+            start = time.perf_counter()
+            stats = run(importer, rows, uuid.uuid4())
+            elapsed = time.perf_counter() - start
+            db.session.remove()
+            db.drop_all()
+        print(f"{name:<9} {elapsed:>8.1f} {args.rows / elapsed:>8.1f}  {stats}")
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
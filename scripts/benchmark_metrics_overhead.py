@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-observation overhead of src.common.metrics.
+
+Times counter.inc(), gauge.set(), histogram.observe() and the
+histogram.time() context manager in a tight loop, subtracts the cost of an
+empty loop and reports ns per operation against a budget (1 us by default).
+histogram.time() includes its two perf_counter() calls; the floor row is an
+empty context manager making the same two calls, for reference. Nothing
+reads the metrics during the loop, so the cost of folding buffered updates
+(every FOLD_THRESHOLD of them) is included.
+
+Usage:
+    python scripts/benchmark_metrics_overhead.py
+    python scripts/benchmark_metrics_overhead.py --iterations 2000000 --budget-ns 1000
+
+Pure Python; run from the project root. Exits non-zero if a budgeted
+operation is over budget.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.common.metrics import MetricsRegistry  # noqa: E402
+
+
+class ClockTimer:
+    """Context manager that reads the clock twice and records nothing."""
+
+    __slots__ = ("start",)
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        time.perf_counter() - self.start
+
+
+def best_of(func, iterations, repeats):
+    """Return the fastest of ``repeats`` runs of func(iterations), in seconds."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(iterations)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--iterations', type=int, default=1000000)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--budget-ns', type=float, default=1000.0)
+    args = parser.parse_args()
+
+    registry = MetricsRegistry()
+    counter = registry.counter('bench_total')
+    gauge = registry.gauge('bench_value')
+    histogram = registry.histogram('bench_seconds')
+    # Spread observations across the buckets
+    values = [0.0003 * (1.7 ** (i % 20)) for i in range(1024)]
+
+    def empty(n):
+        for i in range(n):
+            values[i & 1023]
+
+    def inc(n):
+        for i in range(n):
+            values[i & 1023]
+            counter.inc()
+
+    def set_value(n):
+        for i in range(n):
+            gauge.set(values[i & 1023])
+
+    def observe(n):
+        for i in range(n):
+            histogram.observe(values[i & 1023])
+
+    def timed(n):
+        for i in range(n):
+            values[i & 1023]
+            with histogram.time():
+                pass
+
+    floor_timer = ClockTimer()
+
+    def floor(n):
+        for i in range(n):
+            values[i & 1023]
+            with floor_timer:
+                pass
+
+    baseline = best_of(empty, args.iterations, args.repeats)
+    failed = False
+    print(f"{'operation':<18} {'ns/op':>7}  budget")
+    for name, func, budgeted in (
+        ("counter.inc", inc, True),
+        ("gauge.set", set_value, True),
+        ("histogram.observe", observe, True),
+        ("histogram.time", timed, True),
+        ("floor", floor, False),
+    ):
+        elapsed = best_of(func, args.iterations, args.repeats)
+        ns = max(0.0, elapsed - baseline) * 1e9 / args.iterations
+        if budgeted:
+            ok = ns < args.budget_ns
+            failed |= not ok
+            verdict = "ok" if ok else "OVER"
+        else:
+            verdict = "-"
+        print(f"{name:<18} {ns:>7.0f}  {verdict}")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
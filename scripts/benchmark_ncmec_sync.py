@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Benchmark the NCMEC poster sync end to end against a local API stand-in.
+
+Starts a local HTTP server that plays the NCMEC Poster API (token, poster
+search pages and photo downloads, each with a fixed latency) and points
+sync_ncmec_posters_task at it. Face encoding is replaced by a stand-in
+that burns --encode-ms of CPU per photo, so the run does not depend on
+dlib or on photos containing faces. Records go to a file-backed SQLite
+database. Times three syncs of --posters posters:
+
+- initial: empty database, every photo downloaded and encoded
+- nightly unchanged: same posters, every photo hash matches
+- nightly changed: --changed-percent of the posters get a new photo
+
+Usage:
+    python scripts/benchmark_ncmec_sync.py
+    python scripts/benchmark_ncmec_sync.py --posters 500 --encode-ms 50
+
+Run from the project root.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import numpy as np  # noqa: E402
+
+from central_hub.config import TestingConfig, get_config  # noqa: E402
+
+PHOTO_PAYLOAD = os.urandom(60 * 1024)
+
+
+def stand_in_encode(photo_bytes: bytes, encode_ms: float) -> bytes:
+    """Burn encode_ms of CPU, then return a 512-byte encoding for the photo."""
+    deadline = time.process_time() + encode_ms / 1000
+    while time.process_time() < deadline:
+        pass
+    seed = int.from_bytes(photo_bytes[:8], 'little')
+    return np.random.default_rng(seed).random(128).astype(np.float32).tobytes()
+
+
+class PosterApi(ThreadingHTTPServer):
+    """Local stand-in for the NCMEC Poster API."""
+
+    daemon_threads = True
+
+    def __init__(self, posters: int, page_latency: float, photo_latency: float):
+        super().__init__(('127.0.0.1', 0), PosterApiHandler)
+        self.posters = posters
+        self.page_latency = page_latency
+        self.photo_latency = photo_latency
+        self.photo_versions = {}
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+
+class PosterApiHandler(BaseHTTPRequestHandler):
+    """Serves /Auth/Token, /Poster/Search and /photo/<case>/<version>.jpg."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def _send(self, body: bytes, content_type: str) -> None:
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        if self.path == '/Auth/Token':
+            self._send(json.dumps({'accessToken': 'benchmark'}).encode(), 'application/json')
+            return
+
+        time.sleep(self.server.page_latency)
+        page, size = body['pageNumber'], body['pageSize']
+        first, last = (page - 1) * size, min(page * size, self.server.posters)
+        posters = [
+            {
+                'caseNumber': f'NCMEC-{index}',
+                'firstName': 'Child',
+                'lastName': str(index),
+                'age': 9,
+                'missingDate': '2024-01-15',
+                'city': 'Springfield',
+                'state': 'IL',
+                'photoUrl': f'{self.server.base_url}/photo/{index}/'
+                            f'{self.server.photo_versions.get(index, 0)}.jpg',
+            }
+            for index in range(first, last)
+        ]
+        payload = {'posters': posters, 'totalRecords': self.server.posters}
+        self._send(json.dumps(payload).encode(), 'application/json')
+
+    def do_GET(self):
+        time.sleep(self.server.photo_latency)
+        # The path makes every poster's photo, and every version of it, hash differently
+        self._send(self.path.encode().ljust(64, b'-') + PHOTO_PAYLOAD, 'image/jpeg')
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--posters', type=int, default=10000)
+    parser.add_argument('--page-latency-ms', type=float, default=150)
+    parser.add_argument('--photo-latency-ms', type=float, default=30)
+    parser.add_argument('--encode-ms', type=float, default=5,
+                        help='CPU time the stand-in encoder spends per photo')
+    parser.add_argument('--changed-percent', type=float, default=2)
+    args = parser.parse_args()
+
+    api = PosterApi(args.posters, args.page_latency_ms / 1000, args.photo_latency_ms / 1000)
+    threading.Thread(target=api.serve_forever, daemon=True).start()
+    os.environ.setdefault('NCMEC_POSTER_CLIENT_ID', 'benchmark')
+    os.environ.setdefault('NCMEC_POSTER_CLIENT_SECRET', 'benchmark')
+
+    database = os.path.join(tempfile.mkdtemp(prefix='ncmec-bench-'), 'central_hub.db')
+    # The engine is bound in create_app(), so point the config at the
+    # scratch database first
+    TestingConfig.SQLALCHEMY_DATABASE_URI = f'sqlite:///{database}'
+    logging.disable(logging.WARNING)  # per-page progress and task chatter
+
+    from central_hub.app import create_app
+    from central_hub.extensions import db
+    from central_hub.tasks import sync_ncmec_posters
+    from central_hub.tasks.compile_ncmec import compile_ncmec_task
+
+    app = create_app('testing')
+    config = get_config()
+    changed_every = max(1, round(100 / args.changed_percent)) if args.changed_percent else 0
+
+    # A partial of a module-level function, so it pickles into the
+    # encoding pool's worker processes
+    encode = partial(stand_in_encode, encode_ms=args.encode_ms)
+
+    print(f"{args.posters} posters, page latency {args.page_latency_ms:.0f} ms, "
+          f"photo latency {args.photo_latency_ms:.0f} ms, stand-in encode {args.encode_ms:.0f} ms CPU")
+    print(f"{config.NCMEC_SYNC_DOWNLOAD_WORKERS} download threads, "
+          f"{config.NCMEC_SYNC_ENCODE_WORKERS} encode workers, {os.cpu_count()} CPUs, file SQLite")
+    print(f"{'run':<18} {'seconds':>8} {'created':>8} {'updated':>8} {'unchanged':>10} {'failed':>7}")
+
+    with app.app_context(), \
+            patch.object(sync_ncmec_posters, 'POSTER_API_BASE', api.base_url), \
+            patch.object(sync_ncmec_posters, 'extract_encoding_from_bytes', encode), \
+            patch.object(compile_ncmec_task, 'delay'):
+        db.create_all()
+
+        for run in ('initial', 'nightly unchanged', 'nightly changed'):
+            if run == 'nightly changed' and changed_every:
+                for index in range(0, args.posters, changed_every):
+                    api.photo_versions[index] = 1
+
+            start = time.perf_counter()
+            result = sync_ncmec_posters.sync_ncmec_posters_task(triggered_by='benchmark')
+            elapsed = time.perf_counter() - start
+
+            if result['status'] != 'ok':
+                raise SystemExit(f"{run} sync failed: {result}")
+            print(f"{run:<18} {elapsed:>8.1f} {result['records_created']:>8} "
+                  f"{result['records_updated']:>8} {result['records_unchanged']:>10} "
+                  f"{result['photos_failed']:>7}")
+
+        db.session.remove()
+
+    api.shutdown()
+
+
+if __name__ == '__main__':
+    main()
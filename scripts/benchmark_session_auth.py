@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark authenticated GET throughput in the CMS.
+
+Creates a file-backed SQLite database with one active admin and one
+session, then sends --requests authenticated GETs to each endpoint
+through the Flask test client under three configurations:
+
+- uncached: SESSION_CACHE_TTL 0 and SESSION_ACTIVITY_UPDATE_INTERVAL 0,
+  i.e. session and user lookups plus a last_active write per request
+- throttled: no validation cache, last_active written once a minute
+- cached: validation cache (SESSION_CACHE_TTL 30, each hit re-checked
+  with one read) and throttled writes
+
+Reports requests per second and p50/p95 latency per endpoint and mode.
+
+Usage:
+    python scripts/benchmark_session_auth.py
+    python scripts/benchmark_session_auth.py --requests 5000
+
+Run from the project root.
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from cms.app import create_app  # noqa: E402
+from cms.config import TestingConfig  # noqa: E402
+from cms.models import db, User, UserSession  # noqa: E402
+
+ENDPOINTS = ('/api/v1/auth/me', '/api/v1/sessions')
+
+MODES = (
+    ('uncached', 0, 0),
+    ('throttled', 0, 60),
+    ('cached', 30, 60),
+)
+
+
+def seed():
+    """Create an active admin with one session; return the session token."""
+    user = User(email='bench@example.com', name='Bench Admin', role='admin', status='active')
+    user.set_password('BenchPassword123!')
+    db.session.add(user)
+    db.session.commit()
+
+    session = UserSession.create_session(user_id=user.id, ip_address='127.0.0.1', user_agent='bench')
+    db.session.add(session)
+    db.session.commit()
+    return session.token
+
+
+def run(client, path, headers, requests):
+    """Send requests GETs; return per-request latencies in ms."""
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.get(path, headers=headers)
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, (path, response.status_code)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--requests', type=int, default=1000)
+    args = parser.parse_args()
+
+    database = os.path.join(tempfile.mkdtemp(prefix='session-bench-'), 'cms.db')
+    # The engine is bound in create_app(), so point the config at the
+    # scratch database first
+    TestingConfig.SQLALCHEMY_DATABASE_URI = f'sqlite:///{database}'
+    logging.disable(logging.INFO)  # blueprint registration chatter
+    app = create_app(config_name='testing')
+    if hasattr(app, 'limiter'):
+        app.limiter.enabled = False  # default limits would 429 the run
+
+    with app.app_context():
+        db.create_all()
+        headers = {'Authorization': f'Bearer {seed()}'}
+        client = app.test_client()
+
+        print(f"{args.requests} requests per row, file SQLite")
+        print(f"{'endpoint':<18} {'mode':<10} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8}")
+        for path in ENDPOINTS:
+            for mode, ttl, interval in MODES:
+                app.config['SESSION_CACHE_TTL'] = ttl
+                app.config['SESSION_ACTIVITY_UPDATE_INTERVAL'] = interval
+                app.extensions.pop('session_cache', None)
+                run(client, path, headers, 20)  # warm up
+                start = time.perf_counter()
+                latencies = sorted(run(client, path, headers, args.requests))
+                elapsed = time.perf_counter() - start
+                p95 = latencies[int(len(latencies) * 0.95) - 1]
+                print(f"{path:<18} {mode:<10} {args.requests / elapsed:>8.0f} "
+                      f"{statistics.median(latencies):>8.2f} {p95:>8.2f}")
+
+        db.session.remove()
+
+
+if __name__ == '__main__':
+    main()
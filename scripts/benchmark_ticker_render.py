@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark ticker zone rendering headlessly.
+
+Renders a 1920-wide ticker zone into an offscreen cairo surface for a
+fixed number of frames and reports CPU time per frame for:
+
+- legacy: what TickerZone did before, per 30 fps frame -- a new Pango
+  layout and font description to measure the text in the animation timer,
+  another in the draw handler, then PangoCairo.show_layout()
+- cached: TickerZone.advance() + TickerZone.render(), which paints a
+  pre-rendered surface at the current offset
+
+Also reports the CPU share each path would take at --fps.
+
+Usage:
+    python scripts/benchmark_ticker_render.py
+    python scripts/benchmark_ticker_render.py --frames 2000 --width 3840 --fps 60
+
+Needs PyGObject with Gtk 3, Pango, PangoCairo and pycairo; no display is
+required. Run from the project root.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import cairo  # noqa: E402
+from gi.repository import Pango, PangoCairo  # noqa: E402
+
+from cms.templates.layout_renderer import LayerConfig, TickerZone  # noqa: E402
+
+FONT = 'Sans Bold 32'
+ITEMS = [
+    'Welcome to Skillz Media',
+    'Happy hour 4-7pm: half price on all draft beers',
+    'Ask about our loyalty program',
+    'Free WiFi: SKILLZ-GUEST',
+]
+
+
+def legacy_frame(cr, text, width, height, offset):
+    """One frame of the old timer + draw path."""
+    # _animate(): measure the text
+    layout = PangoCairo.create_layout(cr)
+    layout.set_text(text, -1)
+    layout.set_font_description(Pango.FontDescription.from_string(FONT))
+    text_width, _ = layout.get_pixel_size()
+
+    # _on_draw(): lay out again and draw
+    cr.set_source_rgb(1, 1, 1)
+    layout = PangoCairo.create_layout(cr)
+    layout.set_text(text, -1)
+    layout.set_font_description(Pango.FontDescription.from_string(FONT))
+    _, text_height = layout.get_pixel_size()
+    cr.move_to(width - offset, (height - text_height) // 2)
+    PangoCairo.show_layout(cr, layout)
+    return text_width
+
+
+def clear(cr):
+    cr.set_source_rgb(0, 0, 0)
+    cr.paint()
+
+
+def run_legacy(cr, args):
+    text = '    '.join(ITEMS) + '    '
+    step = args.speed // args.fps
+    offset = 0
+    start = time.process_time()
+    for _ in range(args.frames):
+        clear(cr)
+        text_width = legacy_frame(cr, text, args.width, args.height, offset)
+        offset += step
+        if offset > text_width + args.width:
+            offset = 0
+    return time.process_time() - start
+
+
+def run_cached(cr, args):
+    layer = LayerConfig(
+        id='ticker', name='Ticker', layer_type='ticker', x=0, y=0,
+        width=args.width, height=args.height, z_index=0, opacity=1.0,
+        background_type='solid', background_color='#000000',
+        content_source='static', is_primary=False, items=[]
+    )
+    zone = TickerZone(layer, ITEMS, ticker_speed=args.speed, ticker_font=FONT)
+    zone.render(cr)  # build the cached surface outside the timed loop
+    start = time.process_time()
+    for _ in range(args.frames):
+        if zone.advance(1 / args.fps):
+            clear(cr)
+            zone.render(cr)
+    return time.process_time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--frames', type=int, default=1000)
+    parser.add_argument('--width', type=int, default=1920)
+    parser.add_argument('--height', type=int, default=80)
+    parser.add_argument('--speed', type=int, default=100, help='Scroll speed in px/s')
+    parser.add_argument('--fps', type=int, default=30)
+    args = parser.parse_args()
+
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, args.width, args.height)
+    cr = cairo.Context(surface)
+
+    print(f"{args.width}x{args.height} ticker, {args.frames} frames at {args.fps} fps")
+    print(f"{'path':<8} {'ms/frame':>9} {'cpu %':>7}")
+    for name, run in (('legacy', run_legacy), ('cached', run_cached)):
+        per_frame = run(cr, args) / args.frames
+        print(f"{name:<8} {per_frame * 1000:>9.3f} {per_frame * args.fps * 100:>7.1f}")
+
+
+if __name__ == '__main__':
+    main()
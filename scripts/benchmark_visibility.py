@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Benchmark content catalog asset visibility for an agency user.
+
+Seeds a scratch SQLite database with --brands brand organizations of
+--assets-per-brand assets each, plus an agency allowed to manage every
+brand and one agency user. Then times, per request:
+
+- service: VisibilityService.visible_assets_query() for one page of
+  --per-page assets, newest first, plus the total count
+- page: GET /partner/assets through the Flask test client
+
+each with a cold VisibilityCache (cleared before every request) and a
+warm one. Reports mean/p50/p95 latency and SQL statements per request.
+
+Usage:
+    python scripts/benchmark_visibility.py
+    python scripts/benchmark_visibility.py --brands 1000 --assets-per-brand 10 --requests 200
+
+Run from the project root.
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import bcrypt  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from content_catalog.app import create_app  # noqa: E402
+from content_catalog.config import TestingConfig  # noqa: E402
+from content_catalog.models import db, ContentAsset, Organization, User  # noqa: E402
+from content_catalog.services.auth_service import AuthService  # noqa: E402
+from content_catalog.services.visibility_service import (  # noqa: E402
+    VisibilityService,
+    get_visibility_cache,
+)
+
+
+def seed(brands: int, assets_per_brand: int) -> User:
+    """Create the brands, their assets and an agency user allowed to see them all."""
+    organizations = [
+        Organization(
+            name=f'Bench Brand {index}',
+            type='partner',
+            contact_email=f'brand{index}@example.com',
+            status='active',
+            org_type=Organization.ORG_TYPE_BRAND,
+        )
+        for index in range(brands)
+    ]
+    db.session.add_all(organizations)
+    db.session.flush()
+
+    agency = Organization(
+        name='Bench Agency',
+        type='partner',
+        contact_email='agency@example.com',
+        status='active',
+        org_type=Organization.ORG_TYPE_AGENCY,
+        allowed_brand_ids=json.dumps([org.id for org in organizations]),
+    )
+    db.session.add(agency)
+    db.session.flush()
+
+    user = User(
+        email='agent@benchagency.com',
+        password_hash=bcrypt.hashpw(b'bench', bcrypt.gensalt(rounds=4)).decode(),
+        name='Bench Agent',
+        role=User.ROLE_PARTNER,
+        organization_id=agency.id,
+        status=User.STATUS_ACTIVE,
+    )
+    db.session.add(user)
+
+    statuses = (ContentAsset.STATUS_APPROVED, ContentAsset.STATUS_DRAFT)
+    db.session.add_all(
+        ContentAsset(
+            title=f'Brand {org.id} Clip {index}',
+            filename=f'brand_{org.id}_{index}.mp4',
+            file_path=f'/uploads/brand_{org.id}_{index}.mp4',
+            status=statuses[index % len(statuses)],
+            organization_id=org.id,
+        )
+        for org in organizations
+        for index in range(assets_per_brand)
+    )
+    db.session.commit()
+    return user
+
+
+def list_page(user_id: int, per_page: int) -> int:
+    """One service-level listing: a page of visible assets and the total."""
+    query = VisibilityService.visible_assets_query(db.session, user_id, include_drafts=True)
+    page = query.order_by(ContentAsset.created_at.desc(), ContentAsset.id.desc()).limit(per_page).all()
+    total = query.count()
+    return len(page) + total
+
+
+def measure(run, requests: int, cold: bool):
+    """Time run() per request; returns (latencies in ms, mean statements per request)."""
+    statements = []
+
+    def count_statement(*args):
+        statements.append(1)
+
+    event.listen(db.engine, 'before_cursor_execute', count_statement)
+    latencies = []
+    try:
+        for _ in range(requests):
+            if cold:
+                get_visibility_cache().clear()
+            start = time.perf_counter()
+            run()
+            latencies.append((time.perf_counter() - start) * 1000)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', count_statement)
+    return latencies, len(statements) / requests
+
+
+def report(name, latencies, queries):
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(f"{name:<14} {statistics.mean(latencies):>9.2f} {statistics.median(latencies):>9.2f} "
+          f"{p95:>9.2f} {queries:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--brands', type=int, default=300)
+    parser.add_argument('--assets-per-brand', type=int, default=20)
+    parser.add_argument('--per-page', type=int, default=48)
+    parser.add_argument('--requests', type=int, default=100)
+    args = parser.parse_args()
+
+    scratch = Path(tempfile.mkdtemp(prefix='visibility-bench-'))
+    # The engine is bound in create_app(), so point the config at the
+    # scratch database first
+    TestingConfig.DATABASE_PATH = scratch / 'catalog.db'
+    TestingConfig.SQLALCHEMY_DATABASE_URI = f'sqlite:///{TestingConfig.DATABASE_PATH}'
+    logging.disable(logging.INFO)  # blueprint registration chatter
+    app = create_app(config_name='testing')
+    app.config['UPLOADS_PATH'] = str(scratch / 'uploads')
+
+    with app.app_context():
+        db.create_all()
+        user = seed(args.brands, args.assets_per_brand)
+        user_id = user.id
+        session = AuthService.create_session(db.session, user_id)
+        db.session.commit()
+        token = session.token
+
+        client = app.test_client()
+        client.set_cookie('partner_session', token)
+
+        def service_request():
+            # A fresh request context, like a real request, so only the
+            # VisibilityCache carries contexts from one request to the next
+            with app.test_request_context():
+                list_page(user_id, args.per_page)
+                db.session.remove()
+
+        def page_request():
+            response = client.get(f'/partner/assets?per_page={args.per_page}')
+            assert response.status_code == 200, response.status_code
+
+        print(f"{args.brands} brands x {args.assets_per_brand} assets, agency user, "
+              f"{args.requests} requests, page of {args.per_page}")
+        print(f"{'':<14} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'queries':>9}")
+        for label, run in (('service', service_request), ('page', page_request)):
+            run()  # warm up imports, templates and SQLite's page cache
+            for cache_state in ('cold', 'warm'):
+                latencies, queries = measure(run, args.requests, cold=cache_state == 'cold')
+                report(f'{label} {cache_state}', latencies, queries)
+
+        db.session.remove()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Load test the device health server with concurrent health, log and command requests.
+
+Runs, for a fixed duration, health pollers on keep-alive connections,
+clients pulling the log tail and clients sending a slow remote command.
+Reports requests, errors and p50/p95/max latency per endpoint.
+
+With no --url a local HealthServer is started on a free port with a
+synthetic log file and a player controller whose minimize() takes
+--command-delay seconds.
+
+Usage:
+    python scripts/load_test_health_server.py
+    python scripts/load_test_health_server.py --url http://192.168.1.50:8080 --duration 30
+
+Run from the project root. Note: against a device, the command clients
+really minimize the player.
+"""
+
+import argparse
+import http.client
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.player.health_server import HealthRequestHandler, HealthServer  # noqa: E402
+
+
+class SlowController:
+    """Player controller stand-in with a slow minimize()."""
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    def get_status(self):
+        return {'status': 'playing'}
+
+    def minimize(self):
+        time.sleep(self.delay)
+
+
+def client(host, port, method, path, stop, results, errors):
+    """Send requests on one keep-alive connection until stopped."""
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            connection.request(method, path)
+            response = connection.getresponse()
+            response.read()
+            if response.status != 200:
+                errors.append(response.status)
+        except (OSError, http.client.HTTPException) as e:
+            errors.append(type(e).__name__)
+            connection.close()
+            connection = http.client.HTTPConnection(host, port, timeout=30)
+            continue
+        results.append(time.perf_counter() - start)
+    connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--url', help='Health server to test (default: start one locally)')
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--health-clients', type=int, default=4)
+    parser.add_argument('--log-clients', type=int, default=2)
+    parser.add_argument('--command-clients', type=int, default=1)
+    parser.add_argument('--log-lines', type=int, default=1000, help='Lines per /api/logs/raw request')
+    parser.add_argument('--log-mb', type=float, default=50.0, help='Synthetic log size (local only)')
+    parser.add_argument('--command-delay', type=float, default=1.0, help='minimize() time (local only)')
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        parsed = urlparse(args.url)
+        host, port = parsed.hostname, parsed.port or 80
+    else:
+        log_dir = Path(tempfile.mkdtemp(prefix='health-load-'))
+        line = b'2024-01-01 00:00:00 INFO player: synthetic log line for the health server load test\n'
+        with open(log_dir / 'player.log', 'wb') as f:
+            f.write(line * int(args.log_mb * 1024 * 1024 / len(line)))
+        HealthRequestHandler.log_dir = log_dir
+        server = HealthServer(port=0, player_controller=SlowController(args.command_delay))
+        server.start()
+        host, port = '127.0.0.1', server.port
+
+    endpoints = (
+        ('GET', '/api/health', args.health_clients),
+        ('GET', f'/api/logs/raw?lines={args.log_lines}', args.log_clients),
+        ('POST', '/api/command/minimize', args.command_clients),
+    )
+    stop = threading.Event()
+    stats = []
+    threads = []
+    for method, path, clients in endpoints:
+        results, errors = [], []
+        stats.append((method, path, results, errors))
+        for _ in range(clients):
+            thread = threading.Thread(
+                target=client, args=(host, port, method, path, stop, results, errors), daemon=True
+            )
+            thread.start()
+            threads.append(thread)
+
+    time.sleep(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=args.command_delay + 30)
+    if server:
+        server.stop()
+
+    print(f"{'endpoint':<34} {'reqs':>6} {'errors':>6} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    for method, path, results, errors in stats:
+        results.sort()
+        if results:
+            p50 = results[len(results) // 2] * 1000
+            p95 = results[int(len(results) * 0.95)] * 1000
+            worst = results[-1] * 1000
+        else:
+            p50 = p95 = worst = 0.0
+        print(
+            f"{method + ' ' + path:<34} {len(results):>6} {len(errors):>6} "
+            f"{p50:>8.1f} {p95:>8.1f} {worst:>8.1f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
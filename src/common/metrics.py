@@ -0,0 +1,353 @@
+"""
+Lightweight in-process metrics for Jetson Media Player.
+Counters, gauges and fixed-bucket histograms cheap enough for hot paths,
+with Prometheus text rendering and compact summaries for heartbeats.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+# Latency buckets in seconds: 0.5 ms to 10 s
+DEFAULT_LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Buffered updates after which the updating thread folds them in itself
+FOLD_THRESHOLD = 4096
+
+
+class Counter:
+    """
+    Monotonically increasing count.
+
+    inc() appends to a deque (atomic under the GIL) instead of taking a
+    lock; reads fold the buffered amounts into the total.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self._value = 0
+        self._pending = deque()
+        self._lock = threading.Lock()
+
+    def inc(self, amount: Union[int, float] = 1) -> None:
+        """Add ``amount`` (must be non-negative)."""
+        pending = self._pending
+        pending.append(amount)
+        if len(pending) > FOLD_THRESHOLD:
+            _fold_if_idle(self)
+
+    def _fold(self) -> None:
+        """Move buffered amounts into the total (caller holds the lock)."""
+        pending = self._pending
+        total = self._value
+        for _ in range(len(pending)):
+            total += pending.popleft()
+        self._value = total
+
+    @property
+    def value(self) -> Union[int, float]:
+        """Current total."""
+        with self._lock:
+            self._fold()
+            return self._value
+
+    def summary(self) -> Union[int, float]:
+        """Compact value for heartbeats."""
+        return self.value
+
+    def render(self) -> List[str]:
+        """Prometheus sample lines."""
+        return [f"{self.name} {_format(self.value)}"]
+
+
+class Gauge:
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self.value = 0.0
+
+    def set(self, value: Union[int, float]) -> None:
+        """Set the current value."""
+        self.value = value
+
+    def summary(self) -> Union[int, float]:
+        """Compact value for heartbeats."""
+        return self.value
+
+    def render(self) -> List[str]:
+        """Prometheus sample lines."""
+        return [f"{self.name} {_format(self.value)}"]
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram.
+
+    observe() only appends the value to a deque (atomic under the GIL), so
+    the hot path takes no lock. Buffered values are binned into the
+    buckets under the lock when the histogram is read, or by an observing
+    thread once more than FOLD_THRESHOLD are waiting. Quantiles in
+    summaries are interpolated within buckets, so they are as precise as
+    the bucket layout.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ):
+        self.name = name
+        self.description = description
+        self.bounds: Tuple[float, ...] = tuple(sorted(buckets))
+        # One extra slot for observations above the last bound (+Inf)
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._pending = deque()
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        pending = self._pending
+        pending.append(value)
+        if len(pending) > FOLD_THRESHOLD:
+            _fold_if_idle(self)
+
+    def time(self) -> "_Timer":
+        """Context manager observing the wall time of the enclosed block, in seconds."""
+        return _Timer(self)
+
+    def _fold(self) -> None:
+        """Bin buffered observations (caller holds the lock)."""
+        pending = self._pending
+        bounds = self.bounds
+        counts = self._counts
+        value_sum = self._sum
+        maximum = self._max
+        folded = len(pending)
+        for _ in range(folded):
+            value = pending.popleft()
+            counts[bisect_left(bounds, value)] += 1
+            value_sum += value
+            if value > maximum:
+                maximum = value
+        self._count += folded
+        self._sum = value_sum
+        self._max = maximum
+
+    def _snapshot(self) -> Tuple[List[int], int, float, float]:
+        """Bucket counts, count, sum and max including buffered observations."""
+        with self._lock:
+            self._fold()
+            return list(self._counts), self._count, self._sum, self._max
+
+    @property
+    def counts(self) -> List[int]:
+        """Per-bucket counts; the last slot is +Inf."""
+        return self._snapshot()[0]
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return self._snapshot()[1]
+
+    @property
+    def sum(self) -> float:
+        """Sum of all observations."""
+        return self._snapshot()[2]
+
+    @property
+    def max(self) -> float:
+        """Largest observation."""
+        return self._snapshot()[3]
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile (0-1) by interpolating within buckets."""
+        counts, total, _, maximum = self._snapshot()
+        return self._quantile(counts, total, maximum, q)
+
+    def _quantile(self, counts: List[int], total: int, maximum: float, q: float) -> float:
+        if not total:
+            return 0.0
+
+        rank = q * total
+        cumulative = 0
+        for index, bucket_count in enumerate(counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else maximum
+                upper = min(upper, maximum)
+                fraction = (rank - cumulative) / bucket_count
+                return lower + (max(upper, lower) - lower) * fraction
+            cumulative += bucket_count
+        return maximum
+
+    def summary(self) -> Dict[str, float]:
+        """Compact count/mean/quantiles for heartbeats."""
+        counts, total, value_sum, maximum = self._snapshot()
+        if not total:
+            return {"count": 0}
+        return {
+            "count": total,
+            "mean": round(value_sum / total, 6),
+            "p50": round(self._quantile(counts, total, maximum, 0.5), 6),
+            "p95": round(self._quantile(counts, total, maximum, 0.95), 6),
+            "p99": round(self._quantile(counts, total, maximum, 0.99), 6),
+            "max": round(maximum, 6),
+        }
+
+    def render(self) -> List[str]:
+        """Prometheus sample lines (cumulative buckets, sum, count)."""
+        counts, total, value_sum, _ = self._snapshot()
+
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.bounds, counts):
+            cumulative += bucket_count
+            lines.append(f'{self.name}_bucket{{le="{_format(bound)}"}} {cumulative}')
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {total}')
+        lines.append(f"{self.name}_sum {_format(value_sum)}")
+        lines.append(f"{self.name}_count {total}")
+        return lines
+
+
+class _Timer:
+    """Context manager for Histogram.time() (a class, not a generator, to keep it cheap)."""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: Histogram):
+        self._histogram = histogram
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        # Histogram.observe() inlined; this is the hottest path
+        pending = self._histogram._pending
+        pending.append(time.perf_counter() - self._start)
+        if len(pending) > FOLD_THRESHOLD:
+            _fold_if_idle(self._histogram)
+
+
+def _fold_if_idle(metric: Union[Counter, "Histogram"]) -> None:
+    """Fold a metric's buffered updates unless another thread already is."""
+    if metric._lock.acquire(blocking=False):
+        try:
+            metric._fold()
+        finally:
+            metric._lock.release()
+
+
+Metric = Union[Counter, Gauge, Histogram]
+
+
+class MetricsRegistry:
+    """Named collection of metrics; creating an existing name returns it."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(Counter, name, description)
+
+    def gauge(self, name: str, description: str = "") -> Gauge:
+        """Get or create a gauge."""
+        return self._get_or_create(Gauge, name, description)
+
+    def histogram(
+        self,
+        name: str,
+        description: str = "",
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(Histogram, name, description, buckets)
+
+    def _get_or_create(self, metric_class, name: str, description: str, *args) -> Metric:
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = metric_class(name, description, *args)
+                    self._metrics[name] = metric
+        if not isinstance(metric, metric_class):
+            raise ValueError(f"Metric {name} already registered as a {metric.kind}")
+        return metric
+
+    def get(self, name: str) -> Optional[Metric]:
+        """Return a registered metric, or None."""
+        return self._metrics.get(name)
+
+    def _sorted_metrics(self) -> List[Tuple[str, Metric]]:
+        """Copy of the registered metrics, taken under the lock."""
+        with self._lock:
+            return sorted(self._metrics.items())
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        for name, metric in self._sorted_metrics():
+            if metric.description:
+                lines.append(f"# HELP {name} {metric.description}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> Dict[str, object]:
+        """Compact name -> value/summary mapping for heartbeats."""
+        return {name: metric.summary() for name, metric in self._sorted_metrics()}
+
+    def clear(self) -> None:
+        """Remove all metrics (for tests)."""
+        with self._lock:
+            self._metrics.clear()
+
+
+def _format(value: Union[int, float]) -> str:
+    """Format a sample value the way Prometheus expects."""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+# Global registry instance (can be imported by other modules)
+_global_registry: Optional[MetricsRegistry] = None
+_global_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    Get the global metrics registry.
+
+    Returns:
+        MetricsRegistry instance
+    """
+    global _global_registry
+
+    if _global_registry is None:
+        with _global_registry_lock:
+            if _global_registry is None:
+                _global_registry = MetricsRegistry()
+
+    return _global_registry
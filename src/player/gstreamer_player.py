@@ -1,10 +1,12 @@
 """
 GStreamer player module with NVIDIA hardware acceleration.
-Uses playbin3 for gapless video playback on Jetson Orin Nano.
+Uses playbin for video playback on Jetson Orin Nano, with the next item
+prerolled in a standby pipeline for gapless switches.
 """
 
 import logging
 import threading
+import time
 from enum import Enum
 from pathlib import Path
 from typing import Callable, Optional
@@ -36,7 +38,12 @@ class PlayerState(Enum):
 class GStreamerPlayer:
     """
     Hardware-accelerated GStreamer player for Jetson Orin Nano.
-    Uses playbin3 with nv3dsink for smooth, gapless video playback.
+
+    With preroll enabled, the next item is opened, demuxed and decoded up
+    to its first frame in a standby playbin while the current one plays.
+    At end of stream (or on switch_now()) the standby pipeline is set to
+    PLAYING and the two swap roles, so a switch costs a state change
+    rather than a pipeline teardown and rebuild.
     """
 
     # Default media directory on Jetson devices
@@ -47,7 +54,10 @@ class GStreamerPlayer:
         media_dir: Optional[str] = None,
         on_about_to_finish: Optional[Callable[[], Optional[str]]] = None,
         on_error: Optional[Callable[[str], None]] = None,
-        on_eos: Optional[Callable[[], None]] = None
+        on_eos: Optional[Callable[[], None]] = None,
+        on_item_started: Optional[Callable[[str], None]] = None,
+        preroll: bool = True,
+        video_sink_factory: Optional[Callable[[], Gst.Element]] = None
     ):
         """
         Initialize the GStreamer player.
@@ -55,14 +65,22 @@ class GStreamerPlayer:
         Args:
             media_dir: Directory where media files are stored
             on_about_to_finish: Callback that returns the next URI for gapless playback.
-                                Called ~2 seconds before current video ends.
+                                With preroll, called when an item starts; otherwise
+                                ~2 seconds before current video ends.
             on_error: Callback for playback errors with error message
             on_eos: Callback for end-of-stream (when no next URI is queued)
+            on_item_started: Callback with the URI each time a new item starts
+            preroll: Preroll the next item in a standby pipeline
+            video_sink_factory: Creates the video sink for each pipeline
+                                (e.g. fakesink for headless tests)
         """
         self.media_dir = Path(media_dir) if media_dir else Path(self.DEFAULT_MEDIA_DIR)
         self._on_about_to_finish = on_about_to_finish
         self._on_error = on_error
         self._on_eos = on_eos
+        self._on_item_started = on_item_started
+        self._preroll_enabled = preroll
+        self._video_sink_factory = video_sink_factory
 
         self._player: Optional[Gst.Element] = None
         self._bus: Optional[Gst.Bus] = None
@@ -71,7 +89,12 @@ class GStreamerPlayer:
         self._state = PlayerState.STOPPED
         self._current_uri: Optional[str] = None
         self._next_uri_queued = False
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()
+
+        # Standby pipeline holding the prerolled next item
+        self._standby: Optional[Gst.Element] = None
+        self._standby_bus: Optional[Gst.Bus] = None
+        self._preroll_uri: Optional[str] = None
 
         # Track last played URI for consecutive same video handling
         self._last_uri: Optional[str] = None
@@ -81,31 +104,24 @@ class GStreamerPlayer:
 
         logger.info("GStreamerPlayer initialized with media_dir: %s", self.media_dir)
 
-    def _create_player(self) -> Gst.Element:
+    def _create_player(self, name: str = 'player') -> Gst.Element:
         """
         Create and configure the GStreamer playbin element.
 
+        Args:
+            name: Element name ('player' or 'standby')
+
         Returns:
             Configured playbin element
         """
         # playbin3 hangs at PREROLLING on Jetson Orin Nano (GStreamer 1.20).
         # playbin (v2) works reliably with nvv4l2decoder hardware decode.
-        player = Gst.ElementFactory.make('playbin', 'player')
+        player = Gst.ElementFactory.make('playbin', name)
         if player is None:
             raise RuntimeError("Failed to create playbin element. Is GStreamer installed?")
 
-        # Configure video sink — must support GstVideoOverlay for GTK embedding.
-        # nv3dsink renders to its own window and CANNOT embed in GTK.
-        # Use xvimagesink which supports XOverlay and works with nvv4l2decoder.
-        video_sink = None
-        for sink_name in ('xvimagesink', 'nveglglessink', 'autovideosink'):
-            video_sink = Gst.ElementFactory.make(sink_name, 'videosink')
-            if video_sink is not None:
-                logger.info("Using video sink: %s", sink_name)
-                break
-
+        video_sink = self._create_video_sink()
         if video_sink:
-            video_sink.set_property('sync', True)
             player.set_property('video-sink', video_sink)
 
         # Connect about-to-finish signal for gapless playback
@@ -114,21 +130,62 @@ class GStreamerPlayer:
 
         return player
 
+    def _create_video_sink(self) -> Optional[Gst.Element]:
+        """
+        Create the video sink for one pipeline.
+
+        Returns:
+            Configured video sink, or None if none could be created
+        """
+        video_sink = None
+        if self._video_sink_factory:
+            video_sink = self._video_sink_factory()
+        else:
+            # Configure video sink — must support GstVideoOverlay for GTK embedding.
+            # nv3dsink renders to its own window and CANNOT embed in GTK.
+            # Use xvimagesink which supports XOverlay and works with nvv4l2decoder.
+            for sink_name in ('xvimagesink', 'nveglglessink', 'autovideosink'):
+                video_sink = Gst.ElementFactory.make(sink_name, None)
+                if video_sink is not None:
+                    logger.info("Using video sink: %s", sink_name)
+                    break
+
+        if video_sink:
+            video_sink.set_property('sync', True)
+            # The standby pipeline must not paint its prerolled frame over
+            # the active one; it is rendered once the pipeline goes PLAYING
+            if video_sink.find_property('show-preroll-frame'):
+                video_sink.set_property('show-preroll-frame', False)
+        return video_sink
+
     def _setup_bus(self) -> None:
         """Set up the GStreamer message bus for handling events."""
         if self._player is None:
             return
 
-        self._bus = self._player.get_bus()
-        if self._bus:
-            self._bus.add_signal_watch()
-            self._bus.connect('message::error', self._handle_error)
-            self._bus.connect('message::eos', self._handle_eos)
-            self._bus.connect('message::state-changed', self._handle_state_changed)
+        self._bus = self._watch_bus(self._player)
+
+    def _watch_bus(self, player: Gst.Element) -> Optional[Gst.Bus]:
+        """
+        Connect message handlers to a pipeline's bus.
+
+        Args:
+            player: playbin whose bus to watch
+
+        Returns:
+            The watched bus
+        """
+        bus = player.get_bus()
+        if bus:
+            bus.add_signal_watch()
+            bus.connect('message::error', self._handle_error)
+            bus.connect('message::eos', self._handle_eos)
+            bus.connect('message::state-changed', self._handle_state_changed)
 
             # Enable sync message handling for GstVideoOverlay (window embedding)
-            self._bus.enable_sync_message_emission()
-            self._bus.connect('sync-message::element', self._handle_sync_message)
+            bus.enable_sync_message_emission()
+            bus.connect('sync-message::element', self._handle_sync_message)
+        return bus
 
     def _start_main_loop(self) -> None:
         """Start the GLib main loop in a separate thread."""
@@ -170,6 +227,10 @@ class GStreamerPlayer:
         """
         logger.debug("About to finish current video")
 
+        if self._preroll_uri:
+            # The next item is already prerolled; EOS swaps to it
+            return
+
         if self._on_about_to_finish:
             next_uri = self._on_about_to_finish()
             if next_uri:
@@ -202,6 +263,13 @@ class GStreamerPlayer:
         if debug_info:
             error_msg += f" (debug: {debug_info})"
 
+        if bus is not self._bus:
+            # Failure while prerolling; the active item keeps playing and
+            # EOS falls back to fetching the next URI
+            logger.error("Preroll failed for %s: %s", self._preroll_uri, error_msg)
+            self._discard_preroll()
+            return
+
         logger.error(error_msg)
         self._state = PlayerState.ERROR
 
@@ -216,8 +284,14 @@ class GStreamerPlayer:
             bus: The message bus
             message: The EOS message
         """
+        if bus is not self._bus:
+            return
+
         logger.debug("End of stream reached")
 
+        if self._preroll_uri and self._swap_to_preroll():
+            return
+
         # If no next URI was queued, notify callback
         if not self._next_uri_queued:
             # Handle looping same video by resetting pipeline
@@ -271,12 +345,13 @@ class GStreamerPlayer:
         self._window_xid = xid
         logger.info("Stored window XID for video overlay: %s", xid)
 
-        # If player is already initialized, set it on the sink now
-        if self._player is not None:
-            video_sink = self._player.get_property('video-sink')
-            if video_sink:
-                GstVideo.VideoOverlay.set_window_handle(video_sink, xid)
-                logger.info("Set video overlay window handle: %s", xid)
+        # If player is already initialized, set it on the sinks now
+        for player in (self._player, self._standby):
+            if player is not None:
+                video_sink = player.get_property('video-sink')
+                if video_sink:
+                    GstVideo.VideoOverlay.set_window_handle(video_sink, xid)
+                    logger.info("Set video overlay window handle: %s", xid)
 
     def initialize(self) -> bool:
         """
@@ -305,10 +380,41 @@ class GStreamerPlayer:
             self._state = PlayerState.ERROR
             return False
 
+    def _resolve_uri(self, uri: str) -> Optional[str]:
+        """
+        Convert a path or URI to a playable URI and check local files exist.
+
+        Args:
+            uri: URI (file://, http://, https://) or path relative to media_dir
+
+        Returns:
+            Playable URI, or None if the local file is missing
+        """
+        if not uri.startswith(('file://', 'http://', 'https://')):
+            # Assume local file path, convert to URI
+            file_path = Path(uri)
+            if not file_path.is_absolute():
+                file_path = self.media_dir / uri
+            uri = f"file://{file_path}"
+
+        # Check if file exists for local files
+        if uri.startswith('file://'):
+            file_path = Path(uri[7:])  # Remove 'file://' prefix
+            if not file_path.exists():
+                logger.error("Video file not found: %s", file_path)
+                if self._on_error:
+                    self._on_error(f"File not found: {file_path}")
+                return None
+
+        return uri
+
     def play(self, uri: Optional[str] = None) -> bool:
         """
         Start playback of a video.
 
+        If ``uri`` is the prerolled next item, switches to it instead of
+        reloading the active pipeline.
+
         Args:
             uri: URI of the video to play (file:// or http://).
                  If None, resumes current video.
@@ -316,6 +422,13 @@ class GStreamerPlayer:
         Returns:
             True if playback started successfully, False otherwise
         """
+        if uri:
+            uri = self._resolve_uri(uri)
+            if uri is None:
+                return False
+            if uri == self._preroll_uri and self._swap_to_preroll():
+                return True
+
         with self._lock:
             if self._player is None:
                 if not self.initialize():
@@ -325,23 +438,6 @@ class GStreamerPlayer:
                 # Store last URI for consecutive video handling
                 self._last_uri = self._current_uri
 
-                # Validate URI
-                if not uri.startswith(('file://', 'http://', 'https://')):
-                    # Assume local file path, convert to URI
-                    file_path = Path(uri)
-                    if not file_path.is_absolute():
-                        file_path = self.media_dir / uri
-                    uri = f"file://{file_path}"
-
-                # Check if file exists for local files
-                if uri.startswith('file://'):
-                    file_path = Path(uri[7:])  # Remove 'file://' prefix
-                    if not file_path.exists():
-                        logger.error("Video file not found: %s", file_path)
-                        if self._on_error:
-                            self._on_error(f"File not found: {file_path}")
-                        return False
-
                 # Reset pipeline state for consecutive same video
                 if uri == self._last_uri:
                     logger.debug("Same video as last, resetting pipeline state")
@@ -360,7 +456,138 @@ class GStreamerPlayer:
                 return False
 
             self._state = PlayerState.PLAYING
-            return True
+
+        if uri:
+            self._item_started(uri)
+        return True
+
+    def preroll(self, uri: str) -> bool:
+        """
+        Open the given item in the standby pipeline, ready to switch to.
+
+        Replaces any item already prerolled.
+
+        Args:
+            uri: URI or media path of the next item
+
+        Returns:
+            True if prerolling started, False if disabled or it failed
+        """
+        if not self._preroll_enabled:
+            return False
+
+        resolved = self._resolve_uri(uri)
+        if resolved is None:
+            return False
+
+        with self._lock:
+            if self._player is None:
+                return False
+
+            if self._standby is None:
+                self._standby = self._create_player('standby')
+                self._standby_bus = self._watch_bus(self._standby)
+                if self._window_xid:
+                    video_sink = self._standby.get_property('video-sink')
+                    if video_sink:
+                        GstVideo.VideoOverlay.set_window_handle(video_sink, self._window_xid)
+
+            # uri can only change in NULL/READY
+            self._standby.set_state(Gst.State.NULL)
+            self._standby.set_property('uri', resolved)
+            ret = self._standby.set_state(Gst.State.PAUSED)
+            if ret == Gst.StateChangeReturn.FAILURE:
+                logger.error("Failed to preroll: %s", resolved)
+                self._standby.set_state(Gst.State.NULL)
+                self._preroll_uri = None
+                return False
+
+            self._preroll_uri = resolved
+
+        logger.debug("Prerolling: %s", resolved)
+        return True
+
+    def switch_now(self, uri: Optional[str] = None) -> bool:
+        """
+        Switch to the prerolled item immediately, mid-item.
+
+        Used for high-priority triggers. If ``uri`` differs from the
+        prerolled item it is prerolled first, then switched to.
+
+        Args:
+            uri: Item to switch to; None switches to the current preroll
+
+        Returns:
+            True if the switch happened, False otherwise
+        """
+        if not self._preroll_enabled:
+            return self.play(uri) if uri else False
+
+        if uri is not None:
+            resolved = self._resolve_uri(uri)
+            if resolved is None:
+                return False
+            if resolved != self._preroll_uri and not self.preroll(resolved):
+                return False
+
+        return self._swap_to_preroll()
+
+    def _swap_to_preroll(self) -> bool:
+        """
+        Start the standby pipeline and make it the active one.
+
+        Returns:
+            True if switched, False if nothing was prerolled or it failed
+        """
+        with self._lock:
+            standby, uri = self._standby, self._preroll_uri
+            if standby is None or uri is None:
+                return False
+
+            started = time.perf_counter()
+            ret = standby.set_state(Gst.State.PLAYING)
+            if ret == Gst.StateChangeReturn.FAILURE:
+                logger.error("Failed to start prerolled item: %s", uri)
+                self._discard_preroll()
+                return False
+
+            # Start the new item before stopping the old one so the window
+            # is never left without a frame
+            previous = self._player
+            self._player, self._standby = standby, previous
+            self._bus, self._standby_bus = self._standby_bus, self._bus
+            if previous is not None:
+                previous.set_state(Gst.State.NULL)
+
+            self._preroll_uri = None
+            self._last_uri = self._current_uri
+            self._current_uri = uri
+            self._next_uri_queued = False
+            self._state = PlayerState.PLAYING
+
+        logger.info("Switched to prerolled item in %.1f ms: %s", (time.perf_counter() - started) * 1000, uri)
+        self._item_started(uri)
+        return True
+
+    def _discard_preroll(self) -> None:
+        """Drop the prerolled item, if any."""
+        with self._lock:
+            if self._standby is not None:
+                self._standby.set_state(Gst.State.NULL)
+            self._preroll_uri = None
+
+    def _item_started(self, uri: str) -> None:
+        """Preroll the following item, then report the new one as started."""
+        if self._preroll_enabled and self._on_about_to_finish:
+            next_uri = self._on_about_to_finish()
+            if next_uri:
+                self.preroll(next_uri)
+
+        if self._on_item_started:
+            try:
+                self._on_item_started(uri)
+            except Exception as e:
+                logger.error("Item started callback failed: %s", e)
 
     def play_file(self, filename: str) -> bool:
         """
@@ -419,6 +646,7 @@ class GStreamerPlayer:
             if ret == Gst.StateChangeReturn.FAILURE:
                 logger.error("Failed to stop playback")
                 return False
+            self._discard_preroll()
 
             self._state = PlayerState.STOPPED
             self._current_uri = None
@@ -486,6 +714,21 @@ class GStreamerPlayer:
         """Get currently playing URI."""
         return self._current_uri
 
+    @property
+    def preroll_uri(self) -> Optional[str]:
+        """Get the prerolled next URI, if any."""
+        return self._preroll_uri
+
+    @property
+    def has_preroll(self) -> bool:
+        """Check if a next item is prerolled."""
+        return self._preroll_uri is not None
+
+    @property
+    def preroll_enabled(self) -> bool:
+        """Check if next items are prerolled in a standby pipeline."""
+        return self._preroll_enabled
+
     @property
     def is_playing(self) -> bool:
         """Check if player is currently playing."""
@@ -506,9 +749,13 @@ class GStreamerPlayer:
             if self._bus:
                 self._bus.remove_signal_watch()
                 self._bus = None
+            if self._standby_bus:
+                self._standby_bus.remove_signal_watch()
+                self._standby_bus = None
 
             self._stop_main_loop()
             self._player = None
+            self._standby = None
 
         logger.info("GStreamer player cleanup complete")
 
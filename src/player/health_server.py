@@ -3,12 +3,13 @@
 Health Monitoring Server - Local web server for device health and remote control.
 
 Provides:
-- System stats (CPU, memory, disk, GPU, temperature)
+- System stats (CPU, memory, disk, GPU, temperature), sampled in the background
 - Player status
 - Network information
 - Camera status
 - Remote control commands
 - Log viewing
+- Prometheus metrics (/metrics)
 
 Runs on port 8080 by default.
 Called remotely by CMS via: POST http://{device_ip}:8080/api/command/{command}
@@ -16,178 +17,88 @@ Called remotely by CMS via: POST http://{device_ip}:8080/api/command/{command}
 
 import os
 import json
-import subprocess
+import selectors
+import socket
 import threading
 import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
 from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Optional
 from datetime import datetime
 
 from src.common.logger import setup_logger
+from src.common.metrics import get_metrics_registry
+from .system_sampler import get_system_sampler
 
 logger = setup_logger(__name__)
 
-
-class SystemMonitor:
-    """Collects system health metrics."""
-
-    @staticmethod
-    def get_cpu_usage() -> float:
-        """Get CPU usage percentage."""
-        try:
-            with open('/proc/stat', 'r') as f:
-                line = f.readline()
-            values = line.split()[1:8]
-            values = [int(v) for v in values]
-            idle = values[3]
-            total = sum(values)
-
-            if not hasattr(SystemMonitor, '_last_cpu'):
-                SystemMonitor._last_cpu = (idle, total)
-                time.sleep(0.1)
-                return SystemMonitor.get_cpu_usage()
-
-            last_idle, last_total = SystemMonitor._last_cpu
-            SystemMonitor._last_cpu = (idle, total)
-
-            idle_delta = idle - last_idle
-            total_delta = total - last_total
-
-            if total_delta == 0:
-                return 0.0
-
-            return round((1 - idle_delta / total_delta) * 100, 1)
-        except Exception:
-            return 0.0
-
-    @staticmethod
-    def get_memory_info() -> Dict[str, Any]:
-        """Get memory usage info."""
-        try:
-            with open('/proc/meminfo', 'r') as f:
-                lines = f.readlines()
-
-            mem = {}
-            for line in lines:
-                parts = line.split()
-                key = parts[0].rstrip(':')
-                value = int(parts[1]) * 1024
-                mem[key] = value
-
-            total = mem.get('MemTotal', 0)
-            available = mem.get('MemAvailable', 0)
-            used = total - available
-
-            return {
-                'total_mb': round(total / 1024 / 1024),
-                'used_mb': round(used / 1024 / 1024),
-                'available_mb': round(available / 1024 / 1024),
-                'percent': round(used / total * 100, 1) if total > 0 else 0
-            }
-        except Exception:
-            return {'total_mb': 0, 'used_mb': 0, 'available_mb': 0, 'percent': 0}
-
-    @staticmethod
-    def get_disk_info() -> Dict[str, Any]:
-        """Get disk usage info."""
-        try:
-            stat = os.statvfs('/')
-            total = stat.f_blocks * stat.f_frsize
-            free = stat.f_bavail * stat.f_frsize
-            used = total - free
-
-            return {
-                'total_gb': round(total / 1024 / 1024 / 1024, 1),
-                'used_gb': round(used / 1024 / 1024 / 1024, 1),
-                'free_gb': round(free / 1024 / 1024 / 1024, 1),
-                'percent': round(used / total * 100, 1) if total > 0 else 0
-            }
-        except Exception:
-            return {'total_gb': 0, 'used_gb': 0, 'free_gb': 0, 'percent': 0}
-
-    @staticmethod
-    def get_gpu_info() -> Dict[str, Any]:
-        """Get NVIDIA GPU info (Jetson tegrastats)."""
-        try:
-            result = subprocess.run(
-                ['tegrastats', '--interval', '100'],
-                capture_output=True, text=True, timeout=1
-            )
-            if result.returncode == 0:
-                return {
-                    'usage_percent': 0,
-                    'temperature_c': 0,
-                    'type': 'Jetson'
-                }
-        except Exception:
-            pass
-        return {'usage_percent': 0, 'temperature_c': 0, 'type': 'Unknown'}
-
-    @staticmethod
-    def get_temperature() -> Dict[str, float]:
-        """Get system temperatures from thermal zones."""
-        temps = {}
-        try:
-            thermal_path = Path('/sys/class/thermal')
-            for zone in thermal_path.glob('thermal_zone*'):
-                try:
-                    type_file = zone / 'type'
-                    temp_file = zone / 'temp'
-                    if type_file.exists() and temp_file.exists():
-                        zone_type = type_file.read_text().strip()
-                        temp = int(temp_file.read_text().strip()) / 1000
-                        temps[zone_type] = round(temp, 1)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        return temps
-
-    @staticmethod
-    def get_network_info() -> Dict[str, Any]:
-        """Get network interface info."""
-        interfaces = {}
-        try:
-            result = subprocess.run(
-                ['ip', '-j', 'addr', 'show'],
-                capture_output=True, text=True
-            )
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                for iface in data:
-                    name = iface.get('ifname', '')
-                    if name in ('lo',):
-                        continue
-                    addrs = []
-                    for addr_info in iface.get('addr_info', []):
-                        if addr_info.get('family') == 'inet':
-                            addrs.append(addr_info.get('local', ''))
-                    if addrs:
-                        interfaces[name] = {
-                            'ip': addrs[0],
-                            'state': iface.get('operstate', 'unknown')
-                        }
-        except Exception:
-            pass
-        return interfaces
-
-    @staticmethod
-    def get_uptime() -> Dict[str, Any]:
-        """Get system uptime."""
-        try:
-            with open('/proc/uptime', 'r') as f:
-                uptime_seconds = float(f.readline().split()[0])
-            days = int(uptime_seconds // 86400)
-            hours = int((uptime_seconds % 86400) // 3600)
-            minutes = int((uptime_seconds % 3600) // 60)
-            return {
-                'seconds': int(uptime_seconds),
-                'formatted': f'{days}d {hours}h {minutes}m'
-            }
-        except Exception:
-            return {'seconds': 0, 'formatted': 'unknown'}
+# Seconds allowed for calls into the player controller, per endpoint
+ENDPOINT_TIMEOUTS = {
+    '/api/player': 2.0,
+    '/api/command/minimize': 5.0,
+    '/api/command/maximize': 5.0,
+}
+DEFAULT_ENDPOINT_TIMEOUT = 5.0
+
+# Log tail limits
+DEFAULT_LOG_LINES = 50
+MAX_LOG_LINES = 1000
+MAX_RAW_LOG_LINES = 20000
+LOG_CHUNK_SIZE = 64 * 1024
+
+# Shared pool for player controller calls, so a hung call can be timed out
+_controller_pool: Optional[ThreadPoolExecutor] = None
+_controller_pool_lock = threading.Lock()
+
+
+def _get_controller_pool() -> ThreadPoolExecutor:
+    global _controller_pool
+
+    with _controller_pool_lock:
+        if _controller_pool is None:
+            _controller_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='health-ctl')
+    return _controller_pool
+
+
+def tail_offset(f, lines: int, block_size: int = LOG_CHUNK_SIZE) -> int:
+    """
+    Find where the last ``lines`` lines of a file start, reading backwards.
+
+    Args:
+        f: File opened in binary mode
+        lines: Number of lines wanted
+        block_size: Bytes read per step
+
+    Returns:
+        Byte offset of the first of the last ``lines`` lines
+    """
+    f.seek(0, os.SEEK_END)
+    end = f.tell()
+    if end == 0 or lines <= 0:
+        return end
+
+    # A trailing newline ends the last line rather than starting a new one
+    f.seek(end - 1)
+    needed = lines + 1 if f.read(1) == b'\n' else lines
+
+    position = end
+    while position > 0:
+        size = min(block_size, position)
+        position -= size
+        f.seek(position)
+        data = f.read(size)
+        index = len(data)
+        while True:
+            index = data.rfind(b'\n', 0, index)
+            if index < 0:
+                break
+            needed -= 1
+            if needed == 0:
+                return position + index + 1
+    return 0
 
 
 DASHBOARD_HTML = '''<!DOCTYPE html>
@@ -305,25 +216,83 @@ class HealthRequestHandler(BaseHTTPRequestHandler):
     player_controller = None
     log_dir = Path('/home/nvidia/skillz-player/logs')
 
+    # Keep-alive: every response carries Content-Length
+    protocol_version = 'HTTP/1.1'
+    # Socket timeout while a request is being read or written. Idle
+    # keep-alive connections are parked by the server and hold no worker.
+    timeout = 10
+    # Headers and body go out as separate writes; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+
     def log_message(self, format, *args):
         logger.debug("HTTP: %s", args[0])
 
+    def handle(self):
+        """
+        Handle the requests already received on this connection.
+
+        Unlike the base class this does not wait for the next request on a
+        keep-alive connection; the server parks the idle socket and hands it
+        back to a worker once it is readable.
+        """
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection and self._request_buffered():
+            self.handle_one_request()
+
+    def _request_buffered(self) -> bool:
+        """Check, without blocking, whether more request data has arrived."""
+        self.connection.settimeout(0)
+        try:
+            return bool(self.rfile.peek(1))
+        except OSError:
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+
     def _send_json(self, data: Dict, status: int = 200):
+        body = json.dumps(data, indent=2).encode()
         self.send_response(status)
         self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
-        self.wfile.write(json.dumps(data, indent=2).encode())
+        self.wfile.write(body)
 
     def _send_html(self, html: str, status: int = 200):
+        body = html.encode()
         self.send_response(status)
         self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_text(self, text: str, content_type: str = 'text/plain; charset=utf-8', status: int = 200):
+        body = text.encode()
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        self.wfile.write(html.encode())
+        self.wfile.write(body)
+
+    def _call_controller(self, path: str, func: Callable, *args):
+        """
+        Call into the player controller with the endpoint's timeout.
+
+        Raises:
+            concurrent.futures.TimeoutError: If the call takes too long
+        """
+        timeout = ENDPOINT_TIMEOUTS.get(path, DEFAULT_ENDPOINT_TIMEOUT)
+        return _get_controller_pool().submit(func, *args).result(timeout=timeout)
+
+    def _send_timeout(self, path: str):
+        logger.warning("Timed out handling %s", path)
+        self._send_json({'error': 'Timed out'}, 504)
 
     def do_GET(self):
         parsed = urlparse(self.path)
         path = parsed.path
+        query = parse_qs(parsed.query)
 
         if path in ('/', '/dashboard'):
             self._send_html(DASHBOARD_HTML)
@@ -333,16 +302,14 @@ class HealthRequestHandler(BaseHTTPRequestHandler):
                 'timestamp': datetime.now().isoformat()
             })
         elif path == '/api/system':
+            snapshot = get_system_sampler().snapshot()
             self._send_json({
-                'cpu': {'usage': SystemMonitor.get_cpu_usage()},
-                'memory': SystemMonitor.get_memory_info(),
-                'disk': SystemMonitor.get_disk_info(),
-                'gpu': SystemMonitor.get_gpu_info(),
-                'temperature': SystemMonitor.get_temperature(),
-                'network': SystemMonitor.get_network_info(),
-                'uptime': SystemMonitor.get_uptime(),
+                **snapshot,
+                'sampled_at': datetime.fromtimestamp(snapshot['timestamp']).isoformat(),
                 'timestamp': datetime.now().isoformat()
             })
+        elif path == '/api/system/history':
+            self._send_json({'samples': get_system_sampler().history()})
         elif path == '/api/player':
             status = {
                 'status': 'unknown',
@@ -351,13 +318,25 @@ class HealthRequestHandler(BaseHTTPRequestHandler):
             }
             if self.player_controller:
                 try:
-                    status.update(self.player_controller.get_status())
+                    status.update(self._call_controller(path, self.player_controller.get_status))
+                except FutureTimeoutError:
+                    self._send_timeout(path)
+                    return
                 except Exception:
                     pass
             self._send_json(status)
         elif path == '/api/logs':
-            logs = self._read_logs()
+            lines = self._query_int(query, 'lines', DEFAULT_LOG_LINES, MAX_LOG_LINES)
+            logs = self._read_logs(lines)
             self._send_json({'logs': logs})
+        elif path == '/api/logs/raw':
+            lines = self._query_int(query, 'lines', MAX_LOG_LINES, MAX_RAW_LOG_LINES)
+            self._stream_log_tail(lines)
+        elif path == '/metrics':
+            self._send_text(
+                get_metrics_registry().render_prometheus(),
+                'text/plain; version=0.0.4; charset=utf-8'
+            )
         else:
             self._send_json({'error': 'Not found'}, 404)
 
@@ -365,14 +344,27 @@ class HealthRequestHandler(BaseHTTPRequestHandler):
         parsed = urlparse(self.path)
         path = parsed.path
 
+        # Commands carry no body, but drain one so the connection stays usable
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+
         if path == '/api/command/minimize':
             if self.player_controller and hasattr(self.player_controller, 'minimize'):
-                self.player_controller.minimize()
+                try:
+                    self._call_controller(path, self.player_controller.minimize)
+                except FutureTimeoutError:
+                    self._send_timeout(path)
+                    return
             self._send_json({'message': 'Player minimized'})
 
         elif path == '/api/command/maximize':
             if self.player_controller and hasattr(self.player_controller, 'maximize'):
-                self.player_controller.maximize()
+                try:
+                    self._call_controller(path, self.player_controller.maximize)
+                except FutureTimeoutError:
+                    self._send_timeout(path)
+                    return
             self._send_json({'message': 'Player maximized'})
 
         elif path == '/api/command/restart':
@@ -408,17 +400,55 @@ class HealthRequestHandler(BaseHTTPRequestHandler):
         else:
             self._send_json({'error': 'Unknown command'}, 404)
 
-    def _read_logs(self):
-        """Read recent log entries."""
+    @staticmethod
+    def _query_int(query: Dict, name: str, default: int, maximum: int) -> int:
+        """Read a positive integer query parameter, clamped to maximum."""
+        try:
+            value = int(query.get(name, [default])[0])
+        except ValueError:
+            value = default
+        return max(1, min(value, maximum))
+
+    def _read_logs(self, lines: int = DEFAULT_LOG_LINES):
+        """Read recent log entries, seeking back from the end of the file."""
         try:
             log_file = self.log_dir / 'player.log'
             if log_file.exists():
-                with open(log_file, 'r') as f:
-                    return f.readlines()[-50:]
+                with open(log_file, 'rb') as f:
+                    f.seek(tail_offset(f, lines))
+                    return f.read().decode('utf-8', errors='replace').splitlines(keepends=True)
         except Exception:
             pass
         return ['No logs available']
 
+    def _stream_log_tail(self, lines: int):
+        """Stream the last lines of the log as text in fixed-size chunks."""
+        log_file = self.log_dir / 'player.log'
+        try:
+            f = open(log_file, 'rb')
+        except OSError:
+            self._send_json({'error': 'No logs available'}, 404)
+            return
+
+        with f:
+            start = tail_offset(f, lines)
+            # Bound the response to the size at request time; the log may keep growing
+            remaining = f.seek(0, os.SEEK_END) - start
+            f.seek(start)
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; charset=utf-8')
+            self.send_header('Content-Length', str(remaining))
+            self.end_headers()
+            while remaining > 0:
+                chunk = f.read(min(LOG_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+        if remaining > 0:
+            # File was truncated under us; the declared length can't be met
+            self.close_connection = True
+
     def _reset_pairing(self):
         """Reset device pairing status."""
         config_path = Path('/home/nvidia/skillz-player/config/device.json')
@@ -435,18 +465,174 @@ class HealthRequestHandler(BaseHTTPRequestHandler):
                 logger.error("Failed to reset pairing: %s", e)
 
 
+class BoundedThreadingHTTPServer(ThreadingHTTPServer):
+    """
+    HTTP server handling requests on a fixed-size thread pool.
+
+    A worker serves one request (plus any already pipelined behind it) and
+    then returns a keep-alive connection to a selector, so idle connections
+    never hold a worker. When a parked connection becomes readable it is
+    dispatched again; after ``idle_timeout`` seconds without data it is
+    closed. At most ``max_workers`` requests run at once and ``backlog``
+    more may wait for a worker; beyond that the connection gets a 503.
+    """
+
+    def __init__(
+        self,
+        server_address,
+        handler_class,
+        max_workers: int = 8,
+        backlog: int = 16,
+        idle_timeout: float = 10.0
+    ):
+        self.idle_timeout = idle_timeout
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='health-http')
+        self._slots = threading.BoundedSemaphore(max_workers + backlog)
+        super().__init__(server_address, handler_class)
+
+        # Idle keep-alive connections, watched by a single thread
+        self._idle_selector = selectors.DefaultSelector()
+        self._idle_pending = []
+        self._idle_lock = threading.Lock()
+        self._idle_closing = False
+        self._wake_recv, self._wake_send = socket.socketpair()
+        self._wake_recv.setblocking(False)
+        self._wake_send.setblocking(False)
+        self._idle_selector.register(self._wake_recv, selectors.EVENT_READ)
+        self._idle_thread = threading.Thread(
+            target=self._watch_idle, name='health-http-idle', daemon=True
+        )
+        self._idle_thread.start()
+
+    def process_request(self, request, client_address):
+        if not self._slots.acquire(blocking=False):
+            self._reject(request)
+            return
+        try:
+            self._pool.submit(self._process, request, client_address)
+        except RuntimeError:
+            # Pool already shut down
+            self._slots.release()
+            self.shutdown_request(request)
+
+    def _process(self, request, client_address):
+        keep_alive = False
+        try:
+            handler = self.RequestHandlerClass(request, client_address, self)
+            keep_alive = not handler.close_connection
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self._slots.release()
+
+        if keep_alive:
+            self._park(request, client_address)
+        else:
+            self.shutdown_request(request)
+
+    def _park(self, request, client_address):
+        """Hand an idle keep-alive connection to the idle watcher."""
+        with self._idle_lock:
+            if self._idle_closing:
+                self.shutdown_request(request)
+                return
+            self._idle_pending.append((request, client_address))
+        self._wake_idle_watcher()
+
+    def _wake_idle_watcher(self):
+        try:
+            self._wake_send.send(b'\0')
+        except OSError:
+            # Buffer full: the watcher is already due to wake up
+            pass
+
+    def _watch_idle(self):
+        """Wait for parked connections to become readable or time out."""
+        while True:
+            for key, _ in self._idle_selector.select(timeout=1.0):
+                if key.fileobj is self._wake_recv:
+                    try:
+                        while self._wake_recv.recv(4096):
+                            pass
+                    except OSError:
+                        pass
+                    continue
+                self._idle_selector.unregister(key.fileobj)
+                self.process_request(key.fileobj, key.data[0])
+
+            with self._idle_lock:
+                if self._idle_closing:
+                    break
+                pending, self._idle_pending = self._idle_pending, []
+            deadline = time.monotonic() + self.idle_timeout
+            for request, client_address in pending:
+                self._idle_selector.register(
+                    request, selectors.EVENT_READ, (client_address, deadline)
+                )
+
+            now = time.monotonic()
+            for key in list(self._idle_selector.get_map().values()):
+                if key.data and key.data[1] <= now:
+                    self._idle_selector.unregister(key.fileobj)
+                    self.shutdown_request(key.fileobj)
+
+        for key in list(self._idle_selector.get_map().values()):
+            if key.data:
+                self.shutdown_request(key.fileobj)
+        for request, _ in self._idle_pending:
+            self.shutdown_request(request)
+        self._idle_selector.close()
+
+    def _reject(self, request):
+        try:
+            request.sendall(
+                b'HTTP/1.1 503 Service Unavailable\r\n'
+                b'Content-Length: 0\r\nConnection: close\r\n\r\n'
+            )
+        except OSError:
+            pass
+        self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        with self._idle_lock:
+            self._idle_closing = True
+        self._wake_idle_watcher()
+        self._idle_thread.join(timeout=5)
+        self._wake_recv.close()
+        self._wake_send.close()
+        self._pool.shutdown(wait=False)
+
+
 class HealthServer:
     """Health monitoring HTTP server running on port 8080."""
 
-    def __init__(self, port: int = 8080, player_controller=None):
+    def __init__(
+        self,
+        port: int = 8080,
+        player_controller=None,
+        max_workers: int = 8,
+        backlog: int = 16,
+        idle_timeout: float = 10.0
+    ):
         self.port = port
+        self.max_workers = max_workers
+        self.backlog = backlog
+        self.idle_timeout = idle_timeout
         self.server = None
         self._thread = None
         HealthRequestHandler.player_controller = player_controller
 
     def start(self):
         """Start the health server in a background thread."""
-        self.server = HTTPServer(('0.0.0.0', self.port), HealthRequestHandler)
+        get_system_sampler()
+        self.server = BoundedThreadingHTTPServer(
+            ('0.0.0.0', self.port), HealthRequestHandler,
+            max_workers=self.max_workers, backlog=self.backlog,
+            idle_timeout=self.idle_timeout
+        )
+        # Resolve port 0 to the port actually bound
+        self.port = self.server.server_address[1]
         self._thread = threading.Thread(
             target=self.server.serve_forever,
             daemon=True
@@ -458,6 +644,7 @@ class HealthServer:
         """Stop the health server."""
         if self.server:
             self.server.shutdown()
+            self.server.server_close()
             logger.info("Health server stopped")
 
     def set_player_controller(self, controller):
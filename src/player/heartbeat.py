@@ -3,14 +3,14 @@ Heartbeat Reporter - Reports device status to hub at regular intervals.
 Sends health metrics and playback state every 60 seconds.
 """
 
-import os
 import time
 import threading
 import requests
-from pathlib import Path
 from typing import Any, Callable, Dict, Optional
 
 from src.common.logger import setup_logger
+from src.common.metrics import get_metrics_registry
+from .system_sampler import get_system_sampler
 
 logger = setup_logger(__name__)
 
@@ -76,23 +76,12 @@ class HeartbeatReporter:
         Returns:
             CPU temperature or 0 if unavailable
         """
-        try:
-            # Try Jetson thermal zones
-            thermal_paths = [
-                "/sys/class/thermal/thermal_zone0/temp",
-                "/sys/class/thermal/thermal_zone1/temp",
-            ]
-
-            for path in thermal_paths:
-                if Path(path).exists():
-                    with open(path, 'r') as f:
-                        temp = int(f.read().strip())
-                        # Convert millidegrees to degrees
-                        return temp // 1000
-
-            return 0
-        except Exception:
-            return 0
+        temperature = get_system_sampler().snapshot()['temperature']
+        # Prefer the Jetson CPU zone, fall back to the first zone
+        for zone, value in temperature.items():
+            if 'cpu' in zone.lower():
+                return int(value)
+        return int(next(iter(temperature.values()), 0))
 
     def _get_memory_usage(self) -> int:
         """
@@ -101,47 +90,16 @@ class HeartbeatReporter:
         Returns:
             Memory usage percent (0-100) or 0 if unavailable
         """
-        try:
-            with open('/proc/meminfo', 'r') as f:
-                meminfo = f.read()
-
-            mem_total = 0
-            mem_available = 0
-
-            for line in meminfo.split('\n'):
-                if line.startswith('MemTotal:'):
-                    mem_total = int(line.split()[1])
-                elif line.startswith('MemAvailable:'):
-                    mem_available = int(line.split()[1])
-
-            if mem_total > 0:
-                mem_used = mem_total - mem_available
-                return int((mem_used / mem_total) * 100)
-
-            return 0
-        except Exception:
-            return 0
+        return int(get_system_sampler().snapshot()['memory']['percent'])
 
     def _get_disk_free(self) -> float:
         """
-        Get free disk space in gigabytes.
+        Get free disk space on the media filesystem in gigabytes.
 
         Returns:
             Free disk space in GB or 0.0 if unavailable
         """
-        try:
-            # Check media directory or home directory
-            check_paths = ['/home/skillz/media', '/home/skillz', '/']
-
-            for path in check_paths:
-                if Path(path).exists():
-                    stat = os.statvfs(path)
-                    free_bytes = stat.f_bavail * stat.f_frsize
-                    return round(free_bytes / (1024 ** 3), 1)
-
-            return 0.0
-        except Exception:
-            return 0.0
+        return float(get_system_sampler().snapshot()['media_disk']['free_gb'])
 
     def _get_uptime(self) -> int:
         """
@@ -173,7 +131,8 @@ class HeartbeatReporter:
             "cpu_temp": self._get_cpu_temp(),
             "memory_usage_percent": self._get_memory_usage(),
             "disk_free_gb": self._get_disk_free(),
-            "uptime_seconds": self._get_uptime()
+            "uptime_seconds": self._get_uptime(),
+            "metrics": get_metrics_registry().summary()
         }
 
     def send_heartbeat(self) -> bool:
@@ -21,6 +21,7 @@ from .state_machine import PlayerStateMachine, PlayerMode, StateTransitionError
 from src.common.logger import setup_logger
 from src.common.cms_client import CMSClient
 from src.common.device_id import get_device_info
+from src.common.metrics import get_metrics_registry
 
 logger = setup_logger(__name__)
 
@@ -179,7 +180,8 @@ class SkillzPlayer:
                 media_dir=self._media_dir,
                 on_about_to_finish=self._get_next_uri,
                 on_error=self._on_playback_error,
-                on_eos=self._on_end_of_stream
+                on_eos=self._on_end_of_stream,
+                on_item_started=self._on_item_started
             )
 
             if not self._gst_player.initialize():
@@ -478,13 +480,69 @@ class SkillzPlayer:
         logger.debug("Trigger received: %s", trigger_data.get('type', 'unknown'))
 
         if self._playlist_manager:
+            registry = get_metrics_registry()
+            was_default = not self._playlist_manager.is_triggered
+
             # Playlist manager handles matching and activation
-            activated = self._playlist_manager.handle_trigger(trigger_data)
+            with registry.histogram(
+                'player_trigger_handle_seconds', 'Time to match and activate a trigger'
+            ).time():
+                activated = self._playlist_manager.handle_trigger(trigger_data)
+                if activated:
+                    self._queue_triggered_content(was_default)
 
             if activated:
                 logger.info("Triggered playlist activated")
-                # Note: GStreamer's gapless mechanism will pick up
-                # the new playlist items automatically
+                sent_at = trigger_data.get('timestamp')
+                if isinstance(sent_at, (int, float)):
+                    registry.histogram(
+                        'player_trigger_to_switch_seconds',
+                        'Time from trigger publication to playlist activation'
+                    ).observe(max(0.0, time.time() - sent_at))
+
+    def _queue_triggered_content(self, was_default: bool) -> None:
+        """
+        Line up the first item of a newly activated triggered playlist.
+
+        Normal priority replaces the prerolled next item so the switch
+        happens gaplessly at the end of the current item. High priority
+        switches immediately. Without preroll, normal priority is left to
+        the about-to-finish handler.
+
+        Args:
+            was_default: Whether the default playlist was active before the trigger
+        """
+        player = self._gst_player
+        if not player or not player.is_initialized:
+            return
+
+        immediate = self._playlist_manager.immediate_switch
+        if not immediate and not player.preroll_enabled:
+            return
+
+        # The prerolled item came from the default playlist; replay it later
+        if was_default and player.has_preroll:
+            self._playlist_manager.rewind_default()
+
+        next_uri = self._playlist_manager.get_next_uri()
+        if not next_uri:
+            return
+
+        if immediate:
+            logger.info("High-priority trigger, switching now: %s", next_uri)
+            player.switch_now(next_uri)
+        else:
+            player.preroll(next_uri)
+
+    def _on_item_started(self, uri: str) -> None:
+        """
+        Callback when playback moves to a new item.
+
+        Args:
+            uri: URI now playing
+        """
+        if self._playlist_manager:
+            self._playlist_manager.mark_started(uri)
 
     def _on_playlist_changed(self, manager: PlaylistManager) -> None:
         """
@@ -126,6 +126,7 @@ class TriggeredPlaylist:
     playlist_id: str
     rule: TriggerRule
     items: List[PlaylistItem]
+    priority: str = "normal"  # "high" switches immediately instead of at the item boundary
 
     def matches_trigger(self, trigger_data: Dict[str, Any]) -> bool:
         """
@@ -276,7 +277,8 @@ class PlaylistManager:
             playlist = TriggeredPlaylist(
                 playlist_id=playlist_data.get('playlist_id', ''),
                 rule=rule,
-                items=items
+                items=items,
+                priority=playlist_data.get('priority', 'normal')
             )
             playlists.append(playlist)
 
@@ -384,6 +386,37 @@ class PlaylistManager:
         self._triggered_index += 1
         return item
 
+    def rewind_default(self) -> None:
+        """
+        Step the default playlist back one item.
+
+        Used when an item already handed out for preroll is discarded
+        because a triggered playlist took over, so it plays later instead
+        of being skipped.
+        """
+        if self._default_items:
+            self._default_index = (self._default_index - 1) % len(self._default_items)
+
+    def mark_started(self, uri: str) -> None:
+        """
+        Record that playback of a handed-out URI has actually started.
+
+        With preroll the next URI is requested while the current item is
+        still playing, so current_item is corrected here when the switch
+        happens.
+
+        Args:
+            uri: URI that started playing
+        """
+        candidates = list(self._default_items)
+        if self._current_triggered:
+            candidates = self._current_triggered.items + candidates
+
+        for item in candidates:
+            if item.get_uri(self.media_dir) == uri:
+                self._current_item = item
+                return
+
     def _switch_to_default(self) -> None:
         """Switch back to default playlist mode."""
         self._mode = PlaylistMode.DEFAULT
@@ -506,6 +539,15 @@ class PlaylistManager:
         """Check if currently playing a triggered playlist."""
         return self._mode == PlaylistMode.TRIGGERED
 
+    @property
+    def immediate_switch(self) -> bool:
+        """Check if the active triggered playlist should interrupt the current item."""
+        return (
+            self._mode == PlaylistMode.TRIGGERED
+            and self._current_triggered is not None
+            and self._current_triggered.priority == 'high'
+        )
+
     @property
     def triggered_playlist_id(self) -> Optional[str]:
         """Get ID of currently playing triggered playlist."""
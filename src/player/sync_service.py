@@ -16,6 +16,7 @@ import requests
 
 from .config import PlayerConfig, get_player_config
 from src.common.logger import setup_logger
+from src.common.metrics import get_metrics_registry
 
 
 logger = setup_logger(__name__)
@@ -615,14 +616,18 @@ class SyncService:
                 return False
 
             # Download to temp file first
+            started = time.perf_counter()
+            received = 0
             with open(temp_path, 'wb') as f:
                 for chunk in response.iter_content(chunk_size=8192):
                     if chunk:
                         f.write(chunk)
+                        received += len(chunk)
 
             # Move to final location
             temp_path.rename(local_path)
 
+            self._record_download(received, time.perf_counter() - started)
             logger.info("Downloaded: %s", filename)
             return True
 
@@ -639,6 +644,26 @@ class SyncService:
             self._cleanup_temp_file(temp_path)
             return False
 
+    @staticmethod
+    def _record_download(size: int, elapsed: float) -> None:
+        """
+        Record download size, duration and throughput metrics.
+
+        Args:
+            size: Bytes received
+            elapsed: Seconds spent receiving and writing
+        """
+        registry = get_metrics_registry()
+        registry.histogram(
+            'sync_download_seconds', 'Content download duration',
+            buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+        ).observe(elapsed)
+        registry.counter('sync_download_bytes_total', 'Content bytes downloaded').inc(size)
+        if elapsed > 0:
+            registry.gauge(
+                'sync_download_bytes_per_second', 'Throughput of the last content download'
+            ).set(round(size / elapsed))
+
     def _cleanup_temp_file(self, temp_path: Path) -> None:
         """Remove a temporary file if it exists."""
         try:
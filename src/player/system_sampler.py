@@ -0,0 +1,325 @@
+"""
+Background system metrics sampler for the health server and heartbeats.
+Reads /proc, /sys thermal zones, GPU load and interface addresses at a
+fixed cadence into a shared snapshot, so readers never block or spawn
+subprocesses.
+"""
+
+import fcntl
+import os
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from src.common.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# ioctl request for an interface's IPv4 address (linux/sockios.h)
+SIOCGIFADDR = 0x8915
+
+# GPU load files (0-1000) on Jetson; the first that exists is used
+GPU_LOAD_FILES = (
+    'devices/gpu.0/load',
+    'devices/platform/gpu.0/load',
+    'devices/platform/17000000.ga10b/load',
+    'devices/platform/17000000.gv11b/load',
+    'devices/platform/57000000.gpu/load',
+)
+
+# Filesystems holding media, most specific first; the first that exists is
+# reported as media_disk (it may be its own partition)
+MEDIA_DISK_PATHS = ('/home/skillz/media', '/home/skillz', '/')
+
+
+class SystemSampler:
+    """
+    Samples system metrics on a background thread.
+
+    Each sample() builds a new snapshot dict and swaps it in, so readers
+    get a consistent view without locking. A ring buffer keeps compact
+    copies of the last ``history`` samples for trend views.
+    """
+
+    def __init__(
+        self,
+        interval: float = 2.0,
+        history: int = 150,
+        disk_path: str = '/',
+        media_paths: Tuple[str, ...] = MEDIA_DISK_PATHS,
+        proc_root: str = '/proc',
+        sys_root: str = '/sys'
+    ):
+        """
+        Initialize sampler.
+
+        Args:
+            interval: Seconds between samples
+            history: Number of compact samples kept in the ring buffer
+            disk_path: Filesystem reported in disk usage
+            media_paths: Candidate media filesystems for media_disk usage
+            proc_root: procfs mount point
+            sys_root: sysfs mount point
+        """
+        self.interval = interval
+        self.disk_path = disk_path
+        self.media_paths = tuple(media_paths)
+        self.proc_root = Path(proc_root)
+        self.sys_root = Path(sys_root)
+
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._last_cpu: Tuple[int, int] = (0, 0)
+        self._gpu_load_file: Optional[Path] = self._find_gpu_load_file()
+        self._sample_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Take a first sample and start sampling in the background."""
+        if self._thread and self._thread.is_alive():
+            return
+        self.sample()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="SystemSampler")
+        self._thread.start()
+        logger.info("System sampler started (every %.1fs)", self.interval)
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the background thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                logger.error(f"System sample failed: {e}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the latest snapshot (do not modify it).
+
+        Samples synchronously if nothing has been sampled yet.
+
+        Returns:
+            Dictionary with cpu, memory, disk, gpu, temperature, network,
+            uptime and timestamp keys
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.sample()
+        return snapshot
+
+    def history(self) -> List[Dict[str, Any]]:
+        """
+        Get recent compact samples, oldest first.
+
+        Returns:
+            List of dicts with timestamp, cpu, memory, gpu and temperature
+        """
+        return list(self._history)
+
+    def sample(self) -> Dict[str, Any]:
+        """
+        Read all metrics once and publish them as the current snapshot.
+
+        Returns:
+            The new snapshot
+        """
+        with self._sample_lock:
+            temperature = self._read_temperature()
+            snapshot = {
+                'cpu': self._read_cpu(),
+                'memory': self._read_memory(),
+                'disk': self._read_disk(self.disk_path),
+                'media_disk': self._read_disk(self._media_path()),
+                'gpu': self._read_gpu(temperature),
+                'temperature': temperature,
+                'network': self._read_network(),
+                'uptime': self._read_uptime(),
+                'timestamp': time.time(),
+            }
+            self._snapshot = snapshot
+            self._history.append({
+                'timestamp': snapshot['timestamp'],
+                'cpu': snapshot['cpu']['usage'],
+                'memory': snapshot['memory']['percent'],
+                'gpu': snapshot['gpu']['usage_percent'],
+                'temperature': max(temperature.values(), default=0),
+            })
+            return snapshot
+
+    def _read_cpu(self) -> Dict[str, Any]:
+        """CPU usage since the previous sample (since boot on the first)."""
+        usage = 0.0
+        try:
+            with open(self.proc_root / 'stat', 'r') as f:
+                values = [int(v) for v in f.readline().split()[1:8]]
+            idle = values[3] + values[4]  # idle + iowait
+            total = sum(values)
+
+            last_idle, last_total = self._last_cpu
+            self._last_cpu = (idle, total)
+            total_delta = total - last_total
+            if total_delta > 0:
+                usage = round((1 - (idle - last_idle) / total_delta) * 100, 1)
+        except Exception:
+            pass
+
+        try:
+            load = [round(value, 2) for value in os.getloadavg()]
+        except OSError:
+            load = [0.0, 0.0, 0.0]
+        return {'usage': usage, 'load': load}
+
+    def _read_memory(self) -> Dict[str, Any]:
+        try:
+            mem = {}
+            with open(self.proc_root / 'meminfo', 'r') as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) >= 2:
+                        mem[parts[0].rstrip(':')] = int(parts[1]) * 1024
+
+            total = mem.get('MemTotal', 0)
+            available = mem.get('MemAvailable', 0)
+            used = total - available
+            return {
+                'total_mb': round(total / 1024 / 1024),
+                'used_mb': round(used / 1024 / 1024),
+                'available_mb': round(available / 1024 / 1024),
+                'percent': round(used / total * 100, 1) if total > 0 else 0
+            }
+        except Exception:
+            return {'total_mb': 0, 'used_mb': 0, 'available_mb': 0, 'percent': 0}
+
+    def _media_path(self) -> str:
+        """First media path that exists, falling back to disk_path."""
+        for path in self.media_paths:
+            if os.path.exists(path):
+                return path
+        return self.disk_path
+
+    def _read_disk(self, path: str) -> Dict[str, Any]:
+        try:
+            stat = os.statvfs(path)
+            total = stat.f_blocks * stat.f_frsize
+            free = stat.f_bavail * stat.f_frsize
+            used = total - free
+            return {
+                'total_gb': round(total / 1024 / 1024 / 1024, 1),
+                'used_gb': round(used / 1024 / 1024 / 1024, 1),
+                'free_gb': round(free / 1024 / 1024 / 1024, 1),
+                'percent': round(used / total * 100, 1) if total > 0 else 0
+            }
+        except Exception:
+            return {'total_gb': 0, 'used_gb': 0, 'free_gb': 0, 'percent': 0}
+
+    def _find_gpu_load_file(self) -> Optional[Path]:
+        for relative in GPU_LOAD_FILES:
+            path = self.sys_root / relative
+            if path.exists():
+                return path
+        return None
+
+    def _read_gpu(self, temperature: Dict[str, float]) -> Dict[str, Any]:
+        """Jetson GPU load from sysfs, temperature from the GPU thermal zone."""
+        gpu_temp = next(
+            (value for zone, value in temperature.items() if 'gpu' in zone.lower()), 0
+        )
+        if self._gpu_load_file is None:
+            return {'usage_percent': 0, 'temperature_c': gpu_temp, 'type': 'Unknown'}
+        try:
+            load = int(self._gpu_load_file.read_text().strip())
+        except (OSError, ValueError):
+            load = 0
+        return {'usage_percent': round(load / 10, 1), 'temperature_c': gpu_temp, 'type': 'Jetson'}
+
+    def _read_temperature(self) -> Dict[str, float]:
+        temps = {}
+        for zone in sorted((self.sys_root / 'class' / 'thermal').glob('thermal_zone*')):
+            try:
+                zone_type = (zone / 'type').read_text().strip()
+                temps[zone_type] = round(int((zone / 'temp').read_text().strip()) / 1000, 1)
+            except (OSError, ValueError):
+                pass
+        return temps
+
+    def _read_network(self) -> Dict[str, Any]:
+        """IPv4 address and operstate of each non-loopback interface with an address."""
+        interfaces = {}
+        for path in sorted((self.sys_root / 'class' / 'net').glob('*')):
+            name = path.name
+            if name == 'lo':
+                continue
+            address = self._interface_address(name)
+            if not address:
+                continue
+            try:
+                state = (path / 'operstate').read_text().strip()
+            except OSError:
+                state = 'unknown'
+            interfaces[name] = {'ip': address, 'state': state.upper()}
+        return interfaces
+
+    @staticmethod
+    def _interface_address(name: str) -> Optional[str]:
+        """IPv4 address of an interface via ioctl, or None."""
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                request = struct.pack('256s', name[:15].encode())
+                result = fcntl.ioctl(sock.fileno(), SIOCGIFADDR, request)
+            return socket.inet_ntoa(result[20:24])
+        except OSError:
+            return None
+
+    def _read_uptime(self) -> Dict[str, Any]:
+        try:
+            with open(self.proc_root / 'uptime', 'r') as f:
+                uptime_seconds = float(f.readline().split()[0])
+            days = int(uptime_seconds // 86400)
+            hours = int((uptime_seconds % 86400) // 3600)
+            minutes = int((uptime_seconds % 3600) // 60)
+            return {
+                'seconds': int(uptime_seconds),
+                'formatted': f'{days}d {hours}h {minutes}m'
+            }
+        except Exception:
+            return {'seconds': 0, 'formatted': 'unknown'}
+
+
+# Global sampler instance (shared by the health server and heartbeats)
+_global_sampler: Optional[SystemSampler] = None
+_global_sampler_lock = threading.Lock()
+
+
+def get_system_sampler() -> SystemSampler:
+    """
+    Get the global system sampler, starting it on first use.
+
+    Returns:
+        Running SystemSampler instance
+    """
+    global _global_sampler
+
+    if _global_sampler is None:
+        with _global_sampler_lock:
+            if _global_sampler is None:
+                sampler = SystemSampler()
+                sampler.start()
+                _global_sampler = sampler
+
+    return _global_sampler
@@ -257,6 +257,9 @@ class TriggerListener:
         converted_data = self._convert_legacy_trigger(trigger_str, confidence)
 
         if converted_data:
+            # Keep the publish time so trigger-to-switch latency can be measured
+            if 'timestamp' in trigger_data:
+                converted_data.setdefault('timestamp', trigger_data['timestamp'])
             self._invoke_callback(converted_data)
 
     def _convert_legacy_trigger(
@@ -5,8 +5,10 @@ Detects faces and estimates demographics.
 
 import cv2
 import numpy as np
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
+from src.trigger_engine.face_detectors import FaceDetectorBackend, create_face_detector
+from src.common.config import get_config
 from src.common.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -25,14 +27,20 @@ class FaceDetection:
 class AgeDetector:
     """Age and gender detection system using real ML models."""
     
-    def __init__(self, use_gpu: bool = False):
-        """Initialize age detector with real models."""
+    def __init__(self, use_gpu: bool = False, face_detector: Optional[FaceDetectorBackend] = None):
+        """
+        Initialize age detector with real models.
+        
+        Args:
+            use_gpu: Whether GPU inference was requested
+            face_detector: Face detector backend; defaults to the one in ml.trigger.detector
+        """
         self.use_gpu = use_gpu
         
         # Face detector
-        self.face_detector = cv2.CascadeClassifier(
-            cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-        )
+        if face_detector is None:
+            face_detector = create_face_detector(get_config().get('ml.trigger.detector', {}))
+        self.face_detector = face_detector
         
         # Load age estimation model
         age_proto = "models/age_deploy.prototxt"
@@ -52,15 +60,23 @@ class AgeDetector:
                          '(38-43)', '(48-53)', '(60-100)']
         self.GENDER_LIST = ['Male', 'Female']
         
+        # Age range to single age value (midpoint)
+        self.AGE_VALUES = {
+            '(0-2)': 1,
+            '(4-6)': 5,
+            '(8-12)': 10,
+            '(15-20)': 18,
+            '(25-32)': 28,
+            '(38-43)': 40,
+            '(48-53)': 50,
+            '(60-100)': 70
+        }
+        
         logger.info(f"Age detector initialized with REAL models (GPU: {use_gpu})")
     
     def detect_faces(self, frame: np.ndarray) -> List[Tuple[int, int, int, int]]:
-        """Detect faces in a frame."""
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        faces = self.face_detector.detectMultiScale(
-            gray, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30)
-        )
-        return faces
+        """Detect faces in a frame; boxes are in full-frame coordinates."""
+        return self.face_detector.detect(frame)
     
     def estimate_demographics(self, frame: np.ndarray, bbox: Tuple[int, int, int, int]) -> Tuple[int, float, str, float]:
         """
@@ -73,12 +89,7 @@ class AgeDetector:
         Returns:
             Tuple of (estimated_age, age_confidence, gender, gender_confidence)
         """
-        x, y, w, h = bbox
-        
-        # Extract face with padding
-        padding = 20
-        face = frame[max(0, y-padding):min(frame.shape[0], y+h+padding),
-                     max(0, x-padding):min(frame.shape[1], x+w+padding)]
+        face = self._crop_face(frame, bbox)
         
         if face.size == 0:
             return 30, 0.5, "unknown", 0.5
@@ -90,39 +101,88 @@ class AgeDetector:
         # Predict gender
         self.gender_net.setInput(blob)
         gender_preds = self.gender_net.forward()
-        gender_idx = gender_preds[0].argmax()
-        gender = self.GENDER_LIST[gender_idx].lower()
-        gender_conf = float(gender_preds[0][gender_idx])
         
         # Predict age
         self.age_net.setInput(blob)
         age_preds = self.age_net.forward()
-        age_idx = age_preds[0].argmax()
+        
+        return self._decode_predictions(gender_preds[0], age_preds[0])
+    
+    def estimate_demographics_batch(
+        self,
+        frame: np.ndarray,
+        bboxes: List[Tuple[int, int, int, int]]
+    ) -> List[Tuple[int, float, str, float]]:
+        """
+        Estimate age and gender for every face in a frame with one forward pass per net.
+        
+        All face crops go into a single (N, 3, 227, 227) blob. Each crop is
+        resized and mean-subtracted exactly as in estimate_demographics, and
+        the nets have no cross-sample layers, so results match the per-face path.
+        
+        Args:
+            frame: Input image
+            bboxes: Face bounding boxes (x, y, width, height)
+            
+        Returns:
+            List of (estimated_age, age_confidence, gender, gender_confidence), one per bbox
+        """
+        results = [(30, 0.5, "unknown", 0.5)] * len(bboxes)
+        
+        faces = []
+        indices = []
+        for index, bbox in enumerate(bboxes):
+            face = self._crop_face(frame, bbox)
+            if face.size != 0:
+                faces.append(face)
+                indices.append(index)
+        
+        if not faces:
+            return results
+        
+        blob = cv2.dnn.blobFromImages(faces, 1.0, (227, 227),
+                                       self.MODEL_MEAN_VALUES, swapRB=False)
+        
+        self.gender_net.setInput(blob)
+        gender_preds = self.gender_net.forward()
+        
+        self.age_net.setInput(blob)
+        age_preds = self.age_net.forward()
+        
+        for row, index in enumerate(indices):
+            results[index] = self._decode_predictions(gender_preds[row], age_preds[row])
+        
+        return results
+    
+    def _crop_face(self, frame: np.ndarray, bbox: Tuple[int, int, int, int]) -> np.ndarray:
+        """Extract a face with padding, clipped to the frame."""
+        x, y, w, h = bbox
+        padding = 20
+        return frame[max(0, y-padding):min(frame.shape[0], y+h+padding),
+                     max(0, x-padding):min(frame.shape[1], x+w+padding)]
+    
+    def _decode_predictions(self, gender_pred: np.ndarray, age_pred: np.ndarray) -> Tuple[int, float, str, float]:
+        """Convert one face's net outputs to (age, age_confidence, gender, gender_confidence)."""
+        gender_idx = gender_pred.argmax()
+        gender = self.GENDER_LIST[gender_idx].lower()
+        gender_conf = float(gender_pred[gender_idx])
+        
+        age_idx = age_pred.argmax()
         age_range = self.AGE_LIST[age_idx]
-        age_conf = float(age_preds[0][age_idx])
+        age_conf = float(age_pred[age_idx])
         
         # Convert age range to single age value (use midpoint)
-        age_map = {
-            '(0-2)': 1,
-            '(4-6)': 5,
-            '(8-12)': 10,
-            '(15-20)': 18,
-            '(25-32)': 28,
-            '(38-43)': 40,
-            '(48-53)': 50,
-            '(60-100)': 70
-        }
-        estimated_age = age_map.get(age_range, 30)
+        estimated_age = self.AGE_VALUES.get(age_range, 30)
         
         return estimated_age, age_conf, gender, gender_conf
     
     def detect_and_estimate(self, frame: np.ndarray) -> List[FaceDetection]:
         """Detect faces and estimate demographics using REAL models."""
-        faces = self.detect_faces(frame)
+        faces = [tuple(face) for face in self.detect_faces(frame)]
+        demographics = self.estimate_demographics_batch(frame, faces)
         results = []
         
-        for (x, y, w, h) in faces:
-            age, age_conf, gender, gender_conf = self.estimate_demographics(frame, (x, y, w, h))
+        for (x, y, w, h), (age, age_conf, gender, gender_conf) in zip(faces, demographics):
             results.append(FaceDetection(
                 bbox=(x, y, w, h),
                 age=age,
@@ -0,0 +1,147 @@
+"""
+Rolling demographics aggregation for trigger engine analytics.
+Keeps fixed-size counters and histograms per reporting interval so memory
+stays constant however many faces are seen.
+"""
+
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+# Confidence histograms use this many equal-width bins over [0, 1]
+CONFIDENCE_BINS = 10
+
+
+def age_range_for(age: int) -> str:
+    """Map an estimated age to the reporting age range."""
+    if age < 27:
+        return "under_27"
+    if age <= 60:
+        return "27-60"
+    return "61+"
+
+
+class ConfidenceHistogram:
+    """Fixed-bin histogram of confidences in [0, 1] with a running mean."""
+
+    def __init__(self, bins: int = CONFIDENCE_BINS):
+        """Initialize an empty histogram with ``bins`` equal-width bins."""
+        self.counts = [0] * bins
+        self.bins = bins
+        self.total = 0.0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """Record one confidence value."""
+        index = int(value * self.bins)
+        if index >= self.bins:
+            index = self.bins - 1
+        elif index < 0:
+            index = 0
+        self.counts[index] += 1
+        self.total += value
+        self.count += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the mean and bin counts."""
+        return {
+            "mean": round(self.total / self.count, 4) if self.count else None,
+            "histogram": list(self.counts),
+        }
+
+
+class DemographicsAggregator:
+    """
+    Per-interval demographics counters for the trigger engine.
+
+    add() updates counters for age range, gender and confidence in O(1).
+    Raw per-detection entries are only kept if ``max_samples`` is set, and
+    then as a reservoir sample of at most that many entries per interval.
+    """
+
+    def __init__(
+        self,
+        collect_age: bool = True,
+        collect_gender: bool = True,
+        max_samples: int = 0,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Initialize aggregator.
+
+        Args:
+            collect_age: Track age ranges and age confidence
+            collect_gender: Track gender and gender confidence
+            max_samples: Raw entries kept per interval (0 disables raw sampling)
+            rng: Random source for reservoir sampling
+        """
+        self.collect_age = collect_age
+        self.collect_gender = collect_gender
+        self.max_samples = max_samples
+        self._rng = rng or random.Random()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all counters and samples and start a new interval."""
+        self.total_detections = 0
+        self.age_distribution: Dict[str, int] = {}
+        self.gender_distribution: Dict[str, int] = {}
+        self.age_confidence = ConfidenceHistogram()
+        self.gender_confidence = ConfidenceHistogram()
+        self.samples: List[Dict[str, Any]] = []
+        self.started_at = time.time()
+
+    def add(self, age: int, age_confidence: float, gender: str, gender_confidence: float) -> None:
+        """Record one detection."""
+        self.total_detections += 1
+
+        if self.collect_age:
+            age_range = age_range_for(age)
+            distribution = self.age_distribution
+            distribution[age_range] = distribution.get(age_range, 0) + 1
+            self.age_confidence.add(age_confidence)
+
+        if self.collect_gender:
+            distribution = self.gender_distribution
+            distribution[gender] = distribution.get(gender, 0) + 1
+            self.gender_confidence.add(gender_confidence)
+
+        if self.max_samples:
+            self._sample(age, age_confidence, gender, gender_confidence)
+
+    def _sample(self, age: int, age_confidence: float, gender: str, gender_confidence: float) -> None:
+        """Reservoir-sample a raw entry (Algorithm R)."""
+        if len(self.samples) < self.max_samples:
+            slot = len(self.samples)
+            self.samples.append({})
+        else:
+            slot = self._rng.randrange(self.total_detections)
+            if slot >= self.max_samples:
+                return
+
+        entry: Dict[str, Any] = {"timestamp": time.time()}
+        if self.collect_age:
+            entry["age"] = age
+            entry["age_confidence"] = age_confidence
+            entry["age_range"] = age_range_for(age)
+        if self.collect_gender:
+            entry["gender"] = gender
+            entry["gender_confidence"] = gender_confidence
+        self.samples[slot] = entry
+
+    def summary(self) -> Dict[str, Any]:
+        """Return summary statistics for the current interval."""
+        if not self.total_detections:
+            return {}
+
+        summary: Dict[str, Any] = {
+            "total_detections": self.total_detections,
+            "time_window": round(time.time() - self.started_at, 1),
+        }
+        if self.collect_age:
+            summary["age_distribution"] = dict(self.age_distribution)
+            summary["age_confidence"] = self.age_confidence.to_dict()
+        if self.collect_gender:
+            summary["gender_distribution"] = dict(self.gender_distribution)
+            summary["gender_confidence"] = self.gender_confidence.to_dict()
+        return summary
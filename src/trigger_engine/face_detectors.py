@@ -0,0 +1,271 @@
+"""
+Face detector backends for the age detector.
+Haar cascade and OpenCV DNN detectors (res10 SSD, YuNet) behind one
+interface, each run on a downscaled copy of the frame with boxes mapped
+back to full resolution.
+"""
+
+import cv2
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+from src.common.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+BBox = Tuple[int, int, int, int]
+
+
+class FaceDetectorBackend(ABC):
+    """
+    Abstract base class for face detectors.
+
+    Subclasses implement _detect_scaled() on the downscaled frame. detect()
+    handles resizing and maps boxes back to the input frame's coordinates.
+    """
+
+    name = "base"
+
+    def __init__(self, input_width: int = 640):
+        """
+        Initialize detector.
+
+        Args:
+            input_width: Width frames are downscaled to before detection; 0 or
+                anything wider than the frame runs at full resolution
+        """
+        self.input_width = input_width
+
+    def detect(self, frame: np.ndarray) -> List[BBox]:
+        """
+        Detect faces in a frame.
+
+        Args:
+            frame: BGR image at any resolution
+
+        Returns:
+            Face boxes (x, y, width, height) in the frame's own coordinates
+        """
+        height, width = frame.shape[:2]
+        scale = 1.0
+        if self.input_width and width > self.input_width:
+            scale = max(self.input_width / width, self.min_scale())
+        if scale < 1.0:
+            frame = cv2.resize(
+                frame, (max(1, round(width * scale)), max(1, round(height * scale))),
+                interpolation=cv2.INTER_AREA
+            )
+
+        boxes = []
+        for x, y, w, h in self._detect_scaled(frame, scale):
+            x0 = max(0, int(round(x / scale)))
+            y0 = max(0, int(round(y / scale)))
+            x1 = min(width, int(round((x + w) / scale)))
+            y1 = min(height, int(round((y + h) / scale)))
+            if x1 > x0 and y1 > y0:
+                boxes.append((x0, y0, x1 - x0, y1 - y0))
+        return boxes
+
+    def min_scale(self) -> float:
+        """
+        Smallest downscale factor the backend still works at.
+
+        Returns:
+            Lower bound for the detection width / frame width ratio; 0.0
+            leaves the downscale to input_width alone
+        """
+        return 0.0
+
+    @abstractmethod
+    def _detect_scaled(
+        self, frame: np.ndarray, scale: float
+    ) -> List[Tuple[float, float, float, float]]:
+        """
+        Detect faces in the (possibly downscaled) frame.
+
+        Args:
+            frame: BGR image at the detection resolution
+            scale: Detection width divided by the original frame width
+
+        Returns:
+            Face boxes (x, y, width, height) in the detection frame's coordinates
+        """
+
+
+class HaarFaceDetector(FaceDetectorBackend):
+    """OpenCV Haar cascade detector (frontal faces)."""
+
+    name = "haar"
+
+    def __init__(
+        self,
+        input_width: int = 640,
+        cascade_path: Optional[str] = None,
+        scale_factor: float = 1.1,
+        min_neighbors: int = 5,
+        min_size: int = 72
+    ):
+        """
+        Initialize Haar detector.
+
+        Args:
+            input_width: Detection width (see FaceDetectorBackend)
+            cascade_path: Cascade XML; defaults to OpenCV's frontal face cascade
+            scale_factor: detectMultiScale scale step
+            min_neighbors: detectMultiScale neighbour threshold
+            min_size: Smallest face in pixels of the original frame. Frames are
+                only downscaled as far as such a face still fills the
+                cascade's 24 px detection window; the default of 72 keeps
+                1080p frames at 640 wide
+        """
+        super().__init__(input_width)
+        if cascade_path is None:
+            cascade_path = cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+        self.cascade = cv2.CascadeClassifier(cascade_path)
+        self.scale_factor = scale_factor
+        self.min_neighbors = min_neighbors
+        self.min_size = min_size
+
+    def min_scale(self) -> float:
+        # The cascade cannot find faces smaller than its window (24 px for the
+        # default cascade), so a min_size face must not shrink below it
+        window = min(self.cascade.getOriginalWindowSize())
+        if not window or not self.min_size:
+            return 0.0
+        return min(1.0, window / self.min_size)
+
+    def _detect_scaled(self, frame, scale):
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        min_size = max(1, round(self.min_size * scale))
+        return self.cascade.detectMultiScale(
+            gray,
+            scaleFactor=self.scale_factor,
+            minNeighbors=self.min_neighbors,
+            minSize=(min_size, min_size)
+        )
+
+
+class SsdFaceDetector(FaceDetectorBackend):
+    """OpenCV DNN res10 300x300 SSD face detector (Caffe)."""
+
+    name = "ssd"
+
+    # Mean values the res10 model was trained with (BGR)
+    MEAN_VALUES = (104.0, 177.0, 123.0)
+
+    def __init__(
+        self,
+        model_path: str,
+        config_path: str,
+        input_width: int = 640,
+        confidence_threshold: float = 0.6
+    ):
+        """
+        Initialize SSD detector.
+
+        Args:
+            model_path: res10_300x300_ssd_iter_140000.caffemodel
+            config_path: Matching deploy.prototxt
+            input_width: Detection width (see FaceDetectorBackend)
+            confidence_threshold: Minimum detection score
+        """
+        super().__init__(input_width)
+        self.net = cv2.dnn.readNet(model_path, config_path)
+        self.confidence_threshold = confidence_threshold
+
+    def _detect_scaled(self, frame, scale):
+        height, width = frame.shape[:2]
+        blob = cv2.dnn.blobFromImage(frame, 1.0, (300, 300), self.MEAN_VALUES, swapRB=False)
+        self.net.setInput(blob)
+        detections = self.net.forward()
+
+        boxes = []
+        for detection in detections[0, 0]:
+            if float(detection[2]) < self.confidence_threshold:
+                continue
+            x0, y0, x1, y1 = detection[3:7] * np.array([width, height, width, height])
+            boxes.append((x0, y0, x1 - x0, y1 - y0))
+        return boxes
+
+
+class YuNetFaceDetector(FaceDetectorBackend):
+    """OpenCV YuNet face detector (cv2.FaceDetectorYN, OpenCV 4.5.4+)."""
+
+    name = "yunet"
+
+    def __init__(
+        self,
+        model_path: str,
+        input_width: int = 640,
+        confidence_threshold: float = 0.6,
+        nms_threshold: float = 0.3
+    ):
+        """
+        Initialize YuNet detector.
+
+        Args:
+            model_path: face_detection_yunet ONNX model
+            input_width: Detection width (see FaceDetectorBackend)
+            confidence_threshold: Minimum detection score
+            nms_threshold: Non-maximum suppression IoU threshold
+        """
+        super().__init__(input_width)
+        self.net = cv2.FaceDetectorYN.create(
+            model_path, "", (320, 320), confidence_threshold, nms_threshold
+        )
+        self._input_size: Optional[Tuple[int, int]] = None
+
+    def _detect_scaled(self, frame, scale):
+        size = (frame.shape[1], frame.shape[0])
+        if size != self._input_size:
+            self.net.setInputSize(size)
+            self._input_size = size
+
+        _, faces = self.net.detect(frame)
+        if faces is None:
+            return []
+        return [tuple(face[:4]) for face in faces]
+
+
+def create_face_detector(settings: Optional[Dict[str, Any]] = None) -> FaceDetectorBackend:
+    """
+    Create the face detector backend named in settings.
+
+    Args:
+        settings: The ``ml.trigger.detector`` config section; None uses Haar defaults
+
+    Returns:
+        Configured detector backend
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    settings = settings or {}
+    backend = str(settings.get('backend', 'haar')).lower()
+    input_width = int(settings.get('input_width', 640))
+    confidence = float(settings.get('confidence_threshold', 0.6))
+
+    if backend == 'haar':
+        detector = HaarFaceDetector(
+            input_width=input_width,
+            min_neighbors=int(settings.get('min_neighbors', 5)),
+            min_size=int(settings.get('min_size', 72))
+        )
+    elif backend == 'ssd':
+        detector = SsdFaceDetector(
+            settings.get('ssd_model', 'models/res10_300x300_ssd_iter_140000.caffemodel'),
+            settings.get('ssd_config', 'models/deploy.prototxt'),
+            input_width=input_width,
+            confidence_threshold=confidence
+        )
+    elif backend == 'yunet':
+        detector = YuNetFaceDetector(
+            settings.get('yunet_model', 'models/face_detection_yunet_2023mar.onnx'),
+            input_width=input_width,
+            confidence_threshold=confidence
+        )
+    else:
+        raise ValueError(f"Unknown face detector backend: {backend}")
+
+    logger.info(f"Face detector: {backend} at input width {input_width or 'full'}")
+    return detector
@@ -0,0 +1,233 @@
+"""
+Detect-once, track-between scheduling for the age detector.
+Runs full face detection every N frames or when motion is seen, follows
+faces between detections, and caches each face's demographics per track.
+"""
+
+import cv2
+import numpy as np
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+from src.trigger_engine.age_detector import AgeDetector, FaceDetection
+from src.common.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# OpenCV tracker factories by name; KCF and CSRT live in cv2.legacy on newer builds
+TRACKER_FACTORIES = {
+    "kcf": ("TrackerKCF_create", "TrackerKCF"),
+    "csrt": ("TrackerCSRT_create", "TrackerCSRT"),
+}
+
+
+@dataclass
+class FaceTrack:
+    """A face followed across frames, with its cached demographics."""
+    track_id: int
+    bbox: Tuple[int, int, int, int]
+    age: int
+    gender: str
+    age_confidence: float
+    gender_confidence: float
+    misses: int = 0
+    tracker: Any = None
+
+    def to_detection(self) -> FaceDetection:
+        """Return the track as a FaceDetection for determine_trigger."""
+        return FaceDetection(
+            bbox=self.bbox,
+            age=self.age,
+            gender=self.gender,
+            age_confidence=self.age_confidence,
+            gender_confidence=self.gender_confidence
+        )
+
+
+class FaceTracker:
+    """
+    Schedules full detection and tracks faces between detection passes.
+
+    A detection pass (Haar plus batched age/gender nets) runs every
+    ``detect_interval`` frames, or sooner if the downscaled frame changed by
+    more than ``motion_threshold``. Detected faces are matched to existing
+    tracks by IoU and their demographics refreshed. Between passes, tracks
+    keep their cached demographics and their boxes are either held in place
+    ("iou") or followed with an OpenCV tracker ("kcf" or "csrt").
+    """
+
+    def __init__(
+        self,
+        detector: AgeDetector,
+        detect_interval: int = 5,
+        motion_threshold: float = 8.0,
+        tracker_type: str = "iou",
+        iou_threshold: float = 0.3,
+        max_misses: int = 1
+    ):
+        """
+        Initialize face tracker.
+
+        Args:
+            detector: Detector used for full detection passes
+            detect_interval: Frames between scheduled detection passes (1 = every frame)
+            motion_threshold: Mean absolute pixel change (0-255) that forces a detection pass; 0 disables
+            tracker_type: "iou" (hold boxes), "kcf" or "csrt"
+            iou_threshold: Minimum IoU to match a detection to an existing track
+            max_misses: Detection passes a track may go unmatched before it is dropped
+        """
+        self.detector = detector
+        self.detect_interval = max(1, int(detect_interval))
+        self.motion_threshold = motion_threshold
+        self.iou_threshold = iou_threshold
+        self.max_misses = max_misses
+        self.tracker_type = tracker_type.lower()
+
+        self._tracker_factory = None
+        if self.tracker_type != "iou":
+            self._tracker_factory = _find_tracker_factory(self.tracker_type)
+            if self._tracker_factory is None:
+                logger.warning(f"OpenCV tracker '{tracker_type}' not available, falling back to IoU")
+                self.tracker_type = "iou"
+
+        self.tracks: List[FaceTrack] = []
+        self._next_track_id = 1
+        self._frames_since_detection = self.detect_interval
+        self._previous_thumbnail: Optional[np.ndarray] = None
+
+        # Statistics
+        self.frames = 0
+        self.detection_passes = 0
+
+        logger.info(
+            f"Face tracker initialized (detect every {self.detect_interval} frames, "
+            f"motion threshold {motion_threshold}, tracker {self.tracker_type})"
+        )
+
+    def process(self, frame: np.ndarray) -> List[FaceDetection]:
+        """
+        Return the faces in a frame, running full detection only when scheduled.
+
+        Args:
+            frame: BGR camera frame
+
+        Returns:
+            Current detections with cached demographics
+        """
+        self.frames += 1
+        self._frames_since_detection += 1
+        moved = self._motion_detected(frame)
+
+        if self._frames_since_detection >= self.detect_interval or moved:
+            self._detect(frame)
+        elif self._tracker_factory is not None:
+            self._update_trackers(frame)
+
+        return [track.to_detection() for track in self.tracks]
+
+    def reset(self) -> None:
+        """Drop all tracks and force detection on the next frame."""
+        self.tracks = []
+        self._frames_since_detection = self.detect_interval
+        self._previous_thumbnail = None
+
+    def _motion_detected(self, frame: np.ndarray) -> bool:
+        """Compare a coarse grayscale thumbnail with the previous frame's."""
+        if not self.motion_threshold:
+            return False
+
+        thumbnail = frame[::8, ::8].mean(axis=2, dtype=np.float32)
+        previous = self._previous_thumbnail
+        self._previous_thumbnail = thumbnail
+
+        if previous is None or previous.shape != thumbnail.shape:
+            return False
+        return float(np.abs(thumbnail - previous).mean()) > self.motion_threshold
+
+    def _detect(self, frame: np.ndarray) -> None:
+        """Run a full detection pass and reconcile tracks with its results."""
+        self.detection_passes += 1
+        self._frames_since_detection = 0
+
+        bboxes = [tuple(int(v) for v in face) for face in self.detector.detect_faces(frame)]
+        demographics = self.detector.estimate_demographics_batch(frame, bboxes)
+
+        unmatched = set(range(len(self.tracks)))
+        kept: List[FaceTrack] = []
+        for bbox, (age, age_conf, gender, gender_conf) in zip(bboxes, demographics):
+            best_index, best_iou = None, self.iou_threshold
+            for index in unmatched:
+                overlap = iou(self.tracks[index].bbox, bbox)
+                if overlap >= best_iou:
+                    best_index, best_iou = index, overlap
+
+            if best_index is not None:
+                unmatched.discard(best_index)
+                track = self.tracks[best_index]
+                track.bbox = bbox
+                track.misses = 0
+            else:
+                track = FaceTrack(self._next_track_id, bbox, age, gender, age_conf, gender_conf)
+                self._next_track_id += 1
+
+            track.age, track.gender = age, gender
+            track.age_confidence, track.gender_confidence = age_conf, gender_conf
+            track.tracker = self._start_tracker(frame, bbox)
+            kept.append(track)
+
+        for index in sorted(unmatched):
+            track = self.tracks[index]
+            track.misses += 1
+            if track.misses <= self.max_misses:
+                kept.append(track)
+
+        self.tracks = kept
+
+    def _start_tracker(self, frame: np.ndarray, bbox: Tuple[int, int, int, int]) -> Any:
+        """Create an OpenCV tracker on a box, if one is configured."""
+        if self._tracker_factory is None:
+            return None
+        tracker = self._tracker_factory()
+        tracker.init(frame, bbox)
+        return tracker
+
+    def _update_trackers(self, frame: np.ndarray) -> None:
+        """Move each track's box with its OpenCV tracker; drop tracks it loses."""
+        kept = []
+        for track in self.tracks:
+            if track.tracker is None:
+                kept.append(track)
+                continue
+            ok, bbox = track.tracker.update(frame)
+            if ok:
+                track.bbox = tuple(int(v) for v in bbox)
+                kept.append(track)
+        self.tracks = kept
+
+
+def iou(a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]) -> float:
+    """Intersection over union of two (x, y, w, h) boxes."""
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    inter_w = min(ax + aw, bx + bw) - max(ax, bx)
+    inter_h = min(ay + ah, by + bh) - max(ay, by)
+    if inter_w <= 0 or inter_h <= 0:
+        return 0.0
+    intersection = inter_w * inter_h
+    return intersection / float(aw * ah + bw * bh - intersection)
+
+
+def _find_tracker_factory(name: str):
+    """Look up an OpenCV tracker constructor by name across cv2 and cv2.legacy."""
+    names = TRACKER_FACTORIES.get(name)
+    if names is None:
+        return None
+    for module in (cv2, getattr(cv2, "legacy", None)):
+        if module is None:
+            continue
+        create_name, class_name = names
+        if hasattr(module, create_name):
+            return getattr(module, create_name)
+        tracker_class = getattr(module, class_name, None)
+        if tracker_class is not None and hasattr(tracker_class, "create"):
+            return tracker_class.create
+    return None
@@ -0,0 +1,188 @@
+"""
+Frame pipeline primitives for the trigger engine.
+Decouples camera capture from inference so the detector always works on
+the newest frame instead of a backlog of stale ones.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+
+@dataclass
+class CapturedFrame:
+    """A frame taken from the capture source."""
+    seq: int
+    image: Any
+    captured_at: float
+
+
+class LatestFrameBuffer:
+    """
+    Single-slot frame buffer shared by the capture thread and inference workers.
+
+    The capture thread overwrites the slot on every frame, so a frame that
+    was never picked up is dropped rather than queued. Workers block until a
+    frame newer than the last one taken is available, and each frame is handed
+    to exactly one worker.
+    """
+
+    def __init__(self):
+        """Initialize an empty buffer."""
+        self._cond = threading.Condition()
+        self._frame: Optional[CapturedFrame] = None
+        self._seq = 0
+        self._closed = False
+        self.dropped = 0
+
+    def put(self, image: Any, captured_at: Optional[float] = None) -> int:
+        """
+        Store a new frame, replacing any frame that was not taken yet.
+
+        Args:
+            image: Frame image
+            captured_at: Capture time (time.monotonic); defaults to now
+
+        Returns:
+            Sequence number assigned to the frame
+        """
+        if captured_at is None:
+            captured_at = time.monotonic()
+
+        with self._cond:
+            if self._frame is not None:
+                self.dropped += 1
+            self._seq += 1
+            self._frame = CapturedFrame(self._seq, image, captured_at)
+            self._cond.notify()
+            return self._seq
+
+    def get(self, timeout: Optional[float] = None) -> Optional[CapturedFrame]:
+        """
+        Take the newest frame, waiting for one if the slot is empty.
+
+        Args:
+            timeout: Seconds to wait; None waits until a frame arrives or the buffer closes
+
+        Returns:
+            The newest frame, or None on timeout or once the buffer is closed and empty
+        """
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._frame is not None or self._closed, timeout
+            )
+            frame = self._frame
+            self._frame = None
+            return frame
+
+    def close(self) -> None:
+        """Wake all waiting workers; get() returns None once the slot is empty."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        """Whether close() has been called."""
+        return self._closed
+
+
+class PipelineMetrics:
+    """
+    Rolling capture/inference metrics for the trigger pipeline.
+
+    Latency is measured from frame capture to the end of the trigger
+    decision for that frame. Rates and percentiles cover the last
+    ``window`` frames.
+    """
+
+    def __init__(self, window: int = 300):
+        """
+        Initialize metrics.
+
+        Args:
+            window: Number of recent frames used for rates and percentiles
+        """
+        self._lock = threading.Lock()
+        self._capture_times: Deque[float] = deque(maxlen=window)
+        self._processed_times: Deque[float] = deque(maxlen=window)
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._inference_times: Deque[float] = deque(maxlen=window)
+        self.frames_captured = 0
+        self.frames_processed = 0
+        self.frames_dropped = 0
+        self.stale_results = 0
+
+    def record_capture(self, captured_at: float) -> None:
+        """Record a frame read from the source."""
+        with self._lock:
+            self.frames_captured += 1
+            self._capture_times.append(captured_at)
+
+    def record_processed(self, captured_at: float, started_at: float, finished_at: float) -> None:
+        """
+        Record a frame that went through inference.
+
+        Args:
+            captured_at: When the frame was captured
+            started_at: When inference started on it
+            finished_at: When its trigger decision completed
+        """
+        with self._lock:
+            self.frames_processed += 1
+            self._processed_times.append(finished_at)
+            self._latencies.append(finished_at - captured_at)
+            self._inference_times.append(finished_at - started_at)
+
+    def record_stale(self) -> None:
+        """Record a result discarded because a newer frame was already applied."""
+        with self._lock:
+            self.stale_results += 1
+
+    def set_dropped(self, dropped: int) -> None:
+        """Set the number of frames overwritten before any worker took them."""
+        with self._lock:
+            self.frames_dropped = dropped
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return current metrics as a JSON-serializable dict."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            inference_times = sorted(self._inference_times)
+            return {
+                "frames_captured": self.frames_captured,
+                "frames_processed": self.frames_processed,
+                "frames_dropped": self.frames_dropped,
+                "stale_results": self.stale_results,
+                "capture_fps": round(_rate(self._capture_times), 2),
+                "inference_fps": round(_rate(self._processed_times), 2),
+                "latency_ms": {
+                    "p50": _percentile_ms(latencies, 50),
+                    "p95": _percentile_ms(latencies, 95),
+                    "max": _percentile_ms(latencies, 100),
+                },
+                "inference_ms": {
+                    "p50": _percentile_ms(inference_times, 50),
+                    "p95": _percentile_ms(inference_times, 95),
+                },
+            }
+
+
+def _rate(timestamps: Deque[float]) -> float:
+    """Events per second across a window of timestamps."""
+    if len(timestamps) < 2:
+        return 0.0
+    elapsed = timestamps[-1] - timestamps[0]
+    if elapsed <= 0:
+        return 0.0
+    return (len(timestamps) - 1) / elapsed
+
+
+def _percentile_ms(sorted_values: List[float], percentile: float) -> float:
+    """Nearest-rank percentile of sorted seconds, in milliseconds."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * percentile // 100))
+    return round(sorted_values[int(rank) - 1] * 1000, 2)
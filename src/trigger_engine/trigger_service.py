@@ -6,8 +6,11 @@ Detects faces, estimates demographics, sends triggers to playback.
 import cv2
 import time
 import threading
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from src.trigger_engine.age_detector import AgeDetector
+from src.trigger_engine.demographics import DemographicsAggregator
+from src.trigger_engine.face_tracker import FaceTracker
+from src.trigger_engine.frame_pipeline import LatestFrameBuffer, PipelineMetrics
 from src.common.ipc import MessagePublisher, MessageType
 from src.common.config import get_config
 from src.common.logger import setup_logger
@@ -22,16 +25,33 @@ class TriggerService:
     2. Detects faces and estimates demographics
     3. Sends triggers to playback service
     4. Collects analytics (if enabled)
+
+    Capture and inference run on separate threads joined by a single-slot
+    buffer: the capture thread always overwrites the slot with the newest
+    frame, and inference workers take whatever is newest when they become
+    free. Frames that arrive while inference is busy are dropped instead of
+    queued, so triggers reflect what the camera sees now.
     """
     
     def __init__(
         self,
         camera_id: int = 0,
         trigger_publish_port: int = 5556,
-        analytics_publish_port: int = 5558
+        analytics_publish_port: int = 5558,
+        video_source: Optional[str] = None
     ):
-        """Initialize trigger service."""
+        """
+        Initialize trigger service.
+
+        Args:
+            camera_id: Camera device index
+            trigger_publish_port: Port for trigger messages
+            analytics_publish_port: Port for analytics telemetry
+            video_source: Optional video file read in place of the camera,
+                paced at the file's frame rate (for benchmarks and testing)
+        """
         self.camera_id = camera_id
+        self.video_source = video_source
         self.running = False
         self.config = get_config()
         
@@ -40,11 +60,27 @@ class TriggerService:
         self.last_trigger_time = 0
         self.trigger_cooldown = 2.0
         
-        # Analytics
-        self.analytics_buffer = []
+        # Analytics (fixed-size counters; raw entries only if sampling is enabled)
         self.last_analytics_send = time.time()
         self.analytics_interval = self.config.get('ml.analytics.send_interval', 60)
         self.analytics_enabled = self.config.get('ml.analytics.enabled', True)
+        self.analytics = DemographicsAggregator(
+            collect_age=self.config.get('ml.analytics.collect_age', True),
+            collect_gender=self.config.get('ml.analytics.collect_gender', True),
+            max_samples=self.config.get('ml.analytics.raw_samples', 0)
+        )
+        
+        # Pipeline
+        self.inference_workers = max(1, int(self.config.get('ml.trigger.inference_workers', 1)))
+        self.metrics_interval = self.config.get('ml.trigger.metrics_interval', 30)
+        self.tracking_enabled = self.config.get('ml.trigger.tracking.enabled', True)
+        self.frame_buffer = LatestFrameBuffer()
+        self.metrics = PipelineMetrics()
+        self._decision_lock = threading.Lock()
+        self._publish_lock = threading.Lock()
+        self._last_decided_seq = 0
+        self._threads: List[threading.Thread] = []
+        self._stopped = threading.Event()
         
         # Will be initialized in start()
         self.camera = None
@@ -59,8 +95,16 @@ class TriggerService:
         logger.info(f"Trigger service initialized (analytics: {self.analytics_enabled})")
     
     def _open_camera(self) -> bool:
-        """Open camera connection."""
+        """Open camera connection (or the video file standing in for it)."""
         try:
+            if self.video_source:
+                self.camera = cv2.VideoCapture(self.video_source)
+                if not self.camera.isOpened():
+                    logger.error(f"Failed to open video source: {self.video_source}")
+                    return False
+                logger.info(f"Reading frames from video source: {self.video_source}")
+                return True
+            
             self.camera = cv2.VideoCapture(self.camera_id)
             
             if not self.camera.isOpened():
@@ -78,19 +122,47 @@ class TriggerService:
             logger.error(f"Error opening camera: {e}")
             return False
     
-    def _process_frame(self, frame):
-        """Process a single frame."""
-        detections = self.detector.detect_and_estimate(frame)
-        
-        if not detections:
-            self._send_trigger_if_changed("age:default", 1.0)
-            return
-        
-        trigger, confidence = self.detector.determine_trigger(detections)
-        self._send_trigger_if_changed(trigger, confidence)
+    def _process_frame(
+        self,
+        frame,
+        detector: Optional[AgeDetector] = None,
+        seq: Optional[int] = None,
+        tracker: Optional[FaceTracker] = None
+    ) -> bool:
+        """
+        Process a single frame.
+
+        Args:
+            frame: Camera frame
+            detector: Detector to run (workers each own one); defaults to self.detector
+            seq: Frame sequence number; results older than the last applied frame are discarded
+            tracker: Face tracker scheduling detection for this worker; None detects every frame
+
+        Returns:
+            False if the result was discarded as stale, True otherwise
+        """
+        detector = detector or self.detector
+        if tracker is not None:
+            detections = tracker.process(frame)
+        else:
+            detections = detector.detect_and_estimate(frame)
         
-        if self.analytics_enabled:
-            self._collect_analytics(detections)
+        with self._decision_lock:
+            if seq is not None:
+                if seq < self._last_decided_seq:
+                    return False
+                self._last_decided_seq = seq
+            
+            if not detections:
+                self._send_trigger_if_changed("age:default", 1.0)
+                return True
+            
+            trigger, confidence = detector.determine_trigger(detections)
+            self._send_trigger_if_changed(trigger, confidence)
+            
+            if self.analytics_enabled:
+                self._collect_analytics(detections)
+        return True
     
     def _send_trigger_if_changed(self, trigger: str, confidence: float):
         """Send trigger only if it changed (with cooldown)."""
@@ -101,93 +173,147 @@ class TriggerService:
             
             logger.info(f"Sending trigger: {trigger} (confidence: {confidence:.2f})")
             
-            self.trigger_publisher.publish(
-                MessageType.TRIGGER,
-                {
-                    "trigger": trigger,
-                    "confidence": confidence,
-                    "timestamp": current_time
-                }
-            )
+            with self._publish_lock:
+                self.trigger_publisher.publish(
+                    MessageType.TRIGGER,
+                    {
+                        "trigger": trigger,
+                        "confidence": confidence,
+                        "timestamp": current_time
+                    }
+                )
             
             self.last_trigger = trigger
             self.last_trigger_time = current_time
     
     def _collect_analytics(self, detections):
         """Collect analytics data (demographics only, no faces)."""
-        collect_gender = self.config.get('ml.analytics.collect_gender', True)
-        collect_age = self.config.get('ml.analytics.collect_age', True)
-        
         for detection in detections:
-            analytics_entry = {
-                "timestamp": time.time(),
-                "device_id": self.config.get('device.id', 'unknown'),
-                "location": self.config.get('device.location', 'unknown')
-            }
-            
-            if collect_age:
-                analytics_entry["age"] = detection.age
-                analytics_entry["age_confidence"] = detection.age_confidence
-                
-                if detection.age < 27:
-                    analytics_entry["age_range"] = "under_27"
-                elif detection.age <= 60:
-                    analytics_entry["age_range"] = "27-60"
-                else:
-                    analytics_entry["age_range"] = "61+"
-            
-            if collect_gender:
-                analytics_entry["gender"] = detection.gender
-                analytics_entry["gender_confidence"] = detection.gender_confidence
-            
-            self.analytics_buffer.append(analytics_entry)
+            self.analytics.add(
+                detection.age,
+                detection.age_confidence,
+                detection.gender,
+                detection.gender_confidence
+            )
         
         current_time = time.time()
         if current_time - self.last_analytics_send >= self.analytics_interval:
             self._send_analytics()
     
     def _send_analytics(self):
-        """Send collected analytics to CMS."""
-        if not self.analytics_buffer:
+        """Send the interval's demographics summary (and raw samples, if enabled) to CMS."""
+        if not self.analytics.total_detections:
             return
         
-        logger.info(f"Sending {len(self.analytics_buffer)} analytics entries")
+        logger.info(f"Sending analytics summary ({self.analytics.total_detections} detections)")
         
-        self.analytics_publisher.publish(
-            MessageType.TELEMETRY,
-            {
-                "type": "demographics",
-                "entries": self.analytics_buffer,
-                "summary": self._summarize_analytics()
-            }
-        )
+        payload = {
+            "type": "demographics",
+            "device_id": self.config.get('device.id', 'unknown'),
+            "location": self.config.get('device.location', 'unknown'),
+            "summary": self._summarize_analytics()
+        }
+        if self.analytics.max_samples:
+            payload["entries"] = self.analytics.samples
+        
+        self.analytics_publisher.publish(MessageType.TELEMETRY, payload)
         
-        self.analytics_buffer = []
+        self.analytics.reset()
         self.last_analytics_send = time.time()
     
     def _summarize_analytics(self) -> Dict[str, Any]:
-        """Create summary statistics from analytics buffer."""
-        if not self.analytics_buffer:
-            return {}
-        
-        total = len(self.analytics_buffer)
-        summary = {"total_detections": total, "time_window": self.analytics_interval}
-        
-        if self.config.get('ml.analytics.collect_age', True):
-            age_ranges = {}
-            for entry in self.analytics_buffer:
-                age_range = entry.get("age_range", "unknown")
-                age_ranges[age_range] = age_ranges.get(age_range, 0) + 1
-            summary["age_distribution"] = age_ranges
+        """Create summary statistics for the current analytics interval."""
+        return self.analytics.summary()
+    
+    def _capture_loop(self):
+        """Read frames into the single-slot buffer (runs in the capture thread)."""
+        frame_interval = 0.0
+        if self.video_source:
+            fps = self.camera.get(cv2.CAP_PROP_FPS) or 30.0
+            frame_interval = 1.0 / fps
+        next_frame_at = time.monotonic()
         
-        if self.config.get('ml.analytics.collect_gender', True):
-            genders = {}
-            for entry in self.analytics_buffer:
-                gender = entry.get("gender", "unknown")
-                genders[gender] = genders.get(gender, 0) + 1
-            summary["gender_distribution"] = genders
+        while self.running:
+            ret, frame = self.camera.read()
+            
+            if not ret:
+                if self.video_source:
+                    logger.info("End of video source")
+                    break
+                logger.warning("Failed to read frame")
+                time.sleep(0.1)
+                continue
+            
+            captured_at = time.monotonic()
+            self.frame_buffer.put(frame, captured_at)
+            self.metrics.record_capture(captured_at)
+            self.metrics.set_dropped(self.frame_buffer.dropped)
+            
+            # A camera blocks in read() at its own rate; a file has to be paced
+            if frame_interval:
+                next_frame_at += frame_interval
+                delay = next_frame_at - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_frame_at = time.monotonic()
         
-        return summary
+        self.frame_buffer.close()
+    
+    def _create_tracker(self, detector: AgeDetector) -> Optional[FaceTracker]:
+        """Create a face tracker for a worker's detector, if tracking is enabled."""
+        if not self.tracking_enabled:
+            return None
+        return FaceTracker(
+            detector,
+            detect_interval=self.config.get('ml.trigger.tracking.detect_interval', 5),
+            motion_threshold=self.config.get('ml.trigger.tracking.motion_threshold', 8.0),
+            tracker_type=self.config.get('ml.trigger.tracking.tracker', 'iou'),
+            iou_threshold=self.config.get('ml.trigger.tracking.iou_threshold', 0.3),
+            max_misses=self.config.get('ml.trigger.tracking.max_misses', 1)
+        )
+    
+    def _inference_loop(self, detector: AgeDetector, tracker: Optional[FaceTracker] = None):
+        """Process the newest frame whenever this worker is free (runs in a worker thread)."""
+        while self.running or not self.frame_buffer.closed:
+            captured = self.frame_buffer.get(timeout=0.5)
+            if captured is None:
+                if self.frame_buffer.closed:
+                    break
+                continue
+            
+            started_at = time.monotonic()
+            try:
+                applied = self._process_frame(captured.image, detector, captured.seq, tracker)
+            except Exception as e:
+                logger.error(f"Error processing frame: {e}")
+                continue
+            
+            if applied:
+                self.metrics.record_processed(captured.captured_at, started_at, time.monotonic())
+            else:
+                self.metrics.record_stale()
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return capture/inference pipeline metrics."""
+        snapshot = self.metrics.snapshot()
+        snapshot["inference_workers"] = self.inference_workers
+        return snapshot
+    
+    def _publish_metrics(self):
+        """Log pipeline metrics and publish them as telemetry."""
+        metrics = self.get_metrics()
+        logger.info(
+            f"Pipeline: capture {metrics['capture_fps']} FPS, "
+            f"inference {metrics['inference_fps']} FPS, "
+            f"latency p50 {metrics['latency_ms']['p50']} ms / p95 {metrics['latency_ms']['p95']} ms, "
+            f"dropped {metrics['frames_dropped']}"
+        )
+        with self._publish_lock:
+            self.trigger_publisher.publish(
+                MessageType.TELEMETRY,
+                {"type": "trigger_pipeline", "metrics": metrics, "timestamp": time.time()}
+            )
     
     def start(self):
         """Start the trigger service."""
@@ -195,8 +321,9 @@ class TriggerService:
             logger.warning("Service already running")
             return
         
-        # Initialize detector
-        self.detector = AgeDetector(use_gpu=False)
+        # Initialize detectors (one per worker; cv2.dnn nets are not shared across threads)
+        detectors = [AgeDetector(use_gpu=False) for _ in range(self.inference_workers)]
+        self.detector = detectors[0]
         
         # Open camera
         if not self._open_camera():
@@ -215,31 +342,35 @@ class TriggerService:
                 service_name="analytics_engine"
             )
         
+        self.frame_buffer = LatestFrameBuffer()
+        self._last_decided_seq = 0
         self.running = True
-        logger.info("Trigger service started")
+        self._stopped.clear()
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="TriggerCapture", daemon=True)
+        ]
+        for index, detector in enumerate(detectors):
+            self._threads.append(threading.Thread(
+                target=self._inference_loop,
+                args=(detector, self._create_tracker(detector)),
+                name=f"TriggerInference-{index}",
+                daemon=True
+            ))
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"Trigger service started ({self.inference_workers} inference worker(s))")
         
         try:
-            frame_count = 0
-            fps_start = time.time()
+            last_metrics = time.monotonic()
             
             while self.running:
-                ret, frame = self.camera.read()
-                
-                if not ret:
-                    logger.warning("Failed to read frame")
-                    time.sleep(0.1)
-                    continue
-                
-                self._process_frame(frame)
-                
-                frame_count += 1
-                if frame_count % 30 == 0:
-                    elapsed = time.time() - fps_start
-                    fps = 30 / elapsed
-                    logger.debug(f"Processing at {fps:.1f} FPS")
-                    fps_start = time.time()
-                
-                time.sleep(0.033)
+                if self._stopped.wait(1.0):
+                    break
+                if not any(thread.is_alive() for thread in self._threads):
+                    break
+                if time.monotonic() - last_metrics >= self.metrics_interval:
+                    self._publish_metrics()
+                    last_metrics = time.monotonic()
                 
         except KeyboardInterrupt:
             logger.info("Received interrupt signal")
@@ -253,8 +384,15 @@ class TriggerService:
         
         logger.info("Stopping trigger service...")
         self.running = False
+        self._stopped.set()
+        self.frame_buffer.close()
+        
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout=5.0)
+        self._threads = []
         
-        if self.analytics_enabled and self.analytics_buffer:
+        if self.analytics_enabled and self.analytics.total_detections:
             self._send_analytics()
         
         if self.camera:
@@ -0,0 +1,122 @@
+"""Unit tests for the AgeDetector module.
+
+Tests the batched demographics path against the per-face path and the
+trigger rules. The DNN models are replaced with deterministic stand-ins
+so no model files are needed; OpenCV itself is required.
+"""
+
+import pytest
+from unittest import mock
+
+cv2 = pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+from src.trigger_engine.age_detector import AgeDetector, FaceDetection
+
+
+class FakeNet:
+    """Per-sample stand-in for a Caffe classifier: output depends only on that sample's pixels."""
+
+    def __init__(self, classes):
+        self.classes = classes
+        self.blob = None
+
+    def setInput(self, blob):
+        self.blob = blob
+
+    def forward(self):
+        means = self.blob.reshape(self.blob.shape[0], -1).mean(axis=1)
+        logits = np.stack([np.cos(means * (k + 1)) for k in range(self.classes)], axis=1)
+        exp = np.exp(logits)
+        return (exp / exp.sum(axis=1, keepdims=True)).astype(np.float32)
+
+
+@pytest.fixture
+def detector():
+    """AgeDetector with fake age and gender nets."""
+    nets = [FakeNet(8), FakeNet(2)]
+    with mock.patch.object(cv2.dnn, 'readNet', side_effect=nets):
+        yield AgeDetector(use_gpu=False)
+
+
+@pytest.fixture
+def frame():
+    """Synthetic 480x640 BGR frame."""
+    return np.random.default_rng(7).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+
+
+class TestBatchedDemographics:
+    """Tests for estimate_demographics_batch."""
+
+    def test_matches_per_face_path(self, detector, frame):
+        """Batched results should equal running each face on its own."""
+        bboxes = [(10, 10, 80, 80), (200, 50, 120, 100), (600, 400, 60, 60)]
+
+        batched = detector.estimate_demographics_batch(frame, bboxes)
+        per_face = [detector.estimate_demographics(frame, bbox) for bbox in bboxes]
+
+        assert len(batched) == 3
+        for got, expected in zip(batched, per_face):
+            assert got[0] == expected[0]
+            assert got[2] == expected[2]
+            assert got[1] == pytest.approx(expected[1], abs=1e-5)
+            assert got[3] == pytest.approx(expected[3], abs=1e-5)
+
+    def test_runs_each_net_once(self, detector, frame):
+        """All faces should go through one forward pass per net."""
+        bboxes = [(10, 10, 80, 80), (200, 50, 120, 100)]
+
+        with mock.patch.object(detector.age_net, 'forward', wraps=detector.age_net.forward) as age_forward:
+            detector.estimate_demographics_batch(frame, bboxes)
+
+        assert age_forward.call_count == 1
+        assert detector.age_net.blob.shape == (2, 3, 227, 227)
+
+    def test_empty_crop_uses_default(self, detector, frame):
+        """Boxes outside the frame should get the same default as the per-face path."""
+        bboxes = [(2000, 2000, 50, 50), (10, 10, 80, 80)]
+
+        batched = detector.estimate_demographics_batch(frame, bboxes)
+
+        assert batched[0] == (30, 0.5, "unknown", 0.5)
+        assert batched[1] == detector.estimate_demographics(frame, bboxes[1])
+
+    def test_no_faces(self, detector, frame):
+        """No boxes should return no results without running the nets."""
+        assert detector.estimate_demographics_batch(frame, []) == []
+        assert detector.age_net.blob is None
+
+    def test_detect_and_estimate_uses_batch(self, detector, frame):
+        """detect_and_estimate should build detections from the batched results."""
+        bboxes = np.array([[10, 10, 80, 80], [200, 50, 120, 100]])
+
+        with mock.patch.object(detector, 'detect_faces', return_value=bboxes):
+            detections = detector.detect_and_estimate(frame)
+
+        expected = detector.estimate_demographics_batch(frame, [tuple(b) for b in bboxes])
+        assert [d.bbox for d in detections] == [(10, 10, 80, 80), (200, 50, 120, 100)]
+        assert [(d.age, d.gender) for d in detections] == [(e[0], e[2]) for e in expected]
+
+
+class TestDetermineTrigger:
+    """Tests for determine_trigger."""
+
+    def _face(self, age):
+        return FaceDetection(bbox=(0, 0, 10, 10), age=age, gender="male",
+                             age_confidence=0.8, gender_confidence=0.9)
+
+    def test_no_faces(self, detector):
+        assert detector.determine_trigger([]) == ("age:default", 1.0)
+
+    def test_any_minor_wins(self, detector):
+        trigger, _ = detector.determine_trigger([self._face(40), self._face(18)])
+        assert trigger == "age:under_27"
+
+    def test_all_seniors(self, detector):
+        trigger, confidence = detector.determine_trigger([self._face(70), self._face(70)])
+        assert trigger == "age:senior"
+        assert confidence == pytest.approx(0.8)
+
+    def test_mixed_adults(self, detector):
+        trigger, _ = detector.determine_trigger([self._face(40), self._face(70)])
+        assert trigger == "age:adult"
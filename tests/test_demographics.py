@@ -0,0 +1,106 @@
+"""Unit tests for the trigger engine demographics aggregator.
+
+Tests age range bucketing, O(1) counters and confidence histograms,
+reservoir-sampled raw entries, and interval reset.
+"""
+
+import random
+
+import pytest
+
+from src.trigger_engine.demographics import (
+    ConfidenceHistogram,
+    DemographicsAggregator,
+    age_range_for,
+)
+
+
+class TestAgeRange:
+    """Tests for age_range_for."""
+
+    @pytest.mark.parametrize("age,expected", [
+        (1, "under_27"), (26, "under_27"), (27, "27-60"),
+        (60, "27-60"), (61, "61+"), (70, "61+"),
+    ])
+    def test_boundaries(self, age, expected):
+        assert age_range_for(age) == expected
+
+
+class TestConfidenceHistogram:
+    """Tests for ConfidenceHistogram."""
+
+    def test_bins_and_mean(self):
+        histogram = ConfidenceHistogram(bins=10)
+        for value in (0.0, 0.05, 0.55, 1.0):
+            histogram.add(value)
+
+        result = histogram.to_dict()
+
+        assert result["histogram"][0] == 2
+        assert result["histogram"][5] == 1
+        assert result["histogram"][9] == 1
+        assert result["mean"] == pytest.approx(0.4)
+
+    def test_empty(self):
+        assert ConfidenceHistogram().to_dict()["mean"] is None
+
+
+class TestDemographicsAggregator:
+    """Tests for DemographicsAggregator."""
+
+    def test_summary_counts(self):
+        """Summary should match the distributions the old buffer produced."""
+        aggregator = DemographicsAggregator()
+        aggregator.add(18, 0.9, "female", 0.8)
+        aggregator.add(40, 0.7, "male", 0.6)
+        aggregator.add(70, 0.5, "male", 0.9)
+
+        summary = aggregator.summary()
+
+        assert summary["total_detections"] == 3
+        assert summary["age_distribution"] == {"under_27": 1, "27-60": 1, "61+": 1}
+        assert summary["gender_distribution"] == {"female": 1, "male": 2}
+        assert summary["age_confidence"]["mean"] == pytest.approx(0.7)
+        assert "entries" not in summary
+
+    def test_empty_summary(self):
+        assert DemographicsAggregator().summary() == {}
+
+    def test_respects_collection_flags(self):
+        """Disabled fields should not be counted or reported."""
+        aggregator = DemographicsAggregator(collect_gender=False, max_samples=5)
+        aggregator.add(40, 0.7, "male", 0.6)
+
+        summary = aggregator.summary()
+
+        assert "gender_distribution" not in summary
+        assert "gender" not in aggregator.samples[0]
+        assert aggregator.samples[0]["age_range"] == "27-60"
+
+    def test_no_samples_by_default(self):
+        aggregator = DemographicsAggregator()
+        for _ in range(100):
+            aggregator.add(40, 0.7, "male", 0.6)
+
+        assert aggregator.samples == []
+
+    def test_sampling_is_bounded(self):
+        """The reservoir should never exceed max_samples."""
+        aggregator = DemographicsAggregator(max_samples=10, rng=random.Random(1))
+        for i in range(10000):
+            aggregator.add(i % 90, 0.7, "male", 0.6)
+
+        assert len(aggregator.samples) == 10
+        assert aggregator.total_detections == 10000
+        # Later detections should be able to displace early ones
+        assert any(sample["age"] != i for i, sample in enumerate(aggregator.samples))
+
+    def test_reset_starts_new_interval(self):
+        aggregator = DemographicsAggregator(max_samples=5)
+        aggregator.add(40, 0.7, "male", 0.6)
+
+        aggregator.reset()
+
+        assert aggregator.total_detections == 0
+        assert aggregator.samples == []
+        assert aggregator.summary() == {}
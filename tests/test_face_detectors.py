@@ -0,0 +1,165 @@
+"""Unit tests for the face detector backends.
+
+Tests downscaling and mapping boxes back to full resolution, the Haar
+detector's minimum face size under downscaling, and backend selection
+from config.
+"""
+
+import pytest
+
+pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+from src.trigger_engine.face_detectors import (
+    FaceDetectorBackend,
+    HaarFaceDetector,
+    create_face_detector,
+)
+
+
+class ScriptedDetector(FaceDetectorBackend):
+    """Backend returning fixed boxes and recording the frame size it saw."""
+
+    def __init__(self, boxes, input_width=640):
+        super().__init__(input_width)
+        self.boxes = boxes
+        self.seen_shape = None
+
+    def _detect_scaled(self, frame, scale):
+        self.seen_shape = frame.shape
+        return self.boxes
+
+
+class FakeCascade:
+    """
+    Stand-in for cv2.CascadeClassifier with one face in the scene.
+
+    Like a real cascade, it only finds the face if it is at least as large
+    as both the detection window and minSize in the frame it is given.
+    """
+
+    WINDOW = (24, 24)
+
+    def __init__(self, face, frame_width):
+        self.face = face
+        self.frame_width = frame_width
+        self.seen_shape = None
+        self.min_size = None
+
+    def getOriginalWindowSize(self):
+        return self.WINDOW
+
+    def detectMultiScale(self, gray, scaleFactor, minNeighbors, minSize):
+        self.seen_shape = gray.shape
+        self.min_size = minSize
+        scale = gray.shape[1] / self.frame_width
+        x, y, size = (value * scale for value in self.face)
+        if size < max(self.WINDOW[0], minSize[0]):
+            return ()
+        return [(x, y, size, size)]
+
+
+@pytest.fixture
+def hd_frame():
+    """1280x720 BGR frame."""
+    return np.zeros((720, 1280, 3), dtype=np.uint8)
+
+
+class TestFaceDetectorBackend:
+    """Tests for the shared downscale/upscale handling."""
+
+    def test_downscales_and_maps_boxes_back(self, hd_frame):
+        """Boxes found at 640 wide should come back in 1280x720 coordinates."""
+        detector = ScriptedDetector([(10, 20, 30, 40)], input_width=640)
+
+        boxes = detector.detect(hd_frame)
+
+        assert detector.seen_shape[:2] == (360, 640)
+        assert boxes == [(20, 40, 60, 80)]
+
+    def test_full_resolution_when_disabled(self, hd_frame):
+        """input_width 0 should run on the original frame."""
+        detector = ScriptedDetector([(10, 20, 30, 40)], input_width=0)
+
+        boxes = detector.detect(hd_frame)
+
+        assert detector.seen_shape[:2] == (720, 1280)
+        assert boxes == [(10, 20, 30, 40)]
+
+    def test_no_upscaling_of_small_frames(self):
+        """Frames narrower than input_width should not be resized."""
+        detector = ScriptedDetector([], input_width=640)
+
+        detector.detect(np.zeros((240, 320, 3), dtype=np.uint8))
+
+        assert detector.seen_shape[:2] == (240, 320)
+
+    def test_boxes_clipped_to_frame(self, hd_frame):
+        """DNN boxes can overhang the frame edge; they should be clipped."""
+        detector = ScriptedDetector([(-5, 300, 50, 100), (700, 700, 10, 10)], input_width=640)
+
+        boxes = detector.detect(hd_frame)
+
+        assert boxes == [(0, 600, 90, 120)]
+
+
+class TestHaarFaceDetector:
+    """Tests for the Haar backend's minimum face size."""
+
+    def test_small_face_near_old_minimum_still_detected(self, hd_frame):
+        """A 32 px face in a 1280 wide frame must survive the downscale."""
+        detector = HaarFaceDetector(input_width=640, min_size=30)
+        detector.cascade = FakeCascade(face=(400, 200, 32), frame_width=1280)
+
+        boxes = detector.detect(hd_frame)
+
+        # Halving to 640 would leave a 16 px face, below the 24 px window
+        assert detector.cascade.seen_shape == (576, 1024)
+        assert detector.cascade.min_size == (24, 24)
+        assert boxes == [(400, 200, 32, 32)]
+
+    def test_min_size_scaled_with_frame(self, hd_frame):
+        """With a large min_size the frame is downscaled fully and min_size with it."""
+        detector = HaarFaceDetector(input_width=640, min_size=80)
+        detector.cascade = FakeCascade(face=(400, 200, 100), frame_width=1280)
+
+        boxes = detector.detect(hd_frame)
+
+        assert detector.cascade.seen_shape == (360, 640)
+        assert detector.cascade.min_size == (40, 40)
+        assert boxes == [(400, 200, 100, 100)]
+
+    def test_defaults_detect_1080p_at_input_width(self):
+        """Default settings should detect 1080p frames at the full 640 downscale."""
+        detector = create_face_detector(None)
+        detector.cascade = FakeCascade(face=(900, 400, 80), frame_width=1920)
+
+        boxes = detector.detect(np.zeros((1080, 1920, 3), dtype=np.uint8))
+
+        assert detector.cascade.seen_shape == (360, 640)
+        assert detector.cascade.min_size == (24, 24)
+        assert len(boxes) == 1
+
+    def test_backend_is_abstract(self):
+        with pytest.raises(TypeError):
+            FaceDetectorBackend()
+
+
+class TestCreateFaceDetector:
+    """Tests for create_face_detector."""
+
+    def test_defaults_to_haar(self):
+        detector = create_face_detector(None)
+
+        assert isinstance(detector, HaarFaceDetector)
+        assert detector.input_width == 640
+
+    def test_haar_settings(self):
+        detector = create_face_detector({'backend': 'haar', 'input_width': 480, 'min_size': 24})
+
+        assert detector.input_width == 480
+        assert detector.min_size == 24
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown face detector backend"):
+            create_face_detector({'backend': 'mtcnn'})
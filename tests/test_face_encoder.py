@@ -112,6 +112,24 @@ class TestExtractEncoding:
             assert any("Multiple faces" in record.message or "multiple" in record.message.lower()
                       for record in caplog.records)
 
+    @patch('central_hub.services.face_encoder.face_recognition')
+    def test_extract_encoding_from_bytes_in_memory(self, mock_face_rec, app):
+        """Test encoding from bytes loads the image from memory, not a temp file."""
+        from central_hub.services.face_encoder import extract_encoding_from_bytes
+
+        mock_face_rec.load_image_file.return_value = np.zeros((100, 100, 3), dtype=np.uint8)
+        mock_face_rec.face_encodings.return_value = [np.random.rand(128)]
+
+        with app.app_context():
+            with patch('tempfile.NamedTemporaryFile') as mock_tempfile:
+                encoding = extract_encoding_from_bytes(b'fake jpeg bytes')
+
+            assert len(encoding) == 512
+            mock_tempfile.assert_not_called()
+
+            loaded = mock_face_rec.load_image_file.call_args[0][0]
+            assert loaded.read() == b'fake jpeg bytes'
+
 
 class TestValidateImageFile:
     """Tests for validate_image_file function."""
@@ -0,0 +1,111 @@
+"""Unit tests for the FaceTracker detection scheduler.
+
+Tests detection scheduling (interval and motion), IoU track matching,
+demographics caching between detection passes, and track expiry.
+"""
+
+import pytest
+from unittest import mock
+
+pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+from src.trigger_engine.face_tracker import FaceTracker, iou
+
+
+def make_detector(faces_per_call):
+    """Fake AgeDetector returning scripted faces; demographics encode the box x."""
+    detector = mock.MagicMock()
+    detector.detect_faces.side_effect = lambda frame: faces_per_call.pop(0) if faces_per_call else []
+    detector.estimate_demographics_batch.side_effect = lambda frame, bboxes: [
+        (20 + bbox[0] % 50, 0.9, "female", 0.8) for bbox in bboxes
+    ]
+    return detector
+
+
+@pytest.fixture
+def still_frame():
+    """Uniform frame so no motion is detected."""
+    return np.full((240, 320, 3), 100, dtype=np.uint8)
+
+
+class TestIoU:
+    """Tests for the iou helper."""
+
+    def test_identical_boxes(self):
+        assert iou((0, 0, 10, 10), (0, 0, 10, 10)) == pytest.approx(1.0)
+
+    def test_disjoint_boxes(self):
+        assert iou((0, 0, 10, 10), (20, 20, 10, 10)) == 0.0
+
+    def test_partial_overlap(self):
+        assert iou((0, 0, 10, 10), (5, 0, 10, 10)) == pytest.approx(50 / 150)
+
+
+class TestFaceTracker:
+    """Tests for FaceTracker scheduling and caching."""
+
+    def test_detects_on_interval_only(self, still_frame):
+        """Full detection should run on the first frame and then every N frames."""
+        detector = make_detector([[(10, 10, 40, 40)]] * 4)
+        tracker = FaceTracker(detector, detect_interval=5, motion_threshold=8.0)
+
+        for _ in range(11):
+            detections = tracker.process(still_frame)
+
+        assert tracker.detection_passes == 3
+        assert detector.detect_faces.call_count == 3
+        assert [d.bbox for d in detections] == [(10, 10, 40, 40)]
+
+    def test_demographics_cached_between_detections(self, still_frame):
+        """Frames between detection passes should reuse the track's demographics."""
+        detector = make_detector([[(10, 10, 40, 40)]])
+        tracker = FaceTracker(detector, detect_interval=10)
+
+        first = tracker.process(still_frame)
+        second = tracker.process(still_frame)
+
+        assert detector.estimate_demographics_batch.call_count == 1
+        assert first[0].age == second[0].age == 30
+
+    def test_motion_forces_detection(self, still_frame):
+        """A large frame change should trigger detection before the interval."""
+        detector = make_detector([[], [(10, 10, 40, 40)]])
+        tracker = FaceTracker(detector, detect_interval=30, motion_threshold=8.0)
+
+        assert tracker.process(still_frame) == []
+        assert tracker.process(still_frame) == []
+        moved = np.full_like(still_frame, 200)
+        detections = tracker.process(moved)
+
+        assert tracker.detection_passes == 2
+        assert len(detections) == 1
+
+    def test_matches_tracks_by_iou(self, still_frame):
+        """A re-detected face should keep its track id."""
+        detector = make_detector([[(10, 10, 40, 40)], [(14, 12, 40, 40), (200, 100, 40, 40)]])
+        tracker = FaceTracker(detector, detect_interval=1, motion_threshold=0)
+
+        tracker.process(still_frame)
+        first_id = tracker.tracks[0].track_id
+        tracker.process(still_frame)
+
+        ids = [track.track_id for track in tracker.tracks]
+        assert ids[0] == first_id
+        assert len(set(ids)) == 2
+        assert tracker.tracks[0].bbox == (14, 12, 40, 40)
+
+    def test_unmatched_tracks_expire(self, still_frame):
+        """A track should survive max_misses passes without a match, then drop."""
+        detector = make_detector([[(10, 10, 40, 40)], [], []])
+        tracker = FaceTracker(detector, detect_interval=1, motion_threshold=0, max_misses=1)
+
+        assert len(tracker.process(still_frame)) == 1
+        assert len(tracker.process(still_frame)) == 1
+        assert tracker.process(still_frame) == []
+
+    def test_unknown_tracker_falls_back_to_iou(self):
+        """An unavailable OpenCV tracker should fall back to IoU holding."""
+        tracker = FaceTracker(make_detector([]), tracker_type="nonexistent")
+
+        assert tracker.tracker_type == "iou"
@@ -0,0 +1,125 @@
+"""Unit tests for the trigger engine frame pipeline.
+
+Tests the single-slot latest-frame buffer (overwrite, drop counting, close
+semantics, worker hand-off) and the rolling pipeline metrics.
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.trigger_engine.frame_pipeline import (
+    LatestFrameBuffer,
+    PipelineMetrics,
+)
+
+
+class TestLatestFrameBuffer:
+    """Tests for LatestFrameBuffer."""
+
+    def test_get_returns_newest_frame(self):
+        """Unread frames should be overwritten, not queued."""
+        buffer = LatestFrameBuffer()
+        buffer.put("frame-1", captured_at=1.0)
+        buffer.put("frame-2", captured_at=2.0)
+        buffer.put("frame-3", captured_at=3.0)
+
+        captured = buffer.get(timeout=0)
+
+        assert captured.image == "frame-3"
+        assert captured.seq == 3
+        assert captured.captured_at == 3.0
+        assert buffer.dropped == 2
+
+    def test_frame_is_taken_once(self):
+        """A frame should be handed to one worker only."""
+        buffer = LatestFrameBuffer()
+        buffer.put("frame-1")
+
+        assert buffer.get(timeout=0) is not None
+        assert buffer.get(timeout=0.01) is None
+        assert buffer.dropped == 0
+
+    def test_get_waits_for_frame(self):
+        """get() should block until the capture thread puts a frame."""
+        buffer = LatestFrameBuffer()
+        timer = threading.Timer(0.05, buffer.put, args=("late-frame",))
+        timer.start()
+
+        captured = buffer.get(timeout=2.0)
+        timer.join()
+
+        assert captured.image == "late-frame"
+
+    def test_close_wakes_waiting_workers(self):
+        """close() should release workers blocked without a timeout."""
+        buffer = LatestFrameBuffer()
+        results = []
+        worker = threading.Thread(target=lambda: results.append(buffer.get()))
+        worker.start()
+
+        time.sleep(0.05)
+        buffer.close()
+        worker.join(timeout=2.0)
+
+        assert not worker.is_alive()
+        assert results == [None]
+        assert buffer.closed is True
+
+    def test_pending_frame_survives_close(self):
+        """The last frame put before close() should still be delivered."""
+        buffer = LatestFrameBuffer()
+        buffer.put("last-frame")
+        buffer.close()
+
+        assert buffer.get(timeout=0).image == "last-frame"
+        assert buffer.get(timeout=0) is None
+
+
+class TestPipelineMetrics:
+    """Tests for PipelineMetrics."""
+
+    def test_empty_snapshot(self):
+        """A fresh instance should report zeros."""
+        snapshot = PipelineMetrics().snapshot()
+
+        assert snapshot["frames_captured"] == 0
+        assert snapshot["frames_processed"] == 0
+        assert snapshot["capture_fps"] == 0.0
+        assert snapshot["latency_ms"]["p95"] == 0.0
+
+    def test_rates_and_latency(self):
+        """FPS and latency percentiles should come from recorded timestamps."""
+        metrics = PipelineMetrics()
+        for i in range(31):
+            metrics.record_capture(i / 30)
+        for i in range(11):
+            captured_at = i / 10
+            metrics.record_processed(captured_at, captured_at + 0.01, captured_at + 0.05)
+        metrics.set_dropped(20)
+        metrics.record_stale()
+
+        snapshot = metrics.snapshot()
+
+        assert snapshot["frames_captured"] == 31
+        assert snapshot["frames_processed"] == 11
+        assert snapshot["frames_dropped"] == 20
+        assert snapshot["stale_results"] == 1
+        assert snapshot["capture_fps"] == pytest.approx(30.0)
+        assert snapshot["inference_fps"] == pytest.approx(10.0)
+        assert snapshot["latency_ms"]["p50"] == pytest.approx(50.0)
+        assert snapshot["inference_ms"]["p95"] == pytest.approx(40.0)
+
+    def test_window_limits_history(self):
+        """Only the most recent frames should count toward percentiles."""
+        metrics = PipelineMetrics(window=5)
+        for i in range(5):
+            metrics.record_processed(0.0, 0.0, 1.0)
+        for i in range(5):
+            metrics.record_processed(10.0, 10.0, 10.002)
+
+        snapshot = metrics.snapshot()
+
+        assert snapshot["frames_processed"] == 10
+        assert snapshot["latency_ms"]["max"] == pytest.approx(2.0)
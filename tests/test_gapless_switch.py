@@ -0,0 +1,162 @@
+"""Tests for gapless item switches in GStreamerPlayer.
+
+Headless harness: plays short generated clips through fakesink and measures the gap between
+the last rendered frame of one item and the first of the next, for
+end-of-item switches and mid-item trigger switches, with and without
+preroll. Needs GStreamer with videotestsrc, jpegenc, avimux and jpegdec;
+skipped otherwise. Run with ``-s`` to see the measured gaps.
+"""
+
+import threading
+import time
+
+import pytest
+
+gi = pytest.importorskip("gi")
+try:
+    gi.require_version("Gst", "1.0")
+    gi.require_version("GstVideo", "1.0")
+    from gi.repository import GLib, Gst
+except (ImportError, ValueError):
+    pytest.skip("GStreamer bindings not available", allow_module_level=True)
+
+Gst.init(None)
+REQUIRED_ELEMENTS = ("playbin", "videotestsrc", "jpegenc", "avimux", "jpegdec", "fakesink")
+if not all(Gst.ElementFactory.find(name) for name in REQUIRED_ELEMENTS):
+    pytest.skip("GStreamer test elements not available", allow_module_level=True)
+
+from src.player.gstreamer_player import GStreamerPlayer  # noqa: E402
+
+FPS = 30
+FRAME_MS = 1000 / FPS
+
+
+def make_clip(path, pattern, frames):
+    """Encode a test-pattern clip of ``frames`` frames to an AVI file."""
+    pipeline = Gst.parse_launch(
+        f"videotestsrc pattern={pattern} num-buffers={frames} ! "
+        f"video/x-raw,width=320,height=240,framerate={FPS}/1 ! "
+        f"jpegenc ! avimux ! filesink location={path}"
+    )
+    pipeline.set_state(Gst.State.PLAYING)
+    pipeline.get_bus().timed_pop_filtered(
+        30 * Gst.SECOND, Gst.MessageType.EOS | Gst.MessageType.ERROR
+    )
+    pipeline.set_state(Gst.State.NULL)
+
+
+class FrameLog:
+    """Records (time, sink, pts) for every frame rendered by the player's fakesinks."""
+
+    def __init__(self):
+        self.frames = []
+        self._lock = threading.Lock()
+        self._sink_count = 0
+
+    def make_sink(self):
+        """Video sink factory for GStreamerPlayer."""
+        index = self._sink_count
+        self._sink_count += 1
+        sink = Gst.ElementFactory.make("fakesink", None)
+        sink.set_property("signal-handoffs", True)
+        sink.connect("handoff", self._on_handoff, index)
+        return sink
+
+    def _on_handoff(self, sink, buffer, pad, index):
+        with self._lock:
+            self.frames.append((time.monotonic(), index, buffer.pts))
+
+    def switches(self):
+        """Return (time of first new frame, extra gap in ms) for each item change."""
+        with self._lock:
+            frames = list(self.frames)
+        result = []
+        for previous, current in zip(frames, frames[1:]):
+            # A new item shows up as another sink or a pts that jumps back
+            if current[1] != previous[1] or current[2] < previous[2]:
+                result.append((current[0], (current[0] - previous[0]) * 1000 - FRAME_MS))
+        return result
+
+
+@pytest.fixture(scope="module")
+def clips(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("clips")
+    uris = {}
+    for name, pattern, frames in (
+        ("a", "smpte", FPS), ("b", "ball", FPS), ("c", "snow", FPS), ("long", "smpte", 3 * FPS)
+    ):
+        path = directory / f"{name}.avi"
+        make_clip(path, pattern, frames)
+        uris[name] = f"file://{path}"
+    return uris
+
+
+@pytest.fixture
+def main_loop():
+    loop = GLib.MainLoop()
+    thread = threading.Thread(target=loop.run, daemon=True)
+    thread.start()
+    yield loop
+    loop.quit()
+    thread.join(timeout=2)
+
+
+def make_player(log, next_uris, preroll, on_eos=None):
+    queue = list(next_uris)
+    player = GStreamerPlayer(
+        on_about_to_finish=lambda: queue.pop(0) if queue else None,
+        on_eos=on_eos,
+        preroll=preroll,
+        video_sink_factory=log.make_sink,
+    )
+    assert player.initialize()
+    return player
+
+
+@pytest.mark.parametrize("preroll", [True, False], ids=["preroll", "about-to-finish"])
+def test_item_boundary_gap(clips, main_loop, preroll):
+    log = FrameLog()
+    finished = threading.Event()
+    player = make_player(log, [clips["b"], clips["c"]], preroll, on_eos=finished.set)
+    try:
+        assert player.play(clips["a"])
+        assert finished.wait(15)
+    finally:
+        player.cleanup()
+
+    gaps = [gap for _, gap in log.switches()]
+    print(f"\nboundary gaps ({'preroll' if preroll else 'about-to-finish'}): "
+          + ", ".join(f"{gap:.1f} ms" for gap in gaps))
+    assert len(gaps) == 2
+    if preroll:
+        assert max(gaps) < 2 * FRAME_MS
+
+
+@pytest.mark.parametrize("preroll", [True, False], ids=["switch_now", "play"])
+def test_mid_item_trigger_switch(clips, main_loop, preroll):
+    log = FrameLog()
+    player = make_player(log, [clips["b"]], preroll)
+    try:
+        assert player.play(clips["long"])
+        time.sleep(1.0)
+
+        requested = time.monotonic()
+        if preroll:
+            assert player.switch_now(clips["b"])
+        else:
+            assert player.play(clips["b"])
+
+        deadline = time.monotonic() + 5
+        while not log.switches() and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        player.cleanup()
+
+    switches = log.switches()
+    assert switches
+    first_frame_at, gap = switches[0]
+    latency = (first_frame_at - requested) * 1000
+    print(f"\nmid-item switch ({'switch_now' if preroll else 'play'}): "
+          f"first new frame after {latency:.1f} ms, gap {gap:.1f} ms")
+    if preroll:
+        assert gap < 3 * FRAME_MS
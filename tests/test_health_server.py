@@ -0,0 +1,219 @@
+"""Tests for the device health server.
+
+Tests log tail seeking, keep-alive, per-endpoint timeouts, the bounded
+worker pool and a concurrent load of health, log and command requests.
+"""
+
+import http.client
+import io
+import threading
+import time
+
+import pytest
+
+from src.player import health_server
+from src.player.health_server import HealthRequestHandler, HealthServer, tail_offset
+
+
+class SlowController:
+    """Player controller whose calls take configurable time."""
+
+    def __init__(self, command_delay=0.0, status_delay=0.0):
+        self.command_delay = command_delay
+        self.status_delay = status_delay
+        self.minimized = 0
+
+    def get_status(self):
+        time.sleep(self.status_delay)
+        return {'status': 'playing'}
+
+    def minimize(self):
+        time.sleep(self.command_delay)
+        self.minimized += 1
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    lines = [f"line {i}\n".encode() for i in range(20000)]
+    (tmp_path / 'player.log').write_bytes(b''.join(lines))
+    monkeypatch.setattr(HealthRequestHandler, 'log_dir', tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def make_server(monkeypatch):
+    monkeypatch.setattr(health_server, 'get_system_sampler', lambda: None)
+    servers = []
+
+    def make(controller=None, **kwargs):
+        server = HealthServer(port=0, player_controller=controller, **kwargs)
+        server.start()
+        servers.append(server)
+        return server
+
+    yield make
+    for server in servers:
+        server.stop()
+
+
+def request(server, method, path):
+    connection = http.client.HTTPConnection('127.0.0.1', server.port, timeout=10)
+    try:
+        connection.request(method, path)
+        response = connection.getresponse()
+        return response.status, response.read()
+    finally:
+        connection.close()
+
+
+class TestTailOffset:
+    """Tests for tail_offset."""
+
+    @pytest.mark.parametrize("data,lines,expected", [
+        (b"a\nb\nc\n", 2, b"b\nc\n"),
+        (b"a\nb\nc", 2, b"b\nc"),
+        (b"a\nb\nc\n", 10, b"a\nb\nc\n"),
+        (b"a\nb\nc\n", 1, b"c\n"),
+        (b"", 5, b""),
+        (b"\n\n\n", 2, b"\n\n"),
+    ])
+    def test_tail(self, data, lines, expected):
+        f = io.BytesIO(data)
+        f.seek(tail_offset(f, lines, block_size=2))
+        assert f.read() == expected
+
+
+class TestEndpoints:
+    """Tests for log, keep-alive and timeout behaviour."""
+
+    def test_logs_returns_requested_tail(self, log_dir, make_server):
+        server = make_server()
+        status, body = request(server, 'GET', '/api/logs?lines=3')
+        assert status == 200
+        assert b'"line 19997\\n"' in body and b'line 19996' not in body
+
+    def test_raw_logs_streams_tail(self, log_dir, make_server):
+        server = make_server()
+        status, body = request(server, 'GET', '/api/logs/raw?lines=5000')
+        assert status == 200
+        lines = body.decode().splitlines()
+        assert len(lines) == 5000
+        assert lines[0] == 'line 15000' and lines[-1] == 'line 19999'
+
+    def test_keep_alive_reuses_connection(self, make_server):
+        server = make_server()
+        connection = http.client.HTTPConnection('127.0.0.1', server.port, timeout=5)
+        try:
+            sockets = set()
+            for _ in range(3):
+                connection.request('GET', '/api/health')
+                response = connection.getresponse()
+                response.read()
+                assert response.status == 200
+                assert not response.will_close
+                sockets.add(id(connection.sock))
+            assert len(sockets) == 1
+        finally:
+            connection.close()
+
+    def test_slow_controller_times_out(self, make_server, monkeypatch):
+        monkeypatch.setitem(health_server.ENDPOINT_TIMEOUTS, '/api/player', 0.1)
+        server = make_server(SlowController(status_delay=1.0))
+        start = time.monotonic()
+        status, _ = request(server, 'GET', '/api/player')
+        assert status == 504
+        assert time.monotonic() - start < 0.9
+
+    def test_full_pool_rejects_with_503(self, make_server):
+        server = make_server(SlowController(command_delay=1.0), max_workers=1, backlog=0)
+        busy = threading.Thread(target=request, args=(server, 'POST', '/api/command/minimize'))
+        busy.start()
+        try:
+            # The slow command occupies the only worker
+            time.sleep(0.2)
+            status, _ = request(server, 'GET', '/api/health')
+            assert status == 503
+        finally:
+            busy.join()
+
+    def test_idle_keep_alive_connections_hold_no_worker(self, make_server):
+        server = make_server(max_workers=2, backlog=0)
+        idle = []
+        try:
+            for _ in range(2):
+                connection = http.client.HTTPConnection('127.0.0.1', server.port, timeout=5)
+                connection.request('GET', '/api/health')
+                response = connection.getresponse()
+                response.read()
+                assert not response.will_close
+                idle.append(connection)
+
+            start = time.monotonic()
+            status, _ = request(server, 'GET', '/api/health')
+            assert status == 200
+            assert time.monotonic() - start < 0.5
+
+            # Parked connections are still served when they send again
+            idle[0].request('GET', '/api/health')
+            assert idle[0].getresponse().status == 200
+        finally:
+            for connection in idle:
+                connection.close()
+
+    def test_idle_connection_closed_after_timeout(self, make_server):
+        server = make_server(idle_timeout=0.2)
+        connection = http.client.HTTPConnection('127.0.0.1', server.port, timeout=5)
+        try:
+            connection.request('GET', '/api/health')
+            connection.getresponse().read()
+            time.sleep(1.5)
+            assert connection.sock.recv(1) == b''
+        finally:
+            connection.close()
+
+
+class TestLoad:
+    """Concurrent health, log and command requests."""
+
+    def test_health_stays_fast_under_slow_commands_and_logs(self, log_dir, make_server):
+        controller = SlowController(command_delay=1.0)
+        server = make_server(controller)
+        stop = threading.Event()
+        latencies = {'health': [], 'logs': [], 'command': []}
+        errors = []
+
+        def client(kind, method, path):
+            connection = http.client.HTTPConnection('127.0.0.1', server.port, timeout=10)
+            try:
+                while not stop.is_set():
+                    start = time.monotonic()
+                    connection.request(method, path)
+                    response = connection.getresponse()
+                    response.read()
+                    if response.status != 200:
+                        errors.append((path, response.status))
+                    latencies[kind].append(time.monotonic() - start)
+            except (OSError, http.client.HTTPException) as e:
+                errors.append((path, e))
+            finally:
+                connection.close()
+
+        clients = (
+            [('health', 'GET', '/api/health')] * 3
+            + [('logs', 'GET', '/api/logs/raw?lines=2000')] * 2
+            + [('command', 'POST', '/api/command/minimize')] * 2
+        )
+        threads = [threading.Thread(target=client, args=args) for args in clients]
+        for thread in threads:
+            thread.start()
+        time.sleep(1.5)
+        stop.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert not errors
+        assert controller.minimized >= 2
+        assert latencies['logs']
+        # A single-threaded server would hold health checks behind each 1 s command
+        assert len(latencies['health']) > 20
+        assert max(latencies['health']) < 0.5
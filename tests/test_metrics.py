@@ -0,0 +1,226 @@
+"""Unit tests for the in-process metrics module.
+
+Tests counters, gauges, fixed-bucket histograms and quantile estimates,
+Prometheus text rendering, heartbeat summaries and the /metrics endpoint.
+"""
+
+import threading
+import time
+from http.server import HTTPServer
+from unittest import mock
+from urllib.request import urlopen
+
+import pytest
+
+from src.common.metrics import (
+    FOLD_THRESHOLD,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    get_metrics_registry,
+)
+
+
+class TestCounterAndGauge:
+    """Tests for Counter and Gauge."""
+
+    def test_counter_increments(self):
+        counter = Counter("requests_total")
+        counter.inc()
+        counter.inc(4)
+        assert counter.value == 5
+        assert counter.render() == ["requests_total 5"]
+
+    def test_counter_is_thread_safe(self):
+        counter = Counter("requests_total")
+
+        def work():
+            for _ in range(10000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert counter.value == 40000
+
+    def test_gauge_sets_value(self):
+        gauge = Gauge("temperature")
+        gauge.set(41.5)
+        gauge.set(40.25)
+        assert gauge.summary() == 40.25
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_observe_places_values_in_buckets(self):
+        histogram = Histogram("latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+        # Bounds are inclusive upper limits, last slot is +Inf
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.count == 4
+        assert histogram.sum == pytest.approx(2.65)
+        assert histogram.max == 2.0
+
+    def test_quantiles_interpolate_within_buckets(self):
+        histogram = Histogram("latency", buckets=(0.01, 0.02, 0.05, 0.1))
+        for _ in range(100):
+            histogram.observe(0.015)
+        summary = histogram.summary()
+        assert summary["count"] == 100
+        assert 0.01 <= summary["p50"] <= 0.015
+        assert summary["p99"] <= 0.015
+        assert summary["max"] == 0.015
+
+    def test_empty_summary(self):
+        assert Histogram("latency").summary() == {"count": 0}
+
+    def test_timer_observes_block_duration(self):
+        histogram = Histogram("latency")
+        with mock.patch("src.common.metrics.time.perf_counter", side_effect=[1.0, 1.25]):
+            with histogram.time():
+                pass
+        assert histogram.count == 1
+        assert histogram.sum == 0.25
+
+    def test_concurrent_observations_are_all_counted(self):
+        histogram = Histogram("latency", buckets=(0.1, 1.0))
+        per_thread = FOLD_THRESHOLD + 500
+
+        def work(value):
+            for _ in range(per_thread):
+                histogram.observe(value)
+
+        # Enough observations per thread that observers fold while others append
+        threads = [threading.Thread(target=work, args=(value,)) for value in (0.05, 0.5, 2.0, 0.05)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert histogram.counts == [2 * per_thread, per_thread, per_thread]
+        assert histogram.count == 4 * per_thread
+        assert histogram.max == 2.0
+
+    def test_timers_fold_past_threshold(self):
+        histogram = Histogram("latency")
+        for _ in range(FOLD_THRESHOLD + 1):
+            with histogram.time():
+                pass
+        # The observing thread folded the buffer itself
+        assert len(histogram._pending) == 0
+        assert histogram.count == FOLD_THRESHOLD + 1
+
+    def test_render_cumulative_buckets(self):
+        histogram = Histogram("latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 2.0):
+            histogram.observe(value)
+        assert histogram.render() == [
+            'latency_bucket{le="0.1"} 1',
+            'latency_bucket{le="1"} 2',
+            'latency_bucket{le="+Inf"} 3',
+            "latency_sum 2.55",
+            "latency_count 3",
+        ]
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry."""
+
+    def test_get_or_create_returns_same_metric(self):
+        registry = MetricsRegistry()
+        assert registry.counter("a") is registry.counter("a")
+        assert registry.get("a") is registry.counter("a")
+        assert registry.get("missing") is None
+
+    def test_kind_mismatch_raises(self):
+        registry = MetricsRegistry()
+        registry.counter("a")
+        with pytest.raises(ValueError):
+            registry.histogram("a")
+
+    def test_render_prometheus(self):
+        registry = MetricsRegistry()
+        registry.counter("downloads_total", "Downloads").inc(2)
+        registry.gauge("throughput").set(1.5)
+        text = registry.render_prometheus()
+        assert "# HELP downloads_total Downloads\n# TYPE downloads_total counter\ndownloads_total 2\n" in text
+        assert "# TYPE throughput gauge\nthroughput 1.5\n" in text
+        assert text.endswith("\n")
+
+    def test_summary_is_compact(self):
+        registry = MetricsRegistry()
+        registry.counter("downloads_total").inc()
+        registry.histogram("latency").observe(0.002)
+        summary = registry.summary()
+        assert summary["downloads_total"] == 1
+        assert summary["latency"]["count"] == 1
+        assert set(summary["latency"]) == {"count", "mean", "p50", "p95", "p99", "max"}
+
+    def test_global_registry_singleton(self):
+        assert get_metrics_registry() is get_metrics_registry()
+
+    def test_concurrent_first_use_creates_one_registry(self, monkeypatch):
+        from src.common import metrics
+
+        created = []
+
+        class SlowRegistry(MetricsRegistry):
+            def __init__(self):
+                super().__init__()
+                created.append(self)
+                time.sleep(0.05)
+
+        monkeypatch.setattr(metrics, "_global_registry", None)
+        monkeypatch.setattr(metrics, "MetricsRegistry", SlowRegistry)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(get_metrics_registry()))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(created) == 1
+        assert all(result is created[0] for result in results)
+
+
+class TestExport:
+    """Tests for the /metrics endpoint and heartbeat summaries."""
+
+    @pytest.fixture
+    def registry(self):
+        registry = get_metrics_registry()
+        registry.clear()
+        yield registry
+        registry.clear()
+
+    def test_metrics_endpoint(self, registry):
+        from src.player.health_server import HealthRequestHandler
+
+        registry.histogram("player_trigger_handle_seconds").observe(0.003)
+        server = HTTPServer(("127.0.0.1", 0), HealthRequestHandler)
+        thread = threading.Thread(target=server.handle_request, daemon=True)
+        thread.start()
+        try:
+            with urlopen(f"http://127.0.0.1:{server.server_port}/metrics", timeout=5) as response:
+                content_type = response.headers["Content-Type"]
+                body = response.read().decode()
+        finally:
+            thread.join(timeout=5)
+            server.server_close()
+
+        assert content_type.startswith("text/plain; version=0.0.4")
+        assert "# TYPE player_trigger_handle_seconds histogram" in body
+        assert "player_trigger_handle_seconds_count 1" in body
+
+    def test_heartbeat_includes_summaries(self, registry):
+        from src.player.heartbeat import HeartbeatReporter
+
+        registry.counter("sync_download_bytes_total").inc(1024)
+        reporter = HeartbeatReporter(hub_url="http://localhost:5000", screen_id="test-screen")
+        metrics = reporter.collect_metrics()
+        assert metrics["metrics"]["sync_download_bytes_total"] == 1024
@@ -0,0 +1,155 @@
+"""
+Test NCMEC Poster Sync
+
+Tests page processing for the NCMEC poster sync task: concurrent photo
+resolution, photo-hash change detection and the per-page upsert.
+Photo downloads and face encoding are mocked.
+"""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+# Set testing environment
+os.environ['FLASK_ENV'] = 'testing'
+
+
+PHOTOS = {
+    'https://photos.test/a.jpg': b'photo-a',
+    'https://photos.test/b.jpg': b'photo-b',
+    'https://photos.test/a2.jpg': b'photo-a-v2',
+}
+
+
+def _poster(case_id, photo_url, first_name='Test', city='Springfield'):
+    """Build a raw poster as returned by the NCMEC Poster API."""
+    return {
+        'caseNumber': case_id,
+        'firstName': first_name,
+        'lastName': 'Child',
+        'age': 9,
+        'missingDate': '2024-01-15',
+        'city': city,
+        'photoUrl': photo_url,
+    }
+
+
+def _encoding_for(photo_bytes):
+    """Deterministic 512-byte encoding derived from the photo bytes."""
+    seed = int(hashlib.sha256(photo_bytes).hexdigest()[:8], 16)
+    return np.random.default_rng(seed).random(128).astype(np.float32).tobytes()
+
+
+@pytest.fixture
+def sync_page():
+    """Run _sync_poster_page with mocked downloads and encoding."""
+    from central_hub.tasks import sync_ncmec_posters
+
+    encoded = []
+
+    def fake_encode(photo_bytes):
+        encoded.append(photo_bytes)
+        return _encoding_for(photo_bytes)
+
+    def run(posters):
+        stats = {
+            'records_created': 0,
+            'records_updated': 0,
+            'records_unchanged': 0,
+            'photos_processed': 0,
+            'photos_failed': 0,
+        }
+        with patch.object(sync_ncmec_posters, '_download_photo', side_effect=PHOTOS.get), \
+                patch.object(sync_ncmec_posters, 'extract_encoding_from_bytes', side_effect=fake_encode), \
+                ThreadPoolExecutor(max_workers=4) as downloads, \
+                ThreadPoolExecutor(max_workers=2) as encoder:
+            sync_ncmec_posters._sync_poster_page(posters, downloads, encoder, stats)
+        sync_ncmec_posters.db.session.commit()
+        return stats
+
+    run.encoded = encoded
+    return run
+
+
+class TestSyncPosterPage:
+    """Tests for _sync_poster_page()."""
+
+    def test_new_posters_created(self, app, sync_page):
+        """New posters should be encoded and inserted as active records."""
+        from central_hub.models import NCMECRecord
+
+        stats = sync_page([
+            _poster('C-1', 'https://photos.test/a.jpg'),
+            _poster('C-2', 'https://photos.test/b.jpg'),
+        ])
+
+        assert stats['records_created'] == 2
+        assert stats['photos_processed'] == 2
+
+        record = NCMECRecord.query.filter_by(case_id='C-1').one()
+        assert record.status == 'active'
+        assert record.face_encoding == _encoding_for(b'photo-a')
+        assert record.photo_hash == hashlib.sha256(b'photo-a').hexdigest()
+        assert record.missing_since.isoformat() == '2024-01-15'
+
+    def test_unchanged_poster_skipped(self, app, sync_page):
+        """A poster with the same photo and fields should not be re-encoded."""
+        posters = [_poster('C-1', 'https://photos.test/a.jpg')]
+        sync_page(posters)
+        sync_page.encoded.clear()
+
+        stats = sync_page(posters)
+
+        assert stats['records_unchanged'] == 1
+        assert stats['records_updated'] == 0
+        assert sync_page.encoded == []
+
+    def test_changed_photo_reencoded(self, app, sync_page):
+        """A poster whose photo changed should be re-encoded and updated."""
+        from central_hub.extensions import db
+        from central_hub.models import NCMECRecord
+
+        sync_page([_poster('C-1', 'https://photos.test/a.jpg')])
+        record_id = NCMECRecord.query.filter_by(case_id='C-1').one().id
+
+        stats = sync_page([_poster('C-1', 'https://photos.test/a2.jpg')])
+
+        assert stats['records_updated'] == 1
+        assert stats['photos_processed'] == 1
+
+        db.session.expire_all()
+        record = NCMECRecord.query.filter_by(case_id='C-1').one()
+        assert record.id == record_id
+        assert record.face_encoding == _encoding_for(b'photo-a-v2')
+        assert NCMECRecord.query.count() == 1
+
+    def test_changed_fields_keep_encoding(self, app, sync_page):
+        """Changed poster fields with the same photo should update without encoding."""
+        from central_hub.extensions import db
+        from central_hub.models import NCMECRecord
+
+        sync_page([_poster('C-1', 'https://photos.test/a.jpg')])
+        sync_page.encoded.clear()
+
+        stats = sync_page([_poster('C-1', 'https://photos.test/a.jpg', city='Shelbyville')])
+
+        assert stats['records_updated'] == 1
+        assert sync_page.encoded == []
+
+        db.session.expire_all()
+        record = NCMECRecord.query.filter_by(case_id='C-1').one()
+        assert record.last_known_location == 'Shelbyville'
+        assert record.face_encoding == _encoding_for(b'photo-a')
+
+    def test_missing_photo_counted_as_failed(self, app, sync_page):
+        """Posters without a downloadable photo should be counted as failed."""
+        from central_hub.models import NCMECRecord
+
+        stats = sync_page([_poster('C-1', 'https://photos.test/missing.jpg')])
+
+        assert stats['photos_failed'] == 1
+        assert NCMECRecord.query.count() == 0
@@ -604,6 +604,36 @@ class TestPlaylistManagerTriggers:
         # Should continue where default left off
         assert 'video2.mp4' in uri3 or 'video1.mp4' in uri3
 
+    def test_immediate_switch_follows_priority(self, playlist_manager):
+        """Test high-priority triggered playlists request an immediate switch."""
+        assert playlist_manager._triggered_playlists[0].priority == 'normal'
+        playlist_manager._triggered_playlists[2].priority = 'high'
+
+        playlist_manager.handle_trigger({'type': 'demographic', 'age': 25, 'gender': 'male'})
+        assert playlist_manager.immediate_switch is False
+
+        playlist_manager.handle_trigger({'type': 'loyalty', 'member_id': 'member-001'})
+        assert playlist_manager.immediate_switch is True
+
+    def test_rewind_default_replays_discarded_preroll(self, playlist_manager, temp_media_dir):
+        """Test a default item handed out for preroll plays after the trigger."""
+        playlist_manager.get_first_uri()
+        assert 'video2.mp4' in playlist_manager.get_next_uri()  # prerolled, then discarded
+
+        playlist_manager.handle_trigger({'type': 'demographic', 'age': 25, 'gender': 'male'})
+        playlist_manager.rewind_default()
+        assert 'young_male_ad.mp4' in playlist_manager.get_next_uri()
+        assert 'video2.mp4' in playlist_manager.get_next_uri()
+
+    def test_mark_started_sets_current_item(self, playlist_manager, temp_media_dir):
+        """Test current_item follows the item that actually started."""
+        first_uri = playlist_manager.get_first_uri()
+        playlist_manager.get_next_uri()  # prerolled next item
+        assert playlist_manager.current_filename == 'video2.mp4'
+
+        playlist_manager.mark_started(first_uri)
+        assert playlist_manager.current_filename == 'video1.mp4'
+
 
 class TestPlaylistManagerCallbacks:
     """Tests for playlist change callbacks."""
@@ -0,0 +1,148 @@
+"""Unit tests for the background system metrics sampler.
+
+Tests parsing of fake /proc and /sys trees, CPU deltas between samples,
+the history ring buffer, snapshot reads, the background thread and the
+shared global sampler.
+"""
+
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from src.player import system_sampler
+from src.player.system_sampler import SystemSampler, get_system_sampler
+
+
+def write_stat(proc, user, idle):
+    """Write a /proc/stat whose first line has the given user and idle jiffies."""
+    (proc / "stat").write_text(f"cpu  {user} 0 0 {idle} 0 0 0 0 0 0\ncpu0 0 0 0 0 0 0 0\n")
+
+
+@pytest.fixture
+def fake_root(tmp_path):
+    proc = tmp_path / "proc"
+    sys_root = tmp_path / "sys"
+    proc.mkdir()
+    write_stat(proc, 100, 900)
+    (proc / "meminfo").write_text(
+        "MemTotal:        8000000 kB\nMemFree:         1000000 kB\nMemAvailable:    2000000 kB\n"
+    )
+    (proc / "uptime").write_text("93784.50 180000.00\n")
+
+    for index, (zone, millidegrees) in enumerate((("CPU-therm", 45500), ("GPU-therm", 43000))):
+        zone_dir = sys_root / "class" / "thermal" / f"thermal_zone{index}"
+        zone_dir.mkdir(parents=True)
+        (zone_dir / "type").write_text(f"{zone}\n")
+        (zone_dir / "temp").write_text(f"{millidegrees}\n")
+
+    gpu = sys_root / "devices" / "gpu.0"
+    gpu.mkdir(parents=True)
+    (gpu / "load").write_text("374\n")
+
+    for name, state in (("lo", "unknown"), ("eth0", "up"), ("wlan0", "down")):
+        iface = sys_root / "class" / "net" / name
+        iface.mkdir(parents=True)
+        (iface / "operstate").write_text(f"{state}\n")
+    return proc, sys_root
+
+
+@pytest.fixture
+def sampler(fake_root):
+    proc, sys_root = fake_root
+    sampler = SystemSampler(interval=0.05, history=3, proc_root=str(proc), sys_root=str(sys_root))
+    with mock.patch.object(
+        SystemSampler, "_interface_address",
+        side_effect=lambda name: {"eth0": "192.168.1.50"}.get(name)
+    ):
+        yield sampler
+    sampler.stop()
+
+
+class TestSample:
+    """Tests for parsing a single sample."""
+
+    def test_memory_temperature_gpu_uptime(self, sampler):
+        snapshot = sampler.sample()
+        assert snapshot["memory"]["percent"] == 75.0
+        assert snapshot["temperature"] == {"CPU-therm": 45.5, "GPU-therm": 43.0}
+        assert snapshot["gpu"] == {"usage_percent": 37.4, "temperature_c": 43.0, "type": "Jetson"}
+        assert snapshot["uptime"] == {"seconds": 93784, "formatted": "1d 2h 3m"}
+
+    def test_network_skips_loopback_and_unaddressed(self, sampler):
+        assert sampler.sample()["network"] == {"eth0": {"ip": "192.168.1.50", "state": "UP"}}
+
+    def test_cpu_usage_is_delta_between_samples(self, sampler, fake_root):
+        proc, _ = fake_root
+        assert sampler.sample()["cpu"]["usage"] == 10.0  # since boot
+        write_stat(proc, 175, 925)
+        assert sampler.sample()["cpu"]["usage"] == 75.0
+
+    def test_media_disk_uses_first_existing_media_path(self, sampler, tmp_path):
+        sampler.media_paths = (str(tmp_path / "missing"), str(tmp_path), "/")
+        with mock.patch.object(sampler, "_read_disk", return_value={"free_gb": 1.0}) as read_disk:
+            snapshot = sampler.sample()
+        assert read_disk.call_args_list == [mock.call("/"), mock.call(str(tmp_path))]
+        assert snapshot["media_disk"] == {"free_gb": 1.0}
+
+    def test_missing_files_fall_back(self, tmp_path):
+        sampler = SystemSampler(proc_root=str(tmp_path), sys_root=str(tmp_path))
+        snapshot = sampler.sample()
+        assert snapshot["cpu"]["usage"] == 0.0
+        assert snapshot["memory"]["percent"] == 0
+        assert snapshot["gpu"]["type"] == "Unknown"
+        assert snapshot["temperature"] == {}
+        assert snapshot["uptime"]["formatted"] == "unknown"
+
+
+class TestSnapshotAndHistory:
+    """Tests for snapshot reads and the ring buffer."""
+
+    def test_snapshot_samples_once_when_empty(self, sampler):
+        with mock.patch.object(sampler, "sample", wraps=sampler.sample) as sample:
+            first = sampler.snapshot()
+            assert sampler.snapshot() is first
+        assert sample.call_count == 1
+
+    def test_history_is_bounded(self, sampler):
+        for _ in range(5):
+            sampler.sample()
+        history = sampler.history()
+        assert len(history) == 3
+        assert set(history[0]) == {"timestamp", "cpu", "memory", "gpu", "temperature"}
+        assert history[-1]["temperature"] == 45.5
+
+    def test_background_thread_refreshes_snapshot(self, sampler):
+        sampler.start()
+        first = sampler.snapshot()
+        deadline = time.time() + 2
+        while sampler.snapshot() is first and time.time() < deadline:
+            time.sleep(0.01)
+        assert sampler.snapshot() is not first
+        sampler.stop()
+        assert not sampler.is_running
+
+
+class TestGlobalSampler:
+    """Tests for get_system_sampler."""
+
+    def test_concurrent_first_use_starts_one_sampler(self, monkeypatch):
+        monkeypatch.setattr(system_sampler, "_global_sampler", None)
+        starts = []
+
+        def slow_start(self):
+            starts.append(self)
+            time.sleep(0.05)
+
+        monkeypatch.setattr(SystemSampler, "start", slow_start)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(get_system_sampler()))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(starts) == 1
+        assert all(result is starts[0] for result in results)
@@ -0,0 +1,161 @@
+"""Tests for TickerZone scrolling and its cached text surface.
+
+Headless: the ticker is laid out with PangoCairo and painted onto an
+offscreen cairo surface, so no display is needed. Needs PyGObject with
+Gtk 3, GStreamer, Pango and PangoCairo plus pycairo (python3-gi-cairo);
+skipped otherwise.
+"""
+
+import pytest
+
+gi = pytest.importorskip("gi")
+cairo = pytest.importorskip("cairo")
+try:
+    gi.require_version("Gtk", "3.0")
+    gi.require_version("Gdk", "3.0")
+    gi.require_version("Gst", "1.0")
+    gi.require_version("GstVideo", "1.0")
+    from gi.repository import PangoCairo  # noqa: F401
+    from cms.templates.layout_renderer import LayerConfig, TickerZone
+except (ImportError, ValueError):
+    pytest.skip("Gtk/PangoCairo bindings not available", allow_module_level=True)
+
+WIDTH = 640
+HEIGHT = 60
+SPEED = 100  # px/s
+
+
+def make_zone(direction="left", items=("Breaking news", "Happy hour 4-7pm")):
+    """Create a ticker zone without a widget, as in headless rendering."""
+    config = LayerConfig(
+        id="ticker",
+        name="Ticker",
+        layer_type="ticker",
+        x=0,
+        y=0,
+        width=WIDTH,
+        height=HEIGHT,
+        z_index=1,
+        opacity=1.0,
+        background_type="solid",
+        background_color="#000000",
+        content_source="static",
+        is_primary=False,
+        items=[],
+    )
+    return TickerZone(config, list(items), ticker_speed=SPEED, ticker_direction=direction)
+
+
+def render(zone):
+    """Paint the zone onto an offscreen surface the size of the layer."""
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, WIDTH, HEIGHT)
+    zone.render(cairo.Context(surface))
+
+
+class TestTickerScrolling:
+    """Tests for advance()."""
+
+    def test_offset_advances_at_speed(self):
+        """The offset should move by speed * elapsed seconds."""
+        zone = make_zone()
+
+        zone.advance(0.5)
+        zone.advance(0.25)
+
+        assert zone._offset == pytest.approx(SPEED * 0.75)
+
+    def test_offset_wraps_after_text_leaves_zone(self):
+        """Once the text has scrolled fully across, the offset restarts at 0."""
+        zone = make_zone()
+        travel = zone.text_width + WIDTH
+        assert travel > 0
+
+        zone.advance((travel - 1) / SPEED)
+        assert zone._offset == pytest.approx(travel - 1)
+
+        zone.advance(2 / SPEED)
+        assert zone._offset == 0.0
+
+    def test_static_direction_does_not_scroll(self):
+        """A ticker that is neither left nor right never moves."""
+        zone = make_zone(direction="none")
+
+        assert zone.advance(1.0) is False
+        assert zone._offset == 0.0
+
+
+class TestTickerRedraw:
+    """Tests for redraw decisions after painting."""
+
+    def test_no_redraw_when_integer_offset_unchanged(self):
+        """Sub-pixel movement should not request a redraw."""
+        zone = make_zone()
+        zone.advance(1.0)
+        render(zone)
+
+        assert zone.advance(0.004) is False  # 0.4 px
+        assert zone.advance(0.004) is False  # 0.8 px
+        assert zone.advance(0.004) is True   # 1.2 px
+
+    def test_redraw_needed_after_render_then_move(self):
+        """Each whole-pixel move after a paint should request a redraw."""
+        zone = make_zone()
+        render(zone)
+
+        assert zone.advance(1 / SPEED) is True
+        render(zone)
+        assert zone._drawn_offset == 1
+
+
+class TestTickerSurfaceCache:
+    """Tests for the cached layout and surface."""
+
+    def test_render_reuses_cached_surface(self):
+        """Painting frames should not rebuild the text surface."""
+        zone = make_zone()
+        render(zone)
+        surface = zone._surface
+        assert surface is not None
+        assert surface.get_width() == zone.text_width
+
+        for _ in range(5):
+            zone.advance(0.1)
+            render(zone)
+
+        assert zone._surface is surface
+
+    def test_set_items_invalidates_surface(self):
+        """New ticker text should drop and rebuild the surface."""
+        zone = make_zone()
+        render(zone)
+        old_surface, old_width = zone._surface, zone.text_width
+
+        zone.set_items(["A much longer headline than before, scrolling across the zone"])
+
+        assert zone._surface is None
+        assert zone._drawn_offset is None
+        assert zone.text_width > old_width
+        assert zone._surface is not old_surface
+
+    def test_set_items_with_same_text_keeps_surface(self):
+        """Setting identical items should keep the cached surface."""
+        zone = make_zone(items=("One", "Two"))
+        render(zone)
+        surface = zone._surface
+
+        zone.set_items(["One", "Two"])
+
+        assert zone._surface is surface
+
+    def test_set_font_invalidates_surface(self):
+        """A font change should drop the surface and re-measure the text."""
+        zone = make_zone()
+        render(zone)
+        old_height = zone._text_height
+
+        zone.set_font("Sans Bold 64")
+
+        assert zone._surface is None
+        render(zone)
+        assert zone._surface is not None
+        assert zone._text_height > old_height